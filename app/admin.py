@@ -14,6 +14,7 @@ from app.models import ActuatorVariableModel
 from app.models import CultivarModel
 from app.models import CultivationMethodModel
 from app.models import IoTConfigModel
+from app.models import DataFileModel
 
 
 class StateAdmin(admin.ModelAdmin):
@@ -108,3 +109,10 @@ class IoTConfigAdmin(admin.ModelAdmin):
 
 
 admin.site.register(IoTConfigModel, IoTConfigAdmin)
+
+
+class DataFileAdmin(admin.ModelAdmin):
+    list_display = ("path", "digest")
+
+
+admin.site.register(DataFileModel, DataFileAdmin)
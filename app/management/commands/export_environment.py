@@ -0,0 +1,64 @@
+# Import standard python modules
+import sys
+
+# Import python types
+from typing import BinaryIO
+
+# Import django modules
+from django.core.management.base import BaseCommand
+
+# Import coordinator elements
+from device.coordinator.export import EnvironmentExporter, parse_timestamp
+
+
+class Command(BaseCommand):
+    """Exports environment history as csv, e.g. 
+    `python manage.py export_environment --start 1546300800 --gzip -o env.csv.gz`"""
+
+    help = "Streams environment history as csv"
+
+    def add_arguments(self, parser) -> None:  # type: ignore
+        """Adds command arguments."""
+        parser.add_argument("--start", type=float, help="Start unix timestamp")
+        parser.add_argument("--end", type=float, help="End unix timestamp")
+        parser.add_argument(
+            "--after",
+            type=parse_timestamp,
+            help="Resume after ISO-8601 timestamp of last exported row",
+        )
+        parser.add_argument(
+            "--after-id", type=int, help="Resume after id of last exported row"
+        )
+        parser.add_argument("--gzip", action="store_true", help="Compress output")
+        parser.add_argument("-o", "--output", help="Output file, default stdout")
+
+    def handle(self, *args, **options) -> None:  # type: ignore
+        """Handles command."""
+        exporter = EnvironmentExporter(
+            start=options["start"],
+            end=options["end"],
+            after=options["after"],
+            after_id=options["after_id"],
+        )
+
+        # Get output file
+        output: BinaryIO
+        if options["output"] != None:
+            output = open(options["output"], "wb")
+        else:
+            output = sys.stdout.buffer
+
+        # Stream export
+        try:
+            if options["gzip"]:
+                for data in exporter.csv_gzip():
+                    output.write(data)
+            else:
+                for chunk in exporter.csv():
+                    output.write(chunk.encode("utf-8"))
+        finally:
+            output.flush()
+            if options["output"] != None:
+                output.close()
+
+        self.stderr.write("Exported {} rows".format(exporter.row_count))
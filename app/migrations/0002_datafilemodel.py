@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("app", "0001_initial")]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataFileModel",
+            fields=[
+                (
+                    "path",
+                    models.TextField(primary_key=True, serialize=False),
+                ),
+                ("digest", models.TextField()),
+            ],
+            options={
+                "verbose_name": "Data File",
+                "verbose_name_plural": "Data Files",
+            },
+        )
+    ]
@@ -207,6 +207,15 @@ class IoTConfigModel(models.Model):
         get_latest_by = "last_config_version"
 
 
+class DataFileModel(models.Model):
+    path = models.TextField(primary_key=True)
+    digest = models.TextField()
+
+    class Meta:
+        verbose_name = "Data File"
+        verbose_name_plural = "Data Files"
+
+
 class ConnectModel(models.Model):
     json = JSONField()
 
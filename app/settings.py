@@ -180,7 +180,7 @@ LOGGING = {
         },
         "app_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "app.log",
             "formatter": "app_file",
             "maxBytes": LOG_SIZE,
@@ -188,7 +188,7 @@ LOGGING = {
         },
         "device_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "device.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -196,7 +196,7 @@ LOGGING = {
         },
         "coordinator_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "coordinator.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -214,7 +214,7 @@ LOGGING = {
         },
         "event_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "event.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -222,7 +222,7 @@ LOGGING = {
         },
         "i2c_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "i2c.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -230,7 +230,7 @@ LOGGING = {
         },
         "iot_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "iot.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -238,7 +238,7 @@ LOGGING = {
         },
         "recipe_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "recipe.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -246,7 +246,7 @@ LOGGING = {
         },
         "resource_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "resource.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -254,7 +254,7 @@ LOGGING = {
         },
         "network_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "network.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -262,7 +262,7 @@ LOGGING = {
         },
         "system_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "system.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
@@ -270,7 +270,7 @@ LOGGING = {
         },
         "upgrade_file": {
             "level": LOG_LEVEL,
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "device.utilities.logger.QueuedRotatingFileHandler",
             "filename": LOG_DIR + "upgrade.log",
             "formatter": "device_file",
             "maxBytes": LOG_SIZE,
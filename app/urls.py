@@ -20,6 +20,9 @@ from app.router import Router
 router = Router()
 router.register(r"state", views.StateViewSet, base_name="api-state")
 router.register(r"event", views.EventViewSet, base_name="api-event")
+router.register(
+    r"environment", views.EnvironmentViewSet, base_name="api-environment"
+)
 router.register(r"recipe", views.RecipeViewSet, base_name="api-recipe")
 router.register(
     r"recipe/transitions",
@@ -50,6 +53,8 @@ router.register(
 )
 router.register(r"system", views.SystemViewSet, base_name="api-system")
 router.register(r"network", views.NetworkViewSet, base_name="api-network")
+router.register(r"logs", views.LogViewSet, base_name="api-logs")
+router.register(r"i2c", views.I2CViewSet, base_name="api-i2c")
 router.register(r"upgrade", views.UpgradeViewSet, base_name="api-upgrade")
 router.register(r"iot", views.IotViewSet, base_name="api-iot")
 router.register(r"led", views.LEDViewSet, base_name="api-led")
@@ -126,7 +126,7 @@ class EventViewer:
         message, status = manager.create_event(request_)
 
         # Successfully created event request
-        self.logger.debug("Responding with ({}): {}".format(status, message))
+        self.logger.debug("Responding with ({}): {}", status, message)
         return message, status
 
 
@@ -141,7 +141,7 @@ class EnvironmentViewer:
         self.sensor_summary = self.get_environment_summary("sensor")
         self.actuator_summary = self.get_environment_summary("actuator")
 
-        self.logger.debug(f"sensor_summary: {self.sensor_summary}")
+        self.logger.debug("sensor_summary: {}", self.sensor_summary)
 
     def get_environment_summary(self, peripheral_type: str) -> Dict[str, str]:
         """Gets environment summary of current reported --> desired value for each 
@@ -153,7 +153,7 @@ class EnvironmentViewer:
         coordinator = app_config.coordinator
 
         # Get environment state dict
-        environment_dict = coordinator.state.environment
+        environment_dict = coordinator.state.snapshot("environment")
         if environment_dict == None:
             return {}
 
@@ -1,5 +1,8 @@
 # Import standard python modules
-import os, json, logging, shutil, glob
+import os, json, logging, shutil, glob, time
+
+# Import python types
+from typing import Any, Dict, Iterator, Optional
 
 # Import django modules
 from django.apps import apps
@@ -10,6 +13,7 @@ from django.contrib.auth import login, authenticate, update_session_auth_hash
 from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.decorators import login_required
 from django.db.models.query import QuerySet
+from django.http import StreamingHttpResponse
 
 from django.conf import settings
 
@@ -20,12 +24,18 @@ from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.decorators import list_route, detail_route, permission_classes
 from rest_framework.renderers import JSONRenderer, TemplateHTMLRenderer
+from rest_framework.pagination import LimitOffsetPagination
 
 # Import app modules
 from app import forms, models, serializers, viewers
 
 # Import device utilities
-from device.utilities import logger, system
+from device.utilities import logger, system, logreader
+from device.utilities.timeseries import TimeSeriesStore
+from device.utilities.communication.i2c.metrics import i2c_metrics
+
+# Import coordinator elements
+from device.coordinator.export import EnvironmentExporter, parse_timestamp
 
 # Initialize project root
 PROJECT_ROOT = str(os.getenv("PROJECT_ROOT", ""))
@@ -41,6 +51,20 @@ STORED_IMAGE_PATH = settings.DATA_PATH + "/images/stored/*.png"
 
 # DEVICE_CONFIG_PATH = "data/config/device.txt"
 DEVICE_CONFIG_PATH = os.path.join(settings.DATA_PATH, "config", "device.txt")
+TIMESERIES_PATH = os.getenv("TIMESERIES_PATH", settings.DATA_PATH + "/timeseries")
+
+# Initialize log files derived from device config
+LOG_FILES = logreader.LogFiles(LOG_DIR, DEVICE_CONFIG_PATH)
+
+# Initialize environment aggregation parameters
+AGGREGATE_DEFAULT_BUCKET = 3600  # seconds
+AGGREGATE_DEFAULT_RANGE = 86400  # seconds
+AGGREGATE_DEFAULT_LIMIT = 500  # buckets per page
+AGGREGATE_MAX_LIMIT = 5000  # buckets per page
+
+# Initialize environment history page sizes
+ENVIRONMENT_DEFAULT_LIMIT = 100  # rows per page
+ENVIRONMENT_MAX_LIMIT = 1000  # rows per page
 
 
 ##### API Views ########################################################################
@@ -101,7 +125,7 @@ class Dashboard(views.APIView):
         }
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
 
@@ -169,106 +193,12 @@ class Logs(views.APIView):
         """Gets logs view."""
         self.logger.debug("Getting logs view")
 
-        # TODO: Clean up the method / make more DRY
-
-        # Load device config
-        if os.path.exists(DEVICE_CONFIG_PATH):
-            with open(DEVICE_CONFIG_PATH) as f:
-                config_name = f.readline().strip()
-        else:
-            config_name = "unspecified"
-        device_config = json.load(open("data/devices/{}.json".format(config_name)))
-
-        # Build peripheral logs
+        # Get last 500 lines of each log file
         logs = []
-        peripherals = device_config.get("peripherals", {})
-        if peripherals == None:
-            peripherals = {}
-        for peripheral in peripherals:
-
-            # Get log file path
-            name = peripheral["name"]
-            PERIPHERAL_PATH = LOG_DIR + "peripherals/{}.log".format(name)
-
-            # Check path exists
-            if not os.path.exists(PERIPHERAL_PATH):
-                continue
-
-            # Load in log file
-            log_file = open(PERIPHERAL_PATH)
-            lines = log_file.readlines()
-
-            # Return up to 500 lines
-            if len(lines) < 500:
-                entries = lines
-            else:
-                entries = lines[-500:]
-
-            # Append to log
-            logs.append({"name": name, "entries": entries})
-
-        # Build controller logs
-        controllers = device_config.get("controllers", {})
-        if controllers == None:
-            controllers = {}
-        for controller in controllers:
-
-            # Get log file path
-            name = controller["name"]
-            CONTROLLER_PATH = LOG_DIR + "controllers/{}.log".format(name)
-
-            # Check path exists
-            if not os.path.exists(CONTROLLER_PATH):
-                continue
-
-            # Load in log file
-            log_file = open(CONTROLLER_PATH)
-            lines = log_file.readlines()
-
-            # Return up to 500 lines
-            if len(lines) < 500:
-                entries = lines
-            else:
-                entries = lines[-500:]
-
-            # Append to log
-            logs.append({"name": name, "entries": entries})
-
-        # Build device top-level logs
-        log_filenames = [
-            "app",
-            "device",
-            "coordinator",
-            "recipe",
-            "resource",
-            "iot",
-            "i2c",
-            "connect",
-            "upgrade",
-        ]
-
-        # Load in all log files
-        for name in log_filenames:
-
-            # Get log file path
-            LOG_PATH = LOG_DIR + name + ".log"
-
-            # Check path exists
-            if not os.path.exists(LOG_PATH):
-                continue
-
-            # Load log filenames
-            file = open(LOG_PATH)
-            lines = file.readlines()
-
-            # Return up to 500 lines
-            if len(lines) < 500:
-                entries = lines
-            else:
-                entries = lines[-500:]
-
-            # Append to log
-            logs.append({"name": name.capitalize(), "entries": entries})
+        for name, path in LOG_FILES.get():
+            entries, _ = logreader.tail(path, limit=500)
+            lines = [line + "\n" for entry in entries for line in entry.lines]
+            logs.append({"name": name, "entries": lines[-500:]})
 
         # Return response
         return Response({"serial_number": os.getenv("SERIAL_NUMBER"),
@@ -302,7 +232,7 @@ class Peripherals(views.APIView):
                     "peripheral_setups": peripheral_setups}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
 
@@ -377,13 +307,13 @@ class Images(views.APIView):
             relative_image_paths.append(relative_image_path)
 
         # Build response
-        self.logger.debug("relative_image_paths = {}".format(relative_image_paths))
+        self.logger.debug("relative_image_paths = {}", relative_image_paths)
         filepaths_json = json.dumps(relative_image_paths)
         response = {"serial_number": os.getenv("SERIAL_NUMBER"),
                     "filepaths_json": filepaths_json}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
 
@@ -415,7 +345,7 @@ class Resource(views.APIView):
         }
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
 
@@ -484,7 +414,7 @@ class IoT(views.APIView):
         }
 
         # Retun response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
 
@@ -565,21 +495,153 @@ class EventViewSet(viewsets.ModelViewSet):
         return Response(response_dict, status=status)
 
 
+class EnvironmentPagination(LimitOffsetPagination):
+    """Pages environment history so a list request never serializes every stored
+    environment row."""
+
+    default_limit = ENVIRONMENT_DEFAULT_LIMIT
+    max_limit = ENVIRONMENT_MAX_LIMIT
+
+
 class EnvironmentViewSet(viewsets.ReadOnlyModelViewSet):
-    """View set for environment interactions."""
+    """View set for environment interactions. Lists are paged newest first, use
+    export for bulk history."""
 
     # Initialize view set parameters
     serializer_class = serializers.EnvironmentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = EnvironmentPagination
 
     # Initialize logger
     logger = logger.Logger("EnvironmentViewSet", "app")
 
     def get_queryset(self) -> QuerySet:
-        """Gets environments queryset."""
-        queryset = models.EnvironmentModel.objects.all()
+        """Gets environments queryset, newest first."""
+        queryset = models.EnvironmentModel.objects.order_by("-timestamp", "-id")
         return queryset
 
+    @list_route(methods=["GET"], permission_classes=[IsAuthenticated])
+    def aggregate(self, request: Request) -> Response:
+        """Gets min, max, mean, and sample count of variables per time bucket.
+        Query parameters are `variables` (comma separated), optional `peripherals`
+        (comma separated), `start` and `end` (unix seconds), `bucket` (seconds), 
+        `limit` (buckets per page), and `cursor` from the previous page. Response
+        is streamed so its size does not depend on how much history is stored."""
+        self.logger.debug("Getting environment aggregates")
+
+        # Parse query parameters
+        params = request.query_params
+        try:
+            variables = [v for v in params["variables"].split(",") if v != ""]
+            peripherals = None
+            if params.get("peripherals"):
+                peripherals = params["peripherals"].split(",")
+            bucket = float(params.get("bucket", AGGREGATE_DEFAULT_BUCKET))
+            end = float(params.get("end", time.time()))
+            start = float(params.get("start", end - AGGREGATE_DEFAULT_RANGE))
+            limit = int(params.get("limit", AGGREGATE_DEFAULT_LIMIT))
+            if params.get("cursor"):
+                start = float(params["cursor"])
+        except KeyError as e:
+            message = "Unable to aggregate environment, {} is required".format(e)
+            return Response({"message": message}, 400)
+        except ValueError as e:
+            message = "Unable to aggregate environment, {}".format(e)
+            return Response({"message": message}, 400)
+
+        # Validate query parameters
+        if variables == [] or bucket < 1 or limit < 1 or end <= start:
+            message = "Unable to aggregate environment, invalid query parameters"
+            return Response({"message": message}, 400)
+
+        # Limit page to limit buckets, next page starts at cursor
+        limit = min(limit, AGGREGATE_MAX_LIMIT)
+        page_end = min(end, (start // bucket + limit) * bucket)
+        cursor = None
+        if page_end < end:
+            cursor = "{!r}".format(page_end)
+
+        # Aggregate page
+        store = self.get_timeseries_store()
+        aggregates = store.aggregate(variables, start, page_end, bucket, peripherals)
+
+        # Stream response
+        header = {"variables": variables, "bucket": bucket, "start": start, "end": end}
+        chunks = self.stream_aggregates(store, header, aggregates, cursor)
+        return StreamingHttpResponse(chunks, content_type="application/json")
+
+    @list_route(methods=["GET"], permission_classes=[IsAuthenticated])
+    def export(self, request: Request) -> Response:
+        """Streams environment history as csv with a column per variable and
+        sensor. Query parameters are optional `start` and `end` (unix seconds)
+        and `compress=gzip`. Interrupted downloads are resumed by passing the
+        timestamp (ISO-8601) and id of the last exported row as `after` and
+        `after_id`."""
+        self.logger.debug("Exporting environment history")
+
+        # Parse query parameters
+        params = request.query_params
+        try:
+            range_: Dict[str, Any] = {}
+            for key in ["start", "end"]:
+                if params.get(key):
+                    range_[key] = float(params[key])
+            if params.get("after"):
+                range_["after"] = parse_timestamp(params["after"])
+            if params.get("after_id"):
+                range_["after_id"] = int(params["after_id"])
+        except ValueError as e:
+            message = "Unable to export environment, {}".format(e)
+            return Response({"message": message}, 400)
+        is_gzip = params.get("compress") == "gzip"
+
+        # Stream export
+        exporter = EnvironmentExporter(**range_)
+        if is_gzip:
+            response = StreamingHttpResponse(
+                exporter.csv_gzip(), content_type="application/gzip"
+            )
+            file_name = "environment.csv.gz"
+        else:
+            response = StreamingHttpResponse(exporter.csv(), content_type="text/csv")
+            file_name = "environment.csv"
+        disposition = 'attachment; filename="{}"'.format(file_name)
+        response["Content-Disposition"] = disposition
+        return response
+
+    def get_timeseries_store(self) -> TimeSeriesStore:
+        """Gets coordinator time series store, or loads store from disk if app is
+        running without device."""
+        app_config = apps.get_app_config(APP_NAME)
+        coordinator = getattr(app_config, "coordinator", None)
+        if coordinator != None:
+            return coordinator.timeseries
+        store = TimeSeriesStore(TIMESERIES_PATH)
+        store.load()
+        return store
+
+    def stream_aggregates(
+        self,
+        store: TimeSeriesStore,
+        header: Dict[str, Any],
+        aggregates: Any,
+        cursor: Optional[str],
+    ) -> Iterator[str]:
+        """Streams aggregates as json chunks."""
+        yield json.dumps(header)[:-1] + ', "buckets": ['
+        for index, aggregate in enumerate(aggregates):
+            bucket = {
+                "timestamp": float(aggregate["timestamp"]),
+                "variable": store.get_variable_name(aggregate["variable"]),
+                "count": int(aggregate["count"]),
+                "min": float("{:.7g}".format(aggregate["min"])),
+                "max": float("{:.7g}".format(aggregate["max"])),
+                "mean": float("{:.7g}".format(aggregate["mean"])),
+            }
+            separator = "," if index > 0 else ""
+            yield separator + json.dumps(bucket)
+        yield '], "cursor": {}}}'.format(json.dumps(cursor))
+
 
 class RecipeViewSet(viewsets.ModelViewSet):
     """View set for recipe interactions."""
@@ -623,14 +685,14 @@ class RecipeViewSet(viewsets.ModelViewSet):
         response = {"message": message}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
     @detail_route(methods=["post"], permission_classes=[IsAuthenticated, IsAdminUser])
     def start(self, request: Request, uuid: str) -> Response:
         """Starts a recipe."""
         self.logger.debug("Starting recipe")
-        self.logger.debug("request type = {}".format(type(request)))
+        self.logger.debug("request type = {}", type(request))
 
         # Get optional timestamp parameter
         request_dict = request.data.dict()
@@ -653,9 +715,9 @@ class RecipeViewSet(viewsets.ModelViewSet):
         response = {"message": message}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         res = Response(response, status)
-        self.logger.debug("res type = {}".format(type(res)))
+        self.logger.debug("res type = {}", type(res))
         return Response(response, status)
 
     @list_route(methods=["post"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -674,7 +736,7 @@ class RecipeViewSet(viewsets.ModelViewSet):
         response = {"message": message}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
 
@@ -808,7 +870,7 @@ class DeviceConfigViewSet(viewsets.ModelViewSet):
         response = {"message": message}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
 
@@ -831,7 +893,7 @@ class SystemViewSet(viewsets.ModelViewSet):
                 "remote_device_ui_url": os.getenv("REMOTE_DEVICE_UI_URL"),
                 "is_wifi_enabled": os.getenv("IS_WIFI_ENABLED") == "true",
             }
-            self.logger.debug("Returning response: {}".format(response))
+            self.logger.debug("Returning response: {}", response)
             return Response(response, 200)
         except Exception as e:
             message = "Unable to get system info, unhandled exception: {}".format(
@@ -841,6 +903,95 @@ class SystemViewSet(viewsets.ModelViewSet):
             return Response({"message": message}, 500)
 
 
+class LogViewSet(viewsets.ModelViewSet):
+    """View set for log interactions."""
+
+    # Initialize logger
+    logger = logger.Logger("LogViewSet", "app")
+
+    @list_route(methods=["GET"], permission_classes=[IsAuthenticated])
+    def entries(self, request: Request) -> Response:
+        """Gets newest entries of a log file. Query parameters are `name`, optional
+        `limit`, minimum `level`, `regex`, and `since` (unix seconds). Passing the
+        returned `offset` back gets only entries written after the previous
+        request, offsets identify the log file so rotated files are read from
+        their start."""
+        self.logger.debug("Getting log entries")
+
+        # Get log file path
+        params = request.query_params
+        paths = dict(LOG_FILES.get())
+        name = params.get("name")
+        if name not in paths:
+            message = "Unable to get log entries, unknown log: {}".format(name)
+            return Response({"message": message}, 400)
+
+        # Read entries
+        try:
+            filter_ = logreader.LogFilter(
+                level=params.get("level"),
+                pattern=params.get("regex"),
+                since=float(params["since"]) if params.get("since") else None,
+            )
+            limit = logreader.parse_limit(params.get("limit", 500))
+            if params.get("offset"):
+                offset = params["offset"]
+                entries, offset = logreader.read_since(paths[name], offset, filter_)
+            else:
+                entries, offset = logreader.tail(paths[name], limit, filter_)
+        except ValueError as e:
+            message = "Unable to get log entries, {}".format(e)
+            return Response({"message": message}, 400)
+
+        # Build response
+        response = {
+            "name": name,
+            "entries": [entry.text for entry in entries],
+            "offset": offset,
+        }
+        return Response(response, 200)
+
+
+class I2CViewSet(viewsets.ModelViewSet):
+    """View set for i2c transaction metrics."""
+
+    # Initialize logger
+    logger = logger.Logger("I2CViewSet", "app")
+
+    @list_route(methods=["GET"], permission_classes=[IsAuthenticated])
+    def metrics(self, request: Request) -> Response:
+        """Gets transaction counters and latency histograms per i2c device.
+        Optional query parameter `device` gets metrics of one device."""
+        self.logger.debug("Getting i2c metrics")
+        devices = i2c_metrics.snapshot()
+        device = request.query_params.get("device")
+        if device != None:
+            if device not in devices:
+                message = "Unable to get i2c metrics, unknown device: {}".format(device)
+                return Response({"message": message}, 400)
+            devices = {device: devices[device]}
+        response = {"enabled": i2c_metrics.enabled, "devices": devices}
+        return Response(response, 200)
+
+    @list_route(methods=["GET"], permission_classes=[IsAuthenticated])
+    def trace(self, request: Request) -> Response:
+        """Gets the last traced i2c transactions, oldest first. Optional query
+        parameters are `device` and `limit`. Tracing is enabled by setting
+        I2C_TRACE_SIZE."""
+        self.logger.debug("Getting i2c trace")
+        params = request.query_params
+        try:
+            limit = int(params["limit"]) if params.get("limit") else None
+        except ValueError as e:
+            message = "Unable to get i2c trace, {}".format(e)
+            return Response({"message": message}, 400)
+        response = {
+            "enabled": i2c_metrics.trace != None,
+            "transactions": i2c_metrics.get_trace(params.get("device"), limit),
+        }
+        return Response(response, 200)
+
+
 class NetworkViewSet(viewsets.ModelViewSet):
     """View set for network interactions."""
 
@@ -865,7 +1016,7 @@ class NetworkViewSet(viewsets.ModelViewSet):
         }
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
     @list_route(methods=["POST"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -887,7 +1038,7 @@ class NetworkViewSet(viewsets.ModelViewSet):
 
         # Build and return response
         response = {"message": message}
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
     @list_route(methods=["POST"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -910,7 +1061,7 @@ class NetworkViewSet(viewsets.ModelViewSet):
 
         # Build and return response
         response = {"message": message}
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
     @list_route(methods=["POST"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -932,7 +1083,7 @@ class NetworkViewSet(viewsets.ModelViewSet):
 
         # Build and return response
         response = {"message": message}
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
     @list_route(methods=["POST"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -957,7 +1108,7 @@ class NetworkViewSet(viewsets.ModelViewSet):
 
         # Build and return response
         response = {"message": message}
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
 
@@ -985,7 +1136,7 @@ class IotViewSet(viewsets.ModelViewSet):
         }
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
     @list_route(methods=["POST"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -1004,7 +1155,7 @@ class IotViewSet(viewsets.ModelViewSet):
         response = {"message": "Successfully registered"}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, 200)
 
     @list_route(methods=["POST"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -1023,7 +1174,7 @@ class IotViewSet(viewsets.ModelViewSet):
         response = {"message": message}
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
 
@@ -1055,7 +1206,7 @@ class UpgradeViewSet(viewsets.ModelViewSet):
         }
 
         # Return response
-        self.logger.debug("Returning response: {}".format(response))
+        self.logger.debug("Returning response: {}", response)
         return Response(response, status)
 
     @list_route(methods=["GET"], permission_classes=[IsAuthenticated, IsAdminUser])
@@ -1080,7 +1231,7 @@ class UpgradeViewSet(viewsets.ModelViewSet):
         }
 
         # Return response
-        self.logger.info("Returning response: {}".format(response))
+        self.logger.info("Returning response: {}", response)
         return Response(response, status)
 
 
@@ -1148,14 +1299,12 @@ class LEDViewSet(viewsets.ModelViewSet):
         except Exception as e:
             message = "Unable to create request dict: {}".format(e)
             return Response(message, 400)
-        self.logger.debug("debubrob rdict={}".format(rdict))
+        self.logger.debug("debubrob rdict={}", rdict)
 
         channel = rdict.get("channel", "B")
         percent = rdict.get("percent", "50")
         self.logger.debug(
-            "Set LED channel via REST API, channel={}, percent={}".format(
-                channel, percent
-            )
+            "Set LED channel via REST API, channel={}, percent={}", channel, percent
         )
         # set channel event: B,50
         val = "{},{}".format(channel, percent)
@@ -24,6 +24,16 @@ def enable_db_access_for_all_tests(db):
     pass
 
 
+# Give each test closed i2c circuit breakers, breakers are shared by devices on
+# the same bus and address so a test that fails a device would open it for the
+# tests that follow
+@pytest.fixture(autouse=True)
+def reset_i2c_circuit_breakers():
+    from device.utilities.communication.i2c.buses import breaker_registry
+
+    breaker_registry.reset()
+
+
 """
 We want django / pytest to recreate a TEST DB each test run, so DON'T 
 override the default fixture by using the function below.
@@ -2,7 +2,7 @@
 import json, time
 
 # Import python types
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import state machine parent class
 from device.utilities.statemachine import manager
@@ -24,6 +24,11 @@ class ControllerManager(StateMachineManager):
     last_update = None  # seconds
     last_update_interval = None  # Seconds
 
+    # Initialize scheduler support
+    is_schedulable = True
+    step_mode: Optional[str] = None
+    error_start_time = 0.0
+
     def __init__(self, name: str, state: State, config: Dict) -> None:
         """Initializes manager."""
 
@@ -76,6 +81,7 @@ class ControllerManager(StateMachineManager):
         """Safely updates controller mode in device state object."""
         self._mode = value
         self.state.set_controller_value(self.name, "mode", value)
+        self.notify_mode_observers(value)
 
     @property
     def setup_uuid(self) -> Optional[str]:
@@ -110,7 +116,7 @@ class ControllerManager(StateMachineManager):
     @sampling_interval.setter
     def sampling_interval(self, value: float) -> None:
         """Safely updates sampling interval in state object."""
-        with self.state.lock:
+        with self.state.writing("controllers"):
             if "stored" not in self.state.controllers[self.name]:
                 self.state.controllers[self.name]["stored"] = {}
             self.state.controllers[self.name]["stored"]["sampling_interval"] = value
@@ -163,67 +169,108 @@ class ControllerManager(StateMachineManager):
     def run_normal_mode(self) -> None:
         """Runs normal mode. Executes child class update function every sampling
         interval. Checks for events and transitions after each update."""
-        self.logger.info("Entered NORMAL")
-
-        # Initialize vars
-        self._update_complete = True
-        self.last_update = time.time()
-
-        # Loop forever
-        while True:
-
-            # Update every sampling interval
-            self.last_update_interval = time.time() - self.last_update
-            if self.sampling_interval < self.last_update_interval:
-                message = "Updating controller, delta: {:.3f}".format(
-                    self.last_update_interval
-                )
-                self.logger.debug(message)
-                self.last_update = time.time()
-                self.update_controller()
-
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
-
-            # Check for events
-            self.check_events()
-
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
-
-            # Update every 100ms
-            time.sleep(0.100)
+        self.enter_normal_mode()
+        while self.update_sampling():
+            self.wait_until(self.next_update_time)
 
     def run_error_mode(self) -> None:
         """Runs error mode. Clears reported values then waits for new 
         events and transitions. Tries to reset every hour."""
-        self.logger.info("Entered ERROR")
+        self.enter_error_mode()
+        while self.update_error():
+            self.wait_until(self.error_start_time + 3600)
 
-        # Clear reported values
+    def enter_normal_mode(self) -> None:
+        """Enters normal mode, next update runs after one sampling interval or 
+        when a subscribed state value changes."""
+        self.logger.info("Entered NORMAL")
+        self._update_complete = True
+        self.last_update = time.time()
+        self.subscribe_state()
+
+    def enter_error_mode(self) -> None:
+        """Enters error mode, clears reported values."""
+        self.logger.info("Entered ERROR")
+        self.unsubscribe_state()
         self.clear_reported_values()
+        self.error_start_time = time.time()
+
+    def update_sampling(self) -> bool:
+        """Executes child class update function if sampling interval elapsed then
+        checks for events. Returns false if state machine left normal mode."""
+
+        # Update every sampling interval or when a subscribed value changed
+        self.last_update_interval = time.time() - self.last_update  # type: ignore
+        is_due = self.sampling_interval < self.last_update_interval  # type: ignore
+        if is_due or self.is_state_changed:
+            message = "Updating controller, delta: {:.3f}"
+            self.logger.debug(message, self.last_update_interval)
+            self.is_state_changed = False
+            self.last_update = time.time()
+            self.update_controller()
 
-        # Initialize vars
-        start_time = time.time()
+        # Check for transitions
+        if self.new_transition(modes.NORMAL):
+            return False
 
-        # Loop forever
-        while True:
+        # Check for events and transitions
+        self.check_events()
+        return not self.new_transition(modes.NORMAL)
 
-            # Check for hourly reset
-            if time.time() - start_time > 3600:  # 1 hour
-                self.mode = modes.RESET
-                break
+    def update_error(self) -> bool:
+        """Checks for hourly reset and events. Returns false if state machine left
+        error mode."""
 
-            # Check for events
-            self.check_events()
+        # Check for hourly reset
+        if time.time() - self.error_start_time > 3600:  # 1 hour
+            self.mode = modes.RESET
+            return False
 
-            # Check for transitions
-            if self.new_transition(modes.ERROR):
-                break
+        # Check for events and transitions
+        self.check_events()
+        return not self.new_transition(modes.ERROR)
 
-            # Update every 100ms
-            time.sleep(0.1)
+    @property
+    def next_update_time(self) -> float:
+        """Gets timestamp of next sampling interval update."""
+        return self.last_update + self.sampling_interval  # type: ignore
+
+    def step(self) -> Optional[float]:
+        """Runs one state machine update when running on a scheduler. Returns 
+        timestamp of next update, or None to wait for an event or transition."""
+
+        # Check if mode was just entered
+        mode = self.mode
+        is_entered = mode != self.step_mode
+        self.step_mode = mode
+
+        # Run modes that complete in one update
+        if mode == modes.INIT:
+            self.run_init_mode()
+        elif mode == modes.RESET:
+            self.run_reset_mode()
+        elif mode == modes.SHUTDOWN:
+            self.run_shutdown_mode()
+
+        # Run one update of looping modes
+        elif mode == modes.NORMAL:
+            if is_entered:
+                self.enter_normal_mode()
+            if self.update_sampling():
+                return self.next_update_time
+        elif mode == modes.ERROR:
+            if is_entered:
+                self.enter_error_mode()
+            if self.update_error():
+                return self.error_start_time + 3600
+        else:
+            self.logger.critical("Invalid state machine mode")
+            self.mode = modes.INVALID
+            self.is_shutdown = True
+            return None
+
+        # Run next mode immediately
+        return time.time()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode. Executes child class reset function, checks for any
@@ -247,6 +294,7 @@ class ControllerManager(StateMachineManager):
         self.logger.info("Entered SHUTDOWN")
 
         # Shutdown controller
+        self.unsubscribe_state()
         self.shutdown_controller()
         self.is_shutdown = True
 
@@ -1,5 +1,5 @@
 # Import standard python modules
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import controller manager parent class
 from device.controllers.classes.controller import manager, modes
@@ -22,6 +22,12 @@ class HystereticControllerManager(manager.ControllerManager):
         self.negative_actuator_name = self.variables.get("negative_actuator_name", None)
         self.accuracy_value = float(self.properties.get("accuracy_value", None))
 
+    @property
+    def subscribed_paths(self) -> List[str]:
+        """Gets desired sensor value path so setpoint changes update controller
+        immediately."""
+        return ["environment.sensor.desired.{}".format(self.sensor_name)]
+
     @property
     def sensor_value(self) -> Optional[float]:
         """Gets sensor value."""
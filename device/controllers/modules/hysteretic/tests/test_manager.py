@@ -114,3 +114,17 @@ def test_shutdown_controller() -> None:
     )
     manager.initialize_controller()
     manager.shutdown_controller()
+
+
+def test_desired_value_change_wakes_controller() -> None:
+    manager = HystereticControllerManager(
+        name="Test", state=State(), config=controller_config
+    )
+    sensor_name = controller_config["parameters"]["variables"]["sensor_name"]
+    manager.state.set_environment_desired_sensor_value(sensor_name, 24)
+    manager.enter_normal_mode()
+    manager.wakeup_event.clear()
+    manager.state.set_environment_desired_sensor_value(sensor_name, 26)
+    manager.wakeup_event.wait(timeout=5)
+    assert manager.is_state_changed
+    manager.unsubscribe_state()
@@ -1,5 +1,5 @@
 # Import standard python modules
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 import time
 
 # Import controller manager parent class
@@ -40,6 +40,13 @@ class WaterAerationControllerManager(manager.ControllerManager):
         self._prev_desired_period: Optional[float] = None
         self._prev_desired_duty_cycle: Optional[float] = None
 
+    @property
+    def subscribed_paths(self) -> List[str]:
+        """Gets desired aeration paths so recipe changes update controller 
+        immediately."""
+        names = [self.rate_name, self.period_name, self.duty_cycle_name]
+        return ["environment.sensor.desired.{}".format(name) for name in names]
+
     @property
     def desired_rate(self) -> Optional[float]:
         """Gets desired aeration rate from shared state."""
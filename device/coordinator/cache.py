@@ -0,0 +1,106 @@
+# Import standard python modules
+import json, threading
+
+# Import python types
+from typing import Dict, Any
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.accessors import freeze
+from device.utilities.logger import Logger
+
+
+class ConfigCache:
+    """In-memory cache of parsed device configs, peripheral setups, and controller
+    setups keyed by uuid. Filled with one query per table, then handed out as
+    read-only dicts so callers can't corrupt the cached copy."""
+
+    def __init__(self) -> None:
+        """Initializes config cache."""
+
+        # Initialize logger
+        self.logger = Logger("ConfigCache", "coordinator")
+
+        # Initialize cache
+        self.lock = threading.RLock()
+        self.is_loaded = False
+        self.device_configs: Dict[str, Dict[str, Any]] = {}
+        self.peripheral_setups: Dict[str, Dict[str, Any]] = {}
+        self.controller_setups: Dict[str, Dict[str, Any]] = {}
+
+        # Initialize counters
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def load(self) -> None:
+        """Loads all device configs, peripheral setups, and controller setups."""
+        self.logger.debug("Loading config cache")
+        with self.lock:
+            self.device_configs = self.load_table(models.DeviceConfigModel)
+            self.peripheral_setups = self.load_table(models.PeripheralSetupModel)
+            self.controller_setups = self.load_table(models.ControllerSetupModel)
+            self.is_loaded = True
+
+    def load_table(self, model: Any) -> Dict[str, Dict[str, Any]]:
+        """Loads and parses every entry in a uuid keyed json table. Entries are
+        loaded as model instances since json fields are only decoded on them."""
+        entries = {}
+        for entry in model.objects.only("json"):
+            dict_ = json.loads(entry.json)
+            entries[str(dict_["uuid"])] = freeze(dict_)
+        return entries
+
+    def invalidate(self) -> None:
+        """Clears cache, cache is re-filled on next load or lookup."""
+        self.logger.debug("Invalidating config cache")
+        with self.lock:
+            self.is_loaded = False
+            self.device_configs = {}
+            self.peripheral_setups = {}
+            self.controller_setups = {}
+
+    def get(
+        self, entries: Dict[str, Dict[str, Any]], model: Any, uuid: str
+    ) -> Dict[str, Any]:
+        """Gets read-only parsed entry for uuid. Falls back to a database lookup
+        for entries created since the cache was loaded. Returns empty dict if
+        entry does not exist."""
+        with self.lock:
+
+            # Check cache
+            entry = entries.get(str(uuid))
+            if entry != None:
+                self.hit_count += 1
+                return entry  # type: ignore
+
+            # Lookup entry in database
+            self.miss_count += 1
+            model_object = model.objects.filter(uuid=uuid).first()
+            if model_object == None:
+                return {}
+            entry = freeze(json.loads(model_object.json))
+            entries[str(uuid)] = entry  # type: ignore
+            return entry  # type: ignore
+
+    def get_device_config(self, uuid: str) -> Dict[str, Any]:
+        """Gets read-only device config dict for uuid."""
+        with self.lock:
+            if not self.is_loaded:
+                self.load()
+            return self.get(self.device_configs, models.DeviceConfigModel, uuid)
+
+    def get_peripheral_setup(self, uuid: str) -> Dict[str, Any]:
+        """Gets read-only peripheral setup dict for uuid."""
+        with self.lock:
+            if not self.is_loaded:
+                self.load()
+            return self.get(self.peripheral_setups, models.PeripheralSetupModel, uuid)
+
+    def get_controller_setup(self, uuid: str) -> Dict[str, Any]:
+        """Gets read-only controller setup dict for uuid."""
+        with self.lock:
+            if not self.is_loaded:
+                self.load()
+            return self.get(self.controller_setups, models.ControllerSetupModel, uuid)
@@ -0,0 +1,64 @@
+# Import python types
+from typing import Dict, List, Set, Any
+
+
+class ManagerDiff:
+    """Difference between two lists of peripheral or controller configs. Configs
+    are matched by name, a config with the same name is changed if its uuid or
+    parameters differ."""
+
+    def __init__(
+        self, old_configs: List[Dict[str, Any]], new_configs: List[Dict[str, Any]]
+    ) -> None:
+        """Initializes manager diff."""
+        old = {config["name"]: config for config in old_configs or []}
+        new = {config["name"]: config for config in new_configs or []}
+        self.added: Set[str] = set(new) - set(old)
+        self.removed: Set[str] = set(old) - set(new)
+        self.changed: Set[str] = set()
+        self.unchanged: Set[str] = set()
+        for name in set(old) & set(new):
+            if self.is_changed(old[name], new[name]):
+                self.changed.add(name)
+            else:
+                self.unchanged.add(name)
+
+    def __repr__(self) -> str:
+        return "ManagerDiff(added={}, removed={}, changed={}, unchanged={})".format(
+            sorted(self.added),
+            sorted(self.removed),
+            sorted(self.changed),
+            sorted(self.unchanged),
+        )
+
+    @property
+    def stopped(self) -> Set[str]:
+        """Gets names of managers that need to be shutdown."""
+        return self.removed | self.changed
+
+    @property
+    def started(self) -> Set[str]:
+        """Gets names of managers that need to be created."""
+        return self.added | self.changed
+
+    def is_changed(self, old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+        """Checks if any field of a config, e.g. uuid or parameters, changed."""
+        return dict(old) != dict(new)
+
+
+class ConfigDiff:
+    """Difference between the peripherals and controllers of two device configs."""
+
+    def __init__(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+        """Initializes config diff."""
+        self.peripherals = ManagerDiff(
+            old_config.get("peripherals", []), new_config.get("peripherals", [])
+        )
+        self.controllers = ManagerDiff(
+            old_config.get("controllers", []), new_config.get("controllers", [])
+        )
+
+    def __repr__(self) -> str:
+        return "ConfigDiff(peripherals={}, controllers={})".format(
+            self.peripherals, self.controllers
+        )
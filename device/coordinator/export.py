@@ -0,0 +1,173 @@
+# Import standard python modules
+import csv, datetime, io, os, zlib
+
+# Import python types
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# Import django modules
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from django.utils.dateparse import parse_datetime
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.logger import Logger
+
+# Initialize number of rows written per streamed chunk
+EXPORT_CHUNK_ROWS = int(os.getenv("ENVIRONMENT_EXPORT_CHUNK_ROWS", 100))
+
+# Initialize gzip compression level, lower levels are faster on the device
+EXPORT_GZIP_LEVEL = int(os.getenv("ENVIRONMENT_EXPORT_GZIP_LEVEL", 6))
+
+
+def to_datetime(timestamp: Optional[float]) -> Optional[datetime.datetime]:
+    """Converts unix timestamp to utc datetime."""
+    if timestamp == None:
+        return None
+    return datetime.datetime.fromtimestamp(
+        timestamp, tz=datetime.timezone.utc  # type: ignore
+    )
+
+
+def format_timestamp(timestamp: datetime.datetime) -> str:
+    """Formats datetime as an ISO-8601 utc timestamp with microseconds."""
+    timestamp = timestamp.astimezone(datetime.timezone.utc)
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def parse_timestamp(value: str) -> datetime.datetime:
+    """Parses ISO-8601 timestamp, timestamps without offset are utc. Raises
+    ValueError on invalid timestamps."""
+    timestamp = parse_datetime(value.strip())
+    if timestamp == None:
+        raise ValueError("Invalid timestamp: {}".format(value))
+    if timestamp.tzinfo == None:  # type: ignore
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)  # type: ignore
+    return timestamp  # type: ignore
+
+
+def flatten(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Flattens individual instantaneous sensor values of environment state into
+    `<variable>.<sensor>` columns."""
+    stats = state.get("reported_sensor_stats", {})
+    instantaneous = stats.get("individual", {}).get("instantaneous", {})
+    columns = {}
+    for variable, sensors in instantaneous.items():
+        if not isinstance(sensors, dict):
+            continue
+        for sensor, value in sensors.items():
+            columns["{}.{}".format(variable, sensor)] = value
+    return columns
+
+
+def gzip_chunks(chunks: Iterator[str]) -> Iterator[bytes]:
+    """Compresses streamed text chunks into a gzip stream."""
+    compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class EnvironmentExporter:
+    """Exports environment history as csv rows ordered by timestamp and id. Rows
+    are read from the environment table with a database iterator and written in
+    small chunks so memory use does not grow with the size of the export. Exports
+    can be resumed by passing the timestamp and id of the last exported row as
+    `after` and `after_id`, rows sharing the last timestamp are not skipped."""
+
+    def __init__(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        after: Optional[datetime.datetime] = None,
+        after_id: Optional[int] = None,
+    ) -> None:
+        """Initializes environment exporter with an optional time range in unix
+        seconds, start is inclusive and end is exclusive. Rows up to and including
+        the (after, after_id) cursor are skipped."""
+
+        # Initialize parameters
+        self.start = start
+        self.end = end
+        self.after = after
+        self.after_id = after_id
+
+        # Initialize logger
+        self.logger = Logger("EnvironmentExporter", "coordinator")
+
+        # Initialize export variables
+        self._columns: Optional[List[str]] = None
+        self.row_count = 0
+
+    @property
+    def range_queryset(self) -> QuerySet:
+        """Gets environment rows in time range ordered by timestamp and id."""
+        queryset = models.EnvironmentModel.objects.order_by("timestamp", "id")
+        if self.start != None:
+            queryset = queryset.filter(timestamp__gte=to_datetime(self.start))
+        if self.end != None:
+            queryset = queryset.filter(timestamp__lt=to_datetime(self.end))
+        return queryset
+
+    @property
+    def queryset(self) -> QuerySet:
+        """Gets environment rows in time range after cursor ordered by timestamp
+        and id."""
+        queryset = self.range_queryset
+        if self.after != None and self.after_id != None:
+            queryset = queryset.filter(
+                Q(timestamp__gt=self.after)
+                | Q(timestamp=self.after, id__gt=self.after_id)
+            )
+        elif self.after != None:
+            queryset = queryset.filter(timestamp__gt=self.after)
+        return queryset
+
+    @property
+    def columns(self) -> List[str]:
+        """Gets sorted sensor columns of rows in time range, ignoring the cursor
+        so a resumed export keeps the header of the interrupted one. Since the
+        header precedes the rows, the range is scanned once more without keeping
+        rows in memory, decoding the state of each row twice per export. Rows
+        are loaded as model instances since json fields are only decoded on
+        them."""
+        if self._columns == None:
+            columns: Set[str] = set()
+            for environment in self.range_queryset.only("state").iterator():
+                columns.update(flatten(environment.state))
+            self._columns = sorted(columns)
+        return self._columns  # type: ignore
+
+    def rows(self) -> Iterator[List[Any]]:
+        """Gets rows of timestamp, id and sensor column values."""
+        columns = self.columns
+        queryset = self.queryset.only("timestamp", "id", "state")
+        for environment in queryset.iterator():
+            values = flatten(environment.state)
+            row = [format_timestamp(environment.timestamp), environment.id]
+            row += [values.get(column) for column in columns]
+            yield row
+
+    def csv(self) -> Iterator[str]:
+        """Gets csv text chunks starting with the header row."""
+        self.logger.debug("Exporting environment history")
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["timestamp", "id"] + self.columns)
+        for row in self.rows():
+            writer.writerow(row)
+            self.row_count += 1
+            if self.row_count % EXPORT_CHUNK_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+        self.logger.debug("Exported {} rows".format(self.row_count))
+
+    def csv_gzip(self) -> Iterator[bytes]:
+        """Gets gzip compressed csv chunks."""
+        return gzip_chunks(self.csv())
@@ -0,0 +1,110 @@
+# Import standard python modules
+import time
+
+# Import python types
+from typing import Optional, Dict, Any
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.state.main import State
+from device.utilities.logger import Logger
+
+
+class EnvironmentHistoryWriter:
+    """Stores environment state snapshots to the environment table on a timer.
+    Keeps the latest stored timestamp in memory so the database is only queried
+    once on load. Snapshots are skipped when the environment has not changed
+    since the last stored snapshot."""
+
+    def __init__(self, state: State, interval: float = 600.0) -> None:
+        """Initializes environment history writer."""
+
+        # Initialize parameters
+        self.state = state
+        self.interval = interval
+
+        # Initialize logger
+        self.logger = Logger("EnvironmentHistoryWriter", "coordinator")
+
+        # Initialize history variables, latest timestamp is the time of the latest
+        # stored snapshot and checked timestamp the time of the latest due check
+        self.latest_timestamp = 0.0
+        self.checked_timestamp = 0.0
+        self.stored_version: Optional[int] = None
+
+        # Initialize counters
+        self.store_count = 0
+        self.skip_count = 0
+
+    @property
+    def next_timestamp(self) -> float:
+        """Gets timestamp of next scheduled snapshot."""
+        return max(self.latest_timestamp, self.checked_timestamp) + self.interval
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets writer metrics."""
+        return {
+            "store_count": self.store_count,
+            "skip_count": self.skip_count,
+            "latest_timestamp": self.latest_timestamp,
+        }
+
+    def load(self) -> None:
+        """Loads latest stored timestamp from environment table."""
+        timestamp = (
+            models.EnvironmentModel.objects.order_by("-timestamp")
+            .values_list("timestamp", flat=True)
+            .first()
+        )
+        if timestamp == None:
+            self.latest_timestamp = 0.0
+        else:
+            self.latest_timestamp = float(timestamp.timestamp())  # type: ignore
+        self.checked_timestamp = self.latest_timestamp
+        self.stored_version = None
+        self.logger.debug(
+            "Loaded latest environment timestamp: {}".format(self.latest_timestamp)
+        )
+
+    def update(self, force: bool = False) -> bool:
+        """Stores environment snapshot if the snapshot interval elapsed. Returns
+        true if a snapshot was stored."""
+
+        # Check if snapshot is due
+        now = time.time()
+        if not force and now < self.next_timestamp:
+            return False
+
+        # Reschedule next check
+        self.checked_timestamp = now
+
+        # Skip snapshot if environment is unchanged since last snapshot
+        version = self.state.get_version("environment")
+        if not force and version == self.stored_version:
+            self.skip_count += 1
+            self.logger.debug(
+                "Skipped unchanged environment snapshot, skipped: {}".format(
+                    self.skip_count
+                )
+            )
+            return False
+
+        # Store snapshot
+        self.store()
+        self.stored_version = version
+        return True
+
+    def store(self) -> None:
+        """Stores current environment state in environment table."""
+        environment = self.state.snapshot("environment")
+        models.EnvironmentModel.objects.create(state=environment)
+        self.latest_timestamp = time.time()
+        self.store_count += 1
+        self.logger.debug(
+            "Stored environment snapshot, stored: {}, skipped: {}".format(
+                self.store_count, self.skip_count
+            )
+        )
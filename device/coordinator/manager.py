@@ -1,18 +1,28 @@
 # Import standard python modules
 import logging, time, json, threading, os, sys, glob, uuid, jsonschema
+import concurrent.futures
 
 # Import python types
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Set
 
 # Import app models
 from app import models
 
 # Import device utilities
 from device.utilities.statemachine.manager import StateMachineManager
+from device.utilities.statemachine.scheduler import Scheduler
 from device.utilities.state.main import State
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.mux_cache import mux_cache
+from device.utilities.communication.i2c.handles import handle_pool
+from device.utilities.communication.i2c.buses import (
+    breaker_registry,
+    bus_registry,
+    parse_bus,
+)
 from device.utilities.accessors import set_nested_dict_safely
-from device.utilities.logger import Logger
+from device.utilities.logger import Logger, log_queue
+from device.utilities.timeseries import TimeSeriesStore
 
 # Import device managers
 from device.recipe.manager import RecipeManager
@@ -23,8 +33,15 @@ from device.upgrade.manager import UpgradeManager
 
 # Import manager elements
 from device.coordinator import modes, events
+from device.coordinator.snapshots import StateSnapshotWriter
+from device.coordinator.cache import ConfigCache
+from device.coordinator.history import EnvironmentHistoryWriter
+from device.coordinator.manifest import DataFileManifest
+from device.coordinator.readiness import ReadinessBarrier
+from device.coordinator.diff import ConfigDiff
 
 from django.conf import settings
+from django.db import connection, transaction
 
 # Initialize file paths
 RECIPES_PATH = "data/recipes/*.json"
@@ -45,6 +62,35 @@ CULTIVARS_SCHEMA_PATH = "data/schemas/cultivars.json"
 CULTIVATION_METHODS_PATH = "data/cultivations/cultivation_methods.json"
 CULTIVATION_METHODS_SCHEMA_PATH = "data/schemas/cultivation_methods.json"
 
+# Initialize state snapshot intervals
+STATE_SNAPSHOT_INTERVAL = float(os.getenv("STATE_SNAPSHOT_INTERVAL", 1.0))  # seconds
+STATE_RECONCILE_INTERVAL = float(os.getenv("STATE_RECONCILE_INTERVAL", 10.0))  # seconds
+
+# Initialize environment history interval
+ENVIRONMENT_HISTORY_INTERVAL = float(
+    os.getenv("ENVIRONMENT_HISTORY_INTERVAL", 60 * 10)
+)  # seconds
+
+# Initialize time series store path, disk budget, and flush interval
+TIMESERIES_PATH = os.getenv("TIMESERIES_PATH", DATA_PATH + "/timeseries")
+TIMESERIES_DISK_BUDGET = int(os.getenv("TIMESERIES_DISK_BUDGET", 32 * 1024 * 1024))
+TIMESERIES_FLUSH_INTERVAL = float(os.getenv("TIMESERIES_FLUSH_INTERVAL", 10.0))
+
+# Initialize peripheral creation concurrency
+PERIPHERAL_CREATE_WORKERS = int(os.getenv("PERIPHERAL_CREATE_WORKERS", 4))
+PERIPHERAL_BUS_CONCURRENCY = int(os.getenv("PERIPHERAL_BUS_CONCURRENCY", 2))
+
+# Initialize peripheral and controller scheduler, zero workers runs each manager on
+# its own thread
+SCHEDULER_WORKERS = int(os.getenv("SCHEDULER_WORKERS", 0))
+
+# Initialize longest manager update allowed on the scheduler before the manager is
+# moved to its own thread, e.g. while blocked in i2c retry backoff
+SCHEDULER_MAX_STEP_TIME = float(os.getenv("SCHEDULER_MAX_STEP_TIME", 2.0))
+
+# Initialize scheduler and state lock metrics report interval
+METRICS_REPORT_INTERVAL = 60  # seconds
+
 # Initialize event recipient types
 PERIPHERAL_RECIPIENT_TYPE = "Peripheral"
 CONTROLLER_RECIPIENT_TYPE = "Controller"
@@ -91,6 +137,46 @@ class CoordinatorManager(StateMachineManager):
             "last_update_minute": None,
         }
 
+        # Initialize state snapshot writer
+        self.snapshot_writer = StateSnapshotWriter(
+            self.state,
+            interval=STATE_SNAPSHOT_INTERVAL,
+            reconcile_interval=STATE_RECONCILE_INTERVAL,
+        )
+
+        # Initialize environment history writer
+        self.environment_writer = EnvironmentHistoryWriter(
+            self.state, interval=ENVIRONMENT_HISTORY_INTERVAL
+        )
+
+        # Initialize time series store, reported sensor values are recorded at the
+        # sensor rate
+        self.timeseries = TimeSeriesStore(
+            TIMESERIES_PATH,
+            disk_budget=TIMESERIES_DISK_BUDGET,
+            flush_interval=TIMESERIES_FLUSH_INTERVAL,
+        )
+        self.state.timeseries = self.timeseries
+
+        # Initialize peripheral and controller scheduler
+        self.manager_scheduler = self.create_scheduler()
+        self.last_metrics_report_time = 0.0
+
+        # Initialize data file manifest and init phase timings
+        self.manifest = DataFileManifest()
+        self.init_timings: Dict[str, float] = {}
+
+        # Initialize parsed config cache
+        self.config_cache = ConfigCache()
+
+        # Initialize config reload variables
+        self.config_diff: Optional[ConfigDiff] = None
+        self.reload_start_time = 0.0
+
+        # Initialize peripheral resources shared across config reloads
+        self.mux_simulator: Optional[MuxSimulator] = None
+        self.bus_semaphores: Dict[Any, threading.Semaphore] = {}
+
         # Initialize managers
         self.recipe = RecipeManager(self.state)
         self.iot = IotManager(self.state, self.recipe)  # type: ignore
@@ -122,8 +208,9 @@ class CoordinatorManager(StateMachineManager):
     def mode(self, value: str) -> None:
         """Safely updates mode in state object."""
         self._mode = value
-        with self.state.lock:
+        with self.state.writing("device"):
             self.state.device["mode"] = value
+        self.notify_mode_observers(value)
 
     @property
     def config_uuid(self) -> Optional[str]:
@@ -133,25 +220,20 @@ class CoordinatorManager(StateMachineManager):
     @config_uuid.setter
     def config_uuid(self, value: Optional[str]) -> None:
         """ Safely updates config uuid in state. """
-        with self.state.lock:
+        with self.state.writing("device"):
             self.state.device["config_uuid"] = value
 
     @property
     def config_dict(self) -> Dict[str, Any]:
-        """Gets config dict for config uuid in device config table."""
+        """Gets read-only config dict for config uuid from config cache."""
         if self.config_uuid == None:
             return {}
-        config = models.DeviceConfigModel.objects.get(uuid=self.config_uuid)
-        return json.loads(config.json)  # type: ignore
+        return self.config_cache.get_device_config(self.config_uuid)  # type: ignore
 
     @property
     def latest_environment_timestamp(self) -> float:
-        """Gets latest environment timestamp from environment table."""
-        if not models.EnvironmentModel.objects.all():
-            return 0.0
-        else:
-            environment = models.EnvironmentModel.objects.latest()
-            return float(environment.timestamp.timestamp())
+        """Gets latest environment timestamp from environment history writer."""
+        return self.environment_writer.latest_timestamp
 
     @property
     def manager_modes(self) -> Dict[str, str]:
@@ -236,8 +318,22 @@ class CoordinatorManager(StateMachineManager):
         self.logger.info("Entered INIT")
 
         # Load local data files and stored db state
+        start_time = time.time()
         self.load_local_data_files()
+        stored_state_start_time = time.time()
         self.load_database_stored_state()
+        self.environment_writer.load()
+        self.timeseries.load()
+        self.init_timings["stored_state"] = round(
+            time.time() - stored_state_start_time, 3
+        )
+        self.init_timings["total"] = round(time.time() - start_time, 3)
+
+        # Report init phase timings
+        self.logger.info("Init timings (seconds): {}".format(self.init_timings))
+
+        # Invalidate config cache since data files were reloaded
+        self.config_cache.invalidate()
 
         # Transition to config mode on next state machine update
         self.mode = modes.CONFIG
@@ -247,6 +343,43 @@ class CoordinatorManager(StateMachineManager):
         config then transitions to setup mode."""
         self.logger.info("Entered CONFIG")
 
+        # Fill config cache
+        self.config_cache.load()
+
+        # Load device config
+        device_config = self.read_device_config()
+
+        # Check if config uuid changed, if so, adjust state. Differential reloads
+        # already cleared state for the managers they restart.
+        if self.config_uuid != device_config["uuid"] and self.config_diff != None:
+            self.config_uuid = device_config["uuid"]
+        elif self.config_uuid != device_config["uuid"]:
+            with self.state.lock:
+                self.state.peripherals = {}
+                self.state.controllers = {}
+                set_nested_dict_safely(
+                    self.state.environment,
+                    ["reported_sensor_stats"],
+                    {},
+                    self.state.lock,
+                )
+                self.state.sensor_stats.reset()
+                set_nested_dict_safely(
+                    self.state.environment, ["sensor", "reported"], {}, self.state.lock
+                )
+                self.state.mark_dirty("peripherals")
+                self.state.mark_dirty("controllers")
+                self.state.mark_dirty("environment")
+                self.config_uuid = device_config["uuid"]
+
+        # Transition to setup mode on next state machine update
+        self.mode = modes.SETUP
+
+    def read_device_config(self) -> Dict[str, Any]:
+        """Reads device config named in device config specifier file. If the
+        specifier file does not exist, writes 'unspecified' or the device type
+        from env to it."""
+
         # Check device config specifier file exists in repo
         try:
             with open(DEVICE_CONFIG_PATH) as f:
@@ -276,26 +409,9 @@ class CoordinatorManager(StateMachineManager):
 
         # Load device config
         self.logger.debug("Loading device config file: {}".format(config_name))
-        device_config = json.load(open("data/devices/{}.json".format(config_name)))
-
-        # Check if config uuid changed, if so, adjust state
-        if self.config_uuid != device_config["uuid"]:
-            with self.state.lock:
-                self.state.peripherals = {}
-                self.state.controllers = {}
-                set_nested_dict_safely(
-                    self.state.environment,
-                    ["reported_sensor_stats"],
-                    {},
-                    self.state.lock,
-                )
-                set_nested_dict_safely(
-                    self.state.environment, ["sensor", "reported"], {}, self.state.lock
-                )
-                self.config_uuid = device_config["uuid"]
-
-        # Transition to setup mode on next state machine update
-        self.mode = modes.SETUP
+        with open("data/devices/{}.json".format(config_name)) as f:
+            device_config = json.load(f)
+        return device_config  # type: ignore
 
     def run_setup_mode(self) -> None:
         """Runs setup mode. Creates and spawns recipe, peripheral, and 
@@ -312,18 +428,51 @@ class CoordinatorManager(StateMachineManager):
             self.network.spawn()
             self.upgrade.spawn()
 
+        # Initialize readiness barrier
+        self.readiness = ReadinessBarrier()
+        self.readiness.add("recipe", "recipe", self.recipe)
+
+        # Get managers to create, differential reloads only create added and
+        # changed managers and keep unchanged managers running
+        peripheral_names = None
+        controller_names = None
+        if self.config_diff != None:
+            peripheral_names = self.config_diff.peripherals.started
+            controller_names = self.config_diff.controllers.started
+
         # Create and spawn peripherals
         self.logger.debug("Creating and spawning peripherals")
-        self.create_peripherals()
-        self.spawn_peripherals()
+        peripherals = self.create_peripherals(peripheral_names)
+        for name, manager in peripherals.items():
+            self.readiness.add("peripherals", name, manager)
+        self.spawn_peripherals(peripherals)
 
         # Create and spawn controllers
-        self.create_controllers()
-        self.spawn_controllers()
+        controllers = self.create_controllers(controller_names)
+        for name, manager in controllers.items():
+            self.readiness.add("controllers", name, manager)
+        self.spawn_controllers(controllers)
+
+        # Wait for all threads to initialize, fall back to checking manager modes
+        # in case a manager changed modes without notifying observers
+        while not self.readiness.wait(timeout=1.0):
+            if self.all_managers_initialized():
+                break
+
+        # Report init times
+        self.logger.debug("Init times: {}".format(self.readiness.init_times))
+        with self.state.writing("device"):
+            self.state.device["init_times"] = self.readiness.init_times
 
-        # Wait for all threads to initialize
-        while not self.all_managers_initialized():
-            time.sleep(0.2)
+        # Report config reload time
+        if self.config_diff != None:
+            reload_time = round(time.time() - self.reload_start_time, 3)
+            self.logger.info(
+                "Reloaded config in {} seconds: {}".format(reload_time, self.config_diff)
+            )
+            with self.state.writing("device"):
+                self.state.device["reload_time"] = reload_time
+            self.config_diff = None
 
         # Unset new config flag
         self.new_config = False
@@ -337,12 +486,17 @@ class CoordinatorManager(StateMachineManager):
         self.logger.info("Entered NORMAL")
 
         while True:
-            # Overwrite system state in database every 100ms
+            # Store changed system state in database every snapshot interval
             self.update_state()
 
-            # Store environment state in every 10 minutes
-            if time.time() - self.latest_environment_timestamp > 60 * 10:
-                self.store_environment()
+            # Store environment state every environment history interval
+            self.environment_writer.update()
+
+            # Flush buffered sensor samples every time series flush interval
+            self.timeseries.update()
+
+            # Report scheduler and state lock metrics every metrics report interval
+            self.update_metrics()
 
             # Check for events
             self.check_events()
@@ -351,38 +505,86 @@ class CoordinatorManager(StateMachineManager):
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next state snapshot, environment snapshot, time series
+            # flush, events, or transitions
+            deadline = min(
+                self.snapshot_writer.next_write_time,
+                self.environment_writer.next_timestamp,
+                self.timeseries.next_flush_time,
+                self.next_metrics_report_time,
+            )
+            self.wait_until(deadline)
 
     def run_load_mode(self) -> None:
-        """Runs load mode, shutsdown peripheral and controller threads then transitions 
-        to config mode."""
+        """Runs load mode, diffs the current and new device configs, shutsdown 
+        peripheral and controller threads that were removed or changed then 
+        transitions to config mode. Unchanged managers keep running with their 
+        calibrations and sampling intervals."""
         self.logger.info("Entered LOAD")
 
+        # Diff current and new device configs
+        try:
+            self.config_diff = ConfigDiff(self.config_dict, self.read_device_config())
+        except Exception as e:
+            self.logger.exception("Unable to diff device configs, reloading all")
+            self.config_diff = None
+        self.logger.debug("Config diff: {}".format(self.config_diff))
+
+        # Get peripherals and controllers to shutdown
+        if self.config_diff == None:
+            peripheral_names = set(self.peripherals)
+            controller_names = set(self.controllers)
+        else:
+            peripheral_names = self.config_diff.peripherals.stopped  # type: ignore
+            controller_names = self.config_diff.controllers.stopped  # type: ignore
+        peripherals = {
+            name: manager
+            for name, manager in self.peripherals.items()
+            if name in peripheral_names
+        }
+        controllers = {
+            name: manager
+            for name, manager in self.controllers.items()
+            if name in controller_names
+        }
+
         # Shutdown peripherals and controllers
-        self.shutdown_peripheral_threads()
-        self.shutdown_controller_threads()
+        for manager in list(peripherals.values()) + list(controllers.values()):
+            manager.shutdown()
 
         # Initialize timeout parameters
         timeout = 10
-        start_time = time.time()
+        deadline = time.time() + timeout
 
-        # Loop forever
-        while True:
-
-            # Check if peripherals and controllers are shutdown
-            if self.all_peripherals_shutdown() and self.all_controllers_shutdown():
-                self.logger.debug("All peripherals and controllers shutdown")
-                break
+        # Wait for peripheral and controller threads or scheduler tasks to exit
+        managers = list(peripherals.values()) + list(controllers.values())
+        for manager in managers:
+            manager.join(max(deadline - time.time(), 0))
 
-            # Check for timeout
-            if time.time() - start_time > timeout:
+        # Check if peripherals and controllers are shutdown
+        for manager in managers:
+            if manager.is_alive():
                 self.logger.critical("Config threads did not shutdown")
                 self.mode = modes.ERROR
                 return
+        self.logger.debug(
+            "Shutdown {} peripherals and {} controllers".format(
+                len(peripherals), len(controllers)
+            )
+        )
+
+        # Remove shutdown managers and their state, restarted managers start from
+        # their configured defaults
+        if self.config_diff != None:
+            for name in peripherals:
+                del self.peripherals[name]
+                self.clear_peripheral_state(name)
+            for name in controllers:
+                del self.controllers[name]
+                self.clear_controller_state(name)
 
-            # Update every 100ms
-            time.sleep(0.1)
+        # Invalidate config cache
+        self.config_cache.invalidate()
 
         # Set new config flag
         self.new_config = True
@@ -400,6 +602,13 @@ class CoordinatorManager(StateMachineManager):
         self.recipe.shutdown()
         self.iot.shutdown()
 
+        # Stop scheduler workers, managers created in init run on a new scheduler
+        self.shutdown_scheduler()
+        self.manager_scheduler = self.create_scheduler()
+
+        # Flush buffered sensor samples
+        self.timeseries.update(force=True)
+
         # Transition to init mode on next state machine update
         self.mode = modes.INIT
 
@@ -422,155 +631,261 @@ class CoordinatorManager(StateMachineManager):
             if self.new_transition(modes.ERROR):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events and transitions
+            self.wait()
 
-    ##### SUPPORT FUNCTIONS ############################################################
+    def run_shutdown_mode(self) -> None:
+        """Runs shutdown mode. Shutsdown child threads and writes buffered sensor
+        samples and open rollups to the time series store."""
+        self.logger.info("Entered SHUTDOWN")
+
+        # Shutdown managers
+        self.shutdown_peripheral_threads()
+        self.shutdown_controller_threads()
+        self.shutdown_scheduler()
 
-    def update_state(self) -> None:
-        """Updates stored state in database. If state does not exist, creates it."""
+        # Flush buffered sensor samples and partial rollup buckets
+        self.timeseries.close()
 
-        # TODO: Move this to state manager
+        # Break out of run thread on next state machine update
+        self.is_shutdown = True
 
-        if not models.StateModel.objects.filter(pk=1).exists():
-            models.StateModel.objects.create(
-                id=1,
-                device=json.dumps(self.state.device),
-                recipe=json.dumps(self.state.recipe),
-                environment=json.dumps(self.state.environment),
-                peripherals=json.dumps(self.state.peripherals),
-                controllers=json.dumps(self.state.controllers),
-                iot=json.dumps(self.state.iot),
-                resource=json.dumps(self.state.resource),
-                connect=json.dumps(self.state.network),
-                upgrade=json.dumps(self.state.upgrade),
-            )
-        else:
-            models.StateModel.objects.filter(pk=1).update(
-                device=json.dumps(self.state.device),
-                recipe=json.dumps(self.state.recipe),
-                environment=json.dumps(self.state.environment),
-                peripherals=json.dumps(self.state.peripherals),
-                controllers=json.dumps(self.state.controllers),
-                iot=json.dumps(self.state.iot),
-                resource=json.dumps(self.state.resource),
-                connect=json.dumps(self.state.network),  # TODO: migrate this
-                upgrade=json.dumps(self.state.upgrade),
-            )
+    ##### SUPPORT FUNCTIONS ############################################################
+
+    def update_state(self, force: bool = False) -> None:
+        """Updates stored state in database. Only changed state sections are
+        serialized and written, at most once per snapshot interval."""
+        self.snapshot_writer.update(force=force)
+
+    @property
+    def next_metrics_report_time(self) -> float:
+        """Gets timestamp of next metrics report."""
+        return self.last_metrics_report_time + METRICS_REPORT_INTERVAL
+
+    def update_metrics(self) -> None:
+        """Updates state lock wait times, time series store usage, queued and
+        dropped log records, i2c handle and mux channel cache counters, i2c
+        circuit breaker states and, if enabled, per-task scheduler run times and
+        deadline misses in device state every metrics report interval."""
+        if time.time() < self.next_metrics_report_time:
+            return
+        self.last_metrics_report_time = time.time()
+        lock_metrics = self.state.lock_metrics
+        timeseries_metrics = self.timeseries.metrics
+        with self.state.writing("device"):
+            self.state.device["lock_metrics"] = lock_metrics
+            self.state.device["timeseries"] = timeseries_metrics
+            self.state.device["logging"] = log_queue.metrics
+            self.state.device["i2c"] = {
+                "handles": handle_pool.metrics,
+                "mux_cache": mux_cache.metrics,
+                "buses": bus_registry.metrics,
+                "breakers": breaker_registry.metrics,
+            }
+            if self.manager_scheduler != None:
+                scheduler_metrics = self.manager_scheduler.metrics  # type: ignore
+                self.state.device["scheduler"] = scheduler_metrics
 
     def load_local_data_files(self) -> None:
-        """ Loads local data files. """
+        """ Loads local data files. Files that are unchanged since they were last 
+            loaded are skipped. Changed files are loaded in a single transaction 
+            with the data file manifest so the manifest always matches the 
+            database. """
         self.logger.info("Loading local data files")
 
-        # Load files with no verification dependencies first
-        self.load_sensor_variables_file()
-        self.load_actuator_variables_file()
-        self.load_cultivars_file()
-        self.load_cultivation_methods_file()
+        # Load data file manifest
+        self.manifest.load()
+
+        # Load files with no verification dependencies first, then recipe files
+        # after sensor/actuator variables, cultivars, and cultivation methods since
+        # verification depends on them, then peripheral and controller setup files
+        # after sensor/actuator variables, then device config files after
+        # peripheral setups
+        phases = [
+            ("sensor_variables", self.load_sensor_variables_file),
+            ("actuator_variables", self.load_actuator_variables_file),
+            ("cultivars", self.load_cultivars_file),
+            ("cultivation_methods", self.load_cultivation_methods_file),
+            ("recipes", self.load_recipe_files),
+            ("peripheral_setups", self.load_peripheral_setup_files),
+            ("controller_setups", self.load_controller_setup_files),
+            ("device_configs", self.load_device_config_files),
+        ]
 
-        # Load recipe files after sensor/actuator variables, cultivars, and
-        # cultivation methods since verification depends on them
-        self.load_recipe_files()
+        # Load files and manifest in one transaction
+        with transaction.atomic():
+            for name, load_function in phases:
+                start_time = time.time()
+                load_function()
+                self.init_timings[name] = round(time.time() - start_time, 3)
+            self.manifest.save()
+
+    def load_variables_file(
+        self, model: Any, filepath: str, schema_filepath: str
+    ) -> None:
+        """ Loads a variables file into database after removing all existing 
+            entries if file or schema changed since last load. """
+
+        # Check if file or schema changed
+        filepaths = [filepath, schema_filepath]
+        if self.manifest.get_changed_files(filepaths) == []:
+            self.logger.debug("Skipping unchanged file: {}".format(filepath))
+            return
 
-        # Load peripheral setup files after sensor/actuator variable since verification
-        # depends on them
-        self.load_peripheral_setup_files()
+        # Load variables and schema
+        variables = json.load(open(filepath))
+        variables_schema = json.load(open(schema_filepath))
 
-        # Load controller setup files after sensor/actuator variable since verification
-        # depends on them
-        self.load_controller_setup_files()
+        # Validate variables with schema
+        jsonschema.validate(variables, variables_schema)
 
-        # Load device config after peripheral setups since verification
-        # depends on  them
-        self.load_device_config_files()
+        # Delete variables table
+        model.objects.all().delete()
 
-    def load_sensor_variables_file(self) -> None:
-        """ Loads sensor variables file into database after removing all 
-            existing entries. """
-        self.logger.debug("Loading sensor variables file")
+        # Create variables table
+        model.objects.bulk_create(
+            [
+                model(key=variable["key"], json=json.dumps(variable))
+                for variable in variables
+            ]
+        )
 
-        # Load sensor variables and schema
-        sensor_variables = json.load(open(SENSOR_VARIABLES_PATH))
-        sensor_variables_schema = json.load(open(SENSOR_VARIABLES_SCHEMA_PATH))
+        # Update manifest
+        self.manifest.update(filepaths)
 
-        # Validate sensor variables with schema
-        jsonschema.validate(sensor_variables, sensor_variables_schema)
+    def load_named_file(self, model: Any, filepath: str, schema_filepath: str) -> None:
+        """ Loads a file of uuid and name keyed entries into database after 
+            removing all existing entries if file or schema changed since last 
+            load. """
 
-        # Delete sensor variables tables
-        models.SensorVariableModel.objects.all().delete()
+        # Check if file or schema changed
+        filepaths = [filepath, schema_filepath]
+        if self.manifest.get_changed_files(filepaths) == []:
+            self.logger.debug("Skipping unchanged file: {}".format(filepath))
+            return
 
-        # Create sensor variables table
-        for sensor_variable in sensor_variables:
-            models.SensorVariableModel.objects.create(json=json.dumps(sensor_variable))
+        # Load entries and schema
+        entries = json.load(open(filepath))
+        schema = json.load(open(schema_filepath))
+
+        # Validate entries with schema
+        jsonschema.validate(entries, schema)
+
+        # Delete table
+        model.objects.all().delete()
+
+        # Create table
+        model.objects.bulk_create(
+            [
+                model(uuid=entry["uuid"], name=entry["name"], json=json.dumps(entry))
+                for entry in entries
+            ]
+        )
+
+        # Update manifest
+        self.manifest.update(filepaths)
+
+    def load_setup_files(
+        self, model: Any, pattern: str, schema_filepath: str
+    ) -> None:
+        """ Loads setup or config files matching pattern into database by creating 
+            new entries after deleting existing entries if any file changed since 
+            last load. Only changed files are validated unless schema changed. """
+
+        # Check if any files or schema changed
+        filepaths = sorted(glob.glob(pattern))
+        changed_filepaths = self.manifest.get_changed_files(filepaths, pattern)
+        schema_changed = self.manifest.get_changed_files([schema_filepath]) != []
+        if changed_filepaths == [] and not schema_changed:
+            self.logger.debug("Skipping unchanged files: {}".format(pattern))
+            return
 
-    def load_actuator_variables_file(self) -> None:
-        """ Loads actuator variables file into database after removing all 
-            existing entries. """
-        self.logger.debug("Loading actuator variables file")
+        # Get schema
+        schema = json.load(open(schema_filepath))
 
-        # Load actuator variables and schema
-        actuator_variables = json.load(open(ACTUATOR_VARIABLES_PATH))
-        actuator_variables_schema = json.load(open(ACTUATOR_VARIABLES_SCHEMA_PATH))
+        # Get setups, validate changed setups with schema
+        setups = []
+        for filepath in filepaths:
+            setup = json.load(open(filepath))
+            if schema_changed or filepath in changed_filepaths:
+                self.logger.debug("Validating file: {}".format(filepath))
+                jsonschema.validate(setup, schema)
+            setups.append(setup)
 
-        # Validate actuator variables with schema
-        jsonschema.validate(actuator_variables, actuator_variables_schema)
+        # Delete all entries from database
+        model.objects.all().delete()
 
-        # Delete actuator variables tables
-        models.ActuatorVariableModel.objects.all().delete()
+        # Create entries in database
+        model.objects.bulk_create(
+            [
+                model(uuid=setup["uuid"], name=setup["name"], json=json.dumps(setup))
+                for setup in setups
+            ]
+        )
 
-        # Create actuator variables table
-        for actuator_variable in actuator_variables:
-            models.ActuatorVariableModel.objects.create(
-                json=json.dumps(actuator_variable)
-            )
+        # Update manifest
+        self.manifest.update(filepaths + [schema_filepath], pattern)
+
+    def load_sensor_variables_file(self) -> None:
+        """ Loads sensor variables file into database after removing all 
+            existing entries. """
+        self.logger.debug("Loading sensor variables file")
+        self.load_variables_file(
+            models.SensorVariableModel,
+            SENSOR_VARIABLES_PATH,
+            SENSOR_VARIABLES_SCHEMA_PATH,
+        )
+
+    def load_actuator_variables_file(self) -> None:
+        """ Loads actuator variables file into database after removing all 
+            existing entries. """
+        self.logger.debug("Loading actuator variables file")
+        self.load_variables_file(
+            models.ActuatorVariableModel,
+            ACTUATOR_VARIABLES_PATH,
+            ACTUATOR_VARIABLES_SCHEMA_PATH,
+        )
 
     def load_cultivars_file(self) -> None:
         """ Loads cultivars file into database after removing all 
             existing entries."""
         self.logger.debug("Loading cultivars file")
-
-        # Load cultivars and schema
-        cultivars = json.load(open(CULTIVARS_PATH))
-        cultivars_schema = json.load(open(CULTIVARS_SCHEMA_PATH))
-
-        # Validate cultivars with schema
-        jsonschema.validate(cultivars, cultivars_schema)
-
-        # Delete cultivars tables
-        models.CultivarModel.objects.all().delete()
-
-        # Create cultivars table
-        for cultivar in cultivars:
-            models.CultivarModel.objects.create(json=json.dumps(cultivar))
+        self.load_named_file(models.CultivarModel, CULTIVARS_PATH, CULTIVARS_SCHEMA_PATH)
 
     def load_cultivation_methods_file(self) -> None:
         """ Loads cultivation methods file into database after removing all 
             existing entries. """
         self.logger.debug("Loading cultivation methods file")
-
-        # Load cultivation methods and schema
-        cultivation_methods = json.load(open(CULTIVATION_METHODS_PATH))
-        cultivation_methods_schema = json.load(open(CULTIVATION_METHODS_SCHEMA_PATH))
-
-        # Validate cultivation methods with schema
-        jsonschema.validate(cultivation_methods, cultivation_methods_schema)
-
-        # Delete cultivation methods tables
-        models.CultivationMethodModel.objects.all().delete()
-
-        # Create cultivation methods table
-        for cultivation_method in cultivation_methods:
-            models.CultivationMethodModel.objects.create(
-                json=json.dumps(cultivation_method)
-            )
+        self.load_named_file(
+            models.CultivationMethodModel,
+            CULTIVATION_METHODS_PATH,
+            CULTIVATION_METHODS_SCHEMA_PATH,
+        )
 
     def load_recipe_files(self) -> None:
         """Loads recipe files into database via recipe manager create or update 
-        function."""
+        function. Unchanged recipe files are skipped unless a file recipe 
+        verification depends on was reloaded."""
         self.logger.debug("Loading recipe files")
 
+        # Check if recipe verification dependencies changed
+        dependencies = [
+            SENSOR_VARIABLES_PATH,
+            ACTUATOR_VARIABLES_PATH,
+            CULTIVARS_PATH,
+            CULTIVATION_METHODS_PATH,
+        ]
+        reload = any(
+            filepath in self.manifest.updated_filepaths for filepath in dependencies
+        )
+
         # Get recipes
         for filepath in glob.glob(RECIPES_PATH):
+
+            # Check if recipe file changed
+            if not reload and self.manifest.get_changed_files([filepath]) == []:
+                continue
+
             self.logger.debug("Loading recipe file: {}".format(filepath))
             with open(filepath, "r") as f:
                 json_ = f.read().replace("\n", "")
@@ -579,96 +894,44 @@ class CoordinatorManager(StateMachineManager):
                     filename = filepath.split("/")[-1]
                     error = "Unable to load {} -> {}".format(filename, message)
                     self.logger.error(error)
+                else:
+                    self.manifest.update([filepath])
 
     def load_peripheral_setup_files(self) -> None:
         """Loads peripheral setup files from codebase into database by creating new 
         entries after deleting existing entries. Verification depends on sensor and 
         actuator variables."""
         self.logger.info("Loading peripheral setup files")
-
-        # Get peripheral setups
-        peripheral_setups = []
-        for filepath in glob.glob(PERIPHERAL_SETUP_FILES_PATH):
-            self.logger.debug("Loading peripheral setup file: {}".format(filepath))
-            peripheral_setups.append(json.load(open(filepath)))
-
-        # Get get peripheral setup schema
         # TODO: Finish schema
-        peripheral_setup_schema = json.load(open(PERIPHERAL_SETUP_SCHEMA_PATH))
-
-        # Validate peripheral setups with schema
-        for peripheral_setup in peripheral_setups:
-            jsonschema.validate(peripheral_setup, peripheral_setup_schema)
-
-        # Delete all peripheral setup entries from database
-        models.PeripheralSetupModel.objects.all().delete()
-
         # TODO: Validate peripheral setup variables with database variables
-
-        # Create peripheral setup entries in database
-        for peripheral_setup in peripheral_setups:
-            models.PeripheralSetupModel.objects.create(
-                json=json.dumps(peripheral_setup)
-            )
+        self.load_setup_files(
+            models.PeripheralSetupModel,
+            PERIPHERAL_SETUP_FILES_PATH,
+            PERIPHERAL_SETUP_SCHEMA_PATH,
+        )
 
     def load_controller_setup_files(self) -> None:
         """Loads controller setup files from codebase into database by creating new 
         entries after deleting existing entries. Verification depends on sensor and 
         actuator variables."""
         self.logger.info("Loading controller setup files")
-
-        # Get controller setups
-        controller_setups = []
-        for filepath in glob.glob(CONTROLLER_SETUP_FILES_PATH):
-            self.logger.debug("Loading controller setup file: {}".format(filepath))
-            controller_setups.append(json.load(open(filepath)))
-
-        # Get get controller setup schema
-        controller_setup_schema = json.load(open(CONTROLLER_SETUP_SCHEMA_PATH))
-
-        # Validate peripheral setups with schema
-        for controller_setup in controller_setups:
-            jsonschema.validate(controller_setup, controller_setup_schema)
-
-        # Delete all peripheral setup entries from database
-        models.ControllerSetupModel.objects.all().delete()
-
         # TODO: Validate controller setup variables with database variables
-
-        # Create peripheral setup entries in database
-        for controller_setup in controller_setups:
-            models.ControllerSetupModel.objects.create(
-                json=json.dumps(controller_setup)
-            )
+        self.load_setup_files(
+            models.ControllerSetupModel,
+            CONTROLLER_SETUP_FILES_PATH,
+            CONTROLLER_SETUP_SCHEMA_PATH,
+        )
 
     def load_device_config_files(self) -> None:
         """Loads device config files from codebase into database by creating new entries 
         after deleting existing entries. Verification depends on peripheral setups. """
         self.logger.info("Loading device config files")
-
-        # Get devices
-        device_configs = []
-        for filepath in glob.glob(DEVICE_CONFIG_FILES_PATH):
-            self.logger.debug("Loading device config file: {}".format(filepath))
-            device_configs.append(json.load(open(filepath)))
-
-        # Get get device config schema
         # TODO: Finish schema (see optional objects)
-        device_config_schema = json.load(open(DEVICE_CONFIG_SCHEMA_PATH))
-
-        # Validate device configs with schema
-        for device_config in device_configs:
-            jsonschema.validate(device_config, device_config_schema)
-
         # TODO: Validate device config with peripherals
         # TODO: Validate device config with varibles
-
-        # Delete all device config entries from database
-        models.DeviceConfigModel.objects.all().delete()
-
-        # Create device config entry if new or update existing
-        for device_config in device_configs:
-            models.DeviceConfigModel.objects.create(json=json.dumps(device_config))
+        self.load_setup_files(
+            models.DeviceConfigModel, DEVICE_CONFIG_FILES_PATH, DEVICE_CONFIG_SCHEMA_PATH
+        )
 
     def load_database_stored_state(self) -> None:
         """ Loads stored state from database if it exists. """
@@ -697,133 +960,197 @@ class CoordinatorManager(StateMachineManager):
 
         # Load peripherals state
         stored_peripherals_state = json.loads(stored_state.peripherals)
-        for peripheral_name in stored_peripherals_state:
-            self.state.peripherals[peripheral_name] = {}
-            if "stored" in stored_peripherals_state[peripheral_name]:
-                stored = stored_peripherals_state[peripheral_name]["stored"]
-                self.state.peripherals[peripheral_name]["stored"] = stored
+        with self.state.writing("peripherals"):
+            for peripheral_name in stored_peripherals_state:
+                self.state.peripherals[peripheral_name] = {}
+                if "stored" in stored_peripherals_state[peripheral_name]:
+                    stored = stored_peripherals_state[peripheral_name]["stored"]
+                    self.state.peripherals[peripheral_name]["stored"] = stored
 
         # Load controllers state
         stored_controllers_state = json.loads(stored_state.controllers)
-        for controller_name in stored_controllers_state:
-            self.state.controllers[controller_name] = {}
-            if "stored" in stored_controllers_state[controller_name]:
-                stored = stored_controllers_state[controller_name]["stored"]
-                self.state.controllers[controller_name]["stored"] = stored
+        with self.state.writing("controllers"):
+            for controller_name in stored_controllers_state:
+                self.state.controllers[controller_name] = {}
+                if "stored" in stored_controllers_state[controller_name]:
+                    stored = stored_controllers_state[controller_name]["stored"]
+                    self.state.controllers[controller_name]["stored"] = stored
 
         # Load iot state
         stored_iot_state = json.loads(stored_state.iot)
-        self.state.iot["stored"] = stored_iot_state.get("stored", {})
+        with self.state.writing("iot"):
+            self.state.iot["stored"] = stored_iot_state.get("stored", {})
 
     def store_environment(self) -> None:
         """ Stores current environment state in environment table. """
-        models.EnvironmentModel.objects.create(state=self.state.environment)
-
-    def create_peripherals(self) -> None:
-        """ Creates peripheral managers. """
+        self.environment_writer.store()
+
+    def create_peripherals(
+        self, names: Optional[Set[str]] = None
+    ) -> Dict[str, StateMachineManager]:
+        """ Creates peripheral managers concurrently. Peripherals on the same bus
+            share a lock and a semaphore that limits how many initialize at once.
+            If names are provided, only creates those peripherals and keeps the
+            rest. Returns created peripherals. """
         self.logger.info("Creating peripheral managers")
 
         # Verify peripherals are configured
-        if self.config_dict.get("peripherals") == None:
+        config_dict = self.config_dict
+        if config_dict.get("peripherals") == None:
             self.logger.info("No peripherals configured")
-            return
-
-        # Set var type
-        mux_simulator: Optional[MuxSimulator]
-
-        # Inintilize simulation parameters
-        if os.environ.get("SIMULATE") == "true":
-            simulate = True
-            mux_simulator = MuxSimulator()
-        else:
-            simulate = False
-            mux_simulator = None
+            return {}
 
-        # Create thread locks
-        i2c_lock = threading.RLock()
+        # Inintilize simulation parameters and shared resources, shared resources
+        # are kept when only some peripherals are created
+        simulate = os.environ.get("SIMULATE") == "true"
+        if names == None:
+            self.peripherals = {}
+            self.mux_simulator = MuxSimulator() if simulate else None
+            self.bus_semaphores = {}
+        elif simulate and self.mux_simulator == None:
+            self.mux_simulator = MuxSimulator()
 
         # Create peripheral managers
-        self.peripherals = {}
-        peripheral_config_dicts = self.config_dict.get("peripherals", {})
-        for peripheral_config_dict in peripheral_config_dicts:
-            self.logger.debug("Creating {}".format(peripheral_config_dict["name"]))
-
-            # Get peripheral setup dict
-            peripheral_uuid = peripheral_config_dict["uuid"]
-            peripheral_setup_dict = self.get_peripheral_setup_dict(peripheral_uuid)
-
-            # Verify valid peripheral config dict
-            if peripheral_setup_dict == {}:
-                self.logger.critical(
-                    "Invalid peripheral uuid in device "
-                    "config. Validator should have caught this."
+        peripheral_config_dicts = [
+            peripheral_config_dict
+            for peripheral_config_dict in config_dict.get("peripherals", [])
+            if names == None or peripheral_config_dict["name"] in names  # type: ignore
+        ]
+        with concurrent.futures.ThreadPoolExecutor(PERIPHERAL_CREATE_WORKERS) as pool:
+            futures = [
+                pool.submit(
+                    self.create_peripheral_in_worker,
+                    peripheral_config_dict,
+                    simulate,
+                    self.mux_simulator,
                 )
+                for peripheral_config_dict in peripheral_config_dicts
+            ]
+            peripherals = [future.result() for future in futures]
+
+        # Limit concurrent initializations per bus
+        created: Dict[str, StateMachineManager] = {}
+        for peripheral in peripherals:
+            if peripheral == None:
                 continue
-
-            # Get peripheral module and class name
-            module_name = (
-                "device.peripherals.modules." + peripheral_setup_dict["module_name"]
+            bus = getattr(peripheral, "bus", None)
+            if bus not in self.bus_semaphores:
+                semaphore = threading.Semaphore(PERIPHERAL_BUS_CONCURRENCY)
+                self.bus_semaphores[bus] = semaphore
+            peripheral.init_semaphore = self.bus_semaphores[bus]  # type: ignore
+            self.set_scheduler(peripheral)  # type: ignore
+            self.peripherals[peripheral.name] = peripheral  # type: ignore
+            created[peripheral.name] = peripheral  # type: ignore
+        return created
+
+    def create_peripheral_in_worker(
+        self,
+        peripheral_config_dict: Dict[str, Any],
+        simulate: bool,
+        mux_simulator: Optional[MuxSimulator],
+    ) -> Optional[StateMachineManager]:
+        """ Creates peripheral manager on a pool thread. Closes the database
+            connection of the thread afterwards since pool threads exit without
+            closing connections they opened. """
+        try:
+            return self.create_peripheral(
+                peripheral_config_dict, simulate, mux_simulator
             )
-            class_name = peripheral_setup_dict["class_name"]
-
-            # Import peripheral library
-            module_instance = __import__(module_name, fromlist=[class_name])
-            class_instance = getattr(module_instance, class_name)
-
-            # Create peripheral manager
-            peripheral_name = peripheral_config_dict["name"]
-
-            peripheral = class_instance(
-                name=peripheral_name,
-                state=self.state,
-                config=peripheral_config_dict,
-                simulate=simulate,
-                i2c_lock=i2c_lock,
-                mux_simulator=mux_simulator,
-                coordinator=self,
+        finally:
+            connection.close()
+
+    def create_peripheral(
+        self,
+        peripheral_config_dict: Dict[str, Any],
+        simulate: bool,
+        mux_simulator: Optional[MuxSimulator],
+    ) -> Optional[StateMachineManager]:
+        """ Creates peripheral manager with the lock of its i2c bus. Returns None
+            if peripheral setup does not exist. """
+        self.logger.debug("Creating {}".format(peripheral_config_dict["name"]))
+
+        # Get peripheral setup dict
+        peripheral_uuid = peripheral_config_dict["uuid"]
+        peripheral_setup_dict = self.get_peripheral_setup_dict(peripheral_uuid)
+
+        # Verify valid peripheral config dict
+        if peripheral_setup_dict == {}:
+            self.logger.critical(
+                "Invalid peripheral uuid in device "
+                "config. Validator should have caught this."
             )
-            self.peripherals[peripheral_name] = peripheral
+            return None
+
+        # Get peripheral module and class name
+        module_name = (
+            "device.peripherals.modules." + peripheral_setup_dict["module_name"]
+        )
+        class_name = peripheral_setup_dict["class_name"]
+
+        # Import peripheral library
+        module_instance = __import__(module_name, fromlist=[class_name])
+        class_instance = getattr(module_instance, class_name)
+
+        # Get lock of peripheral bus, peripherals on independent buses run in
+        # parallel
+        parameters = peripheral_config_dict.get("parameters", {})
+        communication = parameters.get("communication") or {}
+        i2c_lock = bus_registry.get_lock(parse_bus(communication.get("bus")), simulate)
+
+        # Create peripheral manager
+        peripheral_name = peripheral_config_dict["name"]
+        peripheral = class_instance(
+            name=peripheral_name,
+            state=self.state,
+            config=peripheral_config_dict,
+            simulate=simulate,
+            i2c_lock=i2c_lock,
+            mux_simulator=mux_simulator,
+            coordinator=self,
+        )
+        return peripheral  # type: ignore
 
     def get_peripheral_setup_dict(self, uuid: str) -> Dict[str, Any]:
-        """Gets peripheral setup dict for uuid in peripheral setup table."""
-        if not models.PeripheralSetupModel.objects.filter(uuid=uuid).exists():
-            return {}
-        else:
-            json_ = models.PeripheralSetupModel.objects.get(uuid=uuid).json
-        peripheral_setup_dict = json.loads(json_)
-        return peripheral_setup_dict  # type: ignore
+        """Gets read-only peripheral setup dict for uuid from config cache."""
+        return self.config_cache.get_peripheral_setup(uuid)
 
     def get_controller_setup_dict(self, uuid: str) -> Dict[str, Any]:
-        """Gets controller setup dict for uuid in peripheral setup table."""
-        if not models.ControllerSetupModel.objects.filter(uuid=uuid).exists():
-            return {}
-        else:
-            json_ = models.ControllerSetupModel.objects.get(uuid=uuid).json
-        controller_setup_dict = json.loads(json_)
-        return controller_setup_dict  # type: ignore
-
-    def spawn_peripherals(self) -> None:
-        """ Spawns peripherals. """
-        if self.peripherals == {}:
+        """Gets read-only controller setup dict for uuid from config cache."""
+        return self.config_cache.get_controller_setup(uuid)
+
+    def spawn_peripherals(
+        self, peripherals: Optional[Dict[str, StateMachineManager]] = None
+    ) -> None:
+        """ Spawns peripherals, defaults to all peripherals. """
+        if peripherals == None:
+            peripherals = self.peripherals
+        if peripherals == {}:
             self.logger.info("No peripheral threads to spawn")
         else:
             self.logger.info("Spawning peripherals")
-            for name, manager in self.peripherals.items():
+            for name, manager in peripherals.items():  # type: ignore
                 manager.spawn()
 
-    def create_controllers(self) -> None:
-        """ Creates controller managers. """
+    def create_controllers(
+        self, names: Optional[Set[str]] = None
+    ) -> Dict[str, StateMachineManager]:
+        """ Creates controller managers. If names are provided, only creates 
+            those controllers and keeps the rest. Returns created controllers. """
         self.logger.info("Creating controller managers")
 
         # Verify controllers are configured
         if self.config_dict.get("controllers") == None:
             self.logger.info("No controllers configured")
-            return
+            return {}
 
         # Create controller managers
-        self.controllers = {}
+        if names == None:
+            self.controllers = {}
+        created: Dict[str, StateMachineManager] = {}
         controller_config_dicts = self.config_dict.get("controllers", {})
         for controller_config_dict in controller_config_dicts:
+            if names != None and controller_config_dict["name"] not in names:  # type: ignore
+                continue
             self.logger.debug("Creating {}".format(controller_config_dict["name"]))
 
             # Get controller setup dict
@@ -853,18 +1180,63 @@ class CoordinatorManager(StateMachineManager):
             controller_manager = class_instance(
                 controller_name, self.state, controller_config_dict
             )
+            self.set_scheduler(controller_manager)
             self.controllers[controller_name] = controller_manager
-
-    def spawn_controllers(self) -> None:
-        """ Spawns controllers. """
-        if self.controllers == {}:
+            created[controller_name] = controller_manager
+        return created
+
+    def create_scheduler(self) -> Optional[Scheduler]:
+        """Creates and starts peripheral and controller scheduler if enabled."""
+        if SCHEDULER_WORKERS < 1:
+            return None
+        scheduler = Scheduler(
+            num_workers=SCHEDULER_WORKERS, max_step_time=SCHEDULER_MAX_STEP_TIME
+        )
+        scheduler.start()
+        return scheduler
+
+    def shutdown_scheduler(self, timeout: float = 10) -> None:
+        """Waits for scheduled peripherals and controllers to shutdown then stops
+        scheduler workers."""
+        if self.manager_scheduler == None:
+            return
+        deadline = time.time() + timeout
+        managers = list(self.peripherals.values()) + list(self.controllers.values())
+        for manager in managers:
+            manager.join(max(deadline - time.time(), 0))
+        self.manager_scheduler.shutdown(max(deadline - time.time(), 0))  # type: ignore
+        self.manager_scheduler = None
+
+    def set_scheduler(self, manager: StateMachineManager) -> None:
+        """Runs manager on shared scheduler if enabled and supported by manager."""
+        if self.manager_scheduler != None and manager.is_schedulable:
+            manager.scheduler = self.manager_scheduler
+
+    def spawn_controllers(
+        self, controllers: Optional[Dict[str, StateMachineManager]] = None
+    ) -> None:
+        """ Spawns controllers, defaults to all controllers. """
+        if controllers == None:
+            controllers = self.controllers
+        if controllers == {}:
             self.logger.info("No controller threads to spawn")
         else:
             self.logger.info("Spawning controllers")
-            for name, manager in self.controllers.items():
+            for name, manager in controllers.items():  # type: ignore
                 self.logger.debug("Spawning {}".format(name))
                 manager.spawn()
 
+    def clear_peripheral_state(self, name: str) -> None:
+        """Clears peripheral state and reported sensor values of peripheral."""
+        with self.state.writing("peripherals"):
+            self.state.peripherals.pop(name, None)
+        self.state.clear_environment_reported_sensor_values(name)
+
+    def clear_controller_state(self, name: str) -> None:
+        """Clears controller state."""
+        with self.state.writing("controllers"):
+            self.state.controllers.pop(name, None)
+
     def all_managers_initialized(self) -> bool:
         """Checks if all managers have initialized."""
         if self.recipe.mode == modes.INIT:
@@ -902,14 +1274,14 @@ class CoordinatorManager(StateMachineManager):
     def all_peripherals_shutdown(self) -> bool:
         """Check if all peripherals are shutdown."""
         for name, manager in self.peripherals.items():
-            if manager.thread.is_alive():
+            if manager.is_alive():
                 return False
         return True
 
     def all_controllers_shutdown(self) -> bool:
         """Check if all controllers are shutdown."""
         for name, manager in self.controllers.items():
-            if manager.thread.is_alive():
+            if manager.is_alive():
                 return False
         return True
 
@@ -1014,6 +1386,12 @@ class CoordinatorManager(StateMachineManager):
         # Get request parameters
         filename = request.get("filename")
 
+        # Start reload timer
+        self.reload_start_time = time.time()
+
+        # Invalidate config cache
+        self.config_cache.invalidate()
+
         # Write config filename to device config path
         with open(DEVICE_CONFIG_PATH, "w") as f:
             f.write(str(filename) + "\n")
@@ -0,0 +1,116 @@
+# Import standard python modules
+import hashlib, fnmatch
+
+# Import python types
+from typing import Dict, List, Optional, Set
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.logger import Logger
+
+
+class DataFileManifest:
+    """Tracks content hashes of local data files in the data file table so data
+    files that have not changed since they were last loaded into the database
+    can skip validation and import on startup. Hashes are stored in the same
+    database as the imported entries so a fresh database always reloads."""
+
+    def __init__(self) -> None:
+        """Initializes data file manifest."""
+
+        # Initialize logger
+        self.logger = Logger("DataFileManifest", "coordinator")
+
+        # Initialize stored and current file digests
+        self.stored_digests: Dict[str, str] = {}
+        self.digests: Dict[str, str] = {}
+
+        # Initialize pending manifest changes
+        self.updated_digests: Dict[str, str] = {}
+        self.removed_filepaths: Set[str] = set()
+
+    @property
+    def updated_filepaths(self) -> Set[str]:
+        """Gets filepaths updated since manifest was loaded."""
+        return set(self.updated_digests) | self.removed_filepaths
+
+    def load(self) -> None:
+        """Loads stored file digests from data file table."""
+        self.stored_digests = dict(
+            models.DataFileModel.objects.values_list("path", "digest")
+        )
+        self.digests = {}
+        self.updated_digests = {}
+        self.removed_filepaths = set()
+
+    def get_digest(self, filepath: str) -> str:
+        """Gets sha256 content digest for file, computed once per load."""
+        if filepath not in self.digests:
+            with open(filepath, "rb") as f:
+                self.digests[filepath] = hashlib.sha256(f.read()).hexdigest()
+        return self.digests[filepath]
+
+    def get_removed_files(self, filepaths: List[str], pattern: str) -> List[str]:
+        """Gets stored filepaths matching glob pattern that no longer exist."""
+        removed = []
+        for filepath in self.stored_digests:
+            if fnmatch.fnmatch(filepath, pattern) and filepath not in filepaths:
+                removed.append(filepath)
+        return removed
+
+    def get_changed_files(
+        self, filepaths: List[str], pattern: Optional[str] = None
+    ) -> List[str]:
+        """Gets filepaths whose content changed since they were last stored. If a
+        glob pattern is provided, also gets stored filepaths matching the pattern
+        that were removed."""
+        changed = []
+        for filepath in filepaths:
+            if self.stored_digests.get(filepath) != self.get_digest(filepath):
+                changed.append(filepath)
+        if pattern != None:
+            changed += self.get_removed_files(filepaths, pattern)  # type: ignore
+        return changed
+
+    def update(self, filepaths: List[str], pattern: Optional[str] = None) -> None:
+        """Updates manifest with current digests of filepaths. If a glob pattern
+        is provided, also removes stored filepaths matching the pattern that no
+        longer exist. Changes are written on save."""
+        for filepath in filepaths:
+            digest = self.get_digest(filepath)
+            if self.stored_digests.get(filepath) != digest:
+                self.updated_digests[filepath] = digest
+        if pattern != None:
+            removed = self.get_removed_files(filepaths, pattern)  # type: ignore
+            self.removed_filepaths.update(removed)
+
+    def save(self) -> None:
+        """Writes updated and removed digests to data file table."""
+        if not self.updated_digests and not self.removed_filepaths:
+            return
+        self.logger.debug(
+            "Saving manifest, updated: {}, removed: {}".format(
+                len(self.updated_digests), len(self.removed_filepaths)
+            )
+        )
+
+        # Delete stale entries
+        stale_filepaths = set(self.updated_digests) | self.removed_filepaths
+        models.DataFileModel.objects.filter(path__in=stale_filepaths).delete()
+
+        # Create updated entries
+        models.DataFileModel.objects.bulk_create(
+            [
+                models.DataFileModel(path=filepath, digest=digest)
+                for filepath, digest in self.updated_digests.items()
+            ]
+        )
+
+        # Update stored digests
+        self.stored_digests.update(self.updated_digests)
+        for filepath in self.removed_filepaths:
+            self.stored_digests.pop(filepath, None)
+        self.updated_digests = {}
+        self.removed_filepaths = set()
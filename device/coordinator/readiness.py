@@ -0,0 +1,70 @@
+# Import standard python modules
+import threading, time
+
+# Import python types
+from typing import Dict, Optional, Set, Tuple, Any
+
+# Import device utilities
+from device.utilities.statemachine import modes
+from device.utilities.statemachine.manager import StateMachineManager
+
+
+class ReadinessBarrier:
+    """Tracks managers that are initializing and wakes waiters as soon as the
+    last manager leaves init mode. Records how long each manager took to leave
+    init mode, measured from when it was added to the barrier."""
+
+    def __init__(self) -> None:
+        """Initializes readiness barrier."""
+        self.condition = threading.Condition()
+        self.pending: Set[Tuple[str, str]] = set()
+        self.start_times: Dict[Tuple[str, str], float] = {}
+        self.init_times: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def is_ready(self) -> bool:
+        """Checks if all added managers have left init mode."""
+        with self.condition:
+            return len(self.pending) == 0
+
+    def add(self, group: str, name: str, manager: StateMachineManager) -> None:
+        """Adds manager to barrier. Managers already out of init mode are not
+        waited on."""
+        key = (group, name)
+
+        # Observe manager mode transitions
+        def observer(mode: str) -> None:
+            if mode != modes.INIT:
+                self.remove(key, manager, observer)
+
+        with self.condition:
+            self.start_times[key] = time.time()
+            self.pending.add(key)
+            manager.mode_observers.append(observer)
+
+        # Check if manager already left init mode
+        if manager.mode != modes.INIT:
+            self.remove(key, manager, observer)
+
+    def remove(
+        self, key: Tuple[str, str], manager: StateMachineManager, observer: Any
+    ) -> None:
+        """Removes manager from barrier, records init time, and wakes waiters if
+        no managers are pending."""
+        with self.condition:
+            if observer in manager.mode_observers:
+                manager.mode_observers.remove(observer)
+            if key not in self.pending:
+                return
+            self.pending.remove(key)
+            group, name = key
+            init_time = round(time.time() - self.start_times[key], 3)
+            self.init_times.setdefault(group, {})[name] = init_time
+            if len(self.pending) == 0:
+                self.condition.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until all managers have left init mode or timeout expires.
+        Returns true if all managers are ready."""
+        with self.condition:
+            return self.condition.wait_for(lambda: len(self.pending) == 0, timeout)
@@ -0,0 +1,161 @@
+# Import standard python modules
+import json, time
+
+# Import python types
+from typing import Dict, Any
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.state.main import State
+from device.utilities.logger import Logger
+
+# Initialize state section to state table column mapping
+SECTION_COLUMNS = {
+    "device": "device",
+    "recipe": "recipe",
+    "environment": "environment",
+    "peripherals": "peripherals",
+    "controllers": "controllers",
+    "iot": "iot",
+    "resource": "resource",
+    "network": "connect",  # TODO: migrate this
+    "upgrade": "upgrade",
+}
+
+
+class StateSnapshotWriter:
+    """Persists shared state to the state table. Only serializes sections whose
+    version counter changed since the last write and only updates columns whose
+    serialized value changed. Bursts of changes are coalesced into at most one
+    write per interval. All sections are serialized again every reconcile
+    interval so a section whose last write failed is written again."""
+
+    def __init__(
+        self, state: State, interval: float = 1.0, reconcile_interval: float = 10.0
+    ) -> None:
+        """Initializes snapshot writer."""
+
+        # Initialize parameters
+        self.state = state
+        self.interval = interval
+        self.reconcile_interval = reconcile_interval
+
+        # Initialize logger
+        self.logger = Logger("StateSnapshotWriter", "coordinator")
+
+        # Initialize written section versions and serialized values
+        self.written_versions: Dict[str, int] = {}
+        self.written_jsons: Dict[str, str] = {}
+
+        # Initialize timing variables
+        self.start_time = time.time()
+        self.last_write_time = 0.0
+        self.last_reconcile_time = 0.0
+
+        # Initialize counters
+        self.write_count = 0
+        self.skip_count = 0
+        self.bytes_written = 0
+
+    @property
+    def next_write_time(self) -> float:
+        """Gets earliest timestamp of next database write."""
+        return self.last_write_time + self.interval
+
+    @property
+    def write_rate(self) -> float:
+        """Gets average number of database writes per second since start."""
+        elapsed = time.time() - self.start_time
+        if elapsed <= 0:
+            return 0.0
+        return self.write_count / elapsed
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets writer metrics."""
+        return {
+            "write_count": self.write_count,
+            "skip_count": self.skip_count,
+            "bytes_written": self.bytes_written,
+            "write_rate_hz": round(self.write_rate, 3),
+        }
+
+    def update(self, force: bool = False) -> bool:
+        """Writes changed state sections to database if write interval elapsed.
+        Returns true if a write occurred."""
+
+        # Coalesce writes into one per interval
+        now = time.time()
+        if not force and now - self.last_write_time < self.interval:
+            return False
+        self.last_write_time = now
+
+        # Check if sections need a full reconcile
+        reconcile = force or now - self.last_reconcile_time > self.reconcile_interval
+        if reconcile:
+            self.last_reconcile_time = now
+
+        # Serialize changed sections
+        changed = self.serialize_changed_sections(reconcile)
+
+        # Check for changes
+        if changed == {}:
+            self.skip_count += 1
+            return False
+
+        # Write changed columns to database
+        self.write(changed)
+        return True
+
+    def serialize_changed_sections(self, reconcile: bool) -> Dict[str, str]:
+        """Serializes sections with new versions, or all sections if reconciling.
+        Returns dict of column names to serialized values that differ from the
+        last written values."""
+        changed = {}
+        for section, column in SECTION_COLUMNS.items():
+
+            # Check if section version changed
+            version = self.state.get_version(section)
+            if not reconcile and self.written_versions.get(section) == version:
+                continue
+
+            # Serialize section snapshot so writers are not blocked
+            json_ = json.dumps(self.state.snapshot(section))
+            self.written_versions[section] = version
+
+            # Check if serialized value changed
+            if self.written_jsons.get(column) == json_:
+                continue
+            changed[column] = json_
+
+        return changed
+
+    def write(self, changed: Dict[str, str]) -> None:
+        """Writes changed columns to the state table. Creates the state entry with
+        all sections if it does not exist."""
+
+        # Update existing entry
+        queryset = models.StateModel.objects.filter(pk=1)
+        num_updated = queryset.update(**changed)
+
+        # Create entry with empty sections if it does not exist, then write all
+        # sections with the same update as later writes since json fields decode
+        # strings passed to a new entry with a primary key
+        if num_updated == 0:
+            self.logger.debug("Creating stored state")
+            empty_sections: Dict[str, Any] = {c: {} for c in SECTION_COLUMNS.values()}
+            models.StateModel.objects.create(id=1, **empty_sections)
+            for section, column in SECTION_COLUMNS.items():
+                if column not in changed:
+                    changed[column] = json.dumps(self.state.snapshot(section))
+            queryset.update(**changed)
+
+        # Record written values
+        self.written_jsons.update(changed)
+        num_bytes = sum(len(json_) for json_ in changed.values())
+
+        # Update counters
+        self.write_count += 1
+        self.bytes_written += num_bytes
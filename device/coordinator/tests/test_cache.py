@@ -0,0 +1,64 @@
+# Import standard python libraries
+import os, sys, json, uuid, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import coordinator elements
+from device.coordinator.cache import ConfigCache
+
+
+def create_peripheral_setup(name: str = "Test Setup") -> str:
+    uuid_ = str(uuid.uuid4())
+    json_ = json.dumps({"uuid": uuid_, "name": name})
+    models.PeripheralSetupModel.objects.create(json=json_)
+    return uuid_
+
+
+def test_init() -> None:
+    cache = ConfigCache()
+
+
+def test_get_peripheral_setup_loads_cache() -> None:
+    uuid_ = create_peripheral_setup()
+    cache = ConfigCache()
+    setup = cache.get_peripheral_setup(uuid_)
+    assert cache.is_loaded
+    assert setup["name"] == "Test Setup"
+    cache.get_peripheral_setup(uuid_)
+    assert cache.hit_count == 2
+    assert cache.miss_count == 0
+
+
+def test_get_peripheral_setup_is_read_only() -> None:
+    uuid_ = create_peripheral_setup()
+    cache = ConfigCache()
+    setup = cache.get_peripheral_setup(uuid_)
+    with pytest.raises(TypeError):
+        setup["name"] = "Modified"
+
+
+def test_get_peripheral_setup_falls_back_to_database() -> None:
+    cache = ConfigCache()
+    cache.load()
+    uuid_ = create_peripheral_setup()
+    setup = cache.get_peripheral_setup(uuid_)
+    assert setup["name"] == "Test Setup"
+    assert cache.miss_count == 1
+
+
+def test_get_unknown_setup_returns_empty_dict() -> None:
+    cache = ConfigCache()
+    assert cache.get_controller_setup(str(uuid.uuid4())) == {}
+
+
+def test_invalidate() -> None:
+    uuid_ = create_peripheral_setup()
+    cache = ConfigCache()
+    cache.load()
+    cache.invalidate()
+    assert not cache.is_loaded
+    assert cache.peripheral_setups == {}
@@ -0,0 +1,69 @@
+# Import standard python libraries
+import os, sys, copy, json
+from typing import Any, Dict
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.accessors import freeze
+
+# Import coordinator elements
+from device.coordinator.diff import ConfigDiff, ManagerDiff
+
+
+CONFIG: Dict[str, Any] = {
+    "uuid": "a",
+    "peripherals": [
+        {"name": "SHT25-Top", "uuid": "1", "parameters": {"setup": {}, "bus": 2}},
+        {"name": "LED-Panel", "uuid": "2", "parameters": {"setup": {}, "bus": 2}},
+    ],
+    "controllers": [{"name": "Heater", "uuid": "3", "parameters": {"gain": 1}}],
+}
+
+
+def test_unchanged() -> None:
+    diff = ConfigDiff(CONFIG, copy.deepcopy(CONFIG))
+    assert diff.peripherals.unchanged == {"SHT25-Top", "LED-Panel"}
+    assert diff.peripherals.stopped == set()
+    assert diff.peripherals.started == set()
+    assert diff.controllers.unchanged == {"Heater"}
+
+
+def test_changed_parameters_and_uuid() -> None:
+    new_config = copy.deepcopy(CONFIG)
+    new_config["uuid"] = "b"
+    new_config["peripherals"][0]["parameters"]["bus"] = 3
+    new_config["controllers"][0]["uuid"] = "4"
+    diff = ConfigDiff(CONFIG, new_config)
+    assert diff.peripherals.changed == {"SHT25-Top"}
+    assert diff.peripherals.unchanged == {"LED-Panel"}
+    assert diff.controllers.changed == {"Heater"}
+
+
+def test_added_and_removed() -> None:
+    new_config = copy.deepcopy(CONFIG)
+    new_config["peripherals"][1]["name"] = "LED-Panel-Bottom"
+    del new_config["controllers"]
+    diff = ConfigDiff(CONFIG, new_config)
+    assert diff.peripherals.added == {"LED-Panel-Bottom"}
+    assert diff.peripherals.removed == {"LED-Panel"}
+    assert diff.peripherals.stopped == {"LED-Panel"}
+    assert diff.peripherals.started == {"LED-Panel-Bottom"}
+    assert diff.controllers.removed == {"Heater"}
+
+
+def test_frozen_config() -> None:
+    diff = ManagerDiff(freeze(CONFIG)["peripherals"], CONFIG["peripherals"])
+    assert diff.unchanged == {"SHT25-Top", "LED-Panel"}
+
+
+def test_device_configs() -> None:
+    root = os.environ["PROJECT_ROOT"]
+    with open(root + "/data/devices/pfc4-v0.1.0.json") as f:
+        old_config = json.load(f)
+    with open(root + "/data/devices/pfc4-v0.1.0-no-camera.json") as f:
+        new_config = json.load(f)
+    diff = ConfigDiff(old_config, new_config)
+    assert len(diff.peripherals.removed) > 0
+    assert len(diff.peripherals.unchanged) > 0
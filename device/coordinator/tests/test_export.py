@@ -0,0 +1,90 @@
+# Import standard python libraries
+import os, sys, gzip, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import coordinator elements
+from device.coordinator.export import EnvironmentExporter, flatten, parse_timestamp
+
+
+def create_environment(temperatures: dict) -> models.EnvironmentModel:
+    instantaneous = {"air_temperature_celsius": temperatures}
+    state = {"reported_sensor_stats": {"individual": {"instantaneous": instantaneous}}}
+    return models.EnvironmentModel.objects.create(state=state)
+
+
+def test_flatten() -> None:
+    state = {
+        "reported_sensor_stats": {
+            "individual": {
+                "instantaneous": {
+                    "air_temperature_celsius": {"SHT25-Top": 21.5},
+                    "air_humidity_percent": {"SHT25-Top": 40},
+                }
+            }
+        }
+    }
+    assert flatten(state) == {
+        "air_temperature_celsius.SHT25-Top": 21.5,
+        "air_humidity_percent.SHT25-Top": 40,
+    }
+    assert flatten({}) == {}
+
+
+def test_export_csv() -> None:
+    create_environment({"SHT25-Top": 21.5})
+    create_environment({"SHT25-Top": 22.5, "SHT25-Bottom": 20.0})
+    exporter = EnvironmentExporter()
+    lines = "".join(exporter.csv()).splitlines()
+    assert lines[0] == (
+        "timestamp,id,air_temperature_celsius.SHT25-Bottom,"
+        "air_temperature_celsius.SHT25-Top"
+    )
+    assert lines[1].endswith(",,21.5")
+    assert lines[2].endswith(",20.0,22.5")
+    assert exporter.row_count == 2
+
+
+def test_export_resumes_after_timestamp() -> None:
+    first = create_environment({"SHT25-Top": 21.5})
+    create_environment({"SHT25-Top": 22.5})
+    exporter = EnvironmentExporter(after=first.timestamp)
+    lines = "".join(exporter.csv()).splitlines()
+    assert len(lines) == 2
+    assert lines[1].endswith(",22.5")
+
+
+def test_export_resume_keeps_columns() -> None:
+    first = create_environment({"SHT25-Top": 21.5, "SHT25-Bottom": 20.0})
+    create_environment({"SHT25-Top": 22.5})
+    header = "".join(EnvironmentExporter().csv()).splitlines()[0]
+    exporter = EnvironmentExporter(after=first.timestamp, after_id=first.id)
+    lines = "".join(exporter.csv()).splitlines()
+    assert lines[0] == header
+    assert lines[1].endswith(",,22.5")
+
+
+def test_export_resumes_after_row_with_same_timestamp() -> None:
+    first = create_environment({"SHT25-Top": 21.5})
+    second = create_environment({"SHT25-Top": 22.5})
+    third = create_environment({"SHT25-Top": 23.5})
+    models.EnvironmentModel.objects.update(timestamp=first.timestamp)
+    lines = "".join(EnvironmentExporter().csv()).splitlines()
+    timestamp, id_ = lines[2].split(",")[:2]
+    assert parse_timestamp(timestamp) == first.timestamp
+    assert int(id_) == second.id
+    exporter = EnvironmentExporter(after=parse_timestamp(timestamp), after_id=int(id_))
+    lines = "".join(exporter.csv()).splitlines()
+    assert len(lines) == 2
+    assert lines[1].startswith("{},{},".format(timestamp, third.id))
+
+
+def test_export_csv_gzip() -> None:
+    create_environment({"SHT25-Top": 21.5})
+    text = "".join(EnvironmentExporter().csv())
+    data = b"".join(EnvironmentExporter().csv_gzip())
+    assert gzip.decompress(data).decode("utf-8") == text
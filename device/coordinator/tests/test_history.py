@@ -0,0 +1,67 @@
+# Import standard python libraries
+import os, sys, time, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.state.main import State
+
+# Import coordinator elements
+from device.coordinator.history import EnvironmentHistoryWriter
+
+
+def test_init() -> None:
+    writer = EnvironmentHistoryWriter(State())
+
+
+def test_load_empty_table() -> None:
+    writer = EnvironmentHistoryWriter(State())
+    writer.load()
+    assert writer.latest_timestamp == 0.0
+
+
+def test_load_latest_timestamp() -> None:
+    models.EnvironmentModel.objects.create(state={})
+    writer = EnvironmentHistoryWriter(State())
+    writer.load()
+    assert abs(writer.latest_timestamp - time.time()) < 60
+
+
+def test_update_stores_snapshot_when_due() -> None:
+    writer = EnvironmentHistoryWriter(State(), interval=600)
+    writer.load()
+    assert writer.update() == True
+    assert writer.update() == False
+    assert writer.store_count == 1
+    assert models.EnvironmentModel.objects.count() == 1
+
+
+def test_update_skips_unchanged_environment() -> None:
+    state = State()
+    writer = EnvironmentHistoryWriter(state, interval=0)
+    writer.load()
+    assert writer.update() == True
+    assert writer.update() == False
+    assert writer.skip_count == 1
+    state.set_environment_desired_sensor_value("temperature", 20)
+    assert writer.update() == True
+    assert writer.store_count == 2
+
+
+def test_skipped_snapshot_keeps_latest_timestamp() -> None:
+    state = State()
+    writer = EnvironmentHistoryWriter(state, interval=0)
+    writer.load()
+    assert writer.update() == True
+    latest_timestamp = writer.latest_timestamp
+    time.sleep(0.01)
+    assert writer.update() == False
+    assert writer.latest_timestamp == latest_timestamp
+    assert writer.checked_timestamp > latest_timestamp
+    state.set_environment_desired_sensor_value("temperature", 21)
+    assert writer.update() == True
+    assert writer.latest_timestamp > latest_timestamp
@@ -0,0 +1,68 @@
+# Import standard python libraries
+import os, sys, pathlib, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import coordinator elements
+from device.coordinator.manifest import DataFileManifest
+
+
+def write_file(tmp_path: pathlib.Path, name: str, content: str) -> str:
+    filepath = str(tmp_path / name)
+    with open(filepath, "w") as f:
+        f.write(content)
+    return filepath
+
+
+def test_init() -> None:
+    manifest = DataFileManifest()
+
+
+def test_new_file_is_changed(tmp_path: pathlib.Path) -> None:
+    filepath = write_file(tmp_path, "a.json", "{}")
+    manifest = DataFileManifest()
+    manifest.load()
+    assert manifest.get_changed_files([filepath]) == [filepath]
+
+
+def test_saved_file_is_unchanged(tmp_path: pathlib.Path) -> None:
+    filepath = write_file(tmp_path, "a.json", "{}")
+    manifest = DataFileManifest()
+    manifest.load()
+    manifest.update([filepath])
+    manifest.save()
+    assert models.DataFileModel.objects.count() == 1
+    manifest = DataFileManifest()
+    manifest.load()
+    assert manifest.get_changed_files([filepath]) == []
+
+
+def test_modified_file_is_changed(tmp_path: pathlib.Path) -> None:
+    filepath = write_file(tmp_path, "a.json", "{}")
+    manifest = DataFileManifest()
+    manifest.load()
+    manifest.update([filepath])
+    manifest.save()
+    write_file(tmp_path, "a.json", '{"a": 1}')
+    manifest.load()
+    assert manifest.get_changed_files([filepath]) == [filepath]
+
+
+def test_removed_file_is_changed(tmp_path: pathlib.Path) -> None:
+    pattern = str(tmp_path / "*.json")
+    filepath_a = write_file(tmp_path, "a.json", "{}")
+    filepath_b = write_file(tmp_path, "b.json", "{}")
+    manifest = DataFileManifest()
+    manifest.load()
+    manifest.update([filepath_a, filepath_b], pattern)
+    manifest.save()
+    os.remove(filepath_b)
+    manifest.load()
+    assert manifest.get_changed_files([filepath_a], pattern) == [filepath_b]
+    manifest.update([filepath_a], pattern)
+    manifest.save()
+    assert models.DataFileModel.objects.count() == 1
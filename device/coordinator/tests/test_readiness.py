@@ -0,0 +1,42 @@
+# Import standard python libraries
+import os, sys, threading, time, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.statemachine import modes
+from device.utilities.statemachine.manager import StateMachineManager
+
+# Import coordinator elements
+from device.coordinator.readiness import ReadinessBarrier
+
+
+def test_init() -> None:
+    barrier = ReadinessBarrier()
+    assert barrier.is_ready
+
+
+def test_add_initialized_manager() -> None:
+    barrier = ReadinessBarrier()
+    manager = StateMachineManager()
+    manager.mode = modes.NORMAL
+    barrier.add("peripherals", "Test", manager)
+    assert barrier.is_ready
+    assert manager.mode_observers == []
+
+
+def test_wait_wakes_when_last_manager_leaves_init() -> None:
+    barrier = ReadinessBarrier()
+    manager_a = StateMachineManager()
+    manager_b = StateMachineManager()
+    barrier.add("peripherals", "A", manager_a)
+    barrier.add("controllers", "B", manager_b)
+    manager_a.mode = modes.NORMAL
+    assert not barrier.wait(timeout=0)
+    timer = threading.Timer(0.05, lambda: setattr(manager_b, "mode", modes.ERROR))
+    timer.start()
+    assert barrier.wait(timeout=5)
+    assert "A" in barrier.init_times["peripherals"]
+    assert barrier.init_times["controllers"]["B"] >= 0.05
+    assert manager_a.mode_observers == []
@@ -0,0 +1,56 @@
+# Import standard python libraries
+import os, sys, json, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import app models
+from app import models
+
+# Import device utilities
+from device.utilities.state.main import State
+
+# Import coordinator elements
+from device.coordinator.snapshots import StateSnapshotWriter
+
+
+def test_init() -> None:
+    writer = StateSnapshotWriter(State())
+
+
+def test_update_creates_stored_state() -> None:
+    state = State()
+    writer = StateSnapshotWriter(state)
+    assert writer.update(force=True) == True
+    stored_state = models.StateModel.objects.get(pk=1)
+    assert json.loads(stored_state.device) == state.device
+    assert json.loads(stored_state.upgrade) == state.upgrade
+    assert writer.write_count == 1
+    assert writer.bytes_written == sum(len(j) for j in writer.written_jsons.values())
+
+
+def test_update_skips_unchanged_state() -> None:
+    state = State()
+    writer = StateSnapshotWriter(state, interval=0, reconcile_interval=3600)
+    writer.update(force=True)
+    assert writer.update() == False
+    assert writer.write_count == 1
+    assert writer.skip_count == 1
+
+
+def test_update_writes_only_changed_sections() -> None:
+    state = State()
+    writer = StateSnapshotWriter(state, interval=0, reconcile_interval=3600)
+    writer.update(force=True)
+    state.set_environment_desired_sensor_value("air_temperature_celsius", 21)
+    changed = writer.serialize_changed_sections(reconcile=False)
+    assert list(changed.keys()) == ["environment"]
+
+
+def test_update_coalesces_within_interval() -> None:
+    state = State()
+    writer = StateSnapshotWriter(state, interval=3600, reconcile_interval=3600)
+    writer.update(force=True)
+    state.set_environment_desired_sensor_value("air_temperature_celsius", 22)
+    assert writer.update() == False
+    assert writer.write_count == 1
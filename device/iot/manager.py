@@ -1,5 +1,5 @@
 # Import standard python modules
-import os, copy, glob, json, shutil, time, datetime
+import os, glob, json, shutil, time, datetime
 import paho.mqtt.client as mqtt
 import urllib.request
 
@@ -11,6 +11,7 @@ from device.utilities.statemachine import manager
 from device.utilities.state.main import State
 from device.utilities import logger, accessors, system
 from device.utilities.iot import registration
+from device.utilities.communication.i2c.metrics import i2c_metrics
 
 # Import device managers
 from device.recipe.manager import RecipeManager
@@ -31,6 +32,11 @@ DATA_DIR = settings.DATA_PATH
 IMAGES_DIR = DATA_DIR + "/images/"
 STORED_IMAGES_DIR = DATA_DIR + "/images/stored/"
 
+# Initialize published environment variables path
+ENVIRONMENT_VARIABLES_PATH = (
+    "environment.reported_sensor_stats.individual.instantaneous"
+)
+
 
 class IotManager(manager.StateMachineManager):
     """Manages IoT communications to the Google cloud backend MQTT service."""
@@ -105,7 +111,13 @@ class IotManager(manager.StateMachineManager):
 
         # Initialize recipe modes
         self.previous_recipe_mode = recipe_modes.NORECIPE
-        
+
+        # Subscribe to environment variable changes
+        self.is_environment_changed = True
+        self.environment_subscription = self.state.subscribe(
+            ENVIRONMENT_VARIABLES_PATH, callback=self.on_environment_change
+        )
+
 
     ##### INTERNAL STATE DECORATORS ####################################################
 
@@ -117,7 +129,7 @@ class IotManager(manager.StateMachineManager):
     @is_connected.setter
     def is_connected(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("iot"):
             self.state.iot["is_connected"] = value
 
     @property
@@ -128,7 +140,7 @@ class IotManager(manager.StateMachineManager):
     @is_registered.setter
     def is_registered(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("iot"):
             self.state.iot["is_registered"] = value
 
     @property
@@ -139,7 +151,7 @@ class IotManager(manager.StateMachineManager):
     @device_id.setter
     def device_id(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("iot"):
             self.state.iot["device_id"] = value
 
     @property
@@ -150,7 +162,7 @@ class IotManager(manager.StateMachineManager):
     @verification_code.setter
     def verification_code(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("iot"):
             self.state.iot["verification_code"] = value
 
     @property
@@ -162,7 +174,7 @@ class IotManager(manager.StateMachineManager):
     @prev_message_id.setter
     def prev_message_id(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("iot"):
             if "stored" not in self.state.iot:
                 self.state.iot["stored"] = {}
             self.state.iot["stored"]["prev_message_id"] = value
@@ -175,7 +187,7 @@ class IotManager(manager.StateMachineManager):
     @received_message_count.setter
     def received_message_count(self, value: int) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("iot"):
             self.state.iot["received_message_count"] = value
 
     @property
@@ -186,7 +198,7 @@ class IotManager(manager.StateMachineManager):
     @published_message_count.setter
     def published_message_count(self, value: int) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("iot"):
             self.state.iot["published_message_count"] = value
     
     @property
@@ -331,8 +343,8 @@ class IotManager(manager.StateMachineManager):
             if self.new_transition(modes.DISCONNECTED):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events or transitions, service pubsub at least every 100ms
+            self.wait(0.1)
 
     def run_connected_mode(self) -> None:
         """Runs connected mode."""
@@ -379,8 +391,8 @@ class IotManager(manager.StateMachineManager):
             if self.new_transition(modes.CONNECTED):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events or transitions, service pubsub at least every 100ms
+            self.wait(0.1)
 
     ##### HELPER FUNCTIONS ##################################################
 
@@ -432,7 +444,7 @@ class IotManager(manager.StateMachineManager):
         }
 
         # Publish boot message
-        self.logger.debug("Boot message: {}".format(message))
+        self.logger.debug("Boot message: {}", message)
         self.pubsub.publish_boot_message(message)
 
     def publish_system_summary(self) -> None:
@@ -446,6 +458,10 @@ class IotManager(manager.StateMachineManager):
         recipe_time_remaining_minutes = self.state.recipe.get("time_remaining_minutes")
         recipe_time_remaining_string = self.state.recipe.get("time_remaining_string")
         recipe_time_elapsed_string = self.state.recipe.get("time_elapsed_string")
+        environment_summary = accessors.get_nested_dict_safely(
+            self.state.snapshot("environment"),
+            ["reported_sensor_stats", "group", "average"],
+        )
         message = {
             "timestamp": time.strftime("%FT%XZ", time.gmtime()),
             "IP": self.state.network.get("ip_address"),
@@ -461,32 +477,46 @@ class IotManager(manager.StateMachineManager):
             "recipe_time_remaining_minutes": recipe_time_remaining_minutes,
             "recipe_time_remaining_string": recipe_time_remaining_string,
             "recipe_time_elapsed_string": recipe_time_elapsed_string,
+            "environment_summary": environment_summary,
+            "i2c_summary": i2c_metrics.summary(),
         }
 
         # Publish system summary as a status message
         self.pubsub.publish_status_message(message)
 
+    def on_environment_change(self, path: str, value: Any) -> None:
+        """Flags environment variables as changed since last publish."""
+        self.is_environment_changed = True
+
     def publish_environment_variables(self, publish_all: bool = False) -> None:
         """Publishes environment variables."""
-        self.logger.debug(f"Publishing {'all' if publish_all else 'changed'} environment variables")
+        self.logger.debug(
+            "Publishing {} environment variables", "all" if publish_all else "changed"
+        )
+
+        # Skip comparing variables if none changed since last publish
+        if not publish_all and not self.is_environment_changed:
+            return
+        self.is_environment_changed = False
 
         # Get environment variables
         keys = ["reported_sensor_stats", "individual", "instantaneous"]
         environment_variables = accessors.get_nested_dict_safely(
-            self.state.environment, keys
+            self.state.snapshot("environment"), keys
         )
 
         # Ensure environment variables is a dict
         if environment_variables == None:
             environment_variables = {}
 
-        # For each value, only publish the ones that have changed.
+        # For each value, only publish the ones that have changed. Snapshot values
+        # are read-only so they are stored without copying.
         for name, value in environment_variables.items():
             if publish_all:
-                self.prev_environment_variables[name] = copy.deepcopy(value)
+                self.prev_environment_variables[name] = value
                 self.pubsub.publish_environment_variable(name, value)
             elif self.prev_environment_variables.get(name) != value:
-                self.prev_environment_variables[name] = copy.deepcopy(value)
+                self.prev_environment_variables[name] = value
                 self.pubsub.publish_environment_variable(name, value)
 
     def publish_images(self) -> None:
@@ -498,7 +528,7 @@ class IotManager(manager.StateMachineManager):
         published_image_count = 0
         try:
             image_file_list = glob.glob(IMAGES_DIR + "*.png")
-            self.logger.debug("Found {} images".format(len(image_file_list)))
+            self.logger.debug("Found {} images", len(image_file_list))
             for image_file in image_file_list:
 
                 # TODO: Fix this for fswebcam (i.e. non-picam)
@@ -515,7 +545,7 @@ class IotManager(manager.StateMachineManager):
                 # If the size is < 200KB, then it is garbage we delete
                 # (based on the 1280x1024 average file size)
                 if fsize < 500:  # in KB
-                    self.logger.debug(f"Removing {image_file} due to small size")
+                    self.logger.debug("Removing {} due to small size", image_file)
                     os.remove(image_file)
                     continue
 
@@ -537,7 +567,7 @@ class IotManager(manager.StateMachineManager):
             message = "Unable to publish images, unhandled exception: {}".format(e)
             self.logger.exception(message)
         
-        self.logger.debug(f"Published {published_image_count} image(s)")
+        self.logger.debug("Published {} image(s)", published_image_count)
 
     ##### DEVICE EVENT FUNCTIONS ##############################################
 
@@ -589,9 +619,7 @@ class IotManager(manager.StateMachineManager):
 
         # NOTE: This method needs to get deprecated...
 
-        self.logger.debug(
-            "Processing config message, payload: {}".format(message.payload)
-        )
+        self.logger.debug("Processing config message, payload: {}", message.payload)
 
         # Decode and parse message
         try:
@@ -814,9 +842,7 @@ def on_disconnect(client: mqtt.Client, ref_self: IotManager, return_code: int) -
     """Callback for when a device disconnects from mqtt broker."""
     error = "{}: {}".format(return_code, mqtt.error_string(return_code))
     ref_self.logger.error(error)
-    ref_self.logger.debug(
-        "Trying mqtt port: {}".format(str(ref_self.pubsub.next_port()))
-    )
+    ref_self.logger.debug("Trying mqtt port: {}", str(ref_self.pubsub.next_port()))
     ref_self.is_connected = False
     ref_self.mode = modes.DISCONNECTED
 
@@ -851,7 +877,7 @@ def on_message(
 
 def on_log(client: mqtt.Client, ref_self: IotManager, level: str, buf: str) -> None:
     """Paho callback when mqtt broker receives a log message."""
-    ref_self.logger.debug("Received broker log: '{}' {}".format(buf, level))
+    ref_self.logger.debug("Received broker log: '{}' {}", buf, level)
 
 
 def on_subscribe(
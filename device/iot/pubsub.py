@@ -108,7 +108,7 @@ class PubSub:
         test_telemetry_topic = os.environ.get("IOT_TEST_TOPIC")
         if test_telemetry_topic is not None:
             self.telemetry_topic = "/devices/{}/{}".format(self.device_id, test_telemetry_topic)
-            self.logger.debug("Publishing to test topic: {}".format(self.telemetry_topic))
+            self.logger.debug("Publishing to test topic: {}", self.telemetry_topic)
         else:
             self.telemetry_topic = "/devices/{}/events".format(self.device_id)
 
@@ -212,7 +212,9 @@ class PubSub:
         self.publish_command_reply(STATUS_MESSAGE, message_json)
 
     def publish_recipe_event(self, device_id: str, action: str, name: str) -> None:
-        self.logger.debug(f"Publishing recipe event {action} {name} message from {device_id}.")
+        self.logger.debug(
+            "Publishing recipe event {} {} message from {}.", action, name, device_id
+        )
 
         # Check if client is initialized
         if not self.is_initialized:
@@ -269,7 +271,11 @@ class PubSub:
         self, variable_name: str, values_dict: Dict
     ) -> None:
         """Publish a single environment variable."""
-        self.logger.debug(f"Publishing environment variable message: {variable_name}, value: {values_dict}")
+        self.logger.debug(
+            "Publishing environment variable message: {}, value: {}",
+            variable_name,
+            values_dict,
+        )
 
         # Check if client is initialized
         if not self.is_initialized:
@@ -370,7 +376,7 @@ class PubSub:
             # our firebase cloud function that puts the image in the GCP 
             # storage bucket.
             res = subprocess.run(['curl', '--silent', URL, '-F', DATA])
-            self.logger.debug("Uploaded file: {}".format(upload_file_name))
+            self.logger.debug("Uploaded file: {}", upload_file_name)
 
             # Publish a message indicating that we uploaded the image to the
             # public bucket written by the firebase cloud function, and we need
@@ -85,7 +85,7 @@ class NetworkManager(manager.StateMachineManager):
             self.reconnected = False
 
         # Update connection status in shared state
-        with self.state.lock:
+        with self.state.writing("network"):
             self.state.network["is_connected"] = value
 
     @property
@@ -97,7 +97,7 @@ class NetworkManager(manager.StateMachineManager):
     def wifi_ssids(self, value: List[Dict[str, str]]) -> None:
         """Safely updates value in shared state."""
         self.logger.debug("Wifi SSIDs: {}".format(value))
-        with self.state.lock:
+        with self.state.writing("network"):
             self.state.network["wifi_ssids"] = value
 
     @property
@@ -108,7 +108,7 @@ class NetworkManager(manager.StateMachineManager):
     @ip_address.setter
     def ip_address(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("network"):
             self.state.network["ip_address"] = value
 
     @property
@@ -119,7 +119,7 @@ class NetworkManager(manager.StateMachineManager):
     @access_point_enabled.setter
     def access_point_enabled(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("network"):
             self.state.network["access_point_enabled"] = value
 
     ##### EXTERNAL STATE DECORATORS ####################################################
@@ -215,8 +215,8 @@ class NetworkManager(manager.StateMachineManager):
             #         # Update connection information
             #         self.update_connection()
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next update, events, or transitions
+            self.wait_until(last_update_time + update_interval)
 
     def run_disconnected_mode(self) -> None:
         """Runs normal mode."""
@@ -253,8 +253,8 @@ class NetworkManager(manager.StateMachineManager):
             #         # Re-enable access point
             #         self._enable_raspi_access_point()
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next update, events, or transitions
+            self.wait_until(last_update_time + update_interval)
 
         # TODO: SRMoore: DO we need this in Balena?
         # If completing raspi registration, give the iot manager enough time to
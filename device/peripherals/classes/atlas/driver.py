@@ -92,7 +92,7 @@ class AtlasDriver:
         returns a `still processing` response code. Read retry is enabled 
         by default. Returns response string on success or raises exception 
         on error."""
-        self.logger.debug("Processing command: {}".format(command_string))
+        self.logger.debug("Processing command: {}", command_string)
 
         try:
             # Send command to device
@@ -117,7 +117,7 @@ class AtlasDriver:
         response string on success or raises exception on error."""
 
         # Give device time to process
-        self.logger.debug("Waiting for {} seconds".format(process_seconds))
+        self.logger.debug("Waiting for {} seconds", process_seconds)
         time.sleep(process_seconds)
 
         # Read device dataSet
@@ -164,7 +164,7 @@ class AtlasDriver:
 
         # Successfully read response
         response_message = str(data[1:].decode("utf-8").strip("\x00"))
-        self.logger.debug("Response:`{}`".format(response_message))
+        self.logger.debug("Response:`{}`", response_message)
         return response_message
 
     def read_info(self, retry: bool = True) -> Info:
@@ -0,0 +1,226 @@
+# Import standard python modules
+import time, collections, statistics
+
+# Import python types
+from typing import Any, Deque, Dict, List, Optional
+
+# Initialize default filter window sizes
+DEFAULT_MEDIAN_SIZE = 5
+DEFAULT_HAMPEL_WINDOW = 7
+
+# Initialize hampel scale factor, scales median absolute deviation to a standard
+# deviation estimate for normally distributed samples
+HAMPEL_SCALE = 1.4826
+
+
+class Filter:
+    """Parent class of sensor value filters. Filters keep a bounded history of
+    samples and count samples they reject or replace."""
+
+    type = "none"
+
+    def __init__(self) -> None:
+        """Initializes filter."""
+        self.samples = 0
+        self.rejected = 0
+
+    def __repr__(self) -> str:
+        return "{}(samples={}, rejected={})".format(
+            type(self).__name__, self.samples, self.rejected
+        )
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets filter metrics."""
+        return {"type": self.type, "samples": self.samples, "rejected": self.rejected}
+
+    def apply(self, value: float, timestamp: float) -> Optional[float]:
+        """Filters value, returns filtered value or None if value is rejected."""
+        self.samples += 1
+        filtered = self.filter(value, timestamp)
+        if self.is_rejected(value, filtered):
+            self.rejected += 1
+        return filtered
+
+    def filter(self, value: float, timestamp: float) -> Optional[float]:
+        """Filters value."""
+        return value
+
+    def is_rejected(self, value: float, filtered: Optional[float]) -> bool:
+        """Checks if value was rejected or replaced by filter."""
+        return filtered != value
+
+    def reset(self) -> None:
+        """Clears sample history, counters are kept."""
+        pass
+
+
+class MedianFilter(Filter):
+    """Reports median of the last size samples. Single sample spikes never reach
+    the reported value. Every sample is smoothed, so samples are only counted as
+    rejected when they differ from the median by more than threshold."""
+
+    type = "median"
+
+    def __init__(
+        self, size: int = DEFAULT_MEDIAN_SIZE, threshold: Optional[float] = None
+    ) -> None:
+        """Initializes median filter, without a threshold no samples are counted
+        as rejected."""
+        super().__init__()
+        if size < 1:
+            raise ValueError("Invalid median filter size: {}".format(size))
+        self.threshold = threshold
+        self.history: Deque[float] = collections.deque(maxlen=size)
+
+    def filter(self, value: float, timestamp: float) -> Optional[float]:
+        """Filters value."""
+        self.history.append(value)
+        return statistics.median(self.history)
+
+    def is_rejected(self, value: float, filtered: Optional[float]) -> bool:
+        """Checks if value was replaced as an outlier."""
+        if self.threshold == None:
+            return False
+        return abs(value - filtered) > self.threshold  # type: ignore
+
+    def reset(self) -> None:
+        """Clears sample history."""
+        self.history.clear()
+
+
+class HampelFilter(Filter):
+    """Rejects samples further than threshold scaled median absolute deviations
+    from the median of the last window samples. Rejected samples stay in the
+    window so a persistent step change is accepted once it is the median."""
+
+    type = "hampel"
+
+    def __init__(
+        self,
+        window: int = DEFAULT_HAMPEL_WINDOW,
+        threshold: float = 3.0,
+        min_deviation: float = 0.0,
+    ) -> None:
+        """Initializes hampel filter, min deviation is the smallest absolute
+        deviation that is rejected, e.g. for sensors with quantized readings."""
+        super().__init__()
+        if window < 3:
+            raise ValueError("Invalid hampel filter window: {}".format(window))
+        self.threshold = threshold
+        self.min_deviation = min_deviation
+        self.history: Deque[float] = collections.deque(maxlen=window)
+
+    def filter(self, value: float, timestamp: float) -> Optional[float]:
+        """Filters value."""
+        self.history.append(value)
+        if len(self.history) < 3:
+            return value
+        median = statistics.median(self.history)
+        deviation = statistics.median(abs(sample - median) for sample in self.history)
+        limit = max(self.threshold * HAMPEL_SCALE * deviation, self.min_deviation)
+        if abs(value - median) > limit:
+            return None
+        return value
+
+    def reset(self) -> None:
+        """Clears sample history."""
+        self.history.clear()
+
+
+class RateFilter(Filter):
+    """Clamps change between reported values to max rate units per second."""
+
+    type = "rate"
+
+    def __init__(self, max_rate: float) -> None:
+        """Initializes rate filter."""
+        super().__init__()
+        if max_rate <= 0:
+            raise ValueError("Invalid rate filter max rate: {}".format(max_rate))
+        self.max_rate = max_rate
+        self.last_value: Optional[float] = None
+        self.last_timestamp = 0.0
+
+    def filter(self, value: float, timestamp: float) -> Optional[float]:
+        """Filters value."""
+        if self.last_value != None:
+            limit = self.max_rate * max(timestamp - self.last_timestamp, 0.0)
+            lower = self.last_value - limit  # type: ignore
+            upper = self.last_value + limit  # type: ignore
+            value = min(max(value, lower), upper)
+        self.last_value = value
+        self.last_timestamp = timestamp
+        return value
+
+    def reset(self) -> None:
+        """Clears last value."""
+        self.last_value = None
+
+
+# Initialize filter types
+FILTER_TYPES = {
+    MedianFilter.type: MedianFilter,
+    HampelFilter.type: HampelFilter,
+    RateFilter.type: RateFilter,
+}
+
+
+class FilterChain:
+    """Applies filters to values of one variable in order. A value rejected by a
+    filter is not passed to the filters after it."""
+
+    def __init__(self, filters: List[Filter]) -> None:
+        """Initializes filter chain."""
+        self.filters = filters
+
+    def apply(self, value: float, timestamp: Optional[float] = None) -> Optional[float]:
+        """Filters value, returns filtered value or None if value is rejected."""
+        if timestamp == None:
+            timestamp = time.time()
+        for filter_ in self.filters:
+            value = filter_.apply(value, timestamp)  # type: ignore
+            if value == None:
+                return None
+        return value
+
+    def reset(self) -> None:
+        """Clears sample history of filters."""
+        for filter_ in self.filters:
+            filter_.reset()
+
+    @property
+    def rejected(self) -> int:
+        """Gets number of values rejected or replaced by filters."""
+        return sum(filter_.rejected for filter_ in self.filters)
+
+    @property
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Gets metrics of filters."""
+        return [filter_.metrics for filter_ in self.filters]
+
+
+def create_filter(spec: Dict[str, Any]) -> Filter:
+    """Creates filter from a spec e.g. `{"type": "hampel", "window": 7}`, raises
+    ValueError on invalid spec."""
+    parameters = dict(spec)
+    type_ = parameters.pop("type", None)
+    if type_ not in FILTER_TYPES:
+        raise ValueError("Invalid filter type: {}".format(type_))
+    try:
+        return FILTER_TYPES[type_](**parameters)  # type: ignore
+    except TypeError as e:
+        raise ValueError("Invalid {} filter parameters: {}".format(type_, e))
+
+
+def create_filter_chains(specs: Dict[str, Any]) -> Dict[str, FilterChain]:
+    """Creates filter chains by variable name from setup filter specs, each
+    variable takes a filter spec or a list of filter specs. Raises ValueError on
+    invalid specs."""
+    chains = {}
+    for variable, variable_specs in specs.items():
+        if isinstance(variable_specs, dict):
+            variable_specs = [variable_specs]
+        filters = [create_filter(spec) for spec in variable_specs]
+        chains[variable] = FilterChain(filters)
+    return chains
@@ -8,10 +8,19 @@ from typing import Dict, Optional, List, Any, Tuple
 from device.utilities import logger
 from device.utilities.statemachine.manager import StateMachineManager
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.buses import (
+    breaker_registry,
+    get_bus_key,
+    parse_bus,
+)
 from device.utilities.state.main import State
 
 # Import manager elements
 from device.peripherals.classes.peripheral import modes, events
+from device.peripherals.classes.peripheral.filters import (
+    FilterChain,
+    create_filter_chains,
+)
 
 # Initialize constants
 PERIPHERAL_RECIPIENT_TYPE = "Peripheral"
@@ -27,6 +36,14 @@ class PeripheralManager(StateMachineManager):
     last_update = None  # seconds
     last_update_interval = None  # Seconds
 
+    # Initialize concurrency limit shared by peripherals initializing on same bus
+    init_semaphore: Optional[threading.Semaphore] = None
+
+    # Initialize scheduler support
+    is_schedulable = True
+    step_mode: Optional[str] = None
+    error_start_time = 0.0
+
     def __init__(
         self,
         name: str,
@@ -65,14 +82,10 @@ class PeripheralManager(StateMachineManager):
           self.communication = {}
 
         # Initialize i2c bus
-        self.bus = self.communication.get("bus")
-        if self.bus == "default":
+        bus = self.communication.get("bus")
+        if bus == "default":
             self.logger.debug("Using default i2c bus")
-            self.bus = os.getenv("DEFAULT_I2C_BUS")
-        if self.bus == "none":
-            self.bus = None
-        if self.bus != None:
-            self.bus = int(self.bus)
+        self.bus = parse_bus(bus)
 
         # Initialize i2c mux
         self.mux = self.communication.get("mux")
@@ -99,6 +112,14 @@ class PeripheralManager(StateMachineManager):
         # Pull out setup properties if they exist
         self.properties = self.setup_dict.get("properties", {})
 
+        # Initialize sensor value filters declared in setup properties
+        self.filter_chains: Dict[str, FilterChain] = {}
+        try:
+            specs = self.properties.get("filters") or {}
+            self.filter_chains = create_filter_chains(specs)
+        except ValueError as e:
+            self.logger.error("Unable to load sensor value filters: {}".format(e))
+
         # Initialize state machine transitions
         self.transitions = {
             modes.INIT: [modes.SETUP, modes.ERROR, modes.SHUTDOWN],
@@ -127,8 +148,24 @@ class PeripheralManager(StateMachineManager):
 
     @health.setter
     def health(self, value: float) -> None:
-        """Sets health value in shared state."""
+        """Sets health value in shared state along with the circuit breaker state
+        of each i2c device of the peripheral."""
         self.state.set_peripheral_value(self.name, "health", round(value, 2))
+        breakers = self.circuit_breakers
+        if breakers != {}:
+            self.state.set_peripheral_value(self.name, "circuit_breakers", breakers)
+
+    @property
+    def circuit_breakers(self) -> Dict[str, Any]:
+        """Gets circuit breaker state by i2c device name from the breaker
+        registry, peripherals without an address or mux have none."""
+        if self.address == None and self.mux == None:
+            return {}
+        bus_key = get_bus_key(self.bus, simulate=self.simulate)
+        breakers = breaker_registry.find_breakers(
+            bus_key, self.mux, self.channel, self.address
+        )
+        return {breaker.name: breaker.metrics for breaker in breakers}
 
     @property
     def mode(self) -> str:
@@ -140,6 +177,7 @@ class PeripheralManager(StateMachineManager):
         """Safely updates peripheral mode in device state object."""
         self._mode = value
         self.state.set_peripheral_value(self.name, "mode", value)
+        self.notify_mode_observers(value)
 
     @property
     def setup_uuid(self) -> Optional[str]:
@@ -174,7 +212,7 @@ class PeripheralManager(StateMachineManager):
     @sampling_interval.setter
     def sampling_interval(self, value: float) -> None:
         """Safely updates sampling interval in state object."""
-        with self.state.lock:
+        with self.state.writing("peripherals"):
             if "stored" not in self.state.peripherals[self.name]:
                 self.state.peripherals[self.name]["stored"] = {}
             self.state.peripherals[self.name]["stored"]["sampling_interval"] = value
@@ -220,12 +258,19 @@ class PeripheralManager(StateMachineManager):
         next state machine update."""
         self.logger.info("Entered INIT")
 
+        # Wait for a free initialization slot on bus
+        if self.init_semaphore != None:
+            self.init_semaphore.acquire()  # type: ignore
+
         # Initialize peripheral
         try:
             self.initialize_peripheral()
         except Exception as e:
             self.logger.error(f'Could not initialize peripheral: {e}')
             self.mode = modes.ERROR
+        finally:
+            if self.init_semaphore != None:
+                self.init_semaphore.release()  # type: ignore
 
         # Check for transitions
         if self.new_transition(modes.INIT):
@@ -257,122 +302,143 @@ class PeripheralManager(StateMachineManager):
     def run_normal_mode(self) -> None:
         """Runs normal mode. Executes child class update function every sampling
         interval. Checks for events and transitions after each update."""
-        self.logger.info("Entered NORMAL")
-
-        # Initialize vars
-        self._update_complete = True
-        self.last_update = time.time()
-
-        # Loop forever
-        while True:
-
-            # Update every sampling interval
-            self.last_update_interval = time.time() - self.last_update
-            if self.sampling_interval < self.last_update_interval:
-                message = "Updating peripheral, delta: {:.3f}".format(
-                    self.last_update_interval
-                )
-                self.logger.debug(message)
-                self.last_update = time.time()
-                self.update_peripheral()
-
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
-
-            # Check for events
-            self.check_events()
-
-            # Check for transitions
-            if self.new_transition(modes.NORMAL):
-                break
-
-            # Update every 100ms
-            time.sleep(0.100)
+        self.enter_normal_mode()
+        while self.update_sampling(modes.NORMAL):
+            self.wait_until(self.next_update_time)
 
     def run_calibrate_mode(self) -> None:
         """Runs calibrate mode. Performs same function as normal mode except for 
         variable reporting functions only update peripheral state instead of both 
         peripheral and environment."""
-        self.logger.info("Entered CALIBRATE")
-
-        # Initialize vars
-        self._update_complete = True
-        self.last_update = time.time() - self.sampling_interval
-
-        # Loop forever
-        while True:
-
-            # Update every sampling interval
-            self.last_update_interval = time.time() - self.last_update
-            if self.sampling_interval < self.last_update_interval:
-                self.logger.debug(
-                    "Updating peripheral, time delta: {:.3f} sec".format(
-                        self.last_update_interval
-                    )
-                )
-                self.last_update = time.time()
-                self.update_peripheral()
-
-            # Check for transitions
-            if self.new_transition(modes.CALIBRATE):
-                break
-
-            # Check for events
-            self.check_events()
-
-            # Check for transitions
-            if self.new_transition(modes.CALIBRATE):
-                break
-
-            # Update every 100ms
-            time.sleep(0.100)
+        self.enter_calibrate_mode()
+        while self.update_sampling(modes.CALIBRATE):
+            self.wait_until(self.next_update_time)
 
     def run_manual_mode(self) -> None:
         """Runs manual mode. Waits for events and transitions."""
         self.logger.info("Entered MANUAL")
-
-        # Loop forever
-        while True:
-
-            # Check for events
-            self.check_events()
-
-            # Check for transitions
-            if self.new_transition(modes.MANUAL):
-                break
-
-            # Update every 100ms
-            time.sleep(0.100)
+        while self.update_events(modes.MANUAL):
+            self.wait()
 
     def run_error_mode(self) -> None:
         """Runs error mode. Clears reported values then waits for new 
         events and transitions. Tries to reset every hour."""
-        self.logger.info("Entered ERROR")
+        self.enter_error_mode()
+        while self.update_error():
+            self.wait_until(self.error_start_time + 3600)
+
+    def enter_normal_mode(self) -> None:
+        """Enters normal mode, next update runs after one sampling interval or 
+        when a subscribed state value changes."""
+        self.logger.info("Entered NORMAL")
+        self._update_complete = True
+        self.last_update = time.time()
+        self.subscribe_state()
 
-        # Clear reported values
+    def enter_calibrate_mode(self) -> None:
+        """Enters calibrate mode, next update runs immediately."""
+        self.logger.info("Entered CALIBRATE")
+        self._update_complete = True
+        self.last_update = time.time() - self.sampling_interval
+
+    def enter_error_mode(self) -> None:
+        """Enters error mode, clears reported values."""
+        self.logger.info("Entered ERROR")
+        self.unsubscribe_state()
         self.clear_reported_values()
+        self.error_start_time = time.time()
+
+    def update_sampling(self, mode: str) -> bool:
+        """Executes child class update function if sampling interval elapsed then
+        checks for events. Returns false if state machine left mode."""
+
+        # Update every sampling interval or when a subscribed value changed
+        self.last_update_interval = time.time() - self.last_update  # type: ignore
+        is_due = self.sampling_interval < self.last_update_interval  # type: ignore
+        if is_due or self.is_state_changed:
+            message = "Updating peripheral, delta: {:.3f}"
+            self.logger.debug(message, self.last_update_interval)
+            self.is_state_changed = False
+            self.last_update = time.time()
+            self.update_peripheral()
 
-        # Initialize vars
-        start_time = time.time()
+        # Check for transitions
+        if self.new_transition(mode):
+            return False
 
-        # Loop forever
-        while True:
+        # Check for events and transitions
+        return self.update_events(mode)
 
-            # Check for hourly reset
-            if time.time() - start_time > 3600:  # 1 hour
-                self.mode = modes.RESET
-                break
+    def update_events(self, mode: str) -> bool:
+        """Checks for events. Returns false if state machine left mode."""
+        self.check_events()
+        return not self.new_transition(mode)
 
-            # Check for events
-            self.check_events()
+    def update_error(self) -> bool:
+        """Checks for hourly reset and events. Returns false if state machine left
+        error mode."""
 
-            # Check for transitions
-            if self.new_transition(modes.ERROR):
-                break
+        # Check for hourly reset
+        if time.time() - self.error_start_time > 3600:  # 1 hour
+            self.mode = modes.RESET
+            return False
 
-            # Update every 100ms
-            time.sleep(0.1)
+        # Check for events and transitions
+        return self.update_events(modes.ERROR)
+
+    @property
+    def next_update_time(self) -> float:
+        """Gets timestamp of next sampling interval update."""
+        return self.last_update + self.sampling_interval  # type: ignore
+
+    def step(self) -> Optional[float]:
+        """Runs one state machine update when running on a scheduler. Returns 
+        timestamp of next update, or None to wait for an event or transition."""
+
+        # Check if mode was just entered
+        mode = self.mode
+        is_entered = mode != self.step_mode
+        self.step_mode = mode
+
+        # Run modes that complete in one update
+        if mode == modes.INIT:
+            self.run_init_mode()
+        elif mode == modes.SETUP:
+            self.run_setup_mode()
+        elif mode == modes.RESET:
+            self.run_reset_mode()
+        elif mode == modes.SHUTDOWN:
+            self.run_shutdown_mode()
+
+        # Run one update of looping modes
+        elif mode == modes.NORMAL:
+            if is_entered:
+                self.enter_normal_mode()
+            if self.update_sampling(modes.NORMAL):
+                return self.next_update_time
+        elif mode == modes.CALIBRATE:
+            if is_entered:
+                self.enter_calibrate_mode()
+            if self.update_sampling(modes.CALIBRATE):
+                return self.next_update_time
+        elif mode == modes.MANUAL:
+            if is_entered:
+                self.logger.info("Entered MANUAL")
+            if self.update_events(modes.MANUAL):
+                return None
+        elif mode == modes.ERROR:
+            if is_entered:
+                self.enter_error_mode()
+            if self.update_error():
+                return self.error_start_time + 3600
+        else:
+            self.logger.critical("Invalid state machine mode")
+            self.mode = modes.INVALID
+            self.is_shutdown = True
+            return None
+
+        # Run next mode immediately
+        return time.time()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode. Executes child class reset function, checks for any
@@ -395,11 +461,43 @@ class PeripheralManager(StateMachineManager):
         self.logger.info("Entered SHUTDOWN")
 
         # Shutdown peripheral
+        self.unsubscribe_state()
         self.shutdown_peripheral()
         self.is_shutdown = True
 
     ##### HELPER FUNCTIONS #############################################################
 
+    def report_sensor_value(self, variable: str, value: Any) -> None:
+        """Sets reported sensor value in peripheral state and, except from 
+        calibration mode, in environment state. Values are passed through the
+        variable's filters first, values rejected by a filter are not reported.
+        Filter metrics are published when a filter rejects or replaces a value.
+        Filters are bypassed in calibration mode and reset on cleared values."""
+
+        # Filter value
+        chain = self.filter_chains.get(variable)
+        if chain != None and value == None:
+            chain.reset()  # type: ignore
+        elif chain != None and self.mode != modes.CALIBRATE:
+            rejected = chain.rejected  # type: ignore
+            value = chain.apply(value)  # type: ignore
+            if chain.rejected != rejected:  # type: ignore
+                metrics = self.filter_metrics
+                self.state.set_peripheral_value(self.name, "filters", metrics)
+            if value == None:
+                self.logger.debug("Rejected {} sample", variable)
+                return
+
+        # Report value
+        self.state.set_peripheral_reported_sensor_value(self.name, variable, value)
+        if self.mode != modes.CALIBRATE:
+            self.state.set_environment_reported_sensor_value(self.name, variable, value)
+
+    @property
+    def filter_metrics(self) -> Dict[str, Any]:
+        """Gets filter metrics by variable name."""
+        return {name: chain.metrics for name, chain in self.filter_chains.items()}
+
     def load_setup_dict_from_file(self) -> Dict:
         """Loads setup dict from setup filename parameter."""
         self.logger.debug("Loading setup file")
@@ -440,7 +538,7 @@ class PeripheralManager(StateMachineManager):
     def create_event(self, request: Dict[str, Any]) -> Tuple[str, int]:
         """Creates a new event, checks for matching event type, pre-processes request, 
         then adds to event queue."""
-        self.logger.debug("Creating event request: `{}`".format(request))
+        self.logger.debug("Creating event request: `{}`", request)
 
         # Get request parameters
         try:
@@ -481,7 +579,7 @@ class PeripheralManager(StateMachineManager):
 
         # Get request
         request = self.event_queue.get()
-        self.logger.debug("Received new request: {}".format(request))
+        self.logger.debug("Received new request: {}", request)
 
         # Get request parameters
         try:
@@ -0,0 +1,102 @@
+# Import standard python modules
+import sys, os, pytest, threading
+
+# Set system path and directory
+root_dir = os.environ["PROJECT_ROOT"]
+sys.path.append(root_dir)
+os.chdir(root_dir)
+
+# Import device utilities
+from device.utilities.state.main import State
+
+# Import manager elements
+from device.peripherals.classes.peripheral.manager import PeripheralManager
+from device.peripherals.classes.peripheral import modes
+from device.peripherals.classes.peripheral.filters import (
+    MedianFilter,
+    HampelFilter,
+    RateFilter,
+    create_filter_chains,
+)
+
+# Initialize test config, setup declares a hampel filter
+peripheral_config = {
+    "name": "Test",
+    "parameters": {
+        "setup": {"file_name": "atlas_ph/setups/default"},
+        "variables": {"sensor": {"ph": "water_potential_hydrogen"}},
+        "communication": None,
+    },
+}
+
+
+def test_median_filter() -> None:
+    filter_ = MedianFilter(size=3)
+    values = [filter_.apply(value, 0) for value in [7.0, 7.2, 14.0, 7.1, 7.3]]
+    assert values == [7.0, 7.1, 7.2, 7.2, 7.3]
+    assert len(filter_.history) == 3
+    assert filter_.rejected == 0
+
+    # Only outliers further than threshold from the median count as rejected
+    filter_ = MedianFilter(size=3, threshold=1.0)
+    values = [filter_.apply(value, 0) for value in [7.0, 7.2, 14.0, 7.1, 7.3]]
+    assert values == [7.0, 7.1, 7.2, 7.2, 7.3]
+    assert filter_.rejected == 1
+
+
+def test_hampel_filter_rejects_spikes() -> None:
+    filter_ = HampelFilter(window=5, threshold=3)
+    values = [filter_.apply(value, 0) for value in [7.0, 7.1, 7.0, 12.0, 7.1]]
+    assert values == [7.0, 7.1, 7.0, None, 7.1]
+    assert filter_.rejected == 1
+
+    # Persistent step changes are accepted once they are the median
+    values = [filter_.apply(9.0, 0) for _ in range(4)]
+    assert values[-1] == 9.0
+
+
+def test_rate_filter_clamps_change() -> None:
+    filter_ = RateFilter(max_rate=1.0)
+    assert filter_.apply(400, 0) == 400
+    assert filter_.apply(500, 10) == 410
+    assert filter_.apply(415, 20) == 415
+    assert filter_.metrics == {"type": "rate", "samples": 3, "rejected": 1}
+
+
+def test_create_filter_chains() -> None:
+    specs = {
+        "water_potential_hydrogen": {"type": "hampel", "window": 5},
+        "air_carbon_dioxide_ppm": [{"type": "median"}, {"type": "rate", "max_rate": 5}],
+    }
+    chains = create_filter_chains(specs)
+    assert len(chains["air_carbon_dioxide_ppm"].filters) == 2
+    with pytest.raises(ValueError):
+        create_filter_chains({"water_potential_hydrogen": {"type": "kalman"}})
+    with pytest.raises(ValueError):
+        create_filter_chains({"water_potential_hydrogen": {"type": "rate"}})
+
+
+def test_report_sensor_value_skips_rejected_values() -> None:
+    state = State()
+    manager = PeripheralManager(
+        name="Test",
+        state=state,
+        config=peripheral_config,
+        i2c_lock=threading.RLock(),
+        simulate=True,
+    )
+    variable = "water_potential_hydrogen"
+    assert manager.filter_chains[variable].filters[0].type == "hampel"
+    manager.mode = modes.NORMAL
+    for value in [7.0, 7.1, 7.0]:
+        manager.report_sensor_value(variable, value)
+    assert state.get_peripheral_value("Test", "filters") == None
+    manager.report_sensor_value(variable, 12.0)
+    assert state.get_environment_reported_sensor_value(variable) == 7.0
+    metrics = state.get_peripheral_value("Test", "filters")
+    assert metrics[variable][0]["rejected"] == 1
+
+    # Calibration mode reports raw values
+    manager.mode = modes.CALIBRATE
+    manager.report_sensor_value(variable, 12.0)
+    assert state.get_peripheral_reported_sensor_value("Test", variable) == 12.0
@@ -2,7 +2,7 @@
 import time, threading
 
 # Import python types
-from typing import NamedTuple, Optional, Dict
+from typing import NamedTuple, Optional, Dict, List, Tuple
 
 # Import device utilities
 from device.utilities import bitwise, logger
@@ -12,7 +12,7 @@ from device.utilities.communication.i2c.mux_simulator import MuxSimulator
 
 # Import driver elements
 from device.peripherals.common.pca9633.simulator import PCA9633Simulator
-from device.peripherals.common.pca9633 import exceptions
+from device.peripherals.common.adt7470 import exceptions
 
 # Define identification registers
 VERSION_REGISTER = 0x3F
@@ -36,6 +36,30 @@ TACHOMETER_BASE_REGISTER = 0x2A
 FAN_PULSES_PER_REVOLUTION_REGISTER = 0x43
 
 
+def convert_temperature(byte: int) -> float:
+    """Converts two's complement temperature byte to degrees celsius."""
+    if byte > 127:
+        return float(byte - 256)
+    return float(byte)
+
+
+def convert_fan_speed(low_byte: int, high_byte: int) -> float:
+    """Converts tachometer bytes to fan speed in rpm."""
+    tachometer_word = (high_byte << 8) + low_byte
+    if tachometer_word == 0xFFFF or tachometer_word == 0:
+        return 0.0
+    return round(90000 * 60 / tachometer_word, 1)
+
+
+def make_register_reads(registers: List[int]) -> List:
+    """Makes a register pointer write and one byte read message per register so
+    registers are read in the listed order within one combined transfer."""
+    messages: List = []
+    for register in registers:
+        messages += [bytes([register]), 1]
+    return messages
+
+
 class ADT7470Driver:
     """Driver for ADT7470 temperature sensor hub and fan controller."""
 
@@ -43,7 +67,7 @@ class ADT7470Driver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -93,14 +117,14 @@ class ADT7470Driver:
         with self.i2c_lock:
             try:
                 version = self.i2c.read_register(VERSION_REGISTER)
-                self.logger.debug("Version: {}".format(version))
+                self.logger.debug("Version: {}", version)
                 return version
             except I2CError as e:
                 raise exceptions.ReadVersionError(logger=self.logger) from e
 
     def enable_manual_fan_control(self, fan_id: int) -> None:
         """Enables manual fan control."""
-        self.logger.debug("Enabling manual fan control for fan {}".format(fan_id))
+        self.logger.debug("Enabling manual fan control for fan {}", fan_id)
 
         # Validate fan id
         if fan_id < 0 or fan_id > 3:
@@ -118,7 +142,7 @@ class ADT7470Driver:
 
     def enable_automatic_fan_control(self, fan_id: int) -> None:
         """Enables automatic fan control."""
-        self.logger.debug("Enabling automatic fan control for fan {}".format(fan_id))
+        self.logger.debug("Enabling automatic fan control for fan {}", fan_id)
 
         # Validate fan id
         if fan_id < 0 or fan_id > 3:
@@ -179,7 +203,7 @@ class ADT7470Driver:
         self, fan_id: int, minimum_temperature: float
     ) -> None:
         """Writes the minimum temperature for a fan."""
-        self.logger.debug("Writing minimum temperature for fan {}".format(fan_id))
+        self.logger.debug("Writing minimum temperature for fan {}", fan_id)
 
         # Validate fan id
         if fan_id < 0 or fan_id > 3:
@@ -197,7 +221,7 @@ class ADT7470Driver:
             temperature_byte = 128 - temperature_int
         else:
             temperature_byte = temperature_int
-        self.logger.debug("temperature_byte: {}".format(temperature_byte))
+        self.logger.debug("temperature_byte: {}", temperature_byte)
 
         # Write minimum temperature
         with self.i2c_lock:
@@ -207,13 +231,13 @@ class ADT7470Driver:
                 )
                 self.i2c.write_register(register_address, temperature_byte)
             except I2CError as e:
-                raise exceptions.WriteThermalZoneMinimumTemperature(
+                raise exceptions.WriteThermalZoneMinimumTemperatureError(
                     logger=self.logger
                 ) from e
 
     def write_minimum_duty_cycle(self, fan_id: int, duty_cycle: float) -> None:
         """Writes minimum pwm duty cycle for a fan."""
-        self.logger.debug("Writing minimum duty cycle for fan {}".format(fan_id))
+        self.logger.debug("Writing minimum duty cycle for fan {}", fan_id)
 
         # Validate fan id
         if fan_id < 0 or fan_id > 3:
@@ -236,7 +260,7 @@ class ADT7470Driver:
 
     def write_maximum_duty_cycle(self, fan_id: int, duty_cycle: float) -> None:
         """Writes max pwm duty cycle for a fan."""
-        self.logger.debug("Writing maximum duty cycle for fan {}".format(fan_id))
+        self.logger.debug("Writing maximum duty cycle for fan {}", fan_id)
 
         # Validate duty cycle
         if duty_cycle < 0 or duty_cycle > 100:
@@ -259,7 +283,7 @@ class ADT7470Driver:
 
     def read_current_duty_cycle(self, fan_id: int) -> float:
         """Read the current duty cycle for a fan."""
-        self.logger.debug("Reading curent duty cycle for fan {}".format(fan_id))
+        self.logger.debug("Reading curent duty cycle for fan {}", fan_id)
 
         # Validate fan id
         if fan_id < 0 or fan_id > 3:
@@ -277,7 +301,7 @@ class ADT7470Driver:
         duty_cycle = round(0.392 * register_byte, 1)
 
         # Return duty cycle
-        self.logger.debug("Duty cycle: {}%".format(duty_cycle))
+        self.logger.debug("Duty cycle: {}%", duty_cycle)
         return duty_cycle
 
     def write_current_duty_cycle(self, fan_id: int, duty_cycle: float) -> None:
@@ -380,14 +404,14 @@ class ADT7470Driver:
             try:
                 register_byte = self.i2c.read_register(CONFIG_REGISTER_1)
                 register_byte |= 0x40
-                self.logger.debug('reg_byte: {}'.format(hex(register_byte)))
+                self.logger.debug('reg_byte: {}', hex(register_byte))
                 self.i2c.write_register(CONFIG_REGISTER_1, register_byte)
             except I2CError as e:
                 raise exceptions.EnableLowFrequencyFanDriveError(logger=self.logger) from e
 
     def read_temperature(self, sensor_id: int, retry: bool = True, reset_monitor: bool = True) -> float:
         """Reads a temperature sensor."""
-        self.logger.debug("Reading temperature from sensor {}".format(sensor_id))
+        self.logger.debug("Reading temperature from sensor {}", sensor_id)
 
         # Validate sensor id
         if sensor_id < 0 or sensor_id > 9:
@@ -419,7 +443,7 @@ class ADT7470Driver:
                 temperature = float(temperature_byte)
 
             # Return temperature value
-            self.logger.debug("Temperature: {}".format(temperature))
+            self.logger.debug("Temperature: {}", temperature)
             return temperature
 
     def read_maximum_temperature(self, retry: bool = True) -> float:
@@ -433,7 +457,7 @@ class ADT7470Driver:
                     MAXIMUM_TEMPERATURE_REGISTER
                 )
             except I2CError as e:
-                raise exceptions.ReadMaximumTemperatureError(logger=self.logger) from e
+                raise exceptions.ReadMaxTemperatureError(logger=self.logger) from e
 
         # Convert temperature byte to float
         if max_temperature_byte > 127:
@@ -442,39 +466,90 @@ class ADT7470Driver:
             max_temperature = float(max_temperature_byte)
 
         # Return max temperature
-        self.logger.debug("Max Temperature: {}".format(max_temperature))
+        self.logger.debug("Max Temperature: {}", max_temperature)
         return max_temperature
 
     def read_fan_speed(self, fan_id: int) -> float:
         """Reads fan speed."""
-        self.logger.debug("Reading fan speed for fan {}".format(fan_id))
+        self.logger.debug("Reading fan speed for fan {}", fan_id)
 
-        # Read tachometer
+        # Read tachometer, low byte must be read first since high byte freezes
+        # when low byte is read
         with self.i2c_lock:
             try:
                 low_address = TACHOMETER_BASE_REGISTER + 2 * fan_id
-                high_address = low_address + 1
-                low_byte = self.i2c.read_register(
-                    low_address
-                )  # low byte must be read first
-                high_byte = self.i2c.read_register(
-                    high_address
-                )  # high byte freezes when low byte read
-                tachometer_word = (high_byte << 8) + low_byte
-                self.logger.debug("{}: {}".format(hex(low_address), hex(low_byte)))
-                self.logger.debug("{}: {}".format(hex(high_address), hex(high_byte)))
-                self.logger.debug("Word: {}".format(hex(tachometer_word)))
+                messages = make_register_reads([low_address, low_address + 1])
+                low_byte, high_byte = [b[0] for b in self.i2c.rdwr(messages)]
+                self.logger.debug("{}: {}", hex(low_address), hex(low_byte))
+                self.logger.debug("{}: {}", hex(low_address + 1), hex(high_byte))
             except I2CError as e:
                 raise exceptions.ReadTachometerError(logger=self.logger) from e
 
         # Convert bytes to float
-        if tachometer_word == 0xFFFF:
-            fan_speed_rpm = 0.0
-        else:
-            fan_speed_rpm = round(90000 * 60 / tachometer_word, 1)
-        self.logger.debug("Fan Speed: {} RPM".format(fan_speed_rpm))
+        fan_speed_rpm = convert_fan_speed(low_byte, high_byte)
+        self.logger.debug("Fan Speed: {} RPM", fan_speed_rpm)
         return fan_speed_rpm
 
+    def read_temperatures(self, sensor_ids: List[int]) -> Dict[int, float]:
+        """Reads temperature sensors in one combined transfer. Does not reset
+        monitoring."""
+        self.logger.debug("Reading temperatures from sensors {}", sensor_ids)
+
+        # Validate sensor ids
+        for sensor_id in sensor_ids:
+            if sensor_id < 0 or sensor_id > 9:
+                raise ValueError("Sensor id must be a value between 0-9")
+
+        # Read temperature registers
+        registers = [TEMPERATURE_BASE_REGISTER + id_ for id_ in sensor_ids]
+        try:
+            bytes_ = self.i2c.rdwr(make_register_reads(registers))
+        except I2CError as e:
+            message = "sensors {}".format(sensor_ids)
+            raise exceptions.ReadTemperatureError(
+                message=message, logger=self.logger
+            ) from e
+
+        # Convert temperature bytes to floats
+        temperatures = {}
+        for sensor_id, byte in zip(sensor_ids, bytes_):
+            temperatures[sensor_id] = convert_temperature(byte[0])
+        self.logger.debug("Temperatures: {}", temperatures)
+        return temperatures
+
+    def read_fans(self, fan_ids: List[int]) -> Dict[int, Tuple[float, float]]:
+        """Reads current duty cycle and fan speed of fans in one combined
+        transfer."""
+        self.logger.debug("Reading duty cycles and speeds of fans {}", fan_ids)
+
+        # Validate fan ids
+        for fan_id in fan_ids:
+            if fan_id < 0 or fan_id > 3:
+                raise ValueError("Fan id must be a value between 0-3")
+
+        # Read duty cycle and tachometer registers, tachometer low bytes first
+        registers: List[int] = []
+        for fan_id in fan_ids:
+            low_address = TACHOMETER_BASE_REGISTER + 2 * fan_id
+            duty_cycle_address = PWM_CURRENT_DUTY_CYCLE_BASE_REGISTER + fan_id
+            registers += [duty_cycle_address, low_address, low_address + 1]
+        try:
+            bytes_ = [b[0] for b in self.i2c.rdwr(make_register_reads(registers))]
+        except I2CError as e:
+            message = "fans {}".format(fan_ids)
+            raise exceptions.ReadTachometerError(
+                message=message, logger=self.logger
+            ) from e
+
+        # Convert bytes to duty cycles and fan speeds
+        fans = {}
+        for i, fan_id in enumerate(fan_ids):
+            duty_cycle_byte, low_byte, high_byte = bytes_[3 * i : 3 * i + 3]
+            duty_cycle = round(0.392 * duty_cycle_byte, 1)
+            fans[fan_id] = (duty_cycle, convert_fan_speed(low_byte, high_byte))
+        self.logger.debug("Fans: {}", fans)
+        return fans
+
     def shutdown(self, retry: bool = True) -> None:
         """Shuts down peripheral."""
         self.logger.debug("Shutting down")
@@ -38,10 +38,50 @@ class ShutdownError(DriverError):
     message_base = "Unable to power down"
 
 
+class WriteThermalZoneConfigError(DriverError):
+    message_base = "Unable to write thermal zone config"
+
+
+class WriteThermalZoneMinimumTemperatureError(DriverError):
+    message_base = "Unable to write thermal zone minimum temperature"
+
+
+class WriteMinDutyCycleError(DriverError):
+    message_base = "Unable to write minimum duty cycle"
+
+
+class WriteMaxDutyCycleError(DriverError):
+    message_base = "Unable to write maximum duty cycle"
+
+
+class WriteCurrentDutyCycleError(DriverError):
+    message_base = "Unable to write current duty cycle"
+
+
+class WriteFanPulsesPerRevolutionError(DriverError):
+    message_base = "Unable to write fan pulses per revolution"
+
+
+class EnableHighFrequencyFanDriveError(DriverError):
+    message_base = "Unable to enable high frequency fan drive"
+
+
+class EnableLowFrequencyFanDriveError(DriverError):
+    message_base = "Unable to enable low frequency fan drive"
+
+
 class ReadTemperatureError(DriverError):
     message_base = "Unable to read temperature"
 
 
+class ReadCurrentDutyCycleError(DriverError):
+    message_base = "Unable to read current duty cycle"
+
+
+class ReadTachometerError(DriverError):
+    message_base = "Unable to read fan speed"
+
+
 class ReadMaxTemperatureError(DriverError):
     message_base = "Unable to read max temperature"
 
@@ -10,6 +10,7 @@ from device.utilities import bitwise
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.scheduler import PRIORITY_ACTUATOR
 
 # Import driver elements
 from device.peripherals.common.dac5578.simulator import DAC5578Simulator
@@ -23,7 +24,7 @@ class DAC5578Driver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -54,6 +55,7 @@ class DAC5578Driver:
                 channel=channel,
                 mux_simulator=mux_simulator,
                 PeripheralSimulator=Simulator,
+                priority=PRIORITY_ACTUATOR,
             )
         except I2CError as e:
             raise exceptions.InitError(logger=self.logger) from e
@@ -65,6 +67,16 @@ class DAC5578Driver:
         message = "Writing output on channel {} to: {:.02F}%".format(channel, percent)
         self.logger.debug(message)
 
+        # Send set output command to dac
+        bytes_ = self.make_output_bytes(channel, percent)
+        try:
+            self.i2c.write(bytes_, disable_mux=disable_mux)
+        except I2CError as e:
+            raise exceptions.WriteOutputError(logger=self.logger) from e
+
+    def make_output_bytes(self, channel: int, percent: int) -> bytes:
+        """Makes set output command bytes."""
+
         # Check valid channel range
         if channel < 0 or channel > 7:
             message = "channel out of range, must be within 0-7"
@@ -80,18 +92,13 @@ class DAC5578Driver:
             byte = 255
         else:
             byte = int(percent * 2.55)
-
-        # Send set output command to dac
-        self.logger.debug("Writing to dac: ch={}, byte={}".format(channel, byte))
-        try:
-            self.i2c.write(bytes([0x30 + channel, byte, 0x00]), disable_mux=disable_mux)
-        except I2CError as e:
-            raise exceptions.WriteOutputError(logger=self.logger) from e
+        self.logger.debug("Writing to dac: ch={}, byte={}", channel, byte)
+        return bytes([0x30 + channel, byte, 0x00])
 
     def write_outputs(self, outputs: dict, retry: bool = True) -> None:
-        """Sets output channels to output percents. Only sets mux once. 
-        Keeps thread locked since relies on mux not changing."""
-        self.logger.debug("Writing outputs: {}".format(outputs))
+        """Sets output channels to output percents in one combined i2c transfer so
+        the mux is only set once and other threads can not interleave."""
+        self.logger.debug("Writing outputs: {}", outputs)
 
         # Check output dict is not empty
         if len(outputs) < 1:
@@ -103,23 +110,23 @@ class DAC5578Driver:
             message = "output dict must not contain more than 8 entries"
             raise exceptions.WriteOutputsError(message=message, logger=self.logger)
 
-        # Run through each output
-        for channel, percent in outputs.items():
-            message = "Writing output for ch {}: {}%".format(channel, percent)
-            self.logger.debug(message)
-            try:
-                self.write_output(channel, percent, retry=retry)
-            except exceptions.WriteOutputError as e:
-                raise exceptions.WriteOutputsError(logger=self.logger) from e
+        # Write set output command of each channel
+        try:
+            messages = [
+                self.make_output_bytes(channel, percent)
+                for channel, percent in outputs.items()
+            ]
+            self.i2c.rdwr(messages, retry=retry)  # type: ignore
+        except (I2CError, exceptions.WriteOutputError) as e:
+            raise exceptions.WriteOutputsError(logger=self.logger) from e
 
     def read_power_register(self, retry: bool = True) -> Optional[Dict[int, bool]]:
         """Reads power register."""
         self.logger.debug("Reading power register")
 
-        # Read register
+        # Read register, command write and read are one combined transfer
         try:
-            self.i2c.write([0x40], retry=retry)
-            bytes_ = self.i2c.read(2, retry=retry)
+            bytes_ = self.i2c.rdwr([bytes([0x40]), 2], retry=retry)[0]
         except I2CError as e:
             raise exceptions.ReadPowerRegisterError(logger=self.logger) from e
 
@@ -141,7 +148,7 @@ class DAC5578Driver:
     def set_high(self, channel: Optional[int] = None, retry: bool = True) -> None:
         """Sets channel high, sets all channels high if no channel is specified."""
         if channel != None:
-            self.logger.debug("Setting channel {} high".format(channel))
+            self.logger.debug("Setting channel {} high", channel)
             try:
                 self.write_output(channel, 100, retry=retry)  # type: ignore
             except exceptions.WriteOutputError as e:
@@ -157,7 +164,7 @@ class DAC5578Driver:
     def set_low(self, channel: Optional[int] = None, retry: bool = True) -> None:
         """Sets channel low, sets all channels low if no channel is specified."""
         if channel != None:
-            self.logger.debug("Setting channel {} low".format(channel))
+            self.logger.debug("Setting channel {} low", channel)
             try:
                 self.write_output(channel, 0, retry=retry)  # type: ignore
             except exceptions.WriteOutputError as e:
@@ -9,6 +9,7 @@ from device.utilities import bitwise, logger
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.scheduler import PRIORITY_ACTUATOR
 
 # Import driver elements
 from device.peripherals.common.pca9633.simulator import PCA9633Simulator
@@ -22,7 +23,7 @@ class PCA9633Driver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -62,6 +63,7 @@ class PCA9633Driver:
                 channel=channel,
                 mux_simulator=mux_simulator,
                 PeripheralSimulator=Simulator,
+                priority=PRIORITY_ACTUATOR,
             )
             self.i2c.write(bytes(self.data_bytes), disable_mux=True)
         except I2CError as e:
@@ -69,7 +71,7 @@ class PCA9633Driver:
 
     def set_rgb(self, rgb: list, retry: bool = True, disable_mux: bool = False) -> None:
         """Sets port high."""
-        self.logger.debug("Setting rgb: {}".format(rgb))
+        self.logger.debug("Setting rgb: {}", rgb)
 
         # Check valid rgb list length
         if len(rgb) != 3:
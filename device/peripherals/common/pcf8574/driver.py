@@ -9,6 +9,7 @@ from device.utilities import bitwise, logger
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.scheduler import PRIORITY_ACTUATOR
 
 # Import driver elements
 from device.peripherals.common.pcf8574.simulator import PCF8574Simulator
@@ -22,7 +23,7 @@ class PCF8574Driver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -56,6 +57,7 @@ class PCF8574Driver:
                 channel=channel,
                 mux_simulator=mux_simulator,
                 PeripheralSimulator=Simulator,
+                priority=PRIORITY_ACTUATOR,
             )
         except I2CError as e:
             raise exceptions.InitError(logger=self.logger) from e
@@ -67,14 +69,14 @@ class PCF8574Driver:
             port_status_byte = self.i2c.read(1, retry=retry)[0]
         except I2CError as e:
             raise exceptions.GetPortByteError(logger=self.logger) from e
-        self.logger.debug("Got port status byte: 0x{:02X}".format(port_status_byte))
+        self.logger.debug("Got port status byte: 0x{:02X}", port_status_byte)
         return port_status_byte
 
     def set_high(
         self, port: int, retry: bool = True, disable_mux: bool = False
     ) -> None:
         """Sets port high."""
-        self.logger.debug("Setting port {} high".format(port))
+        self.logger.debug("Setting port {} high", port)
 
         # Check valid port range
         if port < 0 or port > 7:
@@ -97,7 +99,7 @@ class PCF8574Driver:
             new_port_status_byte = port_status_byte & (1 << port)
 
             # Send set output command to dac
-            self.logger.debug("Writing port byte: {}".format(new_port_status_byte))
+            self.logger.debug("Writing port byte: {}", new_port_status_byte)
             try:
                 self.i2c.write(bytes([new_port_status_byte]), disable_mux=disable_mux)
             except I2CError as e:
@@ -105,7 +107,7 @@ class PCF8574Driver:
 
     def set_low(self, port: int, retry: bool = True, disable_mux: bool = False) -> None:
         """Sets port high."""
-        self.logger.debug("Setting port {} low".format(port))
+        self.logger.debug("Setting port {} low", port)
 
         # Lock thread in case we have multiple io expander instances
         with self.i2c_lock:
@@ -126,9 +128,7 @@ class PCF8574Driver:
             new_port_status_byte = port_status_byte & (0xFF - (1 << port))
 
             # Send set output command to dac
-            self.logger.debug(
-                "Writing port byte: 0x{:02X}".format(new_port_status_byte)
-            )
+            self.logger.debug("Writing port byte: 0x{:02X}", new_port_status_byte)
             try:
                 self.i2c.write(bytes([new_port_status_byte]), disable_mux=disable_mux)
             except I2CError as e:
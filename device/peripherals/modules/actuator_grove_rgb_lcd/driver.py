@@ -10,6 +10,7 @@ from device.utilities import bitwise
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.scheduler import PRIORITY_ACTUATOR
 
 # Import driver elements
 from device.peripherals.modules.actuator_grove_rgb_lcd import exceptions, simulator
@@ -34,7 +35,7 @@ class GroveRGBLCDDriver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         rgb_address: int = RGB_ADDRESS,
         lcd_address: int = LCD_ADDRESS,
         mux: Optional[int] = None,
@@ -66,6 +67,7 @@ class GroveRGBLCDDriver:
                 channel=channel,
                 mux_simulator=mux_simulator,
                 PeripheralSimulator=Simulator,
+                priority=PRIORITY_ACTUATOR,
             )
             self.i2c_lcd = I2C(
                 name="LCD-{}".format(name),
@@ -76,6 +78,7 @@ class GroveRGBLCDDriver:
                 channel=channel,
                 mux_simulator=mux_simulator,
                 PeripheralSimulator=Simulator,
+                priority=PRIORITY_ACTUATOR,
             )
         except I2CError as e:
             raise exceptions.InitError(logger=self.logger) from e
@@ -121,7 +124,7 @@ class GroveRGBLCDDriver:
     # --------------------------------------------------------------------------
     def write_string(self, message: str = "") -> None:
         """Writes a string to the LCD (16 chars per line limit, 2 lines). Use a '/n' newline character in the string to start the secone line."""
-        self.logger.debug("Writing '{}' to LCD".format(message))
+        self.logger.debug("Writing '{}' to LCD", message)
         try:
             # command: clear display
             self.i2c_lcd.write(bytes([self.CMD, self.CLEAR]))
@@ -144,7 +147,7 @@ class GroveRGBLCDDriver:
         # utc = time.gmtime()
         lt = time.localtime()
         now = "{}".format(time.strftime("%F %X", lt))
-        self.logger.debug("Writing time {}".format(now))
+        self.logger.debug("Writing time {}", now)
         try:
             # command: clear display
             self.i2c_lcd.write(bytes([self.CMD, self.CLEAR]))
@@ -63,9 +63,9 @@ class ActuatorGroveRGBLCDManager(manager.PeripheralManager):
                 self.mux = int(self.mux, 16)
 
         self.logger.info(
-            "rgb_address=0x{:02X}, lcd_address=0x{:02X}".format(
-                self.rgb_address, self.lcd_address
-            )
+            "rgb_address=0x{:02X}, lcd_address=0x{:02X}",
+            self.rgb_address,
+            self.lcd_address,
         )
 
         # Initialize variable names
@@ -161,7 +161,7 @@ class ActuatorGroveRGBLCDManager(manager.PeripheralManager):
         lt = time.localtime()
         lt = time.strftime("%H:%M:%S", lt)
         output = "{}C / {}F\n{} %RH {}".format(tempC, tempF, hum, lt)
-        self.logger.debug("Output: {}".format(output))
+        self.logger.debug("Output: {}", output)
 
         # backlight color based on temp
         if tempF <= 65:
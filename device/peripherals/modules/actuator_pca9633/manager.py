@@ -4,6 +4,9 @@ import time, json, os
 # Import python types
 from typing import Optional, Tuple, Dict, Any, List
 
+# Import device utilities
+from device.utilities.communication.i2c.buses import bus_registry, parse_bus
+
 # Import peripheral parent class
 from device.peripherals.classes.peripheral import manager, modes
 
@@ -153,11 +156,7 @@ class ActuatorPCA9633Manager(manager.PeripheralManager):
                     bus = device.get("bus")
                     if bus == "default":
                         self.logger.debug("Using default i2c bus")
-                        bus = os.getenv("DEFAULT_I2C_BUS")
-                    if bus == "none":
-                        bus = None
-                    if bus != None:
-                        bus = int(bus)
+                    bus = parse_bus(bus)
 
                     # Initialize mux
                     mux = device.get("mux")
@@ -181,7 +180,7 @@ class ActuatorPCA9633Manager(manager.PeripheralManager):
                     self.drivers.append(
                         driver.PCA9633Driver(
                             name=device.get("name", "Default"),
-                            i2c_lock=self.i2c_lock,
+                            i2c_lock=bus_registry.get_lock(bus, self.simulate),
                             bus=bus,
                             mux=mux,
                             channel=channel,
@@ -25,7 +25,7 @@ class AdafruitSoilDriver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -32,13 +32,7 @@ class AdafruitSoilManager(manager.PeripheralManager):
     def temperature(self, value: float) -> None:
         """Sets temperature value in shared state. Does not update environment from
         calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(
-            self.name, self.temperature_name, value
-        )
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.temperature_name, value
-            )
+        self.report_sensor_value(self.temperature_name, value)
 
     @property
     def moisture(self) -> Optional[int]:
@@ -53,13 +47,7 @@ class AdafruitSoilManager(manager.PeripheralManager):
     @moisture.setter
     def moisture(self, value: int) -> None:
         """Sets moisture level in shared state. Does not update environment from calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(
-            self.name, self.moisture_name, value
-        )
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.moisture_name, value
-            )
+        self.report_sensor_value(self.moisture_name, value)
 
     def initialize_peripheral(self):
         """initializes manager."""
@@ -81,7 +69,7 @@ class AdafruitSoilManager(manager.PeripheralManager):
                 mux_simulator=self.mux_simulator,
             )
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to initialize: {}".format(e))
+            self.logger.debug("Unable to initialize: {}", e)
             self.health = 0.0
             self.mode = modes.ERROR
 
@@ -97,7 +85,7 @@ class AdafruitSoilManager(manager.PeripheralManager):
         try:
             temperature = self.driver.read_temperature()
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to read temperature: {}".format(e))
+            self.logger.debug("Unable to read temperature: {}", e)
             self.mode = modes.ERROR
             self.health = 0.0
             return
@@ -106,7 +94,7 @@ class AdafruitSoilManager(manager.PeripheralManager):
         try:
             moisture = self.driver.read_moisture()
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to read moisture: {}".format(e))
+            self.logger.debug("Unable to read moisture: {}", e)
             self.mode = modes.ERROR
             self.health = 0.0
             return
@@ -127,7 +115,7 @@ class AdafruitSoilManager(manager.PeripheralManager):
         try:
             self.driver.reset()
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to reset driver: {}".format(e))
+            self.logger.debug("Unable to reset driver: {}", e)
 
         # Successfully reset
         self.logger.debug("Successfully reset")
@@ -30,7 +30,7 @@ class AtlasCo2Driver(driver.AtlasDriver):
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -108,7 +108,7 @@ class AtlasCo2Driver(driver.AtlasDriver):
                 # Check if prev internal temperature within half a degree of current
                 internal_temperature = self.read_internal_temperature()
                 temp_delta = abs(internal_temperature - prev_internal_temperature)
-                self.logger.debug("temp delta = {}".format(temp_delta))
+                self.logger.debug("temp delta = {}", temp_delta)
                 if temp_delta < 0.5:
                     self.logger.debug("Internal temperature stabilized")
                     self.disable_internal_temperature()
@@ -153,7 +153,7 @@ class AtlasCo2Driver(driver.AtlasDriver):
             return None
 
         # Successfully read co2
-        self.logger.debug("CO2: {} ppm".format(co2))
+        self.logger.debug("CO2: {} ppm", co2)
         return co2
 
     def read_internal_temperature(self, retry: bool = True) -> Optional[float]:
@@ -180,7 +180,7 @@ class AtlasCo2Driver(driver.AtlasDriver):
         internal_temperature = round(internal_temperature_raw, 2)
 
         # Successfully read internal temperature
-        self.logger.debug("Internal Temp: {} C".format(internal_temperature))
+        self.logger.debug("Internal Temp: {} C", internal_temperature)
         return internal_temperature
 
     def enable_internal_temperature(self, retry: bool = True) -> None:
@@ -36,11 +36,7 @@ class AtlasCo2Manager(manager.PeripheralManager):
     def co2(self, value: float) -> None:
         """Sets co2 value in shared state. Does not update enironment from
         calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(self.name, self.co2_name, value)
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.co2_name, value
-            )
+        self.report_sensor_value(self.co2_name, value)
 
     def initialize_peripheral(self) -> None:
         """Initializes peripheral."""
@@ -29,7 +29,7 @@ class AtlasDODriver(driver.AtlasDriver):
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -95,7 +95,7 @@ class AtlasDODriver(driver.AtlasDriver):
             return None
 
         # Successfully read dissolved oxygen
-        self.logger.debug("DO: {}".format(do))
+        self.logger.debug("DO: {}", do)
         return do
 
     def enable_mg_l_output(self, retry: bool = True) -> None:
@@ -45,11 +45,7 @@ class AtlasDOManager(manager.PeripheralManager):
     def do(self, value: float) -> None:
         """Sets dissolved oxygen value in shared state. Does not update enironment from
         calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(self.name, self.do_name, value)
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.do_name, value
-            )
+        self.report_sensor_value(self.do_name, value)
 
     @property
     def temperature(self) -> Optional[float]:
@@ -27,7 +27,7 @@ class AtlasECDriver(driver.AtlasDriver):
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -99,7 +99,7 @@ class AtlasECDriver(driver.AtlasDriver):
             return None
 
         # Successfully read ec
-        self.logger.info("EC: {} mS/cm".format(ec))
+        self.logger.info("EC: {} mS/cm", ec)
         return ec
 
     def enable_ec_output(self, retry: bool = True) -> None:
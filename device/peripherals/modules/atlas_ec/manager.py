@@ -39,11 +39,7 @@ class AtlasECManager(manager.PeripheralManager):
     def ec(self, value: float) -> None:
         """Sets electrical conductivity value in shared state. 
         Does not update enironment from calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(self.name, self.ec_name, value)
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.ec_name, value
-            )
+        self.report_sensor_value(self.ec_name, value)
 
     @property
     def temperature(self) -> Optional[float]:
@@ -27,7 +27,7 @@ class AtlasPHDriver(driver.AtlasDriver):
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -92,5 +92,5 @@ class AtlasPHDriver(driver.AtlasDriver):
             return None
 
         # Succesfully read pH
-        self.logger.info("pH: {}".format(ph))
+        self.logger.info("pH: {}", ph)
         return ph
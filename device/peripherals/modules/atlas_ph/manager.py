@@ -39,11 +39,7 @@ class AtlasPHManager(manager.PeripheralManager):
     def ph(self, value: float) -> None:
         """Sets pH value in shared state. Does not update enironment 
         from calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(self.name, self.ph_name, value)
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.ph_name, value
-            )
+        self.report_sensor_value(self.ph_name, value)
 
     @property
     def temperature(self) -> Optional[float]:
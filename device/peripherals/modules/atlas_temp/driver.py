@@ -91,7 +91,7 @@ class AtlasTempDriver(driver.AtlasDriver):
             return None
 
         # Successfully read temperature
-        self.logger.debug("Temp: {} C".format(temperature))
+        self.logger.debug("Temp: {} C", temperature)
         return temperature
 
     def enable_data_logger(self, retry: bool = True) -> None:
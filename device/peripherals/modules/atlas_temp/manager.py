@@ -36,13 +36,7 @@ class AtlasTempManager(manager.PeripheralManager):
     def temperature(self, value: float) -> None:
         """Sets temperature value in shared state. Does not update enironment from
         calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(
-            self.name, self.temperature_name, value
-        )
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.temperature_name, value
-            )
+        self.report_sensor_value(self.temperature_name, value)
 
     def initialize_peripheral(self) -> None:
         """Initializes peripheral."""
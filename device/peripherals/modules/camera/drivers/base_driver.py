@@ -102,7 +102,7 @@ class CameraDriver(ABC):
                 # Convert exported value from non-pythonic none to pythonic None
                 if self.mux == "none":
                     self.mux = None
-                self.logger.debug("mux = {}".format(self.mux))
+                self.logger.debug("mux = {}", self.mux)
 
             # Convert i2c config params from hex to int if they exist
             if self.address is not None:
@@ -144,7 +144,7 @@ class USBCameraDriver(CameraDriver):
 
     def capture_image_pygame(self, camera_path: str, image_path: str) -> None:
         """Captures an image with pygame."""
-        self.logger.debug("Capturing image from camera: {}".format(camera_path))
+        self.logger.debug("Capturing image from camera: {}", camera_path)
 
         # Capture image
         try:
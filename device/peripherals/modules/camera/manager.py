@@ -4,7 +4,7 @@ import json
 import time
 
 # Import python types
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import device utilities
 from device.utilities import logger, accessors
@@ -19,6 +19,9 @@ from device.recipe import modes as recipe_modes
 class CameraManager(manager.PeripheralManager):  # type: ignore
     """Manages a camera peripheral."""
 
+    # Camera overrides normal mode loop so always runs on its own thread
+    is_schedulable = False
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Instantiates manager Instantiates parent class, and initializes 
         camera variable name."""
@@ -44,6 +47,11 @@ class CameraManager(manager.PeripheralManager):  # type: ignore
 
         self.logger.debug("Instantiating")
 
+    @property
+    def subscribed_paths(self) -> List[str]:
+        """Gets recipe mode path so new recipes trigger a capture."""
+        return ["recipe.mode"]
+
     @property
     def recipe_mode(self) -> str:
         """Gets recipe mode."""
@@ -112,7 +120,7 @@ class CameraManager(manager.PeripheralManager):  # type: ignore
             self.reset_lighting_conditions()
             self.health = 100.0
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to update: {}".format(e))
+            self.logger.debug("Unable to update: {}", e)
             self.mode = modes.ERROR
             self.health = 0
 
@@ -126,13 +134,16 @@ class CameraManager(manager.PeripheralManager):  # type: ignore
         # Initialize vars
         self._update_complete = True
         self.last_update = time.time()
+        self.subscribe_state()
 
         # Loop forever
         while True:
 
-            # Update every sampling interval
+            # Update every sampling interval or when a new recipe is started
             self.last_update_interval = time.time() - self.last_update
-            if self.sampling_interval < self.last_update_interval or self.new_recipe():
+            is_new_recipe = self.is_state_changed and self.new_recipe()
+            self.is_state_changed = False
+            if self.sampling_interval < self.last_update_interval or is_new_recipe:
                 message = "Updating peripheral, delta: {:.3f}".format(
                     self.last_update_interval
                 )
@@ -151,8 +162,8 @@ class CameraManager(manager.PeripheralManager):  # type: ignore
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.100)
+            # Wait for next update, recipe mode changes, events, or transitions
+            self.wait_until(self.last_update + self.sampling_interval)
 
     ##### HELPER FUNCTIONS #############################################################
 
@@ -44,7 +44,7 @@ class CCS811Driver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -144,8 +144,10 @@ class CCS811Driver:
             raise exceptions.ReadRegisterError(
                 message="status reg", logger=self.logger
             ) from e
+        return self.parse_status_register(byte)
 
-        # Parse status register byte
+    def parse_status_register(self, byte: int) -> StatusRegister:
+        """Parses status register byte."""
         status_register = StatusRegister(
             firmware_mode=bitwise.get_bit_from_byte(7, byte),
             app_valid=bool(bitwise.get_bit_from_byte(4, byte)),
@@ -234,7 +236,9 @@ class CCS811Driver:
         retry: bool = True,
     ) -> None:
         """Writes compensation temperature and / or humidity to sensor."""
-        self.logger.debug("Writing environment data temp: {} humidity: {}".format(temperature, humidity))
+        self.logger.debug(
+            "Writing environment data temp: {} humidity: {}", temperature, humidity
+        )
 
         # Check valid environment values
         if temperature is None or humidity is None:
@@ -289,33 +293,30 @@ class CCS811Driver:
 
         # Read status register
         try:
-            status = self.read_status_register()
+            status = self.read_status_register(retry=retry)
         except exceptions.ReadRegisterError as e:
             raise exceptions.ReadAlgorithmDataError(logger=self.logger) from e
 
-        # TODO: This shouldn't be recursive, otherwise we'll end up reading multiple times after the fact \
-        #   Potentially this is fixed by just adding a return to the read_algorithm_data line in the if reread section
         # Check if data is ready
         if not status.data_ready:
             if reread:
                 self.logger.debug("Data not ready yet, re-reading in 1 second")
                 time.sleep(1)
-                self.read_algorithm_data(retry=retry, reread=reread - 1)
+                return self.read_algorithm_data(retry=retry, reread=reread - 1)
             else:
                 self.logger.debug("Data not ready yet, skipping reading")
                 return None, None
 
-        # Get algorithm data
+        # Get algorithm data only once it is ready, reading the result register
+        # clears data ready. Pointer write and read are one combined transfer
         try:
-            with self.i2c_lock:
-                self.i2c.write(bytes([0x02]), retry=retry)
-                bytes_ = self.i2c.read(4)
-            self.logger.debug("CO2 MSB: 0x{:02X}".format(bytes_[0]))
-            self.logger.debug("CO2 LSB: 0x{:02X}".format(bytes_[1]))
-            self.logger.debug("TVOC MSB: 0x{:02X}".format(bytes_[2]))
-            self.logger.debug("TVOC LSB: 0x{:02X}".format(bytes_[3]))
-        except I2CError:
+            bytes_ = self.i2c.read_registers(0x02, 4, retry=retry)
+        except I2CError as e:
             raise exceptions.ReadAlgorithmDataError(logger=self.logger) from e
+        self.logger.debug("CO2 MSB: 0x{:02X}", bytes_[0])
+        self.logger.debug("CO2 LSB: 0x{:02X}", bytes_[1])
+        self.logger.debug("TVOC MSB: 0x{:02X}", bytes_[2])
+        self.logger.debug("TVOC LSB: 0x{:02X}", bytes_[3])
 
         # Check if the i2c data lines aren't getting pulled low fast enough
         # TODO: Investigate this from the hardware lens
@@ -338,14 +339,14 @@ class CCS811Driver:
             self.logger.warning(f"CO2: Outside of valid range: {co2}")
             co2 = None
         else:
-            self.logger.debug("CO2: {} ppm".format(co2))
+            self.logger.debug("CO2: {} ppm", co2)
 
         # Verify tvoc within valid range
         if tvoc < self.min_tvoc or tvoc > self.max_tvoc:
             self.logger.warning(f"TVOC: Outside of valid range: {tvoc}")
             tvoc = None
         else:
-            self.logger.debug("TVOC: {} ppb".format(tvoc))
+            self.logger.debug("TVOC: {} ppb", tvoc)
 
         # Successfully read sensor data
         return co2, tvoc
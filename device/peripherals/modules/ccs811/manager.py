@@ -31,7 +31,11 @@ class CCS811Manager(manager.PeripheralManager):  # type: ignore
 
         self.enable_compensation = self.properties.get("enable_compensation", True)
         if self.enable_compensation:
-            self.logger.info("Using temperature/humidity compensation from {}, {}".format(self.temperature_name, self.humidity_name))
+            self.logger.info(
+                "Using temperature/humidity compensation from {}, {}",
+                self.temperature_name,
+                self.humidity_name,
+            )
         else:
             self.logger.info("Not using external temp/humidity data compensation")
 
@@ -52,11 +56,7 @@ class CCS811Manager(manager.PeripheralManager):  # type: ignore
     def co2(self, value: float) -> None:
         """Sets co2 value in shared state. Does not update environment from 
         calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(self.name, self.co2_name, value)
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.co2_name, value
-            )
+        self.report_sensor_value(self.co2_name, value)
 
     @property
     def tvoc(self) -> Optional[float]:
@@ -72,13 +72,7 @@ class CCS811Manager(manager.PeripheralManager):  # type: ignore
     def tvoc(self, value: float) -> None:
         """ Sets tvoc value in shared state. Does not update environment from 
         calibration mode. """
-        self.state.set_peripheral_reported_sensor_value(
-            self.name, self.tvoc_name, value
-        )
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.tvoc_name, value
-            )
+        self.report_sensor_value(self.tvoc_name, value)
 
     @property
     def temperature(self) -> Optional[float]:
@@ -146,7 +140,11 @@ class CCS811Manager(manager.PeripheralManager):  # type: ignore
                 else:
                     temperature = self.temperature
 
-                self.logger.info("Updating compensation values to {} degC, {} RH".format(temperature, humidity))
+                self.logger.info(
+                    "Updating compensation values to {} degC, {} RH",
+                    temperature,
+                    humidity,
+                )
 
                 # Set compensation variables
                 try:
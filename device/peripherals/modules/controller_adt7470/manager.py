@@ -128,7 +128,7 @@ class ControllerADT7470Manager(manager.PeripheralManager):
                 tachometer_enabled = actuator.get("tachometer_enabled")
                 if tachometer_enabled:
                     fan_speed = self.driver.read_fan_speed(fan_id)
-                    self.logger.debug("Fan {}: Speed: {} RPM".format(fan_id, fan_speed))
+                    self.logger.debug("Fan {}: Speed: {} RPM", fan_id, fan_speed)
                     if fan_speed == 0:
                         self.logger.error("Unable to verify fan {} is functional".format(fan_id))
                         self.health = 60.0
@@ -172,22 +172,28 @@ class ControllerADT7470Manager(manager.PeripheralManager):
             return
 
         try:
-            # Update sensors
+            # Update sensors, all sensors are read in one i2c transfer
+            sensor_ids = [sensor.get("sensor_id") for sensor in self.sensors]
+            temperatures = {}
+            if sensor_ids != []:
+                temperatures = self.driver.read_temperatures(sensor_ids)
             for sensor in self.sensors:
                 sensor_id = sensor.get("sensor_id")
                 variable_name = sensor.get("variable_name")
-                temperature = self.driver.read_temperature(sensor_id, reset_monitor=False)
-                self.set_sensor(variable_name, temperature)
+                self.set_sensor(variable_name, temperatures[sensor_id])
 
-            # Update actuators
+            # Update actuators, all fans are read in one i2c transfer
             health = 100.0
+            fan_ids = [actuator.get("fan_id") for actuator in self.actuators]
+            fans = {}
+            if fan_ids != []:
+                fans = self.driver.read_fans(fan_ids)
             for actuator in self.actuators:
                 fan_id = actuator.get("fan_id")
                 duty_cycle_name = actuator.get("duty_cycle_name")
                 fan_speed_name = actuator.get("fan_speed_name")
                 tachometer_enabled = actuator.get("tachometer_enabled")
-                duty_cycle = self.driver.read_current_duty_cycle(fan_id)
-                fan_speed = self.driver.read_fan_speed(fan_id)
+                duty_cycle, fan_speed = fans[fan_id]
                 self.set_actuator(duty_cycle_name, duty_cycle)
                 self.set_actuator(fan_speed_name, fan_speed)
                 if tachometer_enabled and duty_cycle > 0 and fan_speed == 0:
@@ -197,7 +203,7 @@ class ControllerADT7470Manager(manager.PeripheralManager):
                                                                                                       fan_speed))
                     health = 60.0
             self.health = health
-        except exceptions.DriverError as e:
+        except (exceptions.DriverError, driver.exceptions.DriverError) as e:
             self.logger.exception("Unable to update peripheral: {}".format(e))
             self.mode = modes.ERROR
             self.health = 0.0
@@ -9,6 +9,7 @@ from device.utilities import logger, bitwise, maths
 from device.utilities.communication.i2c.main import I2C
 from device.utilities.communication.i2c.exceptions import I2CError
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.buses import bus_registry, parse_bus
 
 # Import peripheral utilities
 from device.peripherals.utilities import light
@@ -53,14 +54,11 @@ class LEDDAC5578Panel(object):
         # Check if using default bus
         if self.bus == "default":
             self.logger.debug("Using default i2c bus")
-            self.bus = os.getenv("DEFAULT_I2C_BUS")
+        self.bus = parse_bus(self.bus)
 
-        # Convert exported value from non-pythonic none to pythonic None
-        if self.bus == "none":
-            self.bus = None
-
-        if self.bus != None:
-            self.bus = int(self.bus)
+        # Use lock of panel bus, panels may be on a different bus than the
+        # peripheral
+        self.i2c_lock = bus_registry.get_lock(self.bus, simulate)
 
         # Check if using default mux
         if self.mux == "default":
@@ -70,7 +68,7 @@ class LEDDAC5578Panel(object):
         # Convert exported value from non-pythonic none to pythonic None
         if self.mux == "none":
             self.mux = None
-        self.logger.debug("mux = {}".format(self.mux))
+        self.logger.debug("mux = {}", self.mux)
 
         # Convert i2c config params from hex to int if they exist
         if self.address != None:
@@ -84,7 +82,7 @@ class LEDDAC5578Panel(object):
 
     def initialize(self) -> None:
         """Initializes panel."""
-        self.logger.debug("Initializing {}".format(self.name))
+        self.logger.debug("Initializing {}", self.name)
         try:
             self.driver = DAC5578Driver(
                 name=self.full_name,
@@ -205,7 +203,7 @@ class LEDDAC5578Driver:
     def set_outputs(self, par_setpoints: dict) -> None:
         """Sets outputs on light panels. Converts channel names to channel numbers, 
         translates par setpoints to dac setpoints, then sets dac."""
-        self.logger.debug("Setting outputs: {}".format(par_setpoints))
+        self.logger.debug("Setting outputs: {}", par_setpoints)
 
         # Check at least one panel is active
         active_panels = [panel for panel in self.panels if not panel.is_shutdown]
@@ -264,7 +262,7 @@ class LEDDAC5578Driver:
     def set_output(self, channel_name: str, par_setpoint: float) -> None:
         """Sets output on light panels. Converts channel name to channel number, 
         translates par setpoint to dac setpoint, then sets dac."""
-        self.logger.debug("Setting ch {}: {}".format(channel_name, par_setpoint))
+        self.logger.debug("Setting ch {}: {}", channel_name, par_setpoint)
 
         # Check at least one panel is active
         active_panels = [panel for panel in self.panels if not panel.is_shutdown]
@@ -320,7 +318,7 @@ class LEDDAC5578Driver:
         channel_outputs = {}
         for key in self.channels.keys():  # type: ignore
             channel_outputs[key] = value
-        self.logger.debug("channel outputs = {}".format(channel_outputs))
+        self.logger.debug("channel outputs = {}", channel_outputs)
         return channel_outputs
 
     def translate_setpoints(self, par_setpoints: Dict) -> Dict:
@@ -334,8 +332,8 @@ class LEDDAC5578Driver:
             dac_list.append(float(dac_percent))
             par_list.append(float(par_percent))
 
-        self.logger.debug("dac_list = {}".format(dac_list))
-        self.logger.debug("par_list = {}".format(par_list))
+        self.logger.debug("dac_list = {}", dac_list)
+        self.logger.debug("par_list = {}", par_list)
 
         # Get dac setpoints
         dac_setpoints = {}
@@ -345,7 +343,7 @@ class LEDDAC5578Driver:
 
         # Successfully translated dac setpoints
         self.logger.debug(
-            "Translated setpoints from {} to {}".format(par_setpoints, dac_setpoints)
+            "Translated setpoints from {} to {}", par_setpoints, dac_setpoints
         )
         return dac_setpoints
 
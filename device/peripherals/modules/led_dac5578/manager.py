@@ -2,7 +2,7 @@
 import threading, time
 
 # Import python types
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import device utilities
 from device.utilities import maths
@@ -51,6 +51,12 @@ class LEDDAC5578Manager(manager.PeripheralManager):
         channels = self.panel_properties.get("channels", {})  # type: ignore
         self.channel_names = channels.keys()
 
+    @property
+    def subscribed_paths(self) -> List[str]:
+        """Gets desired light paths so recipe changes update panels immediately."""
+        names = [self.intensity_name, self.spectrum_name, self.distance_name]
+        return ["environment.sensor.desired.{}".format(name) for name in names]
+
     @property
     def spectrum(self) -> Any:
         """Gets spectrum value."""
@@ -260,9 +266,7 @@ class LEDDAC5578Manager(manager.PeripheralManager):
             and self.desired_intensity != self.prev_desired_intensity
         ):
             self.logger.info("Received new desired intensity")
-            self.logger.debug(
-                "desired_intensity = {} Watts".format(self.desired_intensity)
-            )
+            self.logger.debug("desired_intensity = {} Watts", self.desired_intensity)
             self.distance = self.desired_distance
             update_required = True
 
@@ -272,7 +276,7 @@ class LEDDAC5578Manager(manager.PeripheralManager):
             and self.desired_spectrum != self.prev_desired_spectrum
         ):
             self.logger.info("Received new desired spectrum")
-            self.logger.debug("desired_spectrum = {}".format(self.desired_spectrum))
+            self.logger.debug("desired_spectrum = {}", self.desired_spectrum)
             update_required = True
 
         # Check for new illumination distance
@@ -281,7 +285,7 @@ class LEDDAC5578Manager(manager.PeripheralManager):
             and self.desired_distance != self.prev_desired_distance
         ):
             self.logger.info("Received new desired illumination distance")
-            self.logger.debug("desired_distance = {} cm".format(self.desired_distance))
+            self.logger.debug("desired_distance = {} cm", self.desired_distance)
             update_required = True
 
         # Check if all desired values exist:
@@ -339,7 +343,7 @@ class LEDDAC5578Manager(manager.PeripheralManager):
             return
 
         # Update reported values
-        self.logger.debug("self.spectrum = {}".format(self.spectrum))
+        self.logger.debug("self.spectrum = {}", self.spectrum)
         self.channel_setpoints = result[0]
         self.spectrum = result[1]
         self.intensity = result[2]
@@ -705,7 +709,7 @@ class LEDDAC5578Manager(manager.PeripheralManager):
                 for value in range(0, 110, 10):
 
                     # Set driver output
-                    self.logger.info("Channel {}: {}%".format(channel_name, value))
+                    self.logger.info("Channel {}: {}%", channel_name, value)
                     try:
                         self.driver.set_output(channel_name, value)
                     except Exception as e:
@@ -723,7 +727,7 @@ class LEDDAC5578Manager(manager.PeripheralManager):
                 for value in range(100, -10, -10):
 
                     # Set driver output
-                    self.logger.info("Channel {}: {}%".format(channel_name, value))
+                    self.logger.info("Channel {}: {}%", channel_name, value)
                     try:
                         self.driver.set_output(channel_name, value)
                     except Exception as e:
@@ -36,7 +36,7 @@ class SHT25Driver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -104,7 +104,7 @@ class SHT25Driver:
             return None
 
         # Successfully read temperature
-        self.logger.debug("Temperature: {} C".format(temperature))
+        self.logger.debug("Temperature: {} C", temperature)
         return temperature
 
     def read_humidity(self, retry: bool = True) -> Optional[float]:
@@ -136,7 +136,7 @@ class SHT25Driver:
             return None
 
         # Successfully read humidity
-        self.logger.debug("Humidity: {} %".format(humidity))
+        self.logger.debug("Humidity: {} %", humidity)
         return humidity
 
     def read_user_register(self, retry: bool = True) -> UserRegister:
@@ -160,7 +160,7 @@ class SHT25Driver:
         )
 
         # Successfully read user register
-        self.logger.debug("User register: {}".format(user_register))
+        self.logger.debug("User register: {}", user_register)
         return user_register
 
     def reset(self, retry: bool = True) -> None:
@@ -38,13 +38,7 @@ class SHT25Manager(manager.PeripheralManager):
     def temperature(self, value: float) -> None:
         """Sets temperature value in shared state. Does not update environment from 
         calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(
-            self.name, self.temperature_name, value
-        )
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.temperature_name, value
-            )
+        self.report_sensor_value(self.temperature_name, value)
 
     @property
     def humidity(self) -> Optional[float]:
@@ -60,13 +54,7 @@ class SHT25Manager(manager.PeripheralManager):
     def humidity(self, value: float) -> None:
         """Sets humidity value in shared state. Does not update environment from 
         calibration mode."""
-        self.state.set_peripheral_reported_sensor_value(
-            self.name, self.humidity_name, value
-        )
-        if self.mode != modes.CALIBRATE:
-            self.state.set_environment_reported_sensor_value(
-                self.name, self.humidity_name, value
-            )
+        self.report_sensor_value(self.humidity_name, value)
 
     def initialize_peripheral(self) -> None:
         """Initializes manager."""
@@ -91,7 +79,7 @@ class SHT25Manager(manager.PeripheralManager):
                 mux_simulator=self.mux_simulator,
             )
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to initialize: {}".format(e))
+            self.logger.debug("Unable to initialize: {}", e)
             self.health = 0.0
             self.mode = modes.ERROR
 
@@ -107,7 +95,7 @@ class SHT25Manager(manager.PeripheralManager):
         try:
             temperature = self.driver.read_temperature()
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to read temperature: {}".format(e))
+            self.logger.debug("Unable to read temperature: {}", e)
             self.mode = modes.ERROR
             self.health = 0.0
             return
@@ -116,7 +104,7 @@ class SHT25Manager(manager.PeripheralManager):
         try:
             humidity = self.driver.read_humidity()
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to read humidity: {}".format(e))
+            self.logger.debug("Unable to read humidity: {}", e)
             self.mode = modes.ERROR
             self.health = 0.0
             return
@@ -137,7 +125,7 @@ class SHT25Manager(manager.PeripheralManager):
         try:
             self.driver.reset()
         except exceptions.DriverError as e:
-            self.logger.debug("Unable to reset driver: {}".format(e))
+            self.logger.debug("Unable to reset driver: {}", e)
 
         # Sucessfully reset
         self.logger.debug("Successfully reset")
@@ -95,3 +95,19 @@ def test_shutdown_peripheral() -> None:
     )
     manager.initialize_peripheral()
     manager.shutdown_peripheral()
+
+
+def test_health_publishes_circuit_breakers() -> None:
+    state = State()
+    manager = SHT25Manager(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        state=state,
+        config=peripheral_config,
+        simulate=True,
+        mux_simulator=MuxSimulator(),
+    )
+    manager.initialize_peripheral()
+    manager.health = 100.0
+    breakers = state.get_peripheral_value("Test", "circuit_breakers")
+    assert list(breakers.values())[0]["state"] == "closed"
@@ -39,7 +39,7 @@ class T6713Driver:
         self,
         name: str,
         i2c_lock: threading.RLock,
-        bus: int,
+        bus: Optional[int],
         address: int,
         mux: Optional[int] = None,
         channel: Optional[int] = None,
@@ -152,7 +152,7 @@ class T6713Driver:
             return None
 
         # Successfully read carbon dioxide
-        self.logger.debug("Co2: {} ppm".format(co2))
+        self.logger.debug("Co2: {} ppm", co2)
         return co2
 
     def read_status(self, retry: bool = True) -> Status:
@@ -181,7 +181,7 @@ class T6713Driver:
         )
 
         # Successfully read status
-        self.logger.debug("Status: {}".format(status))
+        self.logger.debug("Status: {}", status)
         return status
 
     def enable_abc_logic(self, retry: bool = True) -> None:
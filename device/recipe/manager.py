@@ -67,8 +67,9 @@ class RecipeManager(StateMachineManager):
     def mode(self, value: str) -> None:
         """Safely updates recipe mode in shared state."""
         self._mode = value
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["mode"] = value
+        self.notify_mode_observers(value)
 
     @property
     def stored_mode(self) -> Optional[str]:
@@ -82,7 +83,7 @@ class RecipeManager(StateMachineManager):
     @stored_mode.setter
     def stored_mode(self, value: Optional[str]) -> None:
         """Safely updates stored mode in shared state."""
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["stored_mode"] = value
 
     @property
@@ -97,7 +98,7 @@ class RecipeManager(StateMachineManager):
     @recipe_uuid.setter
     def recipe_uuid(self, value: Optional[str]) -> None:
         """Safely updates recipe uuid in shared state."""
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["recipe_uuid"] = value
 
     @property
@@ -112,7 +113,7 @@ class RecipeManager(StateMachineManager):
     @recipe_name.setter
     def recipe_name(self, value: Optional[str]) -> None:
         """ afely updates recipe name in shared state."""
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["recipe_name"] = value
 
     @property
@@ -123,7 +124,7 @@ class RecipeManager(StateMachineManager):
     @is_active.setter
     def is_active(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["is_active"] = value
 
     @property
@@ -131,6 +132,11 @@ class RecipeManager(StateMachineManager):
         """ Get current timestamp in minutes. """
         return int(time.time() / 60)
 
+    @property
+    def next_minute_timestamp(self) -> float:
+        """ Gets timestamp of next minute boundary in seconds. """
+        return float((self.current_timestamp_minutes + 1) * 60)
+
     @property
     def start_timestamp_minutes(self) -> Optional[int]:
         """ Gets start timestamp minutes from shared state. """
@@ -161,7 +167,7 @@ class RecipeManager(StateMachineManager):
             start_datestring = None
 
         # Update start timestamp minutes and datestring in shared state
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["start_timestamp_minutes"] = value
             self.state.recipe["start_datestring"] = start_datestring
 
@@ -190,7 +196,7 @@ class RecipeManager(StateMachineManager):
             duration_string = None
 
         # Safely update duration minutes and string in shared state
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["duration_minutes"] = value
             self.state.recipe["duration_string"] = duration_string
 
@@ -230,7 +236,7 @@ class RecipeManager(StateMachineManager):
             time_elapsed_string = None
 
         # Safely update values in shared state
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["last_update_minute"] = value
             self.state.recipe["percent_complete"] = percent_complete
             self.state.recipe["percent_complete_string"] = percent_complete_string
@@ -279,7 +285,7 @@ class RecipeManager(StateMachineManager):
     @current_phase.setter
     def current_phase(self, value: str) -> None:
         """Safely updates current phase in shared state."""
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["current_phase"] = value
 
     @property
@@ -294,7 +300,7 @@ class RecipeManager(StateMachineManager):
     @current_cycle.setter
     def current_cycle(self, value: Optional[str]) -> None:
         """Safely updates current cycle in shared state."""
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["current_cycle"] = value
 
     @property
@@ -309,7 +315,7 @@ class RecipeManager(StateMachineManager):
     @current_environment_name.setter
     def current_environment_name(self, value: Optional[str]) -> None:
         """Safely updates current environment name in shared state."""
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["current_environment_name"] = value
 
     @property
@@ -320,9 +326,9 @@ class RecipeManager(StateMachineManager):
     @current_environment_state.setter
     def current_environment_state(self, value: Optional[Dict]) -> None:
         """ Safely updates current environment state in shared state. """
-        with self.state.lock:
+        with self.state.writing("recipe"):
             self.state.recipe["current_environment_state"] = value
-            self.set_desired_sensor_values(value)  # type: ignore
+        self.set_desired_sensor_values(value)  # type: ignore
 
     ##### STATE MACHINE FUNCTIONS ######################################################
 
@@ -401,8 +407,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.NORECIPE):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events and transitions
+            self.wait()
 
     def run_start_mode(self) -> None:
         """Runs start mode. Loads commanded recipe uuid into shared state, 
@@ -486,8 +492,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.QUEUED):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next minute, events, or transitions
+            self.wait_until(self.next_minute_timestamp)
 
     def run_normal_mode(self) -> None:
         """ Runs normal mode. Updates recipe and environment states every minute. 
@@ -523,8 +529,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next minute, events, or transitions
+            self.wait_until(self.next_minute_timestamp)
 
     def run_pause_mode(self) -> None:
         """Runs pause mode. Clears recipe and desired sensor state, waits for new 
@@ -548,8 +554,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.PAUSE):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events and transitions
+            self.wait()
 
     def run_stop_mode(self) -> None:
         """Runs stop mode. Clears recipe and desired sensor state then transitions
@@ -590,8 +596,8 @@ class RecipeManager(StateMachineManager):
             if self.new_transition(modes.ERROR):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events and transitions
+            self.wait()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode. Clears error state then transitions to init mode."""
@@ -641,7 +647,7 @@ class RecipeManager(StateMachineManager):
 
     def clear_desired_sensor_state(self) -> None:
         """ Sets desired sensor state to null values. """
-        with self.state.lock:
+        with self.state.writing("environment"):
             for variable in self.state.environment["sensor"]["desired"]:
                 self.state.environment["sensor"]["desired"][variable] = None
 
@@ -679,7 +685,7 @@ class RecipeManager(StateMachineManager):
 
     def set_desired_sensor_values(self, environment_dict: Dict) -> None:
         """Sets desired sensor values from provided environment dict."""
-        with self.state.lock:
+        with self.state.writing("environment"):
             for variable in environment_dict:
                 value = environment_dict[variable]
                 self.state.environment["sensor"]["desired"][variable] = value
@@ -80,7 +80,7 @@ class ResourceManager(manager.StateMachineManager):
     @status.setter
     def status(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("resource"):
             self.state.resource["status"] = value
 
     @property
@@ -92,7 +92,7 @@ class ResourceManager(manager.StateMachineManager):
     @free_disk.setter
     def free_disk(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("resource"):
             # TODO: Fix name
             self.state.resource["available_disk_space"] = value
 
@@ -104,7 +104,7 @@ class ResourceManager(manager.StateMachineManager):
     @free_memory.setter
     def free_memory(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("resource"):
             self.state.resource["free_memory"] = value
 
     ##### STATE MACHINE FUNCTIONS ######################################################
@@ -155,8 +155,8 @@ class ResourceManager(manager.StateMachineManager):
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)  # TODO: Do we really need to update this frequently?
+            # Wait for next update, events, or transitions
+            self.wait_until(last_update_time + update_interval)
 
     ##### HELPER FUNCTIONS #############################################################
 
@@ -53,7 +53,7 @@ class UpgradeManager(manager.StateMachineManager):
     @status.setter
     def status(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("upgrade"):
             self.state.upgrade["status"] = value
 
     @property
@@ -64,7 +64,7 @@ class UpgradeManager(manager.StateMachineManager):
     @current_version.setter
     def current_version(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("upgrade"):
             self.state.upgrade["current_version"] = value
 
     @property
@@ -75,7 +75,7 @@ class UpgradeManager(manager.StateMachineManager):
     @upgrade_version.setter
     def upgrade_version(self, value: str) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("upgrade"):
             self.state.upgrade["upgrade_version"] = value
 
     @property
@@ -86,7 +86,7 @@ class UpgradeManager(manager.StateMachineManager):
     @upgrade_available.setter
     def upgrade_available(self, value: bool) -> None:
         """Safely updates value in shared state."""
-        with self.state.lock:
+        with self.state.writing("upgrade"):
             self.state.upgrade["upgrade_available"] = value
 
     ##### STATE MACHINE FUNCTIONS ######################################################
@@ -143,8 +143,8 @@ class UpgradeManager(manager.StateMachineManager):
             if self.new_transition(modes.AUTOMATIC):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for next update, events, or transitions
+            self.wait_until(last_update_time + update_interval)
 
     def run_manual_mode(self) -> None:
         """Runs manual mode."""
@@ -164,8 +164,8 @@ class UpgradeManager(manager.StateMachineManager):
             if self.new_transition(modes.MANUAL):
                 break
 
-            # Update every minute
-            time.sleep(60)
+            # Wait for events and transitions
+            self.wait()
 
     ##### HELPER FUNCTIONS #############################################################
 
@@ -1,8 +1,8 @@
 # Import python modules
-import threading, subprocess, numpy
+import threading, subprocess, copy, numpy
 
 # Import python types
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, ContextManager
 
 # Import device utilities
 from device.utilities import constants
@@ -43,7 +43,7 @@ def dictify_list(list_: List[Any], reference_dict: Dict[str, Any]) -> Dict[str,
 
 
 def set_nested_dict_safely(
-    nested_dict: Dict, keys: List, value: Any, lock: threading.RLock
+    nested_dict: Dict, keys: List, value: Any, lock: ContextManager
 ) -> None:
     """ Safely sets value in nested dict. """
     with lock:
@@ -68,6 +68,47 @@ def get_nested_dict_safely(nested_dict: Dict, keys: List) -> Any:
     return value
 
 
+class ReadOnlyDict(dict):
+    """Dict that raises a TypeError on mutation. Copies are mutable plain dicts."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Unable to modify read-only dict")
+
+    __setitem__ = __delitem__ = _readonly  # type: ignore
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+
+    def __copy__(self) -> Dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict) -> Dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+class ReadOnlyList(list):
+    """List that raises a TypeError on mutation. Copies are mutable plain lists."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Unable to modify read-only list")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly  # type: ignore
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly  # type: ignore
+
+    def __copy__(self) -> List:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict) -> List:
+        return [copy.deepcopy(value, memo) for value in self]
+
+
+def freeze(value: Any) -> Any:
+    """Recursively converts dicts and lists into read-only dicts and lists."""
+    if isinstance(value, dict):
+        return ReadOnlyDict((key, freeze(item)) for key, item in value.items())
+    elif isinstance(value, list):
+        return ReadOnlyList(freeze(item) for item in value)
+    return value
+
+
 def floatify_string(value: str) -> float:
     """Converts a num string (e.g. 10M or 10K) to a float."""
     unit = value[-1]
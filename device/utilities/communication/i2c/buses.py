@@ -0,0 +1,153 @@
+# Import standard python modules
+import os, threading
+
+# Import python types
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import device utilities
+from device.utilities.functiontools import CircuitBreaker
+
+# Import i2c package elements
+from device.utilities.communication.i2c.device_io import USB_I2C_URL
+from device.utilities.communication.i2c.exceptions import CircuitOpenError
+from device.utilities.communication.i2c.scheduler import (
+    IS_I2C_SCHEDULER_ENABLED,
+    BusScheduler,
+)
+
+# Initialize key of simulated bus, simulated muxes are shared by all buses
+SIMULATED_BUS_KEY = "simulator"
+
+# Initialize circuit breaker settings, after threshold consecutive failed tries a
+# device fails fast for cooldown seconds, threshold 0 disables breakers
+I2C_BREAKER_THRESHOLD = int(os.getenv("I2C_BREAKER_THRESHOLD", "5"))
+I2C_BREAKER_COOLDOWN = float(os.getenv("I2C_BREAKER_COOLDOWN", "30"))
+
+
+def parse_bus(value: Any) -> Optional[int]:
+    """Parses bus number from a communication config value, `default` is the
+    platform default bus and `none` or None is no bus."""
+    if value == "default":
+        value = os.getenv("DEFAULT_I2C_BUS")
+    if value == None or value == "none":
+        return None
+    return int(value)
+
+
+def get_bus_key(bus: Optional[int], simulate: bool = False) -> str:
+    """Gets key of physical bus. All buses of the usb-i2c adapter share one
+    physical bus and all simulated buses share the simulated muxes."""
+    if simulate:
+        return SIMULATED_BUS_KEY
+    if os.getenv("IS_I2C_ENABLED") != "true":
+        if os.getenv("IS_USB_I2C_ENABLED") == "true":
+            return USB_I2C_URL
+    return "/dev/i2c-{}".format(bus)
+
+
+class BusRegistry(object):
+    """Hands out one lock per physical i2c bus so devices on independent buses
+    communicate in parallel while devices on the same bus take turns. When
+    scheduling is enabled the locks are bus schedulers that take turns by
+    priority instead of thread wake up order."""
+
+    def __init__(self, schedule: bool = IS_I2C_SCHEDULER_ENABLED) -> None:
+        """Initializes bus registry."""
+        self.schedule = schedule
+        self.locks: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def get_lock(self, bus: Optional[int], simulate: bool = False) -> threading.RLock:
+        """Gets lock of physical bus."""
+        key = get_bus_key(bus, simulate)
+        with self.lock:
+            if key not in self.locks:
+                if self.schedule:
+                    self.locks[key] = BusScheduler(key)
+                else:
+                    self.locks[key] = threading.RLock()
+            return self.locks[key]
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets scheduler metrics by bus key."""
+        with self.lock:
+            locks = dict(self.locks)
+        return {
+            key: lock.metrics
+            for key, lock in locks.items()
+            if isinstance(lock, BusScheduler)
+        }
+
+
+# Initialize process-wide bus registry
+bus_registry = BusRegistry()
+
+
+class BreakerRegistry(object):
+    """Hands out one circuit breaker per i2c device, keyed by physical bus, mux
+    channel and address, so breaker state outlives drivers that are recreated
+    when a peripheral reinitializes or resets."""
+
+    def __init__(
+        self,
+        threshold: int = I2C_BREAKER_THRESHOLD,
+        cooldown: float = I2C_BREAKER_COOLDOWN,
+    ) -> None:
+        """Initializes breaker registry."""
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.breakers: Dict[Tuple, CircuitBreaker] = {}
+        self.lock = threading.Lock()
+
+    def get_breaker(
+        self,
+        name: str,
+        bus_key: str,
+        address: int,
+        mux: Optional[int] = None,
+        channel: Optional[int] = None,
+    ) -> Optional[CircuitBreaker]:
+        """Gets circuit breaker of device, None if breakers are disabled."""
+        if self.threshold <= 0:
+            return None
+        key = (bus_key, mux, channel, address)
+        with self.lock:
+            if key not in self.breakers:
+                self.breakers[key] = CircuitBreaker(
+                    name, CircuitOpenError, self.threshold, self.cooldown
+                )
+            return self.breakers[key]
+
+    def find_breakers(
+        self,
+        bus_key: str,
+        mux: Optional[int] = None,
+        channel: Optional[int] = None,
+        address: Optional[int] = None,
+    ) -> List[CircuitBreaker]:
+        """Finds existing circuit breakers of devices on bus, mux and channel,
+        only of the device at address if address is not None."""
+        with self.lock:
+            return [
+                breaker
+                for key, breaker in self.breakers.items()
+                if key[:3] == (bus_key, mux, channel)
+                and (address == None or key[3] == address)
+            ]
+
+    def reset(self) -> None:
+        """Removes all breakers."""
+        with self.lock:
+            self.breakers = {}
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets breaker state by device name."""
+        with self.lock:
+            breakers = list(self.breakers.values())
+        return {breaker.name: breaker.metrics for breaker in breakers}
+
+
+# Initialize process-wide breaker registry
+breaker_registry = BreakerRegistry()
@@ -1,12 +1,14 @@
 # Import standard python modules
-import fcntl, io, os
-from typing import Optional, Type, Callable, cast, Any, TypeVar
+import errno, fcntl, io, os
+from typing import Optional, Type, Callable, cast, Any, TypeVar, List, Tuple, Union
 from types import TracebackType
 
 # Import device utilities
 from device.utilities.logger import Logger
 
 # Import usb-i2c driver
+from usb.core import USBError
+from pyftdi.ftdi import FtdiError
 from pyftdi.i2c import I2cController, I2cIOError, I2cNackError
 
 # Import i2c package elements
@@ -20,12 +22,15 @@ from device.utilities.communication.i2c.utilities import (
     make_i2c_rdwr_data,
     c_uint8,
     pointer,
+    POINTER,
+    cast as c_cast,
 )
+from device.utilities.communication.i2c.handles import BusHandle, handle_pool
 
 # Initialize I2C communication options
-I2C_SLAVE = 0x0703  # Use this slave address
 I2C_RDWR = 0x0707  # Combined R/W transfer (one STOP only)
 I2C_M_RD = 0x0001  # read data, from slave to master
+I2C_RDWR_MAX_MESSAGES = 42  # I2C_RDWR_IOCTL_MAX_MSGS
 
 # Initialize type checking variables
 F = TypeVar("F", bound=Callable[..., Any])
@@ -33,20 +38,61 @@ ET = TypeVar("ET", bound=Optional[Type[BaseException]])
 EV = TypeVar("EV", bound=Optional[BaseException])
 EB = TypeVar("EB", bound=Optional[TracebackType])
 
+# Initialize usb-i2c controller url
+USB_I2C_URL = os.getenv("USB_I2C_URL", "ftdi://ftdi:232h/1")
+
+# Initialize errno values of a stream that must be reopened, devices that do not
+# ack (ENXIO, EREMOTEIO) leave the stream usable
+BROKEN_STREAM_ERRNOS = [errno.EBADF, errno.ENODEV, errno.EIO]
+
+
+def is_broken_stream(error: Optional[BaseException]) -> bool:
+    """Checks if an io error was caused by a broken stream, e.g. a closed
+    descriptor, a removed bus or a usb-i2c adapter error."""
+    if isinstance(error, I2cNackError):
+        return False
+    elif isinstance(error, (FtdiError, USBError)):
+        return True
+    return isinstance(error, OSError) and error.errno in BROKEN_STREAM_ERRNOS
+
 
 def manage_io(func: F) -> F:
-    """Manages opening/closing io stream."""
+    """Runs function on pooled io stream of bus while holding the stream lock.
+    Invalidates stream on broken stream errors so the next access reopens it."""
 
     def wrapper(*args, **kwds):  # type: ignore
         self = args[0]
-        self.open()
-        resp = func(*args, **kwds)
-        self.close()
-        return resp
+        while True:
+            handle = self.open()
+            with handle.lock:
+                if handle.closed:
+                    continue
+                try:
+                    return func(*args, **kwds)
+                except (WriteError, ReadError) as e:
+                    if is_broken_stream(e.__cause__):
+                        handle_pool.invalidate(handle)
+                    raise
 
     return cast(F, wrapper)
 
 
+def check_rdwr_messages(messages: List[Union[bytes, int]]) -> None:
+    """Checks number of messages fits in one combined transfer."""
+    if len(messages) < 1 or len(messages) > I2C_RDWR_MAX_MESSAGES:
+        message = "Invalid number of messages: {}, must be 1-{}".format(
+            len(messages), I2C_RDWR_MAX_MESSAGES
+        )
+        raise ValueError(message)
+
+
+def open_usb_i2c() -> I2cController:
+    """Opens usb-i2c controller."""
+    controller = I2cController()
+    controller.configure(USB_I2C_URL)  # type: ignore
+    return controller
+
+
 class DeviceIO(object):
     """Manages byte-level device IO."""
 
@@ -55,6 +101,7 @@ class DeviceIO(object):
         # Initialize parameters
         self.name = name
         self.bus = bus
+        self.handle: Optional[BusHandle] = None
 
         # Initialize logger
         logname = "DeviceIO({})".format(name)
@@ -78,44 +125,45 @@ class DeviceIO(object):
         self.close()
         return False  # Don't suppress exceptions
 
-    def open(self) -> None:
-        """Opens io stream."""
+    def open(self) -> BusHandle:
+        """Opens io stream. Streams are pooled per bus, so an already open stream
+        is reused."""
+        device_name = USB_I2C_URL
         try:
             if os.getenv("IS_I2C_ENABLED") == "true":
                 device_name = "/dev/i2c-{}".format(self.bus)
-                self.io = io.open(device_name, "r+b", buffering=0)
+                self.handle = handle_pool.get(
+                    device_name,
+                    lambda: io.open(device_name, "r+b", buffering=0),
+                    lambda io_: io_.close(),
+                )
             elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                self.io = I2cController()
-                self.io.configure("ftdi://ftdi:232h/1")  # type: ignore
+                self.handle = handle_pool.get(
+                    device_name, open_usb_i2c, lambda io_: io_.terminate()
+                )
             else:
                 message = "Platform does not support i2c communication"
                 raise InitError(message)
-        except (PermissionError, I2cIOError, I2cNackError) as e:
+        except (OSError, I2cIOError, I2cNackError) as e:
             message = "Unable to open device io: {}".format(device_name)
             raise InitError(message, logger=self.logger) from e
+        self.io = self.handle.io
+        return self.handle
 
     def close(self) -> None:
-        """Closes io stream."""
-        try:
-            if os.getenv("IS_I2C_ENABLED") == "true":
-                self.io.close()
-            elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                self.io.terminate()  # type: ignore
-            else:
-                message = "Platform does not support i2c communication"
-                raise InitError(message)
-        except:
-            self.logger.exception("Unable to close")
+        """Releases io stream. Pooled streams stay open for other devices on the
+        bus until they are invalidated or the process exits."""
+        self.handle = None
 
     @manage_io
     def write(self, address: int, bytes_: bytes) -> None:
         """ Writes bytes to IO stream. """
         try:
             if os.getenv("IS_I2C_ENABLED") == "true":
-                fcntl.ioctl(self.io, I2C_SLAVE, address)
+                self.handle.set_address(address)  # type: ignore
                 self.io.write(bytes_)
             elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                device = self.io.get_port(address)  # type: ignore
+                device = self.handle.get_port(address)  # type: ignore
                 device.write(bytes_)
             else:
                 message = "Platform does not support i2c communication"
@@ -129,10 +177,10 @@ class DeviceIO(object):
         """Reads bytes from io stream."""
         try:
             if os.getenv("IS_I2C_ENABLED") == "true":
-                fcntl.ioctl(self.io, I2C_SLAVE, address)
+                self.handle.set_address(address)  # type: ignore
                 return bytes(self.io.read(num_bytes))
             elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                device = self.io.get_port(address)  # type: ignore
+                device = self.handle.get_port(address)  # type: ignore
                 bytes_ = device.read(readlen=num_bytes)
                 return bytes(bytes_)
             else:
@@ -162,13 +210,11 @@ class DeviceIO(object):
                 )
                 fcntl.ioctl(self.io.fileno(), I2C_RDWR, request)
                 byte_ = int(result.value)
-                message = "Read register 0x{:02X}, value: 0x{:02X}".format(
-                    register, byte_
-                )
-                self.logger.debug(message)
+                message = "Read register 0x{:02X}, value: 0x{:02X}"
+                self.logger.debug(message, register, byte_)
                 return byte_
             elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                device = self.io.get_port(address)  # type: ignore
+                device = self.handle.get_port(address)  # type: ignore
                 byte_raw = device.read_from(register, readlen=1)
                 byte = int(byte_raw[0])
                 return byte
@@ -198,7 +244,7 @@ class DeviceIO(object):
             if os.getenv("IS_I2C_ENABLED") == "true":
                 self.write(address, bytes([register, value]))
             elif os.getenv("IS_USB_I2C_ENABLED") == "true":
-                device = self.io.get_port(address)  # type: ignore
+                device = self.handle.get_port(address)  # type: ignore
                 device.write_to(register, [value])
             else:
                 message = "Platform does not support i2c communication"
@@ -206,3 +252,57 @@ class DeviceIO(object):
         except (IOError, I2cIOError, I2cNackError) as e:
             message = "Unable to write register 0x{:02}".format(register)
             raise WriteError(message) from e
+
+    @manage_io
+    def rdwr(self, address: int, messages: List[Union[bytes, int]]) -> List[bytes]:
+        """Runs messages as one combined transfer with repeated starts and a
+        single stop. Messages are bytes to write or a number of bytes to read,
+        returns bytes read by each read message."""
+
+        # Check number of messages
+        check_rdwr_messages(messages)
+
+        # Run messages
+        try:
+            if os.getenv("IS_I2C_ENABLED") == "true":
+                buffers: List[Any] = []
+                request_messages: List[Tuple[int, int, int, Any]] = []
+                for msg in messages:
+                    if isinstance(msg, int):
+                        buffer = (c_uint8 * msg)()
+                        buffers.append(buffer)
+                        flags, length = I2C_M_RD, msg
+                    else:
+                        buffer = (c_uint8 * len(msg)).from_buffer_copy(msg)
+                        flags, length = 0, len(msg)
+                    buf = c_cast(buffer, POINTER(c_uint8))
+                    request_messages.append((address, flags, length, buf))
+                request = make_i2c_rdwr_data(request_messages)  # type: ignore
+                fcntl.ioctl(self.io.fileno(), I2C_RDWR, request)
+                return [bytes(buffer) for buffer in buffers]
+            elif os.getenv("IS_USB_I2C_ENABLED") == "true":
+                device = self.handle.get_port(address)  # type: ignore
+                results: List[bytes] = []
+                out: Optional[bytes] = None
+                for msg in messages:
+                    if isinstance(msg, int):
+                        results.append(bytes(device.exchange(out or b"", msg)))
+                        out = None
+                    else:
+                        if out != None:
+                            device.write(out)
+                        out = msg
+                if out != None:
+                    device.write(out)
+                return results
+            else:
+                message = "Platform does not support i2c communication"
+                raise ReadError(message)
+        except (IOError, I2cIOError, I2cNackError) as e:
+            message = "Unable to run {} messages".format(len(messages))
+            raise ReadError(message) from e
+
+    def read_registers(self, address: int, start: int, count: int) -> bytes:
+        """Reads count consecutive registers from start register in one combined
+        transfer, requires a device that auto increments its register pointer."""
+        return self.rdwr(address, [bytes([start]), count])[0]
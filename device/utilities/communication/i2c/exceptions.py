@@ -28,3 +28,10 @@ class WriteError(I2CError):
 
 class MuxError(I2CError):
     pass
+
+
+class CircuitOpenError(ReadError, WriteError, MuxError):
+    """Raised without accessing the bus while the device circuit breaker is open,
+    handled like any failed read, write or mux transaction."""
+
+    pass
@@ -0,0 +1,128 @@
+# Import standard python modules
+import atexit, fcntl, threading
+
+# Import python types
+from typing import Any, Callable, Dict, Optional
+
+# Initialize I2C communication options
+I2C_SLAVE = 0x0703  # Use this slave address
+
+
+class BusHandle(object):
+    """Open io stream of an i2c bus shared by all devices on the bus. Remembers
+    the slave address last selected on the file descriptor so repeated accesses
+    to the same device skip the address ioctl. The lock serializes selecting an
+    address and transferring bytes."""
+
+    def __init__(self, key: str, io: Any, close: Callable[[Any], None]) -> None:
+        """Initializes bus handle."""
+        self.key = key
+        self.io = io
+        self._close = close
+        self.lock = threading.RLock()
+        self.closed = False
+        self.address: Optional[int] = None
+        self.ports: Dict[int, Any] = {}
+        self.address_hits = 0
+        self.address_misses = 0
+
+    def __repr__(self) -> str:
+        return "BusHandle(key={}, address={})".format(self.key, self.address)
+
+    def set_address(self, address: int) -> None:
+        """Selects slave address on file descriptor if not already selected."""
+        if self.address == address:
+            self.address_hits += 1
+            return
+        self.address = None
+        fcntl.ioctl(self.io, I2C_SLAVE, address)
+        self.address = address
+        self.address_misses += 1
+
+    def get_port(self, address: int) -> Any:
+        """Gets usb-i2c port of address, ports are reused for the life of the
+        handle."""
+        port = self.ports.get(address)
+        if port == None:
+            port = self.io.get_port(address)
+            self.ports[address] = port
+        return port
+
+    def close(self) -> None:
+        """Closes io stream."""
+        with self.lock:
+            self.closed = True
+            self.ports = {}
+            self.address = None
+            self._close(self.io)
+
+
+class HandlePool(object):
+    """Process-wide pool of open bus handles keyed by device path or usb-i2c url.
+    Handles stay open across transactions and are only reopened after being
+    invalidated, e.g. on an io error."""
+
+    def __init__(self) -> None:
+        """Initializes handle pool."""
+        self.handles: Dict[str, BusHandle] = {}
+        self.lock = threading.Lock()
+        self.opens = 0
+        self.invalidations = 0
+        self.closed_address_hits = 0
+        self.closed_address_misses = 0
+
+    def get(
+        self, key: str, open_: Callable[[], Any], close: Callable[[Any], None]
+    ) -> BusHandle:
+        """Gets open handle of key, opens a new handle if none is open."""
+        with self.lock:
+            handle = self.handles.get(key)
+            if handle == None:
+                handle = BusHandle(key, open_(), close)
+                self.handles[key] = handle
+                self.opens += 1
+            return handle  # type: ignore
+
+    def invalidate(self, handle: BusHandle) -> None:
+        """Closes handle and removes it from pool so next access reopens it."""
+        with self.lock:
+            if self.handles.get(handle.key) is handle:
+                del self.handles[handle.key]
+                self.invalidations += 1
+                self.closed_address_hits += handle.address_hits
+                self.closed_address_misses += handle.address_misses
+        try:
+            handle.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Closes all handles."""
+        with self.lock:
+            handles = list(self.handles.values())
+            self.handles = {}
+        for handle in handles:
+            try:
+                handle.close()
+            except Exception:
+                pass
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets handle pool metrics."""
+        with self.lock:
+            handles = list(self.handles.values())
+            address_hits = self.closed_address_hits
+            address_misses = self.closed_address_misses
+        return {
+            "open_handles": len(handles),
+            "opens": self.opens,
+            "invalidations": self.invalidations,
+            "address_hits": address_hits + sum(h.address_hits for h in handles),
+            "address_misses": address_misses + sum(h.address_misses for h in handles),
+        }
+
+
+# Initialize process-wide handle pool, handles are closed on exit
+handle_pool = HandlePool()
+atexit.register(handle_pool.close)
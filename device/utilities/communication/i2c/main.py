@@ -1,12 +1,24 @@
 # Import standard python libraries
-import fcntl, io, time, logging, struct, threading
-from typing import Optional, List
+import os, fcntl, io, time, logging, struct, threading, contextlib, functools
+from typing import Any, Callable, Optional, List, Iterator, Union
 
 # # Import package elements
-from device.utilities.communication.i2c.device_io import DeviceIO
+from device.utilities.communication.i2c.device_io import DeviceIO, check_rdwr_messages
 from device.utilities.communication.i2c.utilities import make_i2c_rdwr_data
 from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
 from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.mux_cache import MuxChannelCache, mux_cache
+from device.utilities.communication.i2c.buses import (
+    BreakerRegistry,
+    breaker_registry,
+    get_bus_key,
+)
+from device.utilities.communication.i2c.metrics import TransactionMetrics, i2c_metrics
+from device.utilities.communication.i2c.scheduler import (
+    PRIORITY_SENSOR,
+    PRIORITY_DIAGNOSTIC,
+    transaction_context,
+)
 from device.utilities.communication.i2c.exceptions import (
     InitError,
     WriteError,
@@ -16,10 +28,32 @@ from device.utilities.communication.i2c.exceptions import (
 
 # Import device utilities
 from device.utilities.logger import Logger
-from device.utilities.functiontools import retry
+from device.utilities.functiontools import CircuitBreaker, retry
 from device.utilities.bitwise import byte_str
 
 
+def record_retry(i2c: "I2C", error: Exception) -> None:
+    """Records retry of a failed operation in transaction metrics."""
+    i2c.metrics.record_retry(i2c.name)
+
+
+def get_breaker(i2c: "I2C") -> Optional[CircuitBreaker]:
+    """Gets circuit breaker of device."""
+    return i2c.breaker
+
+
+def can_retry(i2c: "I2C") -> bool:
+    """Checks if operation may retry, operations in a transaction fail on the
+    first error so backoff sleeps do not hold the bus lock."""
+    return not i2c.in_transaction()
+
+
+# Initialize retry decorator of device operations
+i2c_retry = functools.partial(
+    retry, on_retry=record_retry, breaker=get_breaker, can_retry=can_retry
+)
+
+
 class I2C(object):
     """I2C communication device. Can communicate with device directly or
     via an I2C mux."""
@@ -35,6 +69,10 @@ class I2C(object):
         mux_simulator: Optional[MuxSimulator] = None,
         PeripheralSimulator: Optional[PeripheralSimulator] = None,
         verify_device: bool = True,
+        mux_cache: MuxChannelCache = mux_cache,
+        priority: int = PRIORITY_SENSOR,
+        metrics: TransactionMetrics = i2c_metrics,
+        breakers: BreakerRegistry = breaker_registry,
     ) -> None:
 
         # Initialize passed in parameters
@@ -44,6 +82,12 @@ class I2C(object):
         self.address = address
         self.mux = mux
         self.channel = channel
+        self.mux_cache = mux_cache
+        self.priority = priority
+        self.metrics = metrics
+        self.bus_key = get_bus_key(bus, simulate=PeripheralSimulator != None)
+        self.breaker = breakers.get_breaker(name, self.bus_key, address, mux, channel)
+        self.local = threading.local()
 
         # Initialize logger
         logname = "I2C({})".format(self.name)
@@ -62,7 +106,7 @@ class I2C(object):
             )
         else:
             #self.logger.debug("Using device io stream")
-            with self.i2c_lock:
+            with self.locked():
                 self.io = DeviceIO(name, bus)
 
         # Verify mux exists
@@ -80,7 +124,8 @@ class I2C(object):
         """Verifies mux exists by trying to set it to a channel."""
         try:
             #self.logger.debug("Verifying mux exists")
-            byte = self.set_mux(self.mux, self.channel, retry=True)
+            with self.prioritized(PRIORITY_DIAGNOSTIC):
+                byte = self.set_mux(self.mux, self.channel, retry=True)
         except MuxError as e:
             message = "Unable to verify mux exists"
             raise InitError(message, logger=self.logger) from e
@@ -89,7 +134,8 @@ class I2C(object):
         """Verifies device exists by trying to read a byte from it."""
         try:
             #self.logger.debug("Verifying device exists")
-            byte = self.read(1, retry=True)
+            with self.prioritized(PRIORITY_DIAGNOSTIC):
+                byte = self.read(1, retry=True)
         except ReadError as e:
             message = "Unable to verify device exists, read error"
             raise InitError(message, logger=self.logger) from e
@@ -97,57 +143,94 @@ class I2C(object):
             message = "Unable to verify device exists, mux error"
             raise InitError(message, logger=self.logger) from e
 
-    @retry((WriteError, MuxError), tries=5, delay=0.2, backoff=3)
+    @i2c_retry((WriteError, MuxError), tries=5, delay=0.2, backoff=3)
     def write(
         self, bytes_: bytes, retry: bool = True, disable_mux: bool = False
     ) -> None:
         """Writes byte list to device. Converts byte list to byte array then
         sends bytes. Returns error message."""
-        with self.i2c_lock:
-            self.manage_mux("write bytes", disable_mux)
+        with self.selected_mux(disable_mux):
             #self.logger.debug("Writing bytes: {}".format(byte_str(bytes_)))
-            self.io.write(self.address, bytes_)
+            with self.measured("write", self.address, len(bytes_)):
+                self.io.write(self.address, bytes_)
 
-    @retry((ReadError, MuxError), tries=5, delay=0.2, backoff=3)
+    @i2c_retry((ReadError, MuxError), tries=5, delay=0.2, backoff=3)
     def read(
         self, num_bytes: int, retry: bool = True, disable_mux: bool = False
     ) -> bytes:
         """Reads num bytes from device. Returns byte array."""
-        with self.i2c_lock:
-            self.manage_mux("read bytes", disable_mux)
+        with self.selected_mux(disable_mux):
             #self.logger.debug("Reading {} bytes".format(num_bytes))
-            bytes_ = bytes(self.io.read(self.address, num_bytes))
+            with self.measured("read", self.address, num_bytes):
+                bytes_ = bytes(self.io.read(self.address, num_bytes))
             #self.logger.debug("Read bytes: {}".format(byte_str(bytes_)))
             return bytes_
 
-    @retry((ReadError, MuxError), tries=5, delay=0.2, backoff=3)
+    @i2c_retry((ReadError, MuxError), tries=5, delay=0.2, backoff=3)
     def read_register(
         self, register: int, retry: bool = True, disable_mux: bool = False
     ) -> int:
         """Reads byte stored in register at address."""
-        with self.i2c_lock:
-            self.manage_mux("read register", disable_mux)
+        with self.selected_mux(disable_mux):
             #self.logger.debug("Reading register: 0x{:02X}".format(register))
-            register_byte = int(self.io.read_register(self.address, register))
+            with self.measured("read_register", self.address, 2):
+                register_byte = int(self.io.read_register(self.address, register))
             #self.logger.debug("Register byte: {}".format(hex(register_byte)))
             return register_byte
 
-    @retry((WriteError, MuxError), tries=5, delay=0.2, backoff=3)
+    @i2c_retry((WriteError, MuxError), tries=5, delay=0.2, backoff=3)
     def write_register(
         self, register: int, value: int, retry: bool = True, disable_mux: bool = False
     ) -> None:
-        with self.i2c_lock:
-            self.manage_mux("write register", disable_mux)
+        with self.selected_mux(disable_mux):
             #message = "Writing register: 0x{:02X}, value: 0x{:02X}".format(
             #    register, value
             #)
             #self.logger.debug(message)
-            self.io.write_register(self.address, register, value)
+            with self.measured("write_register", self.address, 2):
+                self.io.write_register(self.address, register, value)
+
+    @i2c_retry((ReadError, MuxError), tries=5, delay=0.2, backoff=3)
+    def read_registers(
+        self, start: int, count: int, retry: bool = True, disable_mux: bool = False
+    ) -> bytes:
+        """Reads count consecutive registers from start register in one combined
+        transfer. Device must auto increment its register pointer."""
+        with self.selected_mux(disable_mux):
+            with self.measured("read_registers", self.address, 1 + count):
+                return bytes(self.io.read_registers(self.address, start, count))
+
+    def rdwr(
+        self,
+        messages: List[Union[bytes, int]],
+        retry: bool = True,
+        disable_mux: bool = False,
+    ) -> List[bytes]:
+        """Runs messages as one combined transfer, e.g. several register pointer
+        writes each followed by a read. Messages are bytes to write or a number of
+        bytes to read, returns bytes read by each read message. Checks messages
+        before retrying so an invalid transfer is not retried or counted by the
+        circuit breaker."""
+        check_rdwr_messages(messages)
+        return self.run_rdwr(messages, retry=retry, disable_mux=disable_mux)
 
-    @retry(MuxError, tries=5, delay=0.2, backoff=3)
+    @i2c_retry((ReadError, WriteError, MuxError), tries=5, delay=0.2, backoff=3)
+    def run_rdwr(
+        self,
+        messages: List[Union[bytes, int]],
+        retry: bool = True,
+        disable_mux: bool = False,
+    ) -> List[bytes]:
+        """Runs checked messages as one combined transfer."""
+        num_bytes = sum(m if isinstance(m, int) else len(m) for m in messages)
+        with self.selected_mux(disable_mux):
+            with self.measured("rdwr", self.address, num_bytes):
+                return [bytes(b) for b in self.io.rdwr(self.address, messages)]
+
+    @i2c_retry(MuxError, tries=5, delay=0.2, backoff=3)
     def set_mux(self, mux: int, channel: int, retry: bool = True) -> None:
         """Sets mux to channel"""
-        with self.i2c_lock:
+        with self.locked():
             channel_byte = 0x01 << channel
             #self.logger.debug(
             #    "Setting mux 0x{:02X} to channel {}, writing: [0x{:02X}]".format(
@@ -155,14 +238,113 @@ class I2C(object):
             #    )
             #)
             try:
-                self.io.write(mux, bytes([channel_byte]))
+                with self.measured("set_mux", mux, 1):
+                    self.io.write(mux, bytes([channel_byte]))
             except WriteError as e:
+                self.mux_cache.invalidate(self.bus_key, mux)
                 raise MuxError("Unable to set mux", logger=self.logger) from e
+            self.mux_cache.select(self.bus_key, mux, channel)
 
-    def manage_mux(self, message: str, disable_mux: bool) -> None:
-        """Sets mux if enabled."""
+    def manage_mux(self, message: str, disable_mux: bool, retry: bool = False) -> None:
+        """Sets mux if enabled and not already set to channel."""
         if disable_mux:
             return
         elif self.mux != None:
+            if self.channel != None and self.mux_cache.is_selected(
+                self.bus_key, self.mux, self.channel
+            ):
+                return
             #self.logger.debug("Managing mux to {}".format(message))
-            self.set_mux(self.mux, self.channel, retry=False)
+            self.set_mux(self.mux, self.channel, retry=retry)
+
+    @contextlib.contextmanager
+    def selected_mux(self, disable_mux: bool = False) -> Iterator[None]:
+        """Holds i2c lock with mux set to channel. Forgets the cached mux channel
+        on communication errors so the next access sets it again. Writes to a
+        device at a mux address also make the cached channel of that mux stale."""
+        with self.locked():
+            self.manage_mux("access device", disable_mux)
+            self.mux_cache.invalidate(self.bus_key, self.address)
+            try:
+                yield
+            except (ReadError, WriteError, MuxError):
+                if self.mux != None and not disable_mux:
+                    self.mux_cache.invalidate(self.bus_key, self.mux)
+                raise
+
+    @contextlib.contextmanager
+    def measured(self, operation: str, address: int, bytes_: int) -> Iterator[None]:
+        """Records latency, size and outcome of an operation in transaction
+        metrics."""
+        start = time.perf_counter()
+        try:
+            yield
+        except (ReadError, WriteError) as e:
+            seconds = time.perf_counter() - start
+            self.metrics.record(self.name, operation, address, bytes_, seconds, e)
+            raise
+        seconds = time.perf_counter() - start
+        self.metrics.record(self.name, operation, address, bytes_, seconds)
+
+    @contextlib.contextmanager
+    def prioritized(
+        self, priority: int, deadline: Optional[float] = None
+    ) -> Iterator[None]:
+        """Sets priority and deadline of bus accesses made by the current thread,
+        used when the bus is scheduled."""
+        channel = (self.mux, self.channel) if self.mux != None else None
+        with transaction_context(self.name, priority, channel, deadline):
+            yield
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """Holds bus lock. Scheduled buses grant the lock by priority, deadline and
+        mux channel, an enclosing prioritized context takes precedence over the
+        device priority."""
+        channel = (self.mux, self.channel) if self.mux != None else None
+        with transaction_context(self.name, self.priority, channel, override=False):
+            with self.i2c_lock:
+                yield
+
+    def in_transaction(self) -> bool:
+        """Checks if current thread is inside a transaction."""
+        return getattr(self.local, "depth", 0) > 0
+
+    @contextlib.contextmanager
+    def transaction(
+        self,
+        disable_mux: bool = False,
+        priority: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator["I2C"]:
+        """Holds bus lock with mux set to channel across multiple operations, e.g.
+        a register write and the read that follows it. Other threads can not
+        access the bus until the transaction ends, so operations in the
+        transaction find the mux already set. Operations in the transaction do
+        not retry, use run_transaction to retry the whole transaction outside the
+        bus lock. Priority defaults to the device priority, deadline is a
+        monotonic timestamp."""
+        if priority == None:
+            priority = self.priority
+        with self.prioritized(priority, deadline), self.locked():  # type: ignore
+            self.local.depth = getattr(self.local, "depth", 0) + 1
+            try:
+                self.manage_mux("start transaction", disable_mux)
+                yield self
+            finally:
+                self.local.depth -= 1
+
+    @i2c_retry((ReadError, WriteError, MuxError), tries=5, delay=0.2, backoff=3)
+    def run_transaction(
+        self,
+        function: Callable[["I2C"], Any],
+        retry: bool = True,
+        disable_mux: bool = False,
+        priority: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """Runs function with the device in a transaction. Retries the whole
+        transaction on errors, the bus lock is released between tries. Returns
+        value returned by function."""
+        with self.transaction(disable_mux, priority, deadline):
+            return function(self)
@@ -0,0 +1,202 @@
+# Import standard python modules
+import os, time, bisect, threading, collections
+
+# Import python types
+from typing import Any, Deque, Dict, List, Optional
+
+# Import pyftdi nack error
+from pyftdi.i2c import I2cNackError
+
+# Initialize metrics settings, trace keeps the last I2C_TRACE_SIZE transactions
+# and is disabled when size is 0
+IS_I2C_METRICS_ENABLED = os.getenv("IS_I2C_METRICS_ENABLED", "true") == "true"
+I2C_TRACE_SIZE = int(os.getenv("I2C_TRACE_SIZE", "0"))
+
+# Initialize upper bounds of latency histogram buckets in milliseconds
+LATENCY_BUCKETS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000]
+
+# Initialize errno values the i2c driver returns when a device does not ack
+NACK_ERRNOS = [6, 121]  # ENXIO, EREMOTEIO
+
+
+def is_nack(error: Exception) -> bool:
+    """Checks if a communication error was caused by a device not acking."""
+    cause = error.__cause__
+    if isinstance(cause, I2cNackError):
+        return True
+    return isinstance(cause, OSError) and cause.errno in NACK_ERRNOS
+
+
+class OperationMetrics(object):
+    """Counts, errors, bytes and latency histogram of one type of operation."""
+
+    def __init__(self) -> None:
+        """Initializes operation metrics."""
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, bytes_: int, milliseconds: float, is_error: bool) -> None:
+        """Adds operation."""
+        self.count += 1
+        if is_error:
+            self.errors += 1
+        else:
+            self.bytes += bytes_
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Gets operation metrics, histogram counts are keyed by bucket upper
+        bound in milliseconds."""
+        bounds = [str(bound) for bound in LATENCY_BUCKETS_MS] + ["+inf"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "max_ms": round(self.max, 3),
+            "histogram": dict(zip(bounds, self.histogram)),
+        }
+
+
+class DeviceMetrics(object):
+    """Transaction metrics of one i2c device."""
+
+    def __init__(self) -> None:
+        """Initializes device metrics."""
+        self.operations: Dict[str, OperationMetrics] = {}
+        self.nacks = 0
+        self.retries = 0
+        self.mux_switches = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Gets device metrics."""
+        operations = {name: o.snapshot() for name, o in self.operations.items()}
+        return {
+            "operations": operations,
+            "bytes": sum(o.bytes for o in self.operations.values()),
+            "errors": sum(o.errors for o in self.operations.values()),
+            "nacks": self.nacks,
+            "retries": self.retries,
+            "mux_switches": self.mux_switches,
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Gets compact device metrics."""
+        count = sum(o.count for o in self.operations.values())
+        total = sum(o.total for o in self.operations.values())
+        return {
+            "transactions": count,
+            "errors": sum(o.errors for o in self.operations.values()),
+            "nacks": self.nacks,
+            "retries": self.retries,
+            "mean_ms": round(total / count, 3) if count else None,
+            "max_ms": round(max([o.max for o in self.operations.values()] or [0]), 3),
+        }
+
+
+class TransactionMetrics(object):
+    """Process-wide i2c transaction metrics by device name with an optional
+    trace of the last transactions, used to find slow or flaky devices."""
+
+    def __init__(
+        self, enabled: bool = IS_I2C_METRICS_ENABLED, trace_size: int = I2C_TRACE_SIZE
+    ) -> None:
+        """Initializes transaction metrics."""
+        self.enabled = enabled
+        self.devices: Dict[str, DeviceMetrics] = {}
+        self.trace: Optional[Deque[Dict[str, Any]]] = None
+        if trace_size > 0:
+            self.trace = collections.deque(maxlen=trace_size)
+        self.lock = threading.Lock()
+
+    def get_device(self, device: str) -> DeviceMetrics:
+        """Gets metrics of device, call while holding lock."""
+        metrics = self.devices.get(device)
+        if metrics == None:
+            metrics = DeviceMetrics()
+            self.devices[device] = metrics
+        return metrics  # type: ignore
+
+    def record(
+        self,
+        device: str,
+        operation: str,
+        address: int,
+        bytes_: int,
+        seconds: float,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Records transaction."""
+        if not self.enabled:
+            return
+        milliseconds = seconds * 1000
+        with self.lock:
+            metrics = self.get_device(device)
+            operation_metrics = metrics.operations.get(operation)
+            if operation_metrics == None:
+                operation_metrics = OperationMetrics()
+                metrics.operations[operation] = operation_metrics
+            operation_metrics.add(bytes_, milliseconds, error != None)
+            if error != None and is_nack(error):
+                metrics.nacks += 1
+            if operation == "set_mux" and error == None:
+                metrics.mux_switches += 1
+            if self.trace != None:
+                self.trace.append(  # type: ignore
+                    {
+                        "timestamp": time.time(),
+                        "device": device,
+                        "operation": operation,
+                        "address": "0x{:02X}".format(address),
+                        "bytes": bytes_,
+                        "duration_ms": round(milliseconds, 3),
+                        "error": None if error == None else str(error),
+                    }
+                )
+
+    def record_retry(self, device: str) -> None:
+        """Records retry of a failed transaction."""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.get_device(device).retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Gets metrics of all devices."""
+        with self.lock:
+            return {name: m.snapshot() for name, m in self.devices.items()}
+
+    def summary(self) -> Dict[str, Any]:
+        """Gets compact metrics of all devices."""
+        with self.lock:
+            return {name: m.summary() for name, m in self.devices.items()}
+
+    def get_trace(
+        self, device: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Gets traced transactions oldest first, optionally of one device and
+        limited to the newest limit transactions."""
+        with self.lock:
+            entries = list(self.trace) if self.trace != None else []
+        if device != None:
+            entries = [entry for entry in entries if entry["device"] == device]
+        if limit != None:
+            entries = entries[-limit:] if limit > 0 else []
+        return entries
+
+    def reset(self) -> None:
+        """Clears metrics and trace."""
+        with self.lock:
+            self.devices = {}
+            if self.trace != None:
+                self.trace.clear()  # type: ignore
+
+
+# Initialize process-wide transaction metrics
+i2c_metrics = TransactionMetrics()
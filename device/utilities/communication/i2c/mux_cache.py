@@ -0,0 +1,72 @@
+# Import standard python modules
+import os, threading
+
+# Import python types
+from typing import Any, Dict, Optional, Tuple
+
+# Initialize mux channel cache setting, disable on boards where something other
+# than this process may change the mux channel e.g. a second bus master
+IS_I2C_MUX_CACHE_ENABLED = os.getenv("IS_I2C_MUX_CACHE_ENABLED", "true") == "true"
+
+
+class MuxChannelCache(object):
+    """Tracks the channel last selected on each i2c mux by bus key and mux
+    address so accesses to a device on the selected channel skip the mux write.
+    Entries are invalidated on communication errors and on writes to a mux that
+    did not go through the cache."""
+
+    def __init__(self, enabled: bool = IS_I2C_MUX_CACHE_ENABLED) -> None:
+        """Initializes mux channel cache."""
+        self.enabled = enabled
+        self.channels: Dict[Tuple[str, int], int] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def is_selected(self, bus: str, mux: int, channel: int) -> bool:
+        """Checks if mux is known to be set to channel."""
+        if not self.enabled:
+            return False
+        with self.lock:
+            if self.channels.get((bus, mux)) == channel:
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def select(self, bus: str, mux: int, channel: int) -> None:
+        """Records mux was set to channel."""
+        with self.lock:
+            self.channels[(bus, mux)] = channel
+
+    def invalidate(self, bus: str, mux: Optional[int] = None) -> None:
+        """Forgets channel of mux, or of all muxes on bus."""
+        with self.lock:
+            if mux != None:
+                keys = [(bus, mux)] if (bus, mux) in self.channels else []
+            else:
+                keys = [key for key in self.channels if key[0] == bus]
+            for key in keys:
+                del self.channels[key]  # type: ignore
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Forgets channels of all muxes."""
+        with self.lock:
+            self.channels = {}
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets mux channel cache metrics."""
+        with self.lock:
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+# Initialize process-wide mux channel cache
+mux_cache = MuxChannelCache()
@@ -2,7 +2,7 @@
 import logging
 
 # Import python types
-from typing import Optional, Dict, Type, TypeVar, Callable, Any, cast
+from typing import Optional, Dict, Type, TypeVar, Callable, Any, cast, List, Union
 from types import TracebackType
 
 # Import device utilities
@@ -179,6 +179,33 @@ class PeripheralSimulator:
         # Write value to register
         self.registers[register_addr] = value
 
+    @verify_mux
+    def rdwr(self, device_addr: int, messages: List[Union[bytes, int]]) -> List[bytes]:
+        """Runs combined write and read messages. A one byte write that is not a
+        known write command sets the register pointer, a read after it reads
+        consecutive registers."""
+        results = []
+        register_addr: Optional[int] = None
+        for message in messages:
+            if isinstance(message, int):
+                if register_addr != None:
+                    bytes_ = self.read_registers(device_addr, register_addr, message)
+                    register_addr = None
+                else:
+                    bytes_ = self.read(device_addr, message)
+                results.append(bytes_)
+            elif len(message) == 1 and self.get_write_response_bytes(message) == None:
+                register_addr = message[0]
+            else:
+                self.write(device_addr, message)
+        return results
+
+    def read_registers(self, device_addr: int, start: int, count: int) -> bytes:
+        """Reads count consecutive register bytes from start register."""
+        return bytes(
+            [self.read_register(device_addr, start + i) for i in range(count)]
+        )
+
     def get_write_response_bytes(self, write_bytes: bytes) -> Optional[bytes]:
         """Gets response byte for write command. Handles state based writes."""
         return self.writes.get(byte_str(write_bytes), None)
@@ -0,0 +1,197 @@
+# Import standard python modules
+import os, time, itertools, threading, contextlib
+
+# Import python types
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Initialize bus scheduler setting, when disabled buses use plain locks
+IS_I2C_SCHEDULER_ENABLED = os.getenv("IS_I2C_SCHEDULER_ENABLED", "false") == "true"
+
+# Initialize transaction priorities, lower values are granted the bus first
+PRIORITY_ACTUATOR = 0
+PRIORITY_SENSOR = 1
+PRIORITY_DIAGNOSTIC = 2
+
+# Initialize default seconds a transaction may wait before it is granted the bus
+# ahead of higher priority transactions
+DEFAULT_DEADLINES = {
+    PRIORITY_ACTUATOR: 0.05,
+    PRIORITY_SENSOR: 0.5,
+    PRIORITY_DIAGNOSTIC: 5.0,
+}
+
+# Initialize thread local transaction context
+context = threading.local()
+
+
+@contextlib.contextmanager
+def transaction_context(
+    name: str,
+    priority: int = PRIORITY_SENSOR,
+    channel: Optional[Tuple[Optional[int], Optional[int]]] = None,
+    deadline: Optional[float] = None,
+    override: bool = True,
+) -> Iterator[None]:
+    """Sets name, priority, mux channel and deadline used when the current thread
+    waits for a scheduled bus. Deadline is a timestamp, defaults to a delay by
+    priority. Without override an enclosing context is kept."""
+    previous = getattr(context, "request", None)
+    if override or previous == None:
+        context.request = (name, priority, channel, deadline)
+    try:
+        yield
+    finally:
+        context.request = previous
+
+
+class Request(object):
+    """Thread waiting for bus access."""
+
+    def __init__(self, sequence: int) -> None:
+        """Initializes request from thread local transaction context."""
+        name, priority, channel, deadline = getattr(context, "request", None) or (
+            threading.current_thread().name,
+            PRIORITY_SENSOR,
+            None,
+            None,
+        )
+        self.name = name
+        self.priority = priority
+        self.channel = channel
+        self.timestamp = time.monotonic()
+        self.deadline = deadline
+        if self.deadline == None:
+            delay = DEFAULT_DEADLINES.get(priority, DEFAULT_DEADLINES[PRIORITY_SENSOR])
+            self.deadline = self.timestamp + delay
+        self.sequence = sequence
+        self.thread = threading.get_ident()
+
+    def __repr__(self) -> str:
+        return "Request(name={}, priority={}, channel={})".format(
+            self.name, self.priority, self.channel
+        )
+
+
+class BusScheduler(object):
+    """Re-entrant bus lock that grants the bus to waiting threads in order of
+    priority (actuators, sensors, then diagnostics). Among waiting transactions
+    of equal priority, ones on the currently selected mux channel go first to
+    minimize mux switches. Transactions past their deadline go ahead of all
+    others so low priority work is not starved. Records queueing delay per
+    device."""
+
+    def __init__(self, name: str) -> None:
+        """Initializes bus scheduler."""
+        self.name = name
+        self.condition = threading.Condition(threading.Lock())
+        self.owner: Optional[int] = None
+        self.count = 0
+        self.waiting: List[Request] = []
+        self.granted: Optional[Request] = None
+        self.channel: Optional[Tuple[Optional[int], Optional[int]]] = None
+        self.sequence = itertools.count()
+        self.grants = 0
+        self.switches = 0
+        self.delays: Dict[str, Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return "BusScheduler(name={}, waiting={})".format(self.name, len(self.waiting))
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires bus, waits until the request is next in schedule order."""
+        thread = threading.get_ident()
+        with self.condition:
+
+            # Re-enter if thread already owns bus
+            if self.owner == thread:
+                self.count += 1
+                return True
+
+            # Grant bus immediately if free and nobody is waiting
+            request = Request(next(self.sequence))
+            if self.owner == None and self.granted == None and self.waiting == []:
+                self.grant(request)
+                return True
+            if not blocking:
+                return False
+
+            # Wait until request is granted
+            end = None if timeout < 0 else time.monotonic() + timeout
+            self.waiting.append(request)
+            while self.granted is not request:
+                remaining = None
+                if end != None:
+                    remaining = end - time.monotonic()  # type: ignore
+                    if remaining <= 0:
+                        self.waiting.remove(request)
+                        return False
+                self.condition.wait(remaining)
+            self.granted = None
+            self.waiting.remove(request)
+            self.grant(request)
+            return True
+
+    def release(self) -> None:
+        """Releases bus, hands it to the next waiting request."""
+        with self.condition:
+            if self.owner != threading.get_ident():
+                raise RuntimeError("Cannot release un-acquired bus")
+            self.count -= 1
+            if self.count > 0:
+                return
+            self.owner = None
+            if self.waiting != []:
+                now = time.monotonic()
+                self.granted = min(self.waiting, key=lambda r: self.get_order(r, now))
+                self.condition.notify_all()
+
+    def grant(self, request: Request) -> None:
+        """Grants bus to request, records queueing delay and mux switches."""
+        self.owner = request.thread
+        self.count = 1
+        self.grants += 1
+        if request.channel != None and request.channel != self.channel:
+            if self.channel != None:
+                self.switches += 1
+            self.channel = request.channel
+        delay = time.monotonic() - request.timestamp
+        stats = self.delays.setdefault(
+            request.name, {"count": 0, "total": 0.0, "max": 0.0}
+        )
+        stats["count"] += 1
+        stats["total"] += delay
+        stats["max"] = max(stats["max"], delay)
+
+    def get_order(self, request: Request, now: float) -> Tuple:
+        """Gets sort key of waiting request, late requests first by deadline,
+        then by priority, selected mux channel, deadline and arrival."""
+        if request.deadline <= now:  # type: ignore
+            return (0, request.deadline, request.sequence)
+        is_switch = request.channel != None and request.channel != self.channel
+        return (1, request.priority, is_switch, request.deadline, request.sequence)
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets grant count, mux switches and queueing delay in milliseconds per
+        device."""
+        with self.condition:
+            delays = {
+                name: {
+                    "count": stats["count"],
+                    "mean_ms": round(stats["total"] / stats["count"] * 1000, 3),
+                    "max_ms": round(stats["max"] * 1000, 3),
+                }
+                for name, stats in self.delays.items()
+            }
+            return {
+                "grants": self.grants,
+                "mux_switches": self.switches,
+                "waiting": len(self.waiting),
+                "queueing_delay": delays,
+            }
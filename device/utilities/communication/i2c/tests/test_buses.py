@@ -0,0 +1,123 @@
+# Import standard python libraries
+import os, sys, threading, pytest
+from typing import Any, Dict
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c.main import I2C
+from device.utilities.communication.i2c.buses import (
+    BreakerRegistry,
+    BusRegistry,
+    parse_bus,
+)
+from device.utilities.communication.i2c.exceptions import ReadError
+from device.utilities.communication.i2c.mux_cache import MuxChannelCache
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
+
+
+def test_parse_bus(monkeypatch: Any) -> None:
+    monkeypatch.setenv("DEFAULT_I2C_BUS", "2")
+    assert parse_bus("default") == 2
+    assert parse_bus("none") == None
+    assert parse_bus(None) == None
+    assert parse_bus(1) == 1
+
+
+def test_one_lock_per_physical_bus(monkeypatch: Any) -> None:
+    monkeypatch.setenv("IS_I2C_ENABLED", "true")
+    registry = BusRegistry()
+    assert registry.get_lock(1) is registry.get_lock(1)
+    assert registry.get_lock(1) is not registry.get_lock(2)
+    assert registry.get_lock(1, simulate=True) is registry.get_lock(2, simulate=True)
+    monkeypatch.setenv("IS_I2C_ENABLED", "false")
+    monkeypatch.setenv("IS_USB_I2C_ENABLED", "true")
+    assert registry.get_lock(1) is registry.get_lock(2)
+
+
+def test_breakers_outlive_devices() -> None:
+    registry = BreakerRegistry(threshold=5)
+    kwargs: Dict[str, Any] = {
+        "i2c_lock": threading.RLock(),
+        "bus": 2,
+        "address": 0x40,
+        "mux": 0x77,
+        "mux_simulator": MuxSimulator(),
+        "PeripheralSimulator": PeripheralSimulator,
+        "breakers": registry,
+    }
+    first = I2C(name="Top", channel=4, **kwargs)
+    assert I2C(name="Top", channel=4, **kwargs).breaker is first.breaker
+    assert I2C(name="Bottom", channel=5, **kwargs).breaker is not first.breaker
+    assert set(registry.metrics) == {"Top", "Bottom"}
+    assert BreakerRegistry(threshold=0).get_breaker("Top", "bus", 0x40) == None
+
+
+def test_find_breakers() -> None:
+    registry = BreakerRegistry(threshold=5)
+    top = registry.get_breaker("Top", "bus", 0x40, mux=0x77, channel=4)
+    bottom = registry.get_breaker("Bottom", "bus", 0x41, mux=0x77, channel=4)
+    registry.get_breaker("Other", "bus", 0x40, mux=0x77, channel=5)
+    assert registry.find_breakers("bus", 0x77, 4, 0x40) == [top]
+    assert registry.find_breakers("bus", 0x77, 4) == [top, bottom]
+    assert registry.find_breakers("other", 0x77, 4) == []
+
+
+def test_transaction_holds_bus_and_mux() -> None:
+    i2c_lock = threading.RLock()
+    mux_cache = MuxChannelCache()
+    i2c = I2C(
+        name="Test",
+        i2c_lock=i2c_lock,
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=PeripheralSimulator,  # type: ignore
+        mux_cache=mux_cache,
+    )
+    is_acquired = []
+    with i2c.transaction():
+        i2c.read(1)
+        i2c.read(1)
+        thread = threading.Thread(
+            target=lambda: is_acquired.append(i2c_lock.acquire(blocking=False))
+        )
+        thread.start()
+        thread.join()
+    assert is_acquired == [False]
+    assert mux_cache.metrics["misses"] == 0
+
+
+def test_transaction_retries_outside_bus_lock(monkeypatch: Any) -> None:
+    i2c_lock = threading.RLock()
+    i2c = I2C(
+        name="Test",
+        i2c_lock=i2c_lock,
+        bus=2,
+        address=0x40,
+        PeripheralSimulator=PeripheralSimulator,  # type: ignore
+    )
+    sleeps = []
+    monkeypatch.setattr(
+        "device.utilities.functiontools.time.sleep",
+        lambda seconds: sleeps.append(i2c_lock._is_owned()),  # type: ignore
+    )
+    reads = []
+
+    def read(address: int, num_bytes: int) -> bytes:
+        reads.append(num_bytes)
+        if len(reads) < 3:
+            raise ReadError("Unable to read")
+        return bytes([0x00])
+
+    monkeypatch.setattr(i2c.io, "read", read)
+    with pytest.raises(ReadError):
+        with i2c.transaction():
+            i2c.read(1)
+    assert sleeps == []
+    assert i2c.run_transaction(lambda device: device.read(1)) == bytes([0x00])
+    assert sleeps == [False]
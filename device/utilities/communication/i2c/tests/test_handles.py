@@ -0,0 +1,90 @@
+# Import standard python libraries
+import os, sys, io, errno, pytest
+from typing import Any, Iterator, List, Optional, Tuple
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c import device_io, handles
+from device.utilities.communication.i2c.handles import HandlePool, handle_pool
+from device.utilities.communication.i2c.device_io import DeviceIO
+from device.utilities.communication.i2c.exceptions import WriteError
+
+
+class FakeBus(io.BytesIO):
+    """Bus stream that records writes and can fail them."""
+
+    failure: Optional[Exception] = None
+
+    def write(self, bytes_: bytes) -> int:  # type: ignore
+        if self.failure != None:
+            raise self.failure
+        return super().write(bytes_)
+
+
+# Initialize opened bus streams and ioctl calls type
+FakeBuses = Tuple[List[FakeBus], List[Tuple]]
+
+
+@pytest.fixture
+def fake_bus(monkeypatch: Any) -> Iterator[FakeBuses]:
+    opened: List[FakeBus] = []
+    ioctls: List[Tuple] = []
+
+    def open_(*args: Any, **kwargs: Any) -> FakeBus:
+        opened.append(FakeBus())
+        return opened[-1]
+
+    monkeypatch.setenv("IS_I2C_ENABLED", "true")
+    monkeypatch.setattr(device_io.io, "open", open_)
+    monkeypatch.setattr(handles.fcntl, "ioctl", lambda *args: ioctls.append(args))
+    handle_pool.close()
+    yield opened, ioctls
+    handle_pool.close()
+
+
+def test_pool_reuses_handles() -> None:
+    pool = HandlePool()
+    first = pool.get("bus", lambda: object(), lambda io_: None)
+    assert pool.get("bus", lambda: object(), lambda io_: None) is first
+    pool.invalidate(first)
+    assert first.closed
+    assert pool.get("bus", lambda: object(), lambda io_: None) is not first
+    assert pool.metrics["opens"] == 2
+
+
+def test_device_io_keeps_stream_open(fake_bus: FakeBuses) -> None:
+    opened, ioctls = fake_bus
+    device = DeviceIO("Test", bus=9)
+    device.write(0x40, bytes([0x01]))
+    device.write_register(0x40, 0x02, 0x03)
+    DeviceIO("Other", bus=9).write(0x41, bytes([0x04]))
+    assert len(opened) == 1
+    assert opened[0].getvalue() == bytes([0x01, 0x02, 0x03, 0x04])
+    assert [args[2] for args in ioctls] == [0x40, 0x41]
+
+
+def test_device_io_reopens_on_error(fake_bus: FakeBuses) -> None:
+    opened, ioctls = fake_bus
+    device = DeviceIO("Test", bus=9)
+    device.write(0x40, bytes([0x01]))
+    opened[0].failure = OSError(errno.EIO, "Input/output error")
+    with pytest.raises(WriteError):
+        device.write(0x40, bytes([0x02]))
+    device.write(0x40, bytes([0x03]))
+    assert len(opened) == 2
+    assert opened[1].getvalue() == bytes([0x03])
+    assert len(ioctls) == 2
+
+
+def test_device_io_keeps_stream_open_on_nack(fake_bus: FakeBuses) -> None:
+    opened, ioctls = fake_bus
+    device = DeviceIO("Test", bus=9)
+    opened[0].failure = OSError(errno.EREMOTEIO, "Remote I/O error")
+    with pytest.raises(WriteError):
+        device.write(0x40, bytes([0x01]))
+    opened[0].failure = None
+    device.write(0x40, bytes([0x02]))
+    assert len(opened) == 1
+    assert len(handle_pool.handles) == 1
@@ -0,0 +1,83 @@
+# Import standard python libraries
+import os, sys, threading
+from typing import Any
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c.main import I2C
+from device.utilities.communication.i2c.buses import BreakerRegistry
+from device.utilities.communication.i2c.exceptions import ReadError, WriteError
+from device.utilities.communication.i2c.metrics import TransactionMetrics, is_nack
+from device.utilities.communication.i2c.mux_cache import MuxChannelCache
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
+
+
+def create_i2c(metrics: TransactionMetrics) -> I2C:
+    return I2C(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=PeripheralSimulator,  # type: ignore
+        mux_cache=MuxChannelCache(),
+        metrics=metrics,
+        breakers=BreakerRegistry(),
+    )
+
+
+def test_records_operations_per_device() -> None:
+    metrics = TransactionMetrics(trace_size=10)
+    i2c = create_i2c(metrics)
+    i2c.read(2)
+    try:
+        i2c.write(bytes([0x01, 0x02]), retry=False)
+    except WriteError:
+        pass
+    device = metrics.snapshot()["Test"]
+    assert device["operations"]["read"]["count"] == 2
+    assert device["operations"]["read"]["bytes"] == 3
+    assert device["operations"]["write"]["errors"] == 1
+    assert device["operations"]["write"]["bytes"] == 0
+    assert device["mux_switches"] == 1
+    assert sum(device["operations"]["read"]["histogram"].values()) == 2
+    assert metrics.summary()["Test"]["transactions"] == 4
+
+
+def test_trace_keeps_last_transactions() -> None:
+    metrics = TransactionMetrics(trace_size=3)
+    i2c = create_i2c(metrics)
+    for _ in range(5):
+        i2c.read(1)
+    trace = metrics.get_trace()
+    assert len(trace) == 3
+    assert trace[-1]["operation"] == "read"
+    assert trace[-1]["address"] == "0x40"
+    assert metrics.get_trace(limit=1) == trace[-1:]
+    assert metrics.get_trace(device="Other") == []
+    assert TransactionMetrics(trace_size=0).get_trace() == []
+
+
+def test_records_errors_nacks_and_retries(monkeypatch: Any) -> None:
+    monkeypatch.setattr("device.utilities.functiontools.time.sleep", lambda s: None)
+    metrics = TransactionMetrics()
+    i2c = create_i2c(metrics)
+
+    def nack(address: int, num_bytes: int) -> bytes:
+        raise ReadError("Unable to read") from OSError(121, "Remote I/O error")
+
+    monkeypatch.setattr(i2c.io, "read", nack)
+    try:
+        i2c.read(1)
+        assert False, "Expected read error"
+    except ReadError as e:
+        assert is_nack(e)
+    device = metrics.snapshot()["Test"]
+    assert device["operations"]["read"]["errors"] == 5
+    assert device["nacks"] == 5
+    assert device["retries"] == 4
@@ -0,0 +1,56 @@
+# Import standard python libraries
+import os, sys, threading
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c.main import I2C
+from device.utilities.communication.i2c.mux_cache import MuxChannelCache
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
+
+
+def create_i2c(mux_cache: MuxChannelCache, channel: int = 4) -> I2C:
+    return I2C(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=channel,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=PeripheralSimulator,  # type: ignore
+        mux_cache=mux_cache,
+    )
+
+
+def test_skips_mux_write_when_channel_selected() -> None:
+    mux_cache = MuxChannelCache()
+    i2c = create_i2c(mux_cache)
+    i2c.read(2)
+    i2c.write_register(0x01, 0x02)
+    assert mux_cache.metrics["misses"] == 0
+    assert mux_cache.metrics["hits"] == 3
+    other = create_i2c(mux_cache, channel=5)
+    assert mux_cache.channels[("simulator", 0x77)] == 5
+    i2c.read(2)
+    assert mux_cache.metrics["misses"] == 1
+
+
+def test_invalidates_on_mux_error() -> None:
+    mux_cache = MuxChannelCache()
+    i2c = create_i2c(mux_cache)
+    MuxSimulator().set(0x77, 0x01)
+    i2c.read(2)
+    assert mux_cache.metrics["invalidations"] == 1
+    assert mux_cache.metrics["misses"] == 1
+    assert MuxSimulator.connections[0x77] == 0x10
+
+
+def test_disabled_cache_always_sets_mux() -> None:
+    mux_cache = MuxChannelCache(enabled=False)
+    i2c = create_i2c(mux_cache)
+    i2c.read(2)
+    assert mux_cache.metrics["hits"] == 0
+    assert mux_cache.metrics["misses"] == 0
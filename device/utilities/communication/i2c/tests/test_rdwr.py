@@ -0,0 +1,115 @@
+# Import standard python libraries
+import os, sys, io, threading, pytest
+from typing import Any, Iterator, List, Union
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.bitwise import byte_str
+
+# Import i2c elements
+from device.utilities.communication.i2c import device_io
+from device.utilities.communication.i2c.main import I2C
+from device.utilities.communication.i2c.device_io import DeviceIO, I2C_M_RD, I2C_RDWR
+from device.utilities.communication.i2c.handles import handle_pool
+from device.utilities.communication.i2c.buses import BreakerRegistry
+from device.utilities.communication.i2c.metrics import TransactionMetrics
+from device.utilities.communication.i2c.mux_cache import MuxChannelCache
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
+
+
+class FakeBus(io.BytesIO):
+    """Bus stream with a file descriptor."""
+
+    def fileno(self) -> int:
+        return 0
+
+
+class Simulator(PeripheralSimulator):  # type: ignore
+    """Simulates a device with registers and a command."""
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore
+        super().__init__(*args, **kwargs)
+        self.registers = {0x20: 0x01, 0x21: 0x02, 0x22: 0x03}
+        self.writes = {byte_str(bytes([0x40])): bytes([0xAA, 0xBB])}
+
+
+@pytest.fixture
+def transfers(monkeypatch: Any) -> Iterator[List[List[Union[bytes, int]]]]:
+    transfers: List[List[Union[bytes, int]]] = []
+
+    def ioctl(fd, request, data):  # type: ignore
+        if request != I2C_RDWR:
+            return
+        messages: List[Union[bytes, int]] = []
+        for i in range(data.nmsgs):
+            message = data.msgs[i]
+            if message.flags & I2C_M_RD:
+                for j in range(message.len):
+                    message.buf[j] = 0x10 + j
+                messages.append(message.len)
+            else:
+                messages.append(bytes(message.buf[: message.len]))
+        transfers.append(messages)
+
+    monkeypatch.setenv("IS_I2C_ENABLED", "true")
+    monkeypatch.setattr(device_io.io, "open", lambda *args, **kwargs: FakeBus())
+    monkeypatch.setattr(device_io.fcntl, "ioctl", ioctl)
+    handle_pool.close()
+    yield transfers
+    handle_pool.close()
+
+
+def test_device_io_combines_messages(transfers: List[List[Union[bytes, int]]]) -> None:
+    device = DeviceIO("Test", bus=9)
+    messages: List[Union[bytes, int]] = [bytes([0x2A]), 1, bytes([0x2B]), 2]
+    assert device.rdwr(0x2F, messages) == [bytes([0x10]), bytes([0x10, 0x11])]
+    assert device.read_registers(0x2F, 0x20, 3) == bytes([0x10, 0x11, 0x12])
+    assert transfers == [messages, [bytes([0x20]), 3]]
+    with pytest.raises(ValueError):
+        device.rdwr(0x2F, [1] * 43)
+
+
+def test_simulator_register_and_command_reads() -> None:
+    metrics = TransactionMetrics()
+    i2c = I2C(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=Simulator,  # type: ignore
+        mux_cache=MuxChannelCache(),
+        metrics=metrics,
+    )
+    assert i2c.read_registers(0x20, 3) == bytes([0x01, 0x02, 0x03])
+    messages: List[Union[bytes, int]] = [bytes([0x22]), 1, bytes([0x40]), 2]
+    assert i2c.rdwr(messages) == [bytes([0x03]), bytes([0xAA, 0xBB])]
+    operations = metrics.snapshot()["Test"]["operations"]
+    assert operations["rdwr"]["count"] == 1
+    assert operations["read_registers"]["bytes"] == 4
+
+
+def test_invalid_messages_skip_retry_and_breaker() -> None:
+    i2c = I2C(
+        name="Test",
+        i2c_lock=threading.RLock(),
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=Simulator,  # type: ignore
+        mux_cache=MuxChannelCache(),
+        metrics=TransactionMetrics(),
+        breakers=BreakerRegistry(threshold=1),
+    )
+    with pytest.raises(ValueError):
+        i2c.rdwr([])
+    assert i2c.breaker is not None
+    assert i2c.breaker.failures == 0
+    assert not i2c.breaker.is_open
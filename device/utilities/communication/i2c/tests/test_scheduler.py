@@ -0,0 +1,126 @@
+# Import standard python libraries
+import os, sys, time, threading
+from typing import List, Optional, Tuple
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import i2c elements
+from device.utilities.communication.i2c.main import I2C
+from device.utilities.communication.i2c.buses import BusRegistry
+from device.utilities.communication.i2c.mux_cache import MuxChannelCache
+from device.utilities.communication.i2c.mux_simulator import MuxSimulator
+from device.utilities.communication.i2c.peripheral_simulator import PeripheralSimulator
+from device.utilities.communication.i2c.scheduler import (
+    BusScheduler,
+    PRIORITY_ACTUATOR,
+    PRIORITY_SENSOR,
+    PRIORITY_DIAGNOSTIC,
+    transaction_context,
+)
+
+# Initialize request type of name, priority, mux channel and deadline
+Channel = Optional[Tuple[Optional[int], Optional[int]]]
+Request = Tuple[str, int, Channel, float]
+
+
+def run_waiting(scheduler: BusScheduler, requests: List[Request]) -> List[str]:
+    """Queues requests while bus is held, returns names in granted order."""
+    order: List[str] = []
+
+    def access(name: str, priority: int, channel: Channel, deadline: float) -> None:
+        with transaction_context(name, priority, channel, deadline):
+            with scheduler:
+                order.append(name)
+
+    with transaction_context("holder", PRIORITY_SENSOR, (0x77, 1)):
+        with scheduler:
+            threads: List[threading.Thread] = []
+            for request in requests:
+                thread = threading.Thread(target=access, args=request)
+                thread.start()
+                threads.append(thread)
+                while len(scheduler.waiting) < len(threads):
+                    time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+    return order
+
+
+def test_grants_by_priority() -> None:
+    scheduler = BusScheduler("test")
+    deadline = time.monotonic() + 60
+    order = run_waiting(
+        scheduler,
+        [
+            ("diagnostic", PRIORITY_DIAGNOSTIC, None, deadline),
+            ("sensor", PRIORITY_SENSOR, None, deadline),
+            ("actuator", PRIORITY_ACTUATOR, None, deadline),
+        ],
+    )
+    assert order == ["actuator", "sensor", "diagnostic"]
+
+
+def test_batches_by_mux_channel() -> None:
+    scheduler = BusScheduler("test")
+    deadline = time.monotonic() + 60
+    order = run_waiting(
+        scheduler,
+        [
+            ("channel-2", PRIORITY_SENSOR, (0x77, 2), deadline),
+            ("channel-1", PRIORITY_SENSOR, (0x77, 1), deadline),
+        ],
+    )
+    assert order == ["channel-1", "channel-2"]
+    assert scheduler.metrics["mux_switches"] == 1
+
+
+def test_late_requests_go_first() -> None:
+    scheduler = BusScheduler("test")
+    order = run_waiting(
+        scheduler,
+        [
+            ("diagnostic", PRIORITY_DIAGNOSTIC, None, time.monotonic() - 1),
+            ("actuator", PRIORITY_ACTUATOR, None, time.monotonic() + 60),
+        ],
+    )
+    assert order == ["diagnostic", "actuator"]
+
+
+def test_reentrant_and_non_blocking() -> None:
+    scheduler = BusScheduler("test")
+    is_acquired: List[bool] = []
+    with scheduler:
+        with scheduler:
+            thread = threading.Thread(
+                target=lambda: is_acquired.append(scheduler.acquire(blocking=False))
+            )
+            thread.start()
+            thread.join()
+    assert is_acquired == [False]
+    assert scheduler.acquire(timeout=0.1)
+    scheduler.release()
+
+
+def test_records_queueing_delay_per_device() -> None:
+    registry = BusRegistry(schedule=True)
+    scheduler = registry.get_lock(2, simulate=True)
+    assert isinstance(scheduler, BusScheduler)
+    i2c = I2C(
+        name="Test",
+        i2c_lock=scheduler,
+        bus=2,
+        address=0x40,
+        mux=0x77,
+        channel=4,
+        mux_simulator=MuxSimulator(),
+        PeripheralSimulator=PeripheralSimulator,  # type: ignore
+        mux_cache=MuxChannelCache(),
+        priority=PRIORITY_ACTUATOR,
+    )
+    with i2c.transaction():
+        i2c.read(1)
+    metrics = registry.metrics["simulator"]
+    assert metrics["queueing_delay"]["Test"]["count"] >= 2
+    assert metrics["waiting"] == 0
+    assert scheduler.channel == (0x77, 4)
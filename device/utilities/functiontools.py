@@ -1,17 +1,136 @@
-import time, inspect, threading
+import time, inspect, threading, contextlib
 from functools import wraps
-from typing import Any, Callable, TypeVar, Tuple, cast, Type
+from typing import Any, Callable, TypeVar, Tuple, cast, Type, Dict, Iterator
 
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
 
 
+class CircuitBreaker(object):
+    """Fails calls fast after threshold consecutive failures so a dead device
+    stops taking time from working ones. After the cool down one probe call is
+    let through (half open), success closes the breaker and failure opens it
+    again with double the cool down, up to max cool down."""
+
+    # Initialize breaker states
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        error: Callable[[str], Exception],
+        threshold: int = 5,
+        cooldown: float = 30.0,
+        max_cooldown: float = 300.0,
+    ) -> None:
+        """Initializes circuit breaker, error creates the exception raised while
+        the breaker is open."""
+        self.name = name
+        self.error = error
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def __repr__(self) -> str:
+        return "CircuitBreaker(name={}, state={})".format(self.name, self.state)
+
+    @property
+    def is_open(self) -> bool:
+        """Checks if breaker is open."""
+        return self.state == self.OPEN
+
+    def is_entered(self) -> bool:
+        """Checks if current thread is inside a guarded call."""
+        return getattr(self.local, "is_entered", False)
+
+    @contextlib.contextmanager
+    def entered(self) -> Iterator[bool]:
+        """Guards a call, raises error if breaker is open. Yields true if the call
+        is the half open probe."""
+        with self.lock:
+            is_probe = False
+            if self.state != self.CLOSED:
+                retry_in = self.opened_at + self.cooldown - time.monotonic()
+                if self.state == self.HALF_OPEN or retry_in > 0:
+                    self.rejected += 1
+                    message = "{} circuit open, probing in {:.0f} seconds".format(
+                        self.name, max(retry_in, 0)
+                    )
+                    raise self.error(message)
+                self.state = self.HALF_OPEN
+                is_probe = True
+        self.local.is_entered = True
+        try:
+            yield is_probe
+        finally:
+            self.local.is_entered = False
+            if is_probe and self.state == self.HALF_OPEN:
+                self.record_failure()
+
+    def record_success(self) -> None:
+        """Records successful call, closes breaker."""
+        with self.lock:
+            self.failures = 0
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                self.cooldown = self.base_cooldown
+
+    def record_failure(self) -> None:
+        """Records failed call, opens breaker after threshold consecutive failures
+        or a failed probe."""
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif self.state == self.OPEN or self.failures < self.threshold:
+                return
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+
+    def reset(self) -> None:
+        """Closes breaker and clears failures."""
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets breaker state."""
+        with self.lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.cooldown - time.monotonic()
+                retry_in = round(max(remaining, 0), 1)
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "probe_in": retry_in,
+            }
+
+
 def retry(
     exceptions: Any,
     tries: int = 5,
     delay: float = 0.1,
     backoff: float = 2,
     logger: Any = None,
+    on_retry: Any = None,
+    breaker: Any = None,
+    can_retry: Any = None,
 ) -> Any:
     """Retry calling the decorated function using an exponential backoff.
     Checks for retry kwarg and adheres to default or passed in value.
@@ -24,41 +143,40 @@ def retry(
         backoff: Backoff multiplier (e.g. value of 2 will double the delay
             each retry).
         logger: Logger to use. If None, print.
+        on_retry: Optional callback called with the first argument of the
+            decorated function, e.g. self, and the exception before each retry.
+        breaker: Optional callback that gets the circuit breaker of a call from
+            the first argument of the decorated function. Each failed try counts
+            as a failure, retries stop when the breaker opens and the half open
+            probe is tried once. Calls nested in a guarded call are not counted.
+        can_retry: Optional callback that checks from the first argument of the
+            decorated function if a call may retry, e.g. false while a lock is
+            held that must not be held across backoff sleeps.
     """
 
     def deco_retry(f: F) -> F:
-        @wraps(f)
-        def f_retry(*args: Any, **kwargs: Any) -> Any:
-
-            # Get retry value from kwargs if it exists
-            retry = kwargs.get("retry", None)
-
-            # Check if retry passed into kwargs
-            if retry == None:
-
-                # Get kwargs defaults if it exists
-                argspec = inspect.getfullargspec(f)
-                positional_count = len(argspec.args) - len(argspec.defaults)
-                defaults = dict(zip(argspec.args[positional_count:], argspec.defaults))
-
-                # Get retry default value
-                retry = defaults.get("retry", None)
 
-            # Check if retry disabled
-            if retry == False:
-                return f(*args, **kwargs)
-
-            # Note: If retry kwarg is None, we are assuming that if the decorator
-            # is present, we should retry by default.
-
-            # Note: We are not checking for retry in *args
-
-            # Run function with retries
-            mtries, mdelay = tries, delay
-            while mtries > 1:
+        # Get retry default value once, assume retry if function has no default
+        argspec = inspect.getfullargspec(f)
+        defaults = argspec.defaults or ()
+        positional_count = len(argspec.args) - len(defaults)
+        default_retry = dict(zip(argspec.args[positional_count:], defaults)).get(
+            "retry", None
+        )
+
+        def run(args: Any, kwargs: Any, retry: Any, breaker_: Any) -> Any:
+            """Runs function with retries, records outcomes in breaker."""
+            mtries = 1 if retry == False else tries
+            mdelay = delay
+            while True:
                 try:
-                    return f(*args, **kwargs)
+                    result = f(*args, **kwargs)
                 except exceptions as e:
+                    if breaker_ != None:
+                        breaker_.record_failure()
+                    mtries -= 1
+                    if mtries < 1 or (breaker_ != None and breaker_.is_open):
+                        raise
 
                     # Try to log exceptions
                     try:
@@ -67,12 +185,36 @@ def retry(
                         self.logger.warning(msg)
                     except:
                         print("No logger configured")
+                    if on_retry != None:
+                        on_retry(args[0] if args else None, e)
                     time.sleep(mdelay)
-                    mtries -= 1
                     mdelay *= backoff
+                    continue
+                if breaker_ != None:
+                    breaker_.record_success()
+                return result
 
-            # Check for thread lock
-            return f(*args, **kwargs)
+        @wraps(f)
+        def f_retry(*args: Any, **kwargs: Any) -> Any:
+
+            # Get retry value from kwargs if it exists, note: we are not checking
+            # for retry in *args
+            retry = kwargs.get("retry", None)
+            if retry == None:
+                retry = default_retry
+            if can_retry != None and not can_retry(args[0] if args else None):
+                retry = False
+
+            # Get circuit breaker, calls nested in a guarded call are not guarded
+            breaker_ = None
+            if breaker != None:
+                breaker_ = breaker(args[0] if args else None)
+            if breaker_ == None or breaker_.is_entered():
+                return run(args, kwargs, retry, None)
+
+            # Run guarded function, the half open probe is tried once
+            with breaker_.entered() as is_probe:
+                return run(args, kwargs, False if is_probe else retry, breaker_)
 
         return cast(F, f_retry)  # true decorator
 
@@ -1,14 +1,34 @@
 # Import standard python modules
-import logging, sys, json, os
+import logging, logging.handlers, sys, json, os, queue, threading, copy, atexit
 
 # Import python types
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set, Tuple
 
 from django.conf import settings
 
 
+# Resolve test mode once, tests print messages instead of logging them
+IS_TEST = "pytest" in sys.modules
+
+
+class LazyMessage:
+    """Log message formatted with `str.format` only when it is reported."""
+
+    __slots__ = ("message", "args")
+
+    def __init__(self, message: Any, args: Tuple) -> None:
+        """Initializes lazy message."""
+        self.message = message
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.message).format(*self.args)
+
+
 class Logger:
-    """Simple logger class. Ensures descriptive logs in run and test environments."""
+    """Simple logger class. Ensures descriptive logs in run and test environments.
+    Messages can take `str.format` arguments, e.g. `logger.debug("Read: {}", value)`,
+    which are only formatted if the level is enabled."""
 
     def __init__(self, name: str, log: str) -> None:
         """ Initializes logger. """
@@ -17,143 +37,219 @@ class Logger:
         logger = logging.getLogger(log)
         self.logger = logging.LoggerAdapter(logger, extra)
 
-    def debug(self, message: str) -> None:
-        """ Reports standard logging debug message if in normal runtime
-            environment. If in test environment, prepends message with
-            logger name. """
-        if "pytest" in sys.modules:
-            print("DEBUG " + self.name + ": " + str(message))
-        else:
-            self.logger.debug(message)
-
-    def info(self, message: str) -> None:
-        """ Reports standard info debug message if in normal runtime
-            environment. If in test environment, prepends message with
-            logger name. """
-        if "pytest" in sys.modules:
-            print("INFO " + self.name + ": " + str(message))
-        else:
-            self.logger.info(message)
-
-    def warning(self, message: str) -> None:
-        """ Reports standard logging warning message if in normal runtime
-            environment. If in test environment, prepends message with
-            logger name. """
-        if "pytest" in sys.modules:
-            print("WARNING " + self.name + ": " + str(message))
-        else:
-            self.logger.warning(message)
-
-    def error(self, message: str) -> None:
-        """ Reports standard logging error message if in normal runtime
-            environment. If in test environment, prepends message with
-            logger name. """
-        if "pytest" in sys.modules:
-            print("ERROR " + self.name + ": " + str(message))
-        else:
-            self.logger.error(message)
-
-    def critical(self, message: str) -> None:
-        """ Reports standard logging critical message if in normal runtime
-            environment. If in test environment, prepends message with
-            logger name. """
-        if "pytest" in sys.modules:
-            print("CRITICAL " + self.name + ": " + str(message))
-        else:
-            self.logger.critical(message)
-
-    def exception(self, message: str) -> None:
+    def is_enabled_for(self, level: int) -> bool:
+        """ Checks if messages of level are reported, use to skip building
+            expensive messages. """
+        return IS_TEST or self.logger.isEnabledFor(level)
+
+    def log(self, level: int, message: Any, args: Tuple) -> None:
+        """ Reports standard logging message if level is enabled in normal 
+            runtime environment. If in test environment, prepends message with
+            level and logger name. """
+        if IS_TEST:
+            if args:
+                message = str(message).format(*args)
+            level_name = logging.getLevelName(level)
+            print(level_name + " " + self.name + ": " + str(message))
+        elif self.logger.isEnabledFor(level):
+            if args:
+                message = LazyMessage(message, args)
+            self.logger.logger.log(level, message, extra=self.logger.extra)
+
+    def debug(self, message: Any, *args: Any) -> None:
+        """ Reports standard logging debug message. """
+        self.log(logging.DEBUG, message, args)
+
+    def info(self, message: Any, *args: Any) -> None:
+        """ Reports standard logging info message. """
+        self.log(logging.INFO, message, args)
+
+    def warning(self, message: Any, *args: Any) -> None:
+        """ Reports standard logging warning message. """
+        self.log(logging.WARNING, message, args)
+
+    def error(self, message: Any, *args: Any) -> None:
+        """ Reports standard logging error message. """
+        self.log(logging.ERROR, message, args)
+
+    def critical(self, message: Any, *args: Any) -> None:
+        """ Reports standard logging critical message. """
+        self.log(logging.CRITICAL, message, args)
+
+    def exception(self, message: Any, *args: Any) -> None:
         """ Reports standard logging exception message if in normal runtime
             environment. If in test environment, prepends message with
             logger name. """
-        if "pytest" in sys.modules:
+        if args:
+            message = LazyMessage(message, args)
+        if IS_TEST:
             self.logger.exception(self.name + ": " + str(message))
         else:
             self.logger.exception(message)
 
 
-class PeripheralFileHandler(logging.Handler):
-    """Splits each peripheral thread into its own log file."""
+# Initialize log queue size and number of records written per flush
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", 100))
+
+
+class LogQueue:
+    """Queue of log records written to files by a single listener thread so
+    logging threads never block on file I/O. Records are written in batches and
+    each file is flushed once per batch. Records are dropped and counted when the
+    queue is full."""
+
+    def __init__(self, size: int = LOG_QUEUE_SIZE) -> None:
+        """Initializes log queue."""
+        self.queue: queue.Queue = queue.Queue(maxsize=size)
+        self.thread: Optional[threading.Thread] = None
+        self.thread_lock = threading.Lock()
+
+        # Initialize counters
+        self.dropped_count = 0
+        self.written_count = 0
+        self.batch_count = 0
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Gets log queue metrics."""
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.dropped_count,
+            "written": self.written_count,
+            "batches": self.batch_count,
+        }
+
+    def put(self, handler: "QueuedRotatingFileHandler", record: Any) -> None:
+        """Queues record to be written by handler, starts listener thread on first
+        record."""
+        if self.thread == None:
+            with self.thread_lock:
+                if self.thread == None:
+                    self.thread = threading.Thread(target=self.run, name="LogQueue")
+                    self.thread.daemon = True
+                    self.thread.start()
+        try:
+            self.queue.put_nowait((handler, record))
+        except queue.Full:
+            self.dropped_count += 1
+
+    def run(self) -> None:
+        """Writes queued records."""
+        while True:
+            self.write_batch(self.queue.get())
+
+    def write_batch(self, item: Tuple) -> None:
+        """Writes item and any other queued records up to batch size, then flushes
+        each written file."""
+        handlers: Set[QueuedRotatingFileHandler] = set()
+        count = 0
+        while True:
+            handler, record = item
+            handler.is_batching = True
+            handlers.add(handler)
+            handler.write(record)
+            self.written_count += 1
+            self.queue.task_done()
+            count += 1
+            if count >= LOG_BATCH_SIZE:
+                break
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+        for handler in handlers:
+            handler.is_batching = False
+            try:
+                handler.flush()
+            except OSError as e:
+                sys.stderr.write("Unable to flush log file: {}\n".format(e))
+        self.batch_count += 1
+
+    def drain(self) -> None:
+        """Waits until all queued records are written."""
+        if self.thread != None:
+            self.queue.join()
+
+
+# Initialize shared log queue, write queued records on exit
+log_queue = LogQueue()
+atexit.register(log_queue.drain)
+
+
+# Initialize types of message arguments that can be formatted later unchanged
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), tuple, frozenset)
+
+
+def snapshot(value: Any) -> Any:
+    """Snapshots message argument so later changes by the logging thread do not
+    change the message, containers are shallow copied and other mutable objects
+    are converted to strings."""
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    elif isinstance(value, (list, dict, set)):
+        return copy.copy(value)
+    return str(value)
+
+
+def prepare(record: logging.LogRecord) -> logging.LogRecord:
+    """Copies record for the listener thread. Message arguments are snapshotted
+    and exception text is rendered on the calling thread so tracebacks are not
+    referenced later, the message itself is formatted by the listener thread."""
+    record = copy.copy(record)
+    if isinstance(record.msg, LazyMessage):
+        args = tuple(snapshot(arg) for arg in record.msg.args)
+        record.msg = LazyMessage(record.msg.message, args)
+    else:
+        record.msg = snapshot(record.msg)
+    if isinstance(record.args, dict):
+        record.args = {key: snapshot(arg) for key, arg in record.args.items()}
+    elif record.args:
+        record.args = tuple(snapshot(arg) for arg in record.args)
+    if record.exc_info:
+        record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+    return record
+
+
+class QueuedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that queues records on the shared log queue, records
+    are written and flushed in batches by the log queue listener thread."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initializes peripheral file handler."""
-
-        # Inherit functions from handler
+        """Initializes queued rotating file handler."""
         super().__init__(*args, **kwargs)
+        self.is_batching = False
 
-        # Get project root dir
-        ROOT_DIR = os.environ.get("PROJECT_ROOT")
-        if ROOT_DIR != None:
-            ROOT_DIR += "/"  # type: ignore
-        else:
-            ROOT_DIR = ""
-
-        # Load device config
-        # DEVICE_CONFIG_PATH = ROOT_DIR + "data/config/device.txt"
-        # DATA_PATH = os.getenv("STORAGE_LOCATION", ROOT_DIR + "data")
-
-        DEVICE_CONFIG_PATH = settings.DATA_PATH + "/config/device.txt"
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queues record."""
+        log_queue.put(self, prepare(record))
 
-        if os.path.exists(DEVICE_CONFIG_PATH):
-            with open(DEVICE_CONFIG_PATH) as f:
-                config_name = f.readline().strip()
-        else:
-            config_name = "unspecified"
-        path = ROOT_DIR + "data/devices/{}.json".format(config_name)
-        device_config = json.load(open(path))
+    def write(self, record: logging.LogRecord) -> None:
+        """Writes record to file, called from log queue listener thread."""
+        self.acquire()
+        try:
+            super().emit(record)
+        finally:
+            self.release()
 
-        # Get peripheral configs
-        peripheral_configs = device_config.get("peripherals", {})
+    def flush(self) -> None:
+        """Flushes file unless a batch is being written."""
+        if not self.is_batching:
+            super().flush()
 
-        # Ensure peripheral configs are not none
-        if peripheral_configs == None:
-            peripheral_configs = {}
 
-        # Make sure log directory exists
-        # LOG_DIR = ROOT_DIR + "data/logs/peripherals/"
-        LOG_DIR = settings.DATA_PATH + "/logs/peripherals/"
-        if not os.path.exists(LOG_DIR):
-            os.makedirs(LOG_DIR)
+class EntityFileHandler(logging.Handler):
+    """Splits each peripheral or controller thread into its own log file. Records
+    are routed by the `file_name` extra attached by `Logger`, e.g. 
+    `Driver(SHT25-Top)` routes to `SHT25-Top.log`. Routes are resolved once per 
+    file name then looked up."""
 
-        # Clear out old peripheral logs
-        for file in os.listdir(LOG_DIR):
-            if file.endswith(".log") or file.endswith(".log.1"):
-                os.remove(LOG_DIR + file)
-
-        # Initialize peripheral file handlers
-        self.file_handlers: Dict = {}
-        for peripheral_config in peripheral_configs:
-            name = peripheral_config["name"]
-            filename = LOG_DIR + name + ".log"
-            handlers = logging.handlers  # type: ignore
-            self.file_handlers[name] = handlers.RotatingFileHandler(
-                filename=filename,
-                mode="a",
-                maxBytes=200 * 1024,
-                backupCount=1,
-                encoding=None,
-                delay=0,
-            )
-            self.file_handlers[name].format = self.format
-
-    def emit(self, record: Any) -> None:
-        """ Emits a log record. """
-
-        # Format record
-        log_entry = self.format(record)
-
-        # Route record to peripheral handler if record contains peripheral name
-        for name, handler in self.file_handlers.items():
-            if name in log_entry:
-                handler.emit(record)
-                break
-
-
-class ControllerFileHandler(logging.Handler):
-    """Splits each controller thread into its own log file."""
+    # Initialize device config key of entities and log directory name
+    kind = ""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Initializes controller file handler."""
+        """Initializes entity file handler."""
 
         # Inherit functions from handler
         super().__init__(*args, **kwargs)
@@ -166,10 +262,7 @@ class ControllerFileHandler(logging.Handler):
             ROOT_DIR = ""
 
         # Load device config
-        # DEVICE_CONFIG_PATH = ROOT_DIR + "data/config/device.txt"
-        # DATA_PATH = os.getenv("STORAGE_LOCATION", ROOT_DIR + "data")
         DEVICE_CONFIG_PATH = settings.DATA_PATH + "/config/device.txt"
-
         if os.path.exists(DEVICE_CONFIG_PATH):
             with open(DEVICE_CONFIG_PATH) as f:
                 config_name = f.readline().strip()
@@ -178,30 +271,27 @@ class ControllerFileHandler(logging.Handler):
         path = ROOT_DIR + "data/devices/{}.json".format(config_name)
         device_config = json.load(open(path))
 
-        # Get controller configs
-        controller_configs = device_config.get("controllers", {})
-
-        # Ensure controller configs are not none
-        if controller_configs == None:
-            controller_configs = {}
+        # Get entity configs, ensure configs are not none
+        entity_configs = device_config.get(self.kind, {})
+        if entity_configs == None:
+            entity_configs = {}
 
         # Make sure log directory exists
-        LOG_DIR = settings.DATA_PATH + "/logs/controllers/"
+        LOG_DIR = settings.DATA_PATH + "/logs/{}/".format(self.kind)
         if not os.path.exists(LOG_DIR):
             os.makedirs(LOG_DIR)
 
-        # Clear out old controller logs
+        # Clear out old entity logs
         for file in os.listdir(LOG_DIR):
             if file.endswith(".log") or file.endswith(".log.1"):
                 os.remove(LOG_DIR + file)
 
-        # Initialize controller file handlers
-        self.file_handlers: Dict = {}
-        for controller_config in controller_configs:
-            name = controller_config["name"]
+        # Initialize entity file handlers
+        self.file_handlers: Dict[str, QueuedRotatingFileHandler] = {}
+        for entity_config in entity_configs:
+            name = entity_config["name"]
             filename = LOG_DIR + name + ".log"
-            handlers = logging.handlers  # type: ignore
-            self.file_handlers[name] = handlers.RotatingFileHandler(
+            self.file_handlers[name] = QueuedRotatingFileHandler(
                 filename=filename,
                 mode="a",
                 maxBytes=200 * 1024,
@@ -209,16 +299,44 @@ class ControllerFileHandler(logging.Handler):
                 encoding=None,
                 delay=0,
             )
-            self.file_handlers[name].format = self.format
-
-    def emit(self, record: Any) -> None:
+            self.file_handlers[name].format = self.format  # type: ignore
+
+        # Initialize routes from file name to entity file handler
+        self.routes: Dict[str, Optional[QueuedRotatingFileHandler]] = {}
+
+    def get_route(self, file_name: str) -> Optional[QueuedRotatingFileHandler]:
+        """Gets entity file handler of file name. Uses the name in parentheses if
+        it is an entity, otherwise the first entity whose name is in file name."""
+        route = self.routes.get(file_name, self)
+        if route is not self:
+            return route  # type: ignore
+        name = file_name[file_name.find("(") + 1 : file_name.rfind(")")]
+        route = self.file_handlers.get(name)
+        if route == None:
+            for name, handler in self.file_handlers.items():
+                if name in file_name:
+                    route = handler
+                    break
+        self.routes[file_name] = route
+        return route
+
+    def emit(self, record: logging.LogRecord) -> None:
         """ Emits a log record. """
+        file_name = getattr(record, "file_name", None)
+        if file_name == None:
+            return
+        handler = self.get_route(file_name)  # type: ignore
+        if handler != None:
+            handler.emit(record)  # type: ignore
 
-        # Format record
-        log_entry = self.format(record)
 
-        # Route record to controller handler if record contains controller name
-        for name, handler in self.file_handlers.items():
-            if name in log_entry:
-                handler.emit(record)
-                break
+class PeripheralFileHandler(EntityFileHandler):
+    """Splits each peripheral thread into its own log file."""
+
+    kind = "peripherals"
+
+
+class ControllerFileHandler(EntityFileHandler):
+    """Splits each controller thread into its own log file."""
+
+    kind = "controllers"
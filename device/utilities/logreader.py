@@ -0,0 +1,329 @@
+# Import standard python modules
+import os, re, json, time, threading
+
+# Import python types
+from typing import Any, BinaryIO, Iterator, List, Optional, Pattern, Tuple
+
+# Initialize block size for reading backwards from end of file
+BLOCK_SIZE = int(os.getenv("LOG_READER_BLOCK_SIZE", 8192))
+
+# Initialize maximum bytes read per incremental read
+MAX_READ_SIZE = int(os.getenv("LOG_READER_MAX_READ_SIZE", 256 * 1024))
+
+# Initialize marker appended to lines longer than the maximum read size
+TRUNCATED_MARKER = " [truncated]"
+
+# Initialize log line header pattern, matches formatters in app settings e.g.
+# `[17/Oct/2026 05:46:42.193] ERROR DeviceIO(LED): Unable to close`
+HEADER_PATTERN = re.compile(
+    r"^\[(\d{2}/\w{3}/\d{4} \d{2}:\d{2}:\d{2})\.(\d{3})\] ([A-Z]+) "
+)
+TIMESTAMP_FORMAT = "%d/%b/%Y %H:%M:%S"
+
+# Initialize log levels
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# Initialize top-level log names
+SYSTEM_LOG_NAMES = [
+    "app",
+    "device",
+    "coordinator",
+    "recipe",
+    "resource",
+    "iot",
+    "i2c",
+    "connect",
+    "upgrade",
+]
+
+
+class LogEntry:
+    """Log entry of a header line followed by any continuation lines, e.g. a
+    traceback."""
+
+    def __init__(self, lines: List[str]) -> None:
+        """Initializes log entry, parses timestamp and level from header line."""
+        self.lines = lines
+        self.timestamp: Optional[float] = None
+        self.level: Optional[str] = None
+        match = HEADER_PATTERN.match(lines[0])
+        if match != None:
+            timestamp, msecs, level = match.groups()  # type: ignore
+            struct_time = time.strptime(timestamp, TIMESTAMP_FORMAT)
+            self.timestamp = time.mktime(struct_time) + int(msecs) / 1000
+            self.level = level
+
+    def __repr__(self) -> str:
+        return "LogEntry(level={}, timestamp={})".format(self.level, self.timestamp)
+
+    @property
+    def text(self) -> str:
+        """Gets entry text."""
+        return "\n".join(self.lines)
+
+
+class LogFilter:
+    """Filters log entries by minimum level, regular expression, and time."""
+
+    def __init__(
+        self,
+        level: Optional[str] = None,
+        pattern: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> None:
+        """Initializes log filter, raises ValueError on invalid level or
+        pattern."""
+        self.level = 0
+        if level != None:
+            if level.upper() not in LEVELS:  # type: ignore
+                raise ValueError("Invalid log level: {}".format(level))
+            self.level = LEVELS[level.upper()]  # type: ignore
+        self.pattern: Optional[Pattern] = None
+        if pattern != None:
+            try:
+                self.pattern = re.compile(pattern)  # type: ignore
+            except re.error as e:
+                raise ValueError("Invalid pattern: {}".format(e))
+        self.since = since
+
+    def matches(self, entry: LogEntry) -> bool:
+        """Checks if entry passes filter."""
+        if self.level > 0 and LEVELS.get(entry.level, 0) < self.level:  # type: ignore
+            return False
+        if self.since != None and entry.timestamp != None:
+            if entry.timestamp < self.since:  # type: ignore
+                return False
+        if self.pattern != None and self.pattern.search(entry.text) == None:
+            return False
+        return True
+
+    def is_before(self, entry: LogEntry) -> bool:
+        """Checks if entry and all entries before it are older than since."""
+        if self.since == None or entry.timestamp == None:
+            return False
+        return entry.timestamp < self.since  # type: ignore
+
+
+def decode(line: bytes) -> str:
+    """Decodes log line."""
+    return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def read_lines_backwards(
+    path: str, end: Optional[int] = None, block_size: int = BLOCK_SIZE
+) -> Iterator[str]:
+    """Reads lines from end offset, or end of file, back to start of file in
+    blocks without reading the whole file."""
+    with open(path, "rb") as f:
+        if end == None:
+            end = f.seek(0, os.SEEK_END)
+        position = end
+        remainder = b""
+        while position > 0:  # type: ignore
+            size = min(block_size, position)  # type: ignore
+            position -= size  # type: ignore
+            f.seek(position)  # type: ignore
+            lines = (f.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line != b"":
+                    yield decode(line)
+        if remainder != b"":
+            yield decode(remainder)
+
+
+def read_entries_backwards(path: str, end: Optional[int] = None) -> Iterator[LogEntry]:
+    """Reads log entries from end offset, or end of file, back to start of file.
+    Continuation lines are grouped with the header line before them."""
+    continuation: List[str] = []
+    for line in read_lines_backwards(path, end):
+        continuation.append(line)
+        if HEADER_PATTERN.match(line) != None:
+            yield LogEntry(list(reversed(continuation)))
+            continuation = []
+    if continuation != []:
+        yield LogEntry(list(reversed(continuation)))
+
+
+def parse_entries(lines: List[str]) -> List[LogEntry]:
+    """Parses lines into log entries."""
+    entries: List[LogEntry] = []
+    for line in lines:
+        if entries == [] or HEADER_PATTERN.match(line) != None:
+            entries.append(LogEntry([line]))
+        else:
+            entries[-1].lines.append(line)
+    return entries
+
+
+def make_offset(inode: int, position: int) -> str:
+    """Makes read offset of a position in the file with inode."""
+    return "{}:{}".format(inode, position)
+
+
+def parse_offset(offset: Any) -> Tuple[Optional[int], int]:
+    """Parses read offset into inode and position, a plain position has no
+    inode. Raises ValueError on invalid offset."""
+    parts = str(offset).split(":")
+    if len(parts) == 1:
+        inode, position = None, int(parts[0])
+    elif len(parts) == 2:
+        inode, position = int(parts[0]), int(parts[1])
+    else:
+        raise ValueError("Invalid offset: {}".format(offset))
+    if position < 0:
+        raise ValueError("Invalid offset: {}".format(offset))
+    return inode, position
+
+
+def parse_limit(limit: Any) -> int:
+    """Parses maximum number of entries. Raises ValueError on invalid limit."""
+    value = int(limit)
+    if value < 1:
+        raise ValueError("Invalid limit: {}".format(limit))
+    return value
+
+
+def skip_line(f: BinaryIO) -> None:
+    """Moves file position past the end of the current line, or to end of file
+    if the line is incomplete."""
+    while True:
+        block = f.read(BLOCK_SIZE)
+        index = block.find(b"\n")
+        if index >= 0:
+            f.seek(index + 1 - len(block), os.SEEK_CUR)
+            return
+        elif len(block) < BLOCK_SIZE:
+            return
+
+
+def tail(
+    path: str, limit: int = 500, filter_: Optional[LogFilter] = None
+) -> Tuple[List[LogEntry], str]:
+    """Gets up to limit newest entries that pass filter, oldest first, by reading
+    backwards from end of file. Returns entries and the end of file offset to
+    pass to `read_since` for live tailing. Raises ValueError on invalid limit."""
+    limit = parse_limit(limit)
+    if filter_ == None:
+        filter_ = LogFilter()
+    stat = os.stat(path)
+    end = stat.st_size
+    entries = []
+    for entry in read_entries_backwards(path, end):
+        if filter_.is_before(entry):  # type: ignore
+            break
+        if filter_.matches(entry):  # type: ignore
+            entries.append(entry)
+            if len(entries) >= limit:
+                break
+    entries.reverse()
+    return entries, make_offset(stat.st_ino, end)
+
+
+def read_since(
+    path: str, offset: Any, filter_: Optional[LogFilter] = None
+) -> Tuple[List[LogEntry], str]:
+    """Gets entries that pass filter written after offset. Returns entries and
+    offset to pass on next read. If the file was replaced or truncated since
+    offset, reads from start of new file. Reads at most max read size bytes and
+    never past the last complete line. When the read stops before end of file,
+    the last entry is left for the next read since its continuation lines may
+    follow. A line longer than max read size is returned truncated. Raises
+    ValueError on invalid offset."""
+    if filter_ == None:
+        filter_ = LogFilter()
+    inode, position = parse_offset(offset)
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        if stat.st_size < position or (inode != None and inode != stat.st_ino):
+            position = 0
+        f.seek(position)
+        data = f.read(min(stat.st_size - position, MAX_READ_SIZE))
+        is_partial = position + len(data) < stat.st_size
+
+        # Truncate line longer than max read size and skip the rest of it
+        if is_partial and b"\n" not in data:
+            skip_line(f)
+            entries = parse_entries([decode(data) + TRUNCATED_MARKER])
+            entries = [entry for entry in entries if filter_.matches(entry)]
+            return entries, make_offset(stat.st_ino, f.tell())
+
+    # Split complete lines
+    data = data[: data.rfind(b"\n") + 1]
+    lines = data.split(b"\n")[:-1]
+
+    # Leave last entry for next read if read stopped before end of file
+    if is_partial:
+        for index in range(len(lines) - 1, 0, -1):
+            if HEADER_PATTERN.match(decode(lines[index])) != None:
+                lines = lines[:index]
+                break
+    size = sum(len(line) + 1 for line in lines)
+
+    # Parse and filter entries
+    lines = [line for line in lines if line != b""]
+    entries = parse_entries([decode(line) for line in lines])
+    entries = [entry for entry in entries if filter_.matches(entry)]
+    return entries, make_offset(stat.st_ino, position + size)
+
+
+class LogFiles:
+    """Gets names and paths of peripheral, controller, and system log files. The
+    list is derived from the device config and cached until the device config
+    file or the config it names changes."""
+
+    def __init__(
+        self,
+        log_dir: str,
+        device_config_path: str,
+        devices_path: str = "data/devices/{}.json",
+    ) -> None:
+        """Initializes log files."""
+        self.log_dir = log_dir
+        self.device_config_path = device_config_path
+        self.devices_path = devices_path
+        self.lock = threading.Lock()
+        self.key: Optional[Tuple] = None
+        self.files: List[Tuple[str, str]] = []
+
+    def get_mtime(self, path: str) -> Optional[float]:
+        """Gets modified time of path, None if path does not exist."""
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def get_config_name(self) -> str:
+        """Gets device config name."""
+        if not os.path.exists(self.device_config_path):
+            return "unspecified"
+        with open(self.device_config_path) as f:
+            return f.readline().strip()
+
+    def get(self) -> List[Tuple[str, str]]:
+        """Gets names and paths of existing log files."""
+        with self.lock:
+            config_name = self.get_config_name()
+            config_path = self.devices_path.format(config_name)
+            key = (config_name, self.get_mtime(config_path))
+            if key != self.key:
+                self.files = self.load(config_path)
+                self.key = key
+            files = self.files
+        return [(name, path) for name, path in files if os.path.exists(path)]
+
+    def load(self, config_path: str) -> List[Tuple[str, str]]:
+        """Loads log file names and paths from device config."""
+        try:
+            with open(config_path) as f:
+                device_config = json.load(f)
+        except (OSError, ValueError):
+            device_config = {}
+        files = []
+        for name in ["peripherals", "controllers"]:
+            for item in device_config.get(name) or []:
+                path = "{}{}/{}.log".format(self.log_dir, name, item["name"])
+                files.append((item["name"], path))
+        for name in SYSTEM_LOG_NAMES:
+            files.append((name.capitalize(), self.log_dir + name + ".log"))
+        return files
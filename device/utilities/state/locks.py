@@ -0,0 +1,94 @@
+# Import standard python modules
+import threading, time
+
+# Import python types
+from typing import Any, Dict, List
+
+
+class SectionLock:
+    """Reentrant lock for one state section. Records how often and how long
+    threads waited to acquire it. Statistics are only updated while the lock is
+    held so they need no extra lock."""
+
+    def __init__(self, name: str) -> None:
+        """Initializes section lock."""
+        self.name = name
+        self.lock = threading.RLock()
+
+        # Initialize contention statistics
+        self.acquire_count = 0
+        self.wait_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def __enter__(self) -> "SectionLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets lock contention metrics."""
+        return {
+            "acquire_count": self.acquire_count,
+            "wait_count": self.wait_count,
+            "total_wait_time": round(self.total_wait_time, 6),
+            "max_wait_time": round(self.max_wait_time, 6),
+        }
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires lock, timing the wait if the lock is held by another thread."""
+
+        # Acquire uncontended lock without timing
+        if self.lock.acquire(blocking=False):
+            self.acquire_count += 1
+            return True
+        if not blocking:
+            return False
+
+        # Wait for lock
+        start_time = time.perf_counter()
+        if not self.lock.acquire(timeout=timeout):
+            return False
+        wait_time = time.perf_counter() - start_time
+
+        # Update statistics
+        self.acquire_count += 1
+        self.wait_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        return True
+
+    def release(self) -> None:
+        """Releases lock."""
+        self.lock.release()
+
+
+class StateLock:
+    """Lock over all state sections for code that updates several sections at
+    once. Acquires section locks in a fixed order so it can not deadlock with
+    itself. Threads holding a section lock must not acquire it."""
+
+    def __init__(self, locks: List[SectionLock]) -> None:
+        """Initializes state lock."""
+        self.locks = locks
+
+    def __enter__(self) -> "StateLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    def acquire(self) -> bool:
+        """Acquires all section locks."""
+        for lock in self.locks:
+            lock.acquire()
+        return True
+
+    def release(self) -> None:
+        """Releases all section locks."""
+        for lock in reversed(self.locks):
+            lock.release()
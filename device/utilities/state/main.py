@@ -1,16 +1,44 @@
 # Import standard python modules
-import threading
+import threading, contextlib, queue
 
 # Import python types
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 # Import device utilities
-from device.utilities.accessors import set_nested_dict_safely, get_nested_dict_safely
+from device.utilities.accessors import (
+    set_nested_dict_safely,
+    get_nested_dict_safely,
+    freeze,
+)
+from device.utilities.state.locks import SectionLock, StateLock
+from device.utilities.state.subscriptions import StateNotifier, Subscription
+from device.utilities.state.stats import SensorStatistics
+
+# Initialize state sections
+SECTIONS = [
+    "device",
+    "environment",
+    "recipe",
+    "peripherals",
+    "controllers",
+    "iot",
+    "resource",
+    "network",
+    "upgrade",
+]
 
 
 class State(object):
     """ Shared memory object used to store and transmit 
-        state between threads. """
+        state between threads. Each section keeps a version counter that is
+        incremented on every tracked write so consumers can tell which sections
+        changed without serializing them. Each section has its own lock so
+        writers to different sections do not block each other, readers take
+        read-only snapshots that are copied on the first read after a change.
+        Consumers can subscribe to key paths to be notified when a value
+        changes instead of polling. Reported sensor values are summarized by a
+        windowed statistics engine and, if a time series store is attached,
+        also recorded there. """
 
     device: Dict[str, Any] = {}
     environment: Dict[str, Any] = {}
@@ -21,7 +49,16 @@ class State(object):
     resource: Dict[str, Any] = {}
     network: Dict[str, Any] = {}
     upgrade: Dict[str, Any] = {}
-    lock = threading.RLock()
+    locks: Dict[str, SectionLock] = {
+        section: SectionLock(section) for section in SECTIONS
+    }
+    lock = StateLock(list(locks.values()))
+    versions: Dict[str, int] = {section: 0 for section in SECTIONS}
+    versions_lock = threading.Lock()
+    snapshots: Dict[str, Tuple[int, Any]] = {}
+    notifier = StateNotifier()
+    sensor_stats = SensorStatistics()
+    timeseries: Optional[Any] = None
 
     def __str__(self) -> str:
         return "State(device={}, environment={}, recipe={}, peripherals={}, controllers={}, iot={}, resource={}, network={}, upgrade={})".format(
@@ -36,142 +73,194 @@ class State(object):
             self.upgrade,
         )
 
+    @property
+    def lock_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Gets lock contention metrics for each section."""
+        return {section: lock.metrics for section, lock in self.locks.items()}
+
+    def mark_dirty(self, section: str) -> None:
+        """Increments version counter for section."""
+        with self.versions_lock:
+            self.versions[section] = self.versions.get(section, 0) + 1
+        self.notifier.notify(section)
+
+    def get_version(self, section: str) -> int:
+        """Gets version counter for section."""
+        return self.versions.get(section, 0)
+
+    def subscribe(
+        self,
+        path: str,
+        callback: Optional[Callable[[str, Any], None]] = None,
+        queue_: Optional[queue.Queue] = None,
+        coalesce: float = 0.0,
+    ) -> Subscription:
+        """Subscribes to changes of the value at a dotted key path, e.g.
+        `environment.sensor.desired.light_ppfd_umol_m2_s`. Changes are passed to
+        callback as (path, value) or put on queue as a (path, value) tuple. If
+        coalesce is set, delivers at most once per coalesce seconds."""
+        return self.notifier.subscribe(self, path, callback, queue_, coalesce)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Cancels subscription."""
+        self.notifier.remove(subscription)
+
+    @contextlib.contextmanager
+    def writing(self, section: str) -> Iterator[None]:
+        """Holds section lock while updating section then increments section
+        version counter."""
+        with self.locks[section]:
+            yield
+            self.mark_dirty(section)
+
+    def snapshot(self, section: str) -> Any:
+        """Gets read-only copy of section. Copies are made on read, not on write:
+        the first reader after a version change freezes the section under its
+        lock, blocking writers for that copy, and later readers reuse it until
+        the section changes again. The environment section changes on every
+        sensor report, far more often than it is read, so copying on write
+        would freeze it on every report."""
+        version = self.get_version(section)
+        cached = self.snapshots.get(section)
+        if cached != None and cached[0] == version:  # type: ignore
+            return cached[1]  # type: ignore
+        with self.locks[section]:
+            version = self.get_version(section)
+            snapshot = freeze(getattr(self, section))
+        self.snapshots[section] = (version, snapshot)
+        return snapshot
+
     def set_environment_reported_sensor_value(
         self, sensor: str, variable: str, value: Any, simple: bool = False
     ) -> None:
         """Sets reported sensor value to shared environment state."""
 
-        # TODO: Clean this up, it is a mess...
-
-        # Ensure valid dict structure
-        if "reported_sensor_stats" not in self.environment:
-            self.environment["reported_sensor_stats"] = {}
-
-        # Individual
-        if "individual" not in self.environment["reported_sensor_stats"]:
-            self.environment["reported_sensor_stats"]["individual"] = {}
-        if (
-            "instantaneous"
-            not in self.environment["reported_sensor_stats"]["individual"]
-        ):
-            self.environment["reported_sensor_stats"]["individual"][
-                "instantaneous"
-            ] = {}
-        if "average" not in self.environment["reported_sensor_stats"]["individual"]:
-            self.environment["reported_sensor_stats"]["individual"]["average"] = {}
-
-        # Group
-        if "group" not in self.environment["reported_sensor_stats"]:
-            self.environment["reported_sensor_stats"]["group"] = {}
-        if "instantaneous" not in self.environment["reported_sensor_stats"]["group"]:
-            self.environment["reported_sensor_stats"]["group"]["instantaneous"] = {}
-        if "average" not in self.environment["reported_sensor_stats"]["group"]:
-            self.environment["reported_sensor_stats"]["group"]["average"] = {}
-
-        # Sensor
-        if "sensor" not in self.environment:
-            self.environment["sensor"] = {}
-        if "reported" not in self.environment["sensor"]:
-            self.environment["sensor"]["reported"] = {}
-
-        # Force simple if value is None (don't want to try averaging `None`)
-        if value is None:
-            simple = True
-
-        with self.lock:
+        # Record numeric samples at the sensor rate in time series store
+        if self.timeseries != None and isinstance(value, (int, float)):
+            if not isinstance(value, bool):
+                self.timeseries.append(variable, sensor, value)
+
+        with self.locks["environment"]:
+
+            # Ensure valid dict structure
+            stats = self.environment.setdefault("reported_sensor_stats", {})
+            individual = stats.setdefault("individual", {})
+            group = stats.setdefault("group", {})
+            instantaneous = individual.setdefault("instantaneous", {})
+            averages = individual.setdefault("average", {})
+            group_instantaneous = group.setdefault("instantaneous", {})
+            group_averages = group.setdefault("average", {})
+            sensor_state = self.environment.setdefault("sensor", {})
+            reported = sensor_state.setdefault("reported", {})
+
             # Update individual instantaneous
-            by_type = self.environment["reported_sensor_stats"]["individual"][
-                "instantaneous"
-            ]
-            if variable not in by_type:
-                by_type[variable] = {}
-            by_var = self.environment["reported_sensor_stats"]["individual"][
-                "instantaneous"
-            ][variable]
-            by_var[sensor] = value
+            instantaneous.setdefault(variable, {})[sensor] = value
+
+            # Force simple if value is None (don't want to try averaging `None`)
+            if value is None:
+                self.sensor_stats.discard(variable, sensor)
+                simple = True
 
+            # Update simple sensor value with reported value
             if simple:
-                # Update simple sensor value with reported value
-                self.environment["sensor"]["reported"][variable] = value
-
-            else:
-                # Update individual average
-                by_type = self.environment["reported_sensor_stats"]["individual"][
-                    "average"
-                ]
-                if variable not in by_type:
-                    by_type[variable] = {}
-                if sensor not in by_type:
-                    by_type[sensor] = {"value": value, "samples": 1}
-                else:
-                    stored_value = by_type[sensor]["value"]
-                    stored_samples = by_type[sensor]["samples"]
-                    new_samples = stored_samples + 1
-                    new_value = (stored_value * stored_samples + value) / new_samples
-                    by_type[sensor]["value"] = new_value
-                    by_type[sensor]["samples"] = new_samples
-
-                # Update group instantaneous
-                by_var_i = self.environment["reported_sensor_stats"]["individual"][
-                    "instantaneous"
-                ][variable]
-                num_sensors = 0
-                total = 0
-                for sensor in by_var_i:
-                    if by_var_i[sensor] != None:
-                        total += by_var_i[sensor]
-                        num_sensors += 1
-                new_value = total / num_sensors
-                self.environment["reported_sensor_stats"]["group"]["instantaneous"][
-                    variable
-                ] = {"value": new_value, "samples": num_sensors}
-
-                # Update group average
-                by_type = self.environment["reported_sensor_stats"]["group"]["average"]
-                if variable not in by_type:
-                    by_type[variable] = {"value": value, "samples": 1}
-                else:
-                    stored_value = by_type[variable]["value"]
-                    stored_samples = by_type[variable]["samples"]
-                    new_samples = stored_samples + 1
-
-                    # Check if group average > 20 samples
-                    if new_samples > 20:
-                        new_samples = 1
-                        new_value = value
-                    else:
-                        new_value = (
-                            stored_value * stored_samples + value
-                        ) / new_samples
-
-                    # Update dict
-                    by_type[variable]["value"] = new_value
-                    by_type[variable]["samples"] = new_samples
-
-                # Update simple sensor value with instantaneous group value
-                self.environment["sensor"]["reported"][variable] = self.environment[
-                    "reported_sensor_stats"
-                ]["group"]["instantaneous"][variable]["value"]
+                reported[variable] = value
+                self.mark_dirty("environment")
+                return
+
+            # Restart stats that were cleared from environment state
+            by_sensor = averages.setdefault(variable, {})
+            if variable not in group_averages:
+                self.sensor_stats.reset(variable)
+            elif sensor not in by_sensor:
+                self.sensor_stats.remove_sensor(sensor, variable)
+
+            # Update sensor and group stats
+            self.sensor_stats.update(variable, sensor, value)
+            sensor_stats = self.sensor_stats.get_sensor(variable, sensor)
+            group_stats = self.sensor_stats.get_group(variable)
+            by_sensor[sensor] = sensor_stats.snapshot()  # type: ignore
+            group_instantaneous[variable] = {
+                "value": group_stats.mean,  # type: ignore
+                "samples": len(group_stats.latest),  # type: ignore
+            }
+            group_averages[variable] = group_stats.stats.snapshot()  # type: ignore
+
+            # Update simple sensor value with instantaneous group value
+            reported[variable] = group_stats.mean  # type: ignore
+
+            # Flag environment section as changed
+            self.mark_dirty("environment")
+
+    def clear_environment_reported_sensor_values(self, sensor: str) -> None:
+        """Clears reported sensor values of sensor from shared environment state
+        and recomputes group values of each variable the sensor reported."""
+        with self.locks["environment"]:
+            stats = self.environment.get("reported_sensor_stats", {})
+            individual = stats.get("individual", {})
+            group = stats.get("group", {})
+            reported = self.environment.get("sensor", {}).get("reported", {})
+
+            # Remove individual values of sensor
+            variables = set()
+            for values in individual.values():
+                for variable, by_sensor in values.items():
+                    if isinstance(by_sensor, dict) and sensor in by_sensor:
+                        del by_sensor[sensor]
+                        variables.add(variable)
+            self.sensor_stats.remove_sensor(sensor)
+
+            # Recompute group values from remaining sensors
+            for variable in variables:
+                group_stats = self.sensor_stats.rebuild_group(variable)
+                if group_stats != None:
+                    group.setdefault("instantaneous", {})[variable] = {
+                        "value": group_stats.mean,  # type: ignore
+                        "samples": len(group_stats.latest),  # type: ignore
+                    }
+                    averages = group.setdefault("average", {})
+                    averages[variable] = group_stats.stats.snapshot()  # type: ignore
+                    reported[variable] = group_stats.mean  # type: ignore
+                    continue
+                for values in group.values():
+                    values.pop(variable, None)
+                remaining = individual.get("instantaneous", {}).get(variable, {})
+                if remaining == {}:
+                    reported.pop(variable, None)
+
+            # Flag environment section as changed
+            self.mark_dirty("environment")
 
     def set_environment_desired_sensor_value(self, variable: str, value: Any) -> None:
         """Sets desired sensor value to shared environment state."""
         set_nested_dict_safely(
-            self.environment, ["sensor", "desired", variable], value, self.lock
+            self.environment,
+            ["sensor", "desired", variable],
+            value,
+            self.locks["environment"],
         )
+        self.mark_dirty("environment")
 
     def set_environment_reported_actuator_value(
         self, variable: str, value: Any
     ) -> None:
         """Sets reported actuator value to shared environment state."""
         set_nested_dict_safely(
-            self.environment, ["actuator", "reported", variable], value, self.lock
+            self.environment,
+            ["actuator", "reported", variable],
+            value,
+            self.locks["environment"],
         )
+        self.mark_dirty("environment")
 
     def set_environment_desired_actuator_value(self, variable: str, value: Any) -> None:
         """Sets desired actuator value to shared environment state."""
         set_nested_dict_safely(
-            self.environment, ["actuator", "desired", variable], value, self.lock
+            self.environment,
+            ["actuator", "desired", variable],
+            value,
+            self.locks["environment"],
         )
+        self.mark_dirty("environment")
 
     def get_environment_reported_sensor_value(self, variable: str) -> Any:
         """Gets reported sensor value from shared environment state."""
@@ -198,8 +287,9 @@ class State(object):
     def set_peripheral_value(self, peripheral: str, variable: str, value: Any) -> None:
         """Sets peripheral to shared peripheral state."""
         set_nested_dict_safely(
-            self.peripherals, [peripheral, variable], value, self.lock
+            self.peripherals, [peripheral, variable], value, self.locks["peripherals"]
         )
+        self.mark_dirty("peripherals")
 
     def get_peripheral_value(self, peripheral: str, variable: str) -> Any:
         """ Gets peripheral value from shared peripheral state. """
@@ -213,8 +303,9 @@ class State(object):
             self.peripherals,
             [peripheral, "sensor", "reported", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def set_peripheral_desired_sensor_value(
         self, peripheral: str, variable: str, value: Any
@@ -224,8 +315,9 @@ class State(object):
             self.peripherals,
             [peripheral, "sensor", "desired", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def set_peripheral_reported_actuator_value(
         self, peripheral: str, variable: str, value: Any
@@ -235,8 +327,9 @@ class State(object):
             self.peripherals,
             [peripheral, "actuator", "reported", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def set_peripheral_desired_actuator_value(
         self, peripheral: str, variable: str, value: Any
@@ -246,8 +339,9 @@ class State(object):
             self.peripherals,
             [peripheral, "actuator", "desired", variable],
             value,
-            self.lock,
+            self.locks["peripherals"],
         )
+        self.mark_dirty("peripherals")
 
     def get_peripheral_reported_sensor_value(
         self, peripheral: str, variable: str
@@ -284,8 +378,9 @@ class State(object):
     def set_controller_value(self, controller: str, variable: str, value: Any) -> None:
         """Sets controller to shared controller state."""
         set_nested_dict_safely(
-            self.controllers, [controller, variable], value, self.lock
+            self.controllers, [controller, variable], value, self.locks["controllers"]
         )
+        self.mark_dirty("controllers")
 
     def get_controller_value(self, controller: str, variable: str) -> Any:
         """Gets controller value from shared controller state."""
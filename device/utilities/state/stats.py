@@ -0,0 +1,250 @@
+# Import standard python modules
+import os, math, collections
+
+# Import python types
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Initialize number of samples in each sensor statistics window
+SENSOR_STATS_WINDOW = int(os.getenv("SENSOR_STATS_WINDOW", 20))
+
+# Initialize number of samples in each group statistics window
+SENSOR_STATS_GROUP_WINDOW = int(os.getenv("SENSOR_STATS_GROUP_WINDOW", 20))
+
+# Initialize smoothing factor of exponentially weighted moving averages
+SENSOR_STATS_EWMA_ALPHA = float(os.getenv("SENSOR_STATS_EWMA_ALPHA", 0.2))
+
+# Initialize number of decimal places kept in statistics snapshots
+SENSOR_STATS_PRECISION = int(os.getenv("SENSOR_STATS_PRECISION", 4))
+
+
+class WindowStats:
+    """Statistics over the last window samples of a value stream. Each sample is
+    added in O(1): a ring buffer keeps running sums for the mean and standard
+    deviation, monotonic queues keep the window min and max, and an exponentially
+    weighted moving average is kept over all samples."""
+
+    def __init__(
+        self, window: int = SENSOR_STATS_WINDOW, alpha: float = SENSOR_STATS_EWMA_ALPHA
+    ) -> None:
+        """Initializes window stats, raises ValueError on invalid parameters."""
+        if window < 1:
+            raise ValueError("Invalid window: {}".format(window))
+        if not 0 < alpha <= 1:
+            raise ValueError("Invalid alpha: {}".format(alpha))
+        self.window = window
+        self.alpha = alpha
+        self.values: List[float] = [0.0] * window
+        self.count = 0
+        self.total = 0.0
+        self.squares = 0.0
+        self.ewma: Optional[float] = None
+        self.minimums: Deque[Tuple[int, float]] = collections.deque()
+        self.maximums: Deque[Tuple[int, float]] = collections.deque()
+
+    def __repr__(self) -> str:
+        return "WindowStats(samples={}, mean={})".format(self.samples, self.mean)
+
+    @property
+    def samples(self) -> int:
+        """Gets number of samples in window."""
+        return min(self.count, self.window)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Gets window mean."""
+        if self.count == 0:
+            return None
+        return self.total / self.samples
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Gets window population standard deviation."""
+        if self.count == 0:
+            return None
+        mean = self.total / self.samples
+        return math.sqrt(max(self.squares / self.samples - mean * mean, 0.0))
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Gets window minimum."""
+        if self.count == 0:
+            return None
+        return self.minimums[0][1]
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """Gets window maximum."""
+        if self.count == 0:
+            return None
+        return self.maximums[0][1]
+
+    def add(self, value: float) -> None:
+        """Adds sample to window, evicting the oldest sample once full."""
+
+        # Replace oldest value in ring buffer
+        index = self.count % self.window
+        if self.count >= self.window:
+            old_value = self.values[index]
+            self.total -= old_value
+            self.squares -= old_value * old_value
+        self.values[index] = value
+        self.total += value
+        self.squares += value * value
+
+        # Update monotonic queues, front of each queue is the window extreme
+        expired = self.count - self.window
+        while self.minimums and self.minimums[-1][1] >= value:
+            self.minimums.pop()
+        self.minimums.append((self.count, value))
+        if self.minimums[0][0] <= expired:
+            self.minimums.popleft()
+        while self.maximums and self.maximums[-1][1] <= value:
+            self.maximums.pop()
+        self.maximums.append((self.count, value))
+        if self.maximums[0][0] <= expired:
+            self.maximums.popleft()
+
+        # Update exponentially weighted moving average
+        if self.ewma == None:
+            self.ewma = value
+        else:
+            self.ewma += self.alpha * (value - self.ewma)  # type: ignore
+
+        # Recompute running sums once per window so rounding errors do not build up
+        self.count += 1
+        if self.count % self.window == 0:
+            self.total = sum(self.values)
+            self.squares = sum(value * value for value in self.values)
+
+    def snapshot(self, precision: int = SENSOR_STATS_PRECISION) -> Dict[str, Any]:
+        """Gets compact dict of window statistics."""
+
+        def compact(value: Optional[float]) -> Optional[float]:
+            return None if value == None else round(value, precision)  # type: ignore
+
+        return {
+            "value": compact(self.mean),
+            "samples": self.samples,
+            "min": compact(self.minimum),
+            "max": compact(self.maximum),
+            "stddev": compact(self.stddev),
+            "ewma": compact(self.ewma),
+        }
+
+
+class GroupStats:
+    """Statistics of a variable reported by a group of sensors. Keeps the latest
+    value of each sensor with a running total so the instantaneous group mean is
+    updated in O(1), and a window over all samples reported by the group."""
+
+    def __init__(
+        self,
+        window: int = SENSOR_STATS_GROUP_WINDOW,
+        alpha: float = SENSOR_STATS_EWMA_ALPHA,
+    ) -> None:
+        """Initializes group stats."""
+        self.latest: Dict[str, float] = {}
+        self.total = 0.0
+        self.updates = 0
+        self.stats = WindowStats(window, alpha)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Gets mean of latest sensor values."""
+        if self.latest == {}:
+            return None
+        return self.total / len(self.latest)
+
+    def update(self, sensor: str, value: float) -> None:
+        """Updates latest sensor value and adds sample to group window."""
+        self.discard(sensor)
+        self.latest[sensor] = value
+        self.total += value
+        self.stats.add(value)
+
+        # Recompute total periodically so rounding errors do not build up
+        self.updates += 1
+        if self.updates % self.stats.window == 0:
+            self.total = sum(self.latest.values())
+
+    def discard(self, sensor: str) -> None:
+        """Removes latest sensor value from group mean."""
+        old_value = self.latest.pop(sensor, None)
+        if old_value != None:
+            self.total -= old_value  # type: ignore
+        if self.latest == {}:
+            self.total = 0.0
+
+
+class SensorStatistics:
+    """Per variable statistics engine for reported sensor values. Keeps window
+    stats for each sensor of each variable and group stats for each variable."""
+
+    def __init__(
+        self,
+        window: int = SENSOR_STATS_WINDOW,
+        group_window: int = SENSOR_STATS_GROUP_WINDOW,
+        alpha: float = SENSOR_STATS_EWMA_ALPHA,
+    ) -> None:
+        """Initializes sensor statistics."""
+        self.window = window
+        self.group_window = group_window
+        self.alpha = alpha
+        self.sensors: Dict[str, Dict[str, WindowStats]] = {}
+        self.groups: Dict[str, GroupStats] = {}
+
+    def update(self, variable: str, sensor: str, value: float) -> None:
+        """Adds sensor sample to sensor and group stats."""
+        by_sensor = self.sensors.setdefault(variable, {})
+        if sensor not in by_sensor:
+            by_sensor[sensor] = WindowStats(self.window, self.alpha)
+        by_sensor[sensor].add(value)
+        if variable not in self.groups:
+            self.groups[variable] = GroupStats(self.group_window, self.alpha)
+        self.groups[variable].update(sensor, value)
+
+    def get_sensor(self, variable: str, sensor: str) -> Optional[WindowStats]:
+        """Gets window stats of sensor."""
+        return self.sensors.get(variable, {}).get(sensor)
+
+    def get_group(self, variable: str) -> Optional[GroupStats]:
+        """Gets group stats of variable."""
+        return self.groups.get(variable)
+
+    def discard(self, variable: str, sensor: str) -> None:
+        """Removes sensor from group mean of variable, e.g. when the sensor stops
+        reporting a value. Sensor window stats are kept."""
+        group = self.groups.get(variable)
+        if group != None:
+            group.discard(sensor)  # type: ignore
+
+    def remove_sensor(self, sensor: str, variable: Optional[str] = None) -> None:
+        """Removes stats of sensor for variable, or for all variables."""
+        for name, by_sensor in self.sensors.items():
+            if variable == None or name == variable:
+                by_sensor.pop(sensor, None)
+                self.discard(name, sensor)
+
+    def rebuild_group(self, variable: str) -> Optional[GroupStats]:
+        """Rebuilds group stats of variable from the latest value of each sensor
+        still in the group, e.g. after a sensor is removed, so the group window
+        no longer holds samples of the removed sensor. Removes group stats when
+        no sensor is left."""
+        group = self.groups.get(variable)
+        if group == None or group.latest == {}:  # type: ignore
+            self.groups.pop(variable, None)
+            return None
+        rebuilt = GroupStats(self.group_window, self.alpha)
+        for sensor, value in group.latest.items():  # type: ignore
+            rebuilt.update(sensor, value)
+        self.groups[variable] = rebuilt
+        return rebuilt
+
+    def reset(self, variable: Optional[str] = None) -> None:
+        """Resets stats of variable, or of all variables."""
+        if variable == None:
+            self.sensors = {}
+            self.groups = {}
+        else:
+            self.sensors.pop(variable, None)  # type: ignore
+            self.groups.pop(variable, None)  # type: ignore
@@ -0,0 +1,214 @@
+# Import standard python modules
+import threading, time, queue
+
+# Import python types
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Import device utilities
+from device.utilities.accessors import get_nested_dict_safely, freeze
+from device.utilities.logger import Logger
+
+# Initialize sentinel for values that were never read
+UNSET = object()
+
+
+class Subscription:
+    """Subscription to a dotted state key path, e.g.
+    `environment.sensor.desired.light_ppfd_umol_m2_s`. Changes are delivered to a
+    callback as `callback(path, value)` or put on a queue as `(path, value)`. If
+    coalesce is set, delivers at most once per coalesce interval with the latest
+    value."""
+
+    def __init__(
+        self,
+        notifier: "StateNotifier",
+        state: Any,
+        path: str,
+        callback: Optional[Callable[[str, Any], None]] = None,
+        queue_: Optional[queue.Queue] = None,
+        coalesce: float = 0.0,
+    ) -> None:
+        """Initializes subscription."""
+
+        # Initialize parameters
+        self.notifier = notifier
+        self.state = state
+        self.path = path
+        self.callback = callback
+        self.queue = queue_
+        self.coalesce = coalesce
+
+        # Parse key path
+        keys = path.split(".")
+        self.section = keys[0]
+        self.keys = keys[1:]
+
+        # Initialize notification variables
+        self.value: Any = UNSET
+        self.last_notify_time = 0.0
+        self.pending_time: Optional[float] = None
+
+        # Initialize counters
+        self.notify_count = 0
+        self.coalesce_count = 0
+
+    def __repr__(self) -> str:
+        return "Subscription(path={}, notified={}, coalesced={})".format(
+            self.path, self.notify_count, self.coalesce_count
+        )
+
+    def read(self) -> Any:
+        """Reads read-only copy of subscribed value from state."""
+        with self.state.locks[self.section]:
+            section = getattr(self.state, self.section)
+            if self.keys == []:
+                return freeze(section)
+            return freeze(get_nested_dict_safely(section, self.keys))
+
+    def cancel(self) -> None:
+        """Cancels subscription."""
+        self.notifier.remove(self)
+
+
+class StateNotifier:
+    """Notifies state subscribers when a subscribed value changes. Writers only
+    flag changed sections, subscribed values are read and compared on a
+    dispatch thread so callbacks never run while a writer holds a state lock."""
+
+    def __init__(self) -> None:
+        """Initializes state notifier."""
+
+        # Initialize logger
+        self.logger = Logger("StateNotifier", "device")
+
+        # Initialize dispatch variables
+        self.condition = threading.Condition()
+        self.subscriptions: Dict[str, List[Subscription]] = {}
+        self.dirty_sections: Set[str] = set()
+        self.thread: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        state: Any,
+        path: str,
+        callback: Optional[Callable[[str, Any], None]] = None,
+        queue_: Optional[queue.Queue] = None,
+        coalesce: float = 0.0,
+    ) -> Subscription:
+        """Subscribes to changes of value at path. Only changes after subscribing
+        are delivered."""
+        if callback == None and queue_ == None:
+            raise ValueError("Subscription requires a callback or a queue")
+        subscription = Subscription(self, state, path, callback, queue_, coalesce)
+        subscription.value = subscription.read()
+        with self.condition:
+            self.subscriptions.setdefault(subscription.section, []).append(
+                subscription
+            )
+            if self.thread == None:
+                self.thread = threading.Thread(target=self.run)
+                self.thread.daemon = True
+                self.thread.start()
+        return subscription
+
+    def remove(self, subscription: Subscription) -> None:
+        """Removes subscription."""
+        with self.condition:
+            subscriptions = self.subscriptions.get(subscription.section, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+
+    def notify(self, section: str) -> None:
+        """Flags section as changed, wakes dispatch thread if section has
+        subscribers."""
+        if not self.subscriptions.get(section):
+            return
+        with self.condition:
+            self.dirty_sections.add(section)
+            self.condition.notify()
+
+    def get_next_pending_time(self) -> Optional[float]:
+        """Gets time of next coalesced delivery. Must be called while holding
+        condition."""
+        pending_times = [
+            subscription.pending_time
+            for subscriptions in self.subscriptions.values()
+            for subscription in subscriptions
+            if subscription.pending_time != None
+        ]
+        if pending_times == []:
+            return None
+        return min(pending_times)  # type: ignore
+
+    def run(self) -> None:
+        """Dispatches notifications for changed sections and coalesced values."""
+        while True:
+
+            # Wait for changed sections or next coalesced delivery
+            with self.condition:
+                while self.dirty_sections == set():
+                    pending_time = self.get_next_pending_time()
+                    if pending_time != None and pending_time <= time.time():
+                        break
+                    timeout = None
+                    if pending_time != None:
+                        timeout = pending_time - time.time()  # type: ignore
+                    self.condition.wait(timeout)
+                sections = self.dirty_sections
+                self.dirty_sections = set()
+                subscriptions = [
+                    subscription
+                    for subscriptions in self.subscriptions.values()
+                    for subscription in subscriptions
+                ]
+
+            # Check subscriptions outside of condition so state locks are never
+            # acquired while holding it
+            for subscription in subscriptions:
+                if subscription.section in sections:
+                    self.check(subscription)
+                elif subscription.pending_time != None:
+                    self.check_pending(subscription)
+
+    def check(self, subscription: Subscription) -> None:
+        """Delivers subscribed value if it changed, or defers delivery until the
+        end of the coalesce interval."""
+        value = subscription.read()
+        if value == subscription.value:
+            return
+        subscription.value = value
+
+        # Coalesce changes within interval
+        now = time.time()
+        next_notify_time = subscription.last_notify_time + subscription.coalesce
+        if now < next_notify_time:
+            if subscription.pending_time != None:
+                subscription.coalesce_count += 1
+            with self.condition:
+                subscription.pending_time = next_notify_time
+            return
+
+        # Deliver change
+        self.deliver(subscription)
+
+    def check_pending(self, subscription: Subscription) -> None:
+        """Delivers coalesced value if coalesce interval elapsed."""
+        if subscription.pending_time > time.time():  # type: ignore
+            return
+        self.deliver(subscription)
+
+    def deliver(self, subscription: Subscription) -> None:
+        """Delivers latest value to subscriber."""
+        with self.condition:
+            subscription.pending_time = None
+        subscription.last_notify_time = time.time()
+        subscription.notify_count += 1
+        try:
+            if subscription.callback != None:
+                subscription.callback(subscription.path, subscription.value)
+            if subscription.queue != None:
+                subscription.queue.put((subscription.path, subscription.value))
+        except Exception as e:
+            self.logger.exception(
+                "Unable to notify subscriber of {}".format(subscription.path)
+            )
@@ -1,5 +1,5 @@
 # Import standard python libraries
-import os, sys, pytest, threading
+import os, sys, pytest, threading, time
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
@@ -16,3 +16,89 @@ from device.utilities.state.main import State
 #     assert list(s.recipe.keys()) == []
 #     assert list(s.peripherals.keys()) == []
 #     assert list(s.controllers.keys()) == []
+
+
+def test_set_value_increments_section_version() -> None:
+    state = State()
+    environment_version = state.get_version("environment")
+    peripherals_version = state.get_version("peripherals")
+    state.set_environment_desired_sensor_value("air_temperature_celsius", 20)
+    assert state.get_version("environment") == environment_version + 1
+    assert state.get_version("peripherals") == peripherals_version
+
+
+def test_mark_dirty_increments_section_version() -> None:
+    state = State()
+    version = state.get_version("iot")
+    state.mark_dirty("iot")
+    assert state.get_version("iot") == version + 1
+
+
+def test_writing_increments_section_version() -> None:
+    state = State()
+    version = state.get_version("network")
+    with state.writing("network"):
+        state.network["is_connected"] = True
+    assert state.get_version("network") == version + 1
+
+
+def test_snapshot_is_read_only_and_reused_until_changed() -> None:
+    state = State()
+    state.set_environment_desired_sensor_value("water_temperature_celsius", 20)
+    snapshot = state.snapshot("environment")
+    assert snapshot["sensor"]["desired"]["water_temperature_celsius"] == 20
+    assert state.snapshot("environment") is snapshot
+    with pytest.raises(TypeError):
+        snapshot["sensor"]["desired"]["water_temperature_celsius"] = 21
+    state.set_environment_desired_sensor_value("water_temperature_celsius", 21)
+    assert snapshot["sensor"]["desired"]["water_temperature_celsius"] == 20
+    new_snapshot = state.snapshot("environment")
+    assert new_snapshot["sensor"]["desired"]["water_temperature_celsius"] == 21
+
+
+def test_section_writers_do_not_block_each_other() -> None:
+    state = State()
+    with state.locks["environment"]:
+        thread = threading.Thread(
+            target=state.set_peripheral_value, args=("Test", "mode", "NORMAL")
+        )
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert state.get_peripheral_value("Test", "mode") == "NORMAL"
+
+
+def test_lock_metrics_record_wait_time() -> None:
+    state = State()
+    wait_count = state.lock_metrics["iot"]["wait_count"]
+
+    def write() -> None:
+        with state.writing("iot"):
+            state.iot["is_connected"] = False
+
+    with state.locks["iot"]:
+        thread = threading.Thread(target=write)
+        thread.start()
+        time.sleep(0.05)
+    thread.join(timeout=5)
+    assert state.lock_metrics["iot"]["wait_count"] == wait_count + 1
+    assert state.lock_metrics["iot"]["max_wait_time"] > 0
+
+
+def test_clear_reported_sensor_values_recomputes_groups() -> None:
+    state = State()
+    state.set_environment_reported_sensor_value("A", "test_clear_celsius", 20.0)
+    state.set_environment_reported_sensor_value("B", "test_clear_celsius", 30.0)
+    state.set_environment_reported_sensor_value("A", "test_clear_ppm", 400.0)
+    state.set_environment_reported_sensor_value("A", "test_clear_mode", "on", True)
+    state.clear_environment_reported_sensor_values("A")
+    stats = state.environment["reported_sensor_stats"]
+    reported = state.environment["sensor"]["reported"]
+    for values in stats["individual"].values():
+        assert "A" not in values.get("test_clear_celsius", {})
+    assert stats["group"]["instantaneous"]["test_clear_celsius"]["value"] == 30.0
+    assert stats["group"]["average"]["test_clear_celsius"]["value"] == 30.0
+    assert reported["test_clear_celsius"] == 30.0
+    assert "test_clear_ppm" not in stats["group"]["average"]
+    assert "test_clear_ppm" not in reported
+    assert "test_clear_mode" not in reported
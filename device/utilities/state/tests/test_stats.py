@@ -0,0 +1,84 @@
+# Import standard python libraries
+import os, sys, math, random, statistics, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device state
+from device.utilities.state.main import State
+from device.utilities.state.stats import WindowStats, SensorStatistics
+
+
+def test_window_stats_match_recomputed_window() -> None:
+    stats = WindowStats(window=5, alpha=0.5)
+    values = [random.uniform(-10, 10) for _ in range(37)]
+    for index, value in enumerate(values):
+        stats.add(value)
+        window = values[max(index - 4, 0) : index + 1]
+        assert stats.samples == len(window)
+        assert stats.mean == pytest.approx(statistics.mean(window))
+        assert stats.stddev == pytest.approx(statistics.pstdev(window), abs=1e-9)
+        assert stats.minimum == min(window)
+        assert stats.maximum == max(window)
+
+
+def test_window_stats_ewma_and_snapshot() -> None:
+    stats = WindowStats(window=3, alpha=0.5)
+    assert stats.snapshot()["value"] == None
+    for value in [10, 20, 30]:
+        stats.add(value)
+    assert stats.ewma == 22.5
+    assert stats.snapshot(precision=2) == {
+        "value": 20.0,
+        "samples": 3,
+        "min": 10,
+        "max": 30,
+        "stddev": round(math.sqrt(200 / 3), 2),
+        "ewma": 22.5,
+    }
+    with pytest.raises(ValueError):
+        WindowStats(window=0)
+
+
+def test_sensor_statistics_group_mean() -> None:
+    stats = SensorStatistics(window=10, group_window=10)
+    stats.update("air_temperature_celsius", "SHT25-Top", 20)
+    stats.update("air_temperature_celsius", "SHT25-Bottom", 24)
+    stats.update("air_temperature_celsius", "SHT25-Top", 22)
+    group = stats.get_group("air_temperature_celsius")
+    assert group is not None
+    assert group.mean == 23
+    assert group.stats.mean == 22
+    stats.discard("air_temperature_celsius", "SHT25-Bottom")
+    assert group.mean == 22
+    stats.remove_sensor("SHT25-Top")
+    assert group.mean == None
+    assert stats.get_sensor("air_temperature_celsius", "SHT25-Top") == None
+
+
+def test_state_reports_sensor_stats() -> None:
+    state = State()
+    state.environment = {}
+    variable = "air_temperature_celsius"
+    state.set_environment_reported_sensor_value("SHT25-Top", variable, 20.0)
+    state.set_environment_reported_sensor_value("SHT25-Bottom", variable, 24.0)
+    state.set_environment_reported_sensor_value("SHT25-Top", variable, 22.0)
+    stats = state.environment["reported_sensor_stats"]
+    assert stats["individual"]["instantaneous"][variable]["SHT25-Top"] == 22.0
+    average = stats["individual"]["average"][variable]["SHT25-Top"]
+    assert average["value"] == 21.0
+    assert average["samples"] == 2
+    assert stats["group"]["instantaneous"][variable] == {"value": 23.0, "samples": 2}
+    assert stats["group"]["average"][variable]["max"] == 24.0
+    assert state.environment["sensor"]["reported"][variable] == 23.0
+
+    # Sensors reporting None are left out of the group mean
+    state.set_environment_reported_sensor_value("SHT25-Bottom", variable, None)
+    state.set_environment_reported_sensor_value("SHT25-Top", variable, 20.0)
+    assert state.environment["sensor"]["reported"][variable] == 20.0
+
+    # Cleared stats restart from the next sample
+    state.environment["reported_sensor_stats"] = {}
+    state.set_environment_reported_sensor_value("SHT25-Top", variable, 30.0)
+    average = state.environment["reported_sensor_stats"]["group"]["average"]
+    assert average[variable]["samples"] == 1
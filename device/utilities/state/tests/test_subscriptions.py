@@ -0,0 +1,65 @@
+# Import standard python libraries
+import os, sys, pytest, queue, time
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device state
+from device.utilities.state.main import State
+
+
+def test_subscribe_requires_callback_or_queue() -> None:
+    state = State()
+    with pytest.raises(ValueError):
+        state.subscribe("environment.sensor.desired.air_humidity_percent")
+
+
+def test_subscribe_delivers_changes_only() -> None:
+    state = State()
+    state.set_environment_desired_sensor_value("air_humidity_percent", 40)
+    queue_: queue.Queue = queue.Queue()
+    path = "environment.sensor.desired.air_humidity_percent"
+    subscription = state.subscribe(path, queue_=queue_)
+    state.set_environment_desired_sensor_value("air_humidity_percent", 40)
+    state.set_environment_desired_sensor_value("air_carbon_dioxide_ppm", 400)
+    state.set_environment_desired_sensor_value("air_humidity_percent", 50)
+    assert queue_.get(timeout=5) == (path, 50)
+    time.sleep(0.05)
+    assert queue_.empty()
+    subscription.cancel()
+
+
+def test_subscribe_callback() -> None:
+    state = State()
+    values: queue.Queue = queue.Queue()
+    callback = lambda path, value: values.put(value)
+    subscription = state.subscribe("network.is_connected", callback=callback)
+    with state.writing("network"):
+        state.network["is_connected"] = not state.network.get("is_connected")
+    assert values.get(timeout=5) == state.network["is_connected"]
+    subscription.cancel()
+
+
+def test_cancelled_subscription_is_not_notified() -> None:
+    state = State()
+    queue_: queue.Queue = queue.Queue()
+    path = "environment.sensor.desired.air_humidity_percent"
+    subscription = state.subscribe(path, queue_=queue_)
+    subscription.cancel()
+    state.set_environment_desired_sensor_value("air_humidity_percent", 60)
+    time.sleep(0.05)
+    assert queue_.empty()
+
+
+def test_subscribe_coalesces_changes() -> None:
+    state = State()
+    queue_: queue.Queue = queue.Queue()
+    path = "environment.sensor.desired.light_ppfd_umol_m2_s"
+    subscription = state.subscribe(path, queue_=queue_, coalesce=0.2)
+    for value in range(5):
+        state.set_environment_desired_sensor_value("light_ppfd_umol_m2_s", value)
+        time.sleep(0.01)
+    assert queue_.get(timeout=5) == (path, 0)
+    assert queue_.get(timeout=5) == (path, 4)
+    assert subscription.notify_count == 2
+    subscription.cancel()
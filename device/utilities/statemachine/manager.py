@@ -2,26 +2,59 @@
 import logging, threading, queue, time
 
 # Import python types
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Callable, Optional
 
 # Import device utilities
 from device.utilities.logger import Logger
+from device.utilities.state.main import State
+from device.utilities.state.subscriptions import Subscription
 
 # Import module elements
 from device.utilities.statemachine import modes, events
+from device.utilities.statemachine.scheduler import Scheduler
+
+
+class EventQueue(queue.Queue):
+    """Event queue that calls a wakeup function whenever an event is added so a
+    waiting state machine processes it immediately."""
+
+    def __init__(self, wakeup: Callable[[], None]) -> None:
+        """Initializes event queue."""
+        super().__init__()
+        self.wakeup = wakeup
+
+    def put(
+        self, item: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Adds item to queue then calls wakeup function."""
+        super().put(item, block, timeout)
+        self.wakeup()
 
 
 class StateMachineManager:
     """Manages state machines. Runs as a daemon thread, ensures valid transitions, 
-    and handles external events with an Events mixin class."""
+    and handles external events with an Events mixin class. Managers that 
+    implement a step function can instead run as a task on a shared scheduler."""
+
+    # Initialize scheduler support, set true by managers that implement step
+    is_schedulable = False
+
+    # Initialize shared state, set by managers that subscribe to state changes
+    state: State
 
     def __init__(self) -> None:
         """Initializes state machine manager."""
         self.logger: Logger = Logger("StateMachineManager", __name__)
         self.thread: threading.Thread = threading.Thread(target=self.run)
-        self.event_queue: queue.Queue = queue.Queue()
+        self.wakeup_event: threading.Event = threading.Event()
+        self.event_queue: queue.Queue = EventQueue(self.wakeup)
+        self.scheduler: Optional[Scheduler] = None
+        self.stopped_event: threading.Event = threading.Event()
         self.is_shutdown: bool = False
         self._mode: str = modes.INIT
+        self.mode_observers: List[Callable[[str], None]] = []
+        self.subscriptions: List[Subscription] = []
+        self.is_state_changed: bool = False
         self.transitions: Dict[str, List[str]] = {
             modes.INIT: [modes.NORMAL, modes.SHUTDOWN, modes.ERROR],
             modes.NORMAL: [modes.RESET, modes.SHUTDOWN, modes.ERROR],
@@ -39,14 +72,102 @@ class StateMachineManager:
     def mode(self, value: str) -> None:
         """Sets mode."""
         self._mode = value
+        self.notify_mode_observers(value)
+
+    def notify_mode_observers(self, mode: str) -> None:
+        """Notifies mode observers of new mode and wakes state machine."""
+        for observer in list(self.mode_observers):
+            observer(mode)
+        self.wakeup()
+
+    def wakeup(self) -> None:
+        """Wakes state machine if it is waiting."""
+        self.wakeup_event.set()
+        if self.scheduler != None:
+            self.scheduler.wakeup(self)  # type: ignore
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until timeout expires or state machine is woken by a new event, 
+        mode transition, or shutdown. Waits forever if timeout is None. Returns 
+        true if woken before timeout expired."""
+
+        # Check for unprocessed events
+        if self.is_shutdown or not self.event_queue.empty():
+            return True
+
+        # Wait for wakeup
+        if timeout != None and timeout < 0:
+            timeout = 0
+        is_woken = self.wakeup_event.wait(timeout)
+        self.wakeup_event.clear()
+        return is_woken
+
+    def wait_until(self, deadline: float) -> bool:
+        """Blocks until deadline timestamp or state machine is woken. Returns true
+        if woken before deadline."""
+        return self.wait(deadline - time.time())
+
+    @property
+    def subscribed_paths(self) -> List[str]:
+        """Gets state key paths whose changes trigger an update before the next 
+        sampling interval."""
+        return []
+
+    def subscribe_state(self) -> None:
+        """Subscribes to subscribed paths so changes wake manager."""
+        self.unsubscribe_state()
+        for path in self.subscribed_paths:
+            subscription = self.state.subscribe(path, callback=self.on_state_change)
+            self.subscriptions.append(subscription)
+
+    def unsubscribe_state(self) -> None:
+        """Cancels state subscriptions."""
+        for subscription in self.subscriptions:
+            subscription.cancel()
+        self.subscriptions = []
+
+    def on_state_change(self, path: str, value: Any) -> None:
+        """Flags subscribed state change and wakes manager."""
+        self.logger.debug("Subscribed value changed: {}", path)
+        self.is_state_changed = True
+        self.wakeup()
 
     ##### STATE MACHINE FUNCTIONS #############################################
 
     def spawn(self) -> None:
-        """ Spawns state machine thread. """
+        """ Spawns state machine thread, or adds state machine to scheduler if 
+            one is set. """
+        if self.scheduler != None:
+            self.scheduler.add(self)  # type: ignore
+            return
         self.thread.daemon = True
         self.thread.start()
 
+    def detach(self) -> None:
+        """Moves state machine from its scheduler to its own thread, e.g. when its
+        updates block scheduler workers."""
+        self.scheduler = None
+        self.spawn()
+
+    def is_alive(self) -> bool:
+        """Checks if state machine thread or scheduler task is running."""
+        if self.scheduler != None:
+            return self.scheduler.contains(self)  # type: ignore
+        return self.thread.is_alive()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Waits for state machine thread or scheduler task to stop."""
+        if self.scheduler != None:
+            if self.scheduler.contains(self):  # type: ignore
+                self.stopped_event.wait(timeout)
+        elif self.thread.is_alive():
+            self.thread.join(timeout)
+
+    def step(self) -> Optional[float]:
+        """Runs one state machine update when running on a scheduler. Returns 
+        timestamp of next update, or None to wait for an event or transition."""
+        return None
+
     def run(self) -> None:
         """Runs state machine."""
 
@@ -97,8 +218,8 @@ class StateMachineManager:
             if self.new_transition(modes.NORMAL):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events and transitions
+            self.wait()
 
     def run_reset_mode(self) -> None:
         """Runs reset mode."""
@@ -123,8 +244,8 @@ class StateMachineManager:
             if self.new_transition(modes.ERROR):
                 break
 
-            # Update every 100ms
-            time.sleep(0.1)
+            # Wait for events and transitions
+            self.wait()
 
     def run_shutdown_mode(self) -> None:
         """Runs shutdown mode."""
@@ -0,0 +1,268 @@
+# Import standard python modules
+import threading, time, heapq, itertools
+
+# Import python types
+from typing import Dict, List, Tuple, Optional, Any
+
+# Import device utilities
+from device.utilities.logger import Logger
+
+
+class SchedulerTask:
+    """Scheduling state and run time statistics for one state machine."""
+
+    def __init__(self, manager: Any) -> None:
+        """Initializes scheduler task."""
+        self.manager = manager
+        self.name = str(getattr(manager, "name", type(manager).__name__))
+
+        # Initialize scheduling variables
+        self.deadline: Optional[float] = None
+        self.generation = 0
+        self.is_running = False
+        self.is_woken = False
+        self.is_timed = False
+
+        # Initialize statistics
+        self.run_count = 0
+        self.total_run_time = 0.0
+        self.max_run_time = 0.0
+        self.deadline_miss_count = 0
+        self.max_lateness = 0.0
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets task run time and deadline metrics."""
+        mean_run_time = 0.0
+        if self.run_count > 0:
+            mean_run_time = self.total_run_time / self.run_count
+        return {
+            "run_count": self.run_count,
+            "mean_run_time": round(mean_run_time, 4),
+            "max_run_time": round(self.max_run_time, 4),
+            "deadline_miss_count": self.deadline_miss_count,
+            "max_lateness": round(self.max_lateness, 4),
+        }
+
+
+class Scheduler:
+    """Runs state machine managers as cooperative tasks on a small fixed pool of
+    worker threads instead of one thread per manager. Each task exposes a step
+    function that runs one state machine update and returns the timestamp of its
+    next update, or None to sleep until woken by an event or mode transition.
+    Tracks per-task run time and counts updates that started later than their
+    deadline plus a miss tolerance. Tasks whose update runs longer than the max
+    step time, e.g. while blocked in i2c retry backoff, are detached from the
+    pool and run on their own thread so they do not starve the other tasks."""
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        miss_tolerance: float = 0.1,
+        max_step_time: Optional[float] = None,
+    ) -> None:
+        """Initializes scheduler."""
+
+        # Initialize parameters
+        self.num_workers = num_workers
+        self.miss_tolerance = miss_tolerance
+        self.max_step_time = max_step_time
+
+        # Initialize logger
+        self.logger = Logger("Scheduler", "coordinator")
+
+        # Initialize scheduling variables
+        self.condition = threading.Condition()
+        self.queue: List[Tuple[float, int, int, SchedulerTask]] = []
+        self.tasks: Dict[int, SchedulerTask] = {}
+        self.counter = itertools.count()
+        self.workers: List[threading.Thread] = []
+        self.is_shutdown = False
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Gets metrics for each scheduled task."""
+        with self.condition:
+            return {task.name: task.metrics for task in self.tasks.values()}
+
+    def start(self) -> None:
+        """Starts worker threads."""
+        self.logger.debug("Starting {} workers".format(self.num_workers))
+        for i in range(self.num_workers):
+            worker = threading.Thread(target=self.run_worker)
+            worker.daemon = True
+            worker.start()
+            self.workers.append(worker)
+
+    def stop(self) -> None:
+        """Stops worker threads after their current task update."""
+        with self.condition:
+            self.is_shutdown = True
+            self.condition.notify_all()
+
+    def shutdown(self, timeout: float = 10) -> None:
+        """Stops worker threads and waits for them to exit, then removes remaining
+        tasks so their managers no longer report as alive."""
+        self.stop()
+        deadline = time.time() + timeout
+        for worker in self.workers:
+            worker.join(max(deadline - time.time(), 0))
+        self.workers = [worker for worker in self.workers if worker.is_alive()]
+        if len(self.workers) > 0:
+            self.logger.warning("{} workers did not stop".format(len(self.workers)))
+        with self.condition:
+            for task in self.tasks.values():
+                task.manager.stopped_event.set()
+            self.tasks = {}
+            self.queue = []
+
+    def add(self, manager: Any) -> None:
+        """Adds manager to scheduler and runs it on the next free worker."""
+        with self.condition:
+            task = SchedulerTask(manager)
+            self.tasks[id(manager)] = task
+            self.schedule(task, time.time())
+
+    def contains(self, manager: Any) -> bool:
+        """Checks if manager is scheduled."""
+        with self.condition:
+            return id(manager) in self.tasks
+
+    def wakeup(self, manager: Any) -> None:
+        """Runs manager on the next free worker."""
+        with self.condition:
+            if id(manager) not in self.tasks:
+                return
+            task = self.tasks[id(manager)]
+            if task.is_running:
+                task.is_woken = True
+                return
+            now = time.time()
+            if task.deadline == None or task.deadline > now:  # type: ignore
+                task.is_timed = False
+                self.schedule(task, now)
+
+    def schedule(self, task: SchedulerTask, deadline: float) -> None:
+        """Schedules task to run at deadline, superseding its previous deadline.
+        Must be called while holding condition."""
+        task.deadline = deadline
+        task.generation += 1
+        entry = (deadline, next(self.counter), task.generation, task)
+        heapq.heappush(self.queue, entry)
+        self.condition.notify()
+
+    def get_next_task(self) -> Optional[SchedulerTask]:
+        """Waits for the next due task. Returns None on shutdown. Must be called
+        while holding condition."""
+        while not self.is_shutdown:
+
+            # Discard superseded and removed entries
+            while len(self.queue) > 0:
+                deadline, _, generation, task = self.queue[0]
+                if generation == task.generation and id(task.manager) in self.tasks:
+                    break
+                heapq.heappop(self.queue)
+
+            # Get due task
+            now = time.time()
+            if len(self.queue) > 0 and self.queue[0][0] <= now:
+                return heapq.heappop(self.queue)[3]
+
+            # Wait for next deadline or new task
+            timeout = None
+            if len(self.queue) > 0:
+                timeout = self.queue[0][0] - now
+            self.condition.wait(timeout)
+
+        return None
+
+    def run_worker(self) -> None:
+        """Runs due tasks until scheduler is shutdown."""
+        while True:
+            with self.condition:
+                task = self.get_next_task()
+                if task == None:
+                    return
+            self.run_task(task)  # type: ignore
+
+    def run_task(self, task: SchedulerTask) -> None:
+        """Runs one task update then reschedules task."""
+
+        # Mark task as running
+        with self.condition:
+            task.is_running = True
+            task.is_woken = False
+            deadline = task.deadline
+            is_timed = task.is_timed
+
+        # Run task update
+        start_time = time.time()
+        try:
+            next_deadline = task.manager.step()
+        except Exception as e:
+            self.logger.exception("Task {} failed".format(task.name))
+            next_deadline = time.time() + 1
+        end_time = time.time()
+
+        # Update task statistics and reschedule
+        with self.condition:
+            self.update_statistics(task, start_time, end_time, deadline, is_timed)
+            task.is_running = False
+
+            # Remove task if manager is shutdown
+            if task.manager.is_shutdown:
+                self.tasks.pop(id(task.manager), None)
+                task.manager.stopped_event.set()
+                return
+
+            # Remove task if its update blocked the worker too long, run woken
+            # tasks immediately and park tasks without a deadline
+            run_time = end_time - start_time
+            is_blocking = self.is_blocking(run_time)
+            if is_blocking:
+                self.tasks.pop(id(task.manager), None)
+            elif task.is_woken:
+                task.is_timed = False
+                self.schedule(task, end_time)
+            elif next_deadline == None:
+                task.deadline = None
+            else:
+                task.is_timed = next_deadline > end_time
+                self.schedule(task, next_deadline)
+
+        # Run removed task on its own thread
+        if is_blocking:
+            self.logger.warning(
+                "Task {} update took {:.1f} seconds, moving task to its own "
+                "thread".format(task.name, run_time)
+            )
+            task.manager.detach()
+
+    def is_blocking(self, run_time: float) -> bool:
+        """Checks if a task update ran longer than the max step time. Must be
+        called while holding condition."""
+        if self.max_step_time == None or self.is_shutdown:
+            return False
+        return run_time > self.max_step_time  # type: ignore
+
+    def update_statistics(
+        self,
+        task: SchedulerTask,
+        start_time: float,
+        end_time: float,
+        deadline: Optional[float],
+        is_timed: bool,
+    ) -> None:
+        """Updates task run time and deadline miss statistics."""
+        run_time = end_time - start_time
+        task.run_count += 1
+        task.total_run_time += run_time
+        task.max_run_time = max(task.max_run_time, run_time)
+
+        # Only timed updates can miss a deadline
+        if not is_timed or deadline == None:
+            return
+        lateness = start_time - deadline  # type: ignore
+        task.max_lateness = max(task.max_lateness, lateness)
+        if lateness > self.miss_tolerance:
+            task.deadline_miss_count += 1
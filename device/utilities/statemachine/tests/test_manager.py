@@ -1,5 +1,5 @@
 # Import standard python libraries
-import os, sys, pytest, logging, time
+import os, sys, pytest, logging, time, threading
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
@@ -219,3 +219,31 @@ def test_process_reset_invalid_mode() -> None:
     assert manager._mode == modes.INIT
     manager._reset()
     assert manager._mode != modes.RESET
+
+
+def test_wait_times_out() -> None:
+    manager = StateMachineManager()
+    start_time = time.time()
+    assert manager.wait(0.05) == False
+    assert time.time() - start_time >= 0.05
+
+
+def test_wait_returns_on_queued_event() -> None:
+    manager = StateMachineManager()
+    manager.shutdown()
+    assert manager.wait(5) == True
+
+
+def test_wait_wakes_on_event() -> None:
+    manager = StateMachineManager()
+    threading.Timer(0.05, manager.shutdown).start()
+    start_time = time.time()
+    assert manager.wait(5) == True
+    assert time.time() - start_time < 5
+
+
+def test_wait_wakes_on_mode_transition() -> None:
+    manager = StateMachineManager()
+    threading.Timer(0.05, lambda: setattr(manager, "mode", modes.NORMAL)).start()
+    assert manager.wait_until(time.time() + 5) == True
+    assert manager.mode == modes.NORMAL
@@ -0,0 +1,117 @@
+# Import standard python libraries
+import os, sys, pytest, time
+from typing import Callable, Optional
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import state machine elements
+from device.utilities.statemachine.manager import StateMachineManager
+from device.utilities.statemachine.scheduler import Scheduler
+from device.utilities.statemachine import modes
+
+
+class CountingManager(StateMachineManager):
+    """State machine that counts steps and waits for events after max steps."""
+
+    is_schedulable = True
+
+    def __init__(self, name: str, interval: float, max_steps: int) -> None:
+        super().__init__()
+        self.name = name
+        self.interval = interval
+        self.max_steps = max_steps
+        self.step_count = 0
+
+    def step(self) -> Optional[float]:
+        self.check_events()
+        if self.mode == modes.SHUTDOWN:
+            self.is_shutdown = True
+            return None
+        self.step_count += 1
+        if self.step_count >= self.max_steps:
+            return None
+        return time.time() + self.interval
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    start_time = time.time()
+    while not condition():
+        assert time.time() - start_time < timeout
+        time.sleep(0.01)
+
+
+def test_init() -> None:
+    scheduler = Scheduler()
+
+
+def test_run_tasks_on_workers() -> None:
+    scheduler = Scheduler(num_workers=2)
+    scheduler.start()
+    managers = [CountingManager("Test{}".format(i), 0.01, 3) for i in range(5)]
+    for manager in managers:
+        manager.scheduler = scheduler
+        manager.spawn()
+    wait_for(lambda: all(manager.step_count == 3 for manager in managers))
+    assert len(scheduler.workers) == 2
+    assert scheduler.metrics["Test0"]["run_count"] == 3
+    scheduler.stop()
+
+
+def test_wakeup_parked_task_on_event() -> None:
+    scheduler = Scheduler(num_workers=1)
+    scheduler.start()
+    manager = CountingManager("Test", 0.01, 1)
+    manager.scheduler = scheduler
+    manager.spawn()
+    wait_for(lambda: manager.step_count == 1)
+    assert manager.is_alive()
+    manager.shutdown()
+    manager.join(5)
+    assert not manager.is_alive()
+    scheduler.stop()
+
+
+def test_deadline_miss_counted() -> None:
+    scheduler = Scheduler(num_workers=1, miss_tolerance=0.01)
+    task_a = CountingManager("A", 0.001, 10)
+    task_b = CountingManager("B", 0.001, 10)
+    task_a.step = lambda: time.sleep(0.05) or time.time()  # type: ignore
+    for manager in [task_a, task_b]:
+        manager.scheduler = scheduler
+        manager.spawn()
+    scheduler.start()
+    wait_for(lambda: scheduler.metrics["B"]["deadline_miss_count"] > 0)
+    assert scheduler.metrics["A"]["mean_run_time"] >= 0.05
+    scheduler.stop()
+
+
+def test_shutdown_stops_workers_and_removes_tasks() -> None:
+    scheduler = Scheduler(num_workers=2)
+    scheduler.start()
+    manager = CountingManager("Test", 0.01, 1)
+    manager.scheduler = scheduler
+    manager.spawn()
+    wait_for(lambda: manager.step_count == 1)
+    scheduler.shutdown(5)
+    assert scheduler.workers == []
+    assert not manager.is_alive()
+
+
+def test_blocking_task_moved_to_own_thread() -> None:
+    scheduler = Scheduler(num_workers=1, max_step_time=0.01)
+    scheduler.start()
+    blocking = CountingManager("Blocking", 0.01, 10)
+    blocking.step = lambda: time.sleep(0.05) or time.time()  # type: ignore
+    blocking.run = lambda: blocking.wait(5)  # type: ignore
+    other = CountingManager("Other", 0.01, 3)
+    for manager in [blocking, other]:
+        manager.scheduler = scheduler
+        manager.spawn()
+    wait_for(lambda: other.step_count == 3)
+    assert blocking.scheduler == None
+    assert blocking.is_alive()
+    assert not scheduler.contains(blocking)
+    blocking.shutdown()
+    blocking.join(5)
+    scheduler.shutdown(5)
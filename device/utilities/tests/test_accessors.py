@@ -1,5 +1,5 @@
 # Import standard python libraries
-import os, sys, pytest, numpy
+import os, sys, copy, pytest, numpy
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
@@ -62,3 +62,20 @@ def test_floatify_string_invalid() -> None:
     string = "10.2Q"
     with pytest.raises(ValueError):
         float_ = accessors.floatify_string(string)
+
+
+def test_freeze_nested_dict() -> None:
+    frozen = accessors.freeze({"a": {"b": [1, {"c": 2}]}})
+    assert frozen == {"a": {"b": [1, {"c": 2}]}}
+    with pytest.raises(TypeError):
+        frozen["a"]["b"][1]["c"] = 3
+    with pytest.raises(TypeError):
+        frozen["a"]["b"].append(4)
+
+
+def test_freeze_deepcopy_is_mutable() -> None:
+    frozen = accessors.freeze({"a": [1, 2]})
+    copied = copy.deepcopy(frozen)
+    copied["a"].append(3)
+    assert copied == {"a": [1, 2, 3]}
+    assert frozen == {"a": [1, 2]}
@@ -1,5 +1,6 @@
 # Import standard python libraries
-import os, sys, pytest, logging
+import os, sys, time, pytest, logging, inspect
+from typing import Any, Optional
 
 # Set system path
 sys.path.append(os.environ["PROJECT_ROOT"])
@@ -8,7 +9,7 @@ sys.path.append(os.environ["PROJECT_ROOT"])
 from device.utilities.logger import Logger
 
 # Import functiontools
-from device.utilities.functiontools import retry
+from device.utilities.functiontools import CircuitBreaker, retry
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -29,3 +30,63 @@ logging.basicConfig(level=logging.DEBUG)
 #     e = ExampleClass()
 #     e.foo()
 #     assert False
+
+
+class Device(object):
+    def __init__(self, breaker: Optional[CircuitBreaker] = None) -> None:
+        self.logger = Logger("Device", "device")
+        self.breaker = breaker
+        self.calls = 0
+        self.is_failing = True
+
+    @retry(
+        ZeroDivisionError, tries=3, delay=0, breaker=lambda self: self.breaker
+    )
+    def read(self, retry: bool = True) -> int:
+        self.calls += 1
+        if self.is_failing:
+            raise ZeroDivisionError("Unable to read")
+        return 1
+
+
+def test_retry_resolves_defaults_once(monkeypatch: Any) -> None:
+    device = Device()
+    monkeypatch.setattr(inspect, "getfullargspec", None)
+    with pytest.raises(ZeroDivisionError):
+        device.read()
+    assert device.calls == 3
+    with pytest.raises(ZeroDivisionError):
+        device.read(retry=False)
+    assert device.calls == 4
+
+
+def test_circuit_breaker_fails_fast_then_probes() -> None:
+    breaker = CircuitBreaker("Device", RuntimeError, threshold=2, cooldown=0.05)
+    device = Device(breaker)
+
+    # Retries stop once breaker opens
+    with pytest.raises(ZeroDivisionError):
+        device.read()
+    assert device.calls == 2
+    assert breaker.metrics["state"] == CircuitBreaker.OPEN
+
+    # Calls fail fast without running function
+    with pytest.raises(RuntimeError):
+        device.read()
+    assert device.calls == 2
+    assert breaker.metrics["rejected"] == 1
+
+    # Failed probe runs once and reopens breaker with longer cool down
+    time.sleep(0.06)
+    with pytest.raises(ZeroDivisionError):
+        device.read()
+    assert device.calls == 3
+    assert breaker.is_open
+    assert breaker.cooldown == 0.1
+
+    # Successful probe closes breaker
+    time.sleep(0.11)
+    device.is_failing = False
+    assert device.read() == 1
+    assert breaker.metrics["state"] == CircuitBreaker.CLOSED
+    assert breaker.metrics["trips"] == 2
@@ -0,0 +1,103 @@
+# Import standard python libraries
+import os, sys, logging, threading, pathlib, pytest
+from typing import Any
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities import logger as logger_module
+from device.utilities.logger import (
+    LazyMessage,
+    Logger,
+    LogQueue,
+    PeripheralFileHandler,
+    QueuedRotatingFileHandler,
+    log_queue,
+)
+
+
+def test_queued_file_handler_writes_records(tmp_path: pathlib.Path) -> None:
+    filename = str(tmp_path / "test.log")
+    handler = QueuedRotatingFileHandler(filename)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    logger = logging.getLogger("test_queued_file_handler")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    logger.info("hello %s", "world")
+    try:
+        raise ValueError("failed")
+    except ValueError:
+        logger.exception("caught")
+    log_queue.drain()
+    logger.removeHandler(handler)
+    handler.close()
+    lines = open(filename).read().splitlines()
+    assert lines[0] == "INFO hello world"
+    assert lines[1] == "ERROR caught"
+    assert lines[-1] == "ValueError: failed"
+
+
+def test_log_queue_drops_records_when_full() -> None:
+    queue_ = LogQueue(size=1)
+    queue_.thread = threading.current_thread()
+    record = logging.makeLogRecord({"msg": "test"})
+    queue_.put(None, record)  # type: ignore
+    queue_.put(None, record)  # type: ignore
+    assert queue_.metrics["queued"] == 1
+    assert queue_.metrics["dropped"] == 1
+
+
+def test_peripheral_routes_by_file_name() -> None:
+    handler = PeripheralFileHandler.__new__(PeripheralFileHandler)
+    logging.Handler.__init__(handler)
+    top, bottom = object(), object()
+    handler.file_handlers = {"SHT25-Top": top, "SHT25-Bottom": bottom}  # type: ignore
+    handler.routes = {}
+    assert handler.get_route("Driver(SHT25-Top)") is top
+    assert handler.get_route("Manager(SHT25-Bottom)") is bottom
+    assert handler.get_route("SHT25-Top.Simulator") is top
+    assert handler.get_route("I2C(LED-Top)") == None
+    assert "I2C(LED-Top)" in handler.routes
+
+
+class FormatCounter:
+    """Counts how often it is formatted."""
+
+    count = 0
+
+    def __format__(self, spec: str) -> str:
+        FormatCounter.count += 1
+        return "formatted"
+
+
+def test_lazy_message() -> None:
+    assert str(LazyMessage("Read: {:.1f}, {}", (21.55, "ok"))) == "Read: 21.6, ok"
+
+
+def test_prepare_snapshots_arguments_without_formatting() -> None:
+    values = [1, 2]
+    message = LazyMessage("Values: {}, {:.1f}", (values, 21.55))
+    record = logger_module.prepare(logging.makeLogRecord({"msg": message}))
+    values.append(3)
+    assert isinstance(record.msg, LazyMessage)
+    assert record.getMessage() == "Values: [1, 2], 21.6"
+    record = logging.makeLogRecord({"msg": "Values: %s", "args": (values,)})
+    record = logger_module.prepare(record)
+    values.append(4)
+    assert record.getMessage() == "Values: [1, 2, 3]"
+
+
+def test_disabled_level_is_not_formatted(monkeypatch: Any, caplog: Any) -> None:
+    monkeypatch.setattr(logger_module, "IS_TEST", False)
+    logging.getLogger("test_lazy").setLevel(logging.WARNING)
+    logger = Logger("Test", "test_lazy")
+    FormatCounter.count = 0
+    logger.debug("Value: {}", FormatCounter())
+    assert FormatCounter.count == 0
+    assert not logger.is_enabled_for(logging.DEBUG)
+    with caplog.at_level(logging.WARNING, logger="test_lazy"):
+        logger.warning("Value: {}", FormatCounter())
+    assert caplog.records[-1].getMessage() == "Value: formatted"
+    assert caplog.records[-1].file_name == "Test"
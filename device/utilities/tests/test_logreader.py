@@ -0,0 +1,143 @@
+# Import standard python libraries
+import os, sys, json, time, pathlib, pytest
+from typing import Any, List
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities import logreader
+from device.utilities.logreader import LogFilter, LogFiles
+
+
+def format_line(timestamp: float, level: str, message: str) -> str:
+    asctime = time.strftime(logreader.TIMESTAMP_FORMAT, time.localtime(timestamp))
+    return "[{}.000] {} Test: {}\n".format(asctime, level, message)
+
+
+def write_log(tmp_path: pathlib.Path, lines: List[str]) -> str:
+    path = str(tmp_path / "test.log")
+    with open(path, "a") as f:
+        f.write("".join(lines))
+    return path
+
+
+def test_read_lines_backwards_across_blocks(tmp_path: pathlib.Path) -> None:
+    lines = ["line {}\n".format(index) for index in range(100)]
+    path = write_log(tmp_path, lines)
+    result = list(logreader.read_lines_backwards(path, block_size=16))
+    assert result == ["line {}".format(index) for index in reversed(range(100))]
+
+
+def test_tail_groups_continuation_lines(tmp_path: pathlib.Path) -> None:
+    now = time.time()
+    lines = [format_line(now, "INFO", "first"), format_line(now, "ERROR", "failed")]
+    lines += ["Traceback (most recent call last):\n", "ValueError\n"]
+    lines += [format_line(now, "INFO", "last")]
+    path = write_log(tmp_path, lines)
+    entries, offset = logreader.tail(path, limit=2)
+    assert [entry.level for entry in entries] == ["ERROR", "INFO"]
+    assert entries[0].lines[-1] == "ValueError"
+    assert logreader.parse_offset(offset)[1] == os.path.getsize(path)
+
+
+def test_tail_filters(tmp_path: pathlib.Path) -> None:
+    now = int(time.time())
+    lines = [
+        format_line(now - 120, "ERROR", "old error"),
+        format_line(now, "DEBUG", "sensor read"),
+        format_line(now, "WARNING", "sensor slow"),
+        format_line(now, "ERROR", "bus error"),
+    ]
+    path = write_log(tmp_path, lines)
+    entries, _ = logreader.tail(path, filter_=LogFilter(level="warning"))
+    assert [entry.level for entry in entries] == ["ERROR", "WARNING", "ERROR"]
+    entries, _ = logreader.tail(path, filter_=LogFilter(pattern="sensor"))
+    assert len(entries) == 2
+    entries, _ = logreader.tail(path, filter_=LogFilter(since=now - 60))
+    assert len(entries) == 3
+    with pytest.raises(ValueError):
+        LogFilter(level="LOUD")
+
+
+def test_read_since_offset(tmp_path: pathlib.Path) -> None:
+    now = time.time()
+    path = write_log(tmp_path, [format_line(now, "INFO", "first")])
+    _, offset = logreader.tail(path)
+    write_log(tmp_path, [format_line(now, "INFO", "second"), "[partial"])
+    entries, offset = logreader.read_since(path, offset)
+    assert [entry.text.endswith("second") for entry in entries] == [True]
+    entries, offset = logreader.read_since(path, offset)
+    assert entries == []
+
+    # Rotated file is read from start
+    with open(path, "w") as f:
+        f.write(format_line(now, "INFO", "rotated"))
+    entries, _ = logreader.read_since(path, offset)
+    assert entries[0].text.endswith("rotated")
+
+    # Replaced file is read from start even if it is longer than offset
+    os.remove(path)
+    write_log(tmp_path, [format_line(now, "INFO", "replaced " + "x" * 100)])
+    entries, _ = logreader.read_since(path, offset)
+    assert entries[0].text.endswith("x")
+
+
+def test_read_since_carries_entries_across_reads(
+    tmp_path: pathlib.Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(logreader, "MAX_READ_SIZE", 120)
+    now = time.time()
+    path = write_log(tmp_path, [])
+    lines = [format_line(now, "INFO", "first"), format_line(now, "ERROR", "failed")]
+    lines += ["Traceback\n" * 6, format_line(now, "INFO", "next")]
+    write_log(tmp_path, lines)
+    filter_ = LogFilter(level="ERROR")
+    entries, offset = logreader.read_since(path, 0, filter_)
+    assert entries == []
+    entries, offset = logreader.read_since(path, offset, filter_)
+    assert [len(entry.lines) for entry in entries] == [7]
+    entries, offset = logreader.read_since(path, offset)
+    assert entries[0].text.endswith("next")
+
+    # Lines longer than max read size are truncated
+    write_log(tmp_path, [format_line(now, "INFO", "y" * 200)])
+    write_log(tmp_path, [format_line(now, "INFO", "after")])
+    entries, offset = logreader.read_since(path, offset)
+    assert entries[0].text.endswith(logreader.TRUNCATED_MARKER)
+    entries, offset = logreader.read_since(path, offset)
+    assert [entry.text.endswith("after") for entry in entries] == [True]
+
+
+def test_invalid_offset_and_limit(tmp_path: pathlib.Path) -> None:
+    now = time.time()
+    path = write_log(tmp_path, [format_line(now, "INFO", "first")])
+    with pytest.raises(ValueError):
+        logreader.read_since(path, -1)
+    with pytest.raises(ValueError):
+        logreader.read_since(path, "{}:-1".format(os.stat(path).st_ino))
+    with pytest.raises(ValueError):
+        logreader.tail(path, limit=0)
+    with pytest.raises(ValueError):
+        logreader.parse_limit("-5")
+    assert logreader.parse_limit("5") == 5
+
+
+def test_log_files_cached_until_config_changes(tmp_path: pathlib.Path) -> None:
+    os.makedirs(str(tmp_path / "logs" / "peripherals"))
+    log_dir = str(tmp_path / "logs") + "/"
+    config_path = str(tmp_path / "device.txt")
+    with open(config_path, "w") as f:
+        f.write("test-config\n")
+    devices_path = str(tmp_path / "{}.json")
+    with open(devices_path.format("test-config"), "w") as f:
+        json.dump({"peripherals": [{"name": "SHT25-Top"}]}, f)
+    with open(log_dir + "peripherals/SHT25-Top.log", "w") as f:
+        f.write("")
+    with open(log_dir + "device.log", "w") as f:
+        f.write("")
+    log_files = LogFiles(log_dir, config_path, devices_path)
+    assert [name for name, _ in log_files.get()] == ["SHT25-Top", "Device"]
+    key = log_files.key
+    log_files.get()
+    assert log_files.key is key
@@ -0,0 +1,140 @@
+# Import standard python libraries
+import os, sys, pathlib, pytest
+
+# Set system path
+sys.path.append(os.environ["PROJECT_ROOT"])
+
+# Import device utilities
+from device.utilities.timeseries import TimeSeriesStore, RAW_DTYPE, RAW, MINUTE, HOUR
+from device.utilities.state.main import State
+
+# Initialize day aligned start timestamp
+START = 86400 * 16667
+
+
+def create_store(
+    tmp_path: pathlib.Path, disk_budget: int = 1024 * 1024
+) -> TimeSeriesStore:
+    store = TimeSeriesStore(str(tmp_path), disk_budget=disk_budget)
+    store.load()
+    return store
+
+
+def test_init(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+
+
+def test_read_raw_samples(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+    store.append("air_temperature_celsius", "SHT25-Top", 21.5, START)
+    store.append("air_temperature_celsius", "SHT25-Bottom", 22.5, START + 1)
+    store.append("air_humidity_percent", "SHT25-Top", 40.0, START + 2)
+    assert store.flush(START + 10) == 3
+    assert os.path.getsize(str(tmp_path / RAW / "{}.bin".format(START))) == 48
+    records = store.read(RAW, variables=["air_temperature_celsius"])
+    assert list(records["value"]) == [21.5, 22.5]
+    records = store.read(RAW, start=START + 1, peripherals=["SHT25-Top"])
+    assert list(records["value"]) == [40.0]
+    assert len(store.read(RAW, variables=["water_potential_hydrogen"])) == 0
+
+
+def test_rollups(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+    for second in range(120):
+        store.append("air_temperature_celsius", "SHT25-Top", second, START + second)
+    store.flush(START + 90)
+    assert len(store.read(MINUTE)) == 1
+    assert len(store.read(HOUR)) == 0
+    store.flush(START + 3600)
+    minutes = store.read(MINUTE)
+    assert list(minutes["mean"]) == [29.5, 89.5]
+    assert list(minutes["min"]) == [0, 60]
+    assert list(minutes["max"]) == [59, 119]
+    hours = store.read(HOUR)
+    assert list(hours["count"]) == [120]
+    assert list(hours["mean"]) == [59.5]
+    assert list(hours["timestamp"]) == [START]
+
+
+def test_close_writes_open_rollups(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+    for second in range(30):
+        store.append("air_temperature_celsius", "SHT25-Top", second, START + second)
+    store.flush(START + 30, close=True)
+    assert list(store.read(MINUTE)["count"]) == [30]
+    assert list(store.read(HOUR)["mean"]) == [14.5]
+    assert store.rollups == {MINUTE: {}, HOUR: {}}
+
+
+def test_names_persist(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+    store.append("air_temperature_celsius", "SHT25-Top", 21.5, START)
+    store.flush(START)
+    store = create_store(tmp_path)
+    assert list(store.read(RAW, peripherals=["SHT25-Top"])["value"]) == [21.5]
+
+
+def test_disk_budget_drops_oldest_raw_segments(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path, disk_budget=RAW_DTYPE.itemsize * 150)
+    for day in range(3):
+        for sample in range(100):
+            timestamp = START + day * 86400 + sample
+            store.append("air_temperature_celsius", "SHT25-Top", 21.5, timestamp)
+    store.flush(START + 3 * 86400)
+    records = store.read(RAW)
+    assert len(records) == 100
+    assert records["timestamp"].min() >= START + 2 * 86400
+    assert len(store.read(MINUTE)) == 6
+    assert store.drop_count == 2
+
+
+def test_state_records_numeric_sensor_values(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+    state = State()
+    state.timeseries = store
+    state.set_environment_reported_sensor_value(
+        "SHT25-Top", "air_temperature_celsius", 21.5
+    )
+    state.set_environment_reported_sensor_value(
+        "AS7262-Top", "light_spectrum_nm_percent", {"400-499": 20}, simple=True
+    )
+    state.set_environment_reported_sensor_value(
+        "SHT25-Top", "air_humidity_percent", None
+    )
+    store.flush()
+    records = store.read(RAW)
+    assert list(records["value"]) == [21.5]
+    assert store.get_peripheral_name(records["peripheral"][0]) == "SHT25-Top"
+
+
+def test_aggregate_raw_samples(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+    store.append("air_temperature_celsius", "SHT25-Top", 20.0, START + 1)
+    store.append("air_temperature_celsius", "SHT25-Bottom", 24.0, START + 2)
+    store.append("air_humidity_percent", "SHT25-Top", 40.0, START + 3)
+    store.append("air_temperature_celsius", "SHT25-Top", 30.0, START + 11)
+    store.flush(START + 20)
+    variables = ["air_temperature_celsius", "air_humidity_percent"]
+    aggregates = store.aggregate(variables, START, START + 20, 10)
+    assert list(aggregates["timestamp"]) == [START, START, START + 10]
+    assert list(aggregates["count"]) == [2, 1, 1]
+    assert list(aggregates["mean"]) == [22.0, 40.0, 30.0]
+    assert list(aggregates["min"]) == [20.0, 40.0, 30.0]
+    assert list(aggregates["max"]) == [24.0, 40.0, 30.0]
+    aggregates = store.aggregate(variables, START, START + 20, 10, ["SHT25-Top"])
+    assert list(aggregates["count"]) == [1, 1, 1]
+
+
+def test_aggregate_combines_tiers(tmp_path: pathlib.Path) -> None:
+    store = create_store(tmp_path)
+    for minute in range(90):
+        timestamp = START + minute * 60
+        store.append("air_temperature_celsius", "SHT25-Top", minute, timestamp)
+    store.flush(START + 5400)
+    store.append("air_temperature_celsius", "SHT25-Top", 100.0, START + 5410)
+    store.flush(START + 5420)
+    variables = ["air_temperature_celsius"]
+    aggregates = store.aggregate(variables, START, START + 5420, 3600)
+    assert list(aggregates["count"]) == [60, 31]
+    assert list(aggregates["mean"]) == [29.5, (sum(range(60, 90)) + 100) / 31]
+    assert list(aggregates["max"]) == [59, 100]
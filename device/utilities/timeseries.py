@@ -0,0 +1,510 @@
+# Import standard python modules
+import os, glob, json, threading, time
+
+# Import python types
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import numpy
+import numpy
+
+# Import device utilities
+from device.utilities.logger import Logger
+
+# Initialize record formats, raw records are 16 bytes, rollup records 24 bytes
+RAW_DTYPE = numpy.dtype(
+    [("variable", "<u2"), ("peripheral", "<u2"), ("timestamp", "<f8"), ("value", "<f4")]
+)
+ROLLUP_DTYPE = numpy.dtype(
+    [
+        ("variable", "<u2"),
+        ("peripheral", "<u2"),
+        ("timestamp", "<u4"),
+        ("mean", "<f4"),
+        ("min", "<f4"),
+        ("max", "<f4"),
+        ("count", "<u4"),
+    ]
+)
+AGGREGATE_DTYPE = numpy.dtype(
+    [
+        ("variable", "<u2"),
+        ("timestamp", "<f8"),
+        ("mean", "<f8"),
+        ("min", "<f4"),
+        ("max", "<f4"),
+        ("count", "<u4"),
+    ]
+)
+
+# Initialize tiers as (name, bucket seconds, segment seconds), ordered from highest
+# resolution to lowest, the disk budget drops oldest high resolution segments first
+RAW = "raw"
+MINUTE = "1m"
+HOUR = "1h"
+TIERS = [(RAW, 0, 86400), (MINUTE, 60, 86400 * 30), (HOUR, 3600, 86400 * 365)]
+TIER_NAMES = [tier[0] for tier in TIERS]
+
+# Initialize defaults
+DEFAULT_DISK_BUDGET = int(os.getenv("TIMESERIES_DISK_BUDGET", 32 * 1024 * 1024))
+DEFAULT_FLUSH_INTERVAL = float(os.getenv("TIMESERIES_FLUSH_INTERVAL", 10.0))
+
+
+def to_rollups(records: numpy.ndarray) -> numpy.ndarray:
+    """Converts raw records to single sample rollup records."""
+    rollups = numpy.zeros(len(records), dtype=ROLLUP_DTYPE)
+    rollups["variable"] = records["variable"]
+    rollups["peripheral"] = records["peripheral"]
+    rollups["timestamp"] = records["timestamp"]
+    rollups["mean"] = records["value"]
+    rollups["min"] = records["value"]
+    rollups["max"] = records["value"]
+    rollups["count"] = 1
+    return rollups
+
+
+def aggregate(records: numpy.ndarray, start: float, bucket: float) -> numpy.ndarray:
+    """Aggregates rollup records of all peripherals into buckets of width bucket
+    seconds starting at start. Returns aggregate records sorted by bucket timestamp
+    then variable id."""
+    if len(records) == 0:
+        return numpy.zeros(0, dtype=AGGREGATE_DTYPE)
+
+    # Sort records by bucket then variable
+    buckets = ((records["timestamp"] - start) // bucket).astype("int64")
+    order = numpy.lexsort((records["variable"], buckets))
+    records = records[order]
+    buckets = buckets[order]
+
+    # Find first record of each bucket and variable group
+    keys = buckets * 65536 + records["variable"]
+    indexes = numpy.concatenate(([0], numpy.flatnonzero(numpy.diff(keys)) + 1))
+
+    # Reduce groups, means are weighted by rollup sample counts
+    counts = records["count"].astype("float64")
+    totals = numpy.add.reduceat(records["mean"] * counts, indexes)
+    aggregates = numpy.zeros(len(indexes), dtype=AGGREGATE_DTYPE)
+    aggregates["variable"] = records["variable"][indexes]
+    aggregates["timestamp"] = start + buckets[indexes] * bucket
+    aggregates["count"] = numpy.add.reduceat(records["count"], indexes)
+    aggregates["mean"] = totals / aggregates["count"]
+    aggregates["min"] = numpy.minimum.reduceat(records["min"], indexes)
+    aggregates["max"] = numpy.maximum.reduceat(records["max"], indexes)
+    return aggregates
+
+
+class Rollup:
+    """Aggregates samples or rollups of one variable from one peripheral into a
+    time bucket."""
+
+    def __init__(self, timestamp: int) -> None:
+        """Initializes rollup."""
+        self.timestamp = timestamp
+        self.total = 0.0
+        self.count = 0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, mean: float, min_: float, max_: float, count: int) -> None:
+        """Adds count weighted sample or rollup to bucket."""
+        self.total += mean * count
+        self.count += count
+        self.min = min(self.min, min_)
+        self.max = max(self.max, max_)
+
+    def record(self, variable_id: int, peripheral_id: int) -> Tuple:
+        """Gets rollup record."""
+        mean = self.total / self.count
+        return (
+            variable_id,
+            peripheral_id,
+            self.timestamp,
+            mean,
+            self.min,
+            self.max,
+            self.count,
+        )
+
+
+class TimeSeriesStore:
+    """Stores sensor samples as fixed width binary records in append only segment
+    files per tier. Samples are buffered in memory at the sensor rate and written
+    on flush, which also rolls raw samples up into one minute and one hour buckets
+    and drops the oldest segments once the store exceeds its disk budget. Reads
+    memory map segment files into numpy record arrays while holding the files
+    lock, so segments are not dropped while they are read."""
+
+    def __init__(
+        self,
+        path: str,
+        disk_budget: int = DEFAULT_DISK_BUDGET,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        """Initializes time series store."""
+
+        # Initialize parameters
+        self.path = path
+        self.disk_budget = disk_budget
+        self.flush_interval = flush_interval
+
+        # Initialize logger
+        self.logger = Logger("TimeSeriesStore", "resource")
+
+        # Initialize name to id maps
+        self.names_path = os.path.join(self.path, "names.json")
+        self.variables: Dict[str, int] = {}
+        self.peripherals: Dict[str, int] = {}
+
+        # Initialize buffer and open rollups keyed by tier then ids
+        self.lock = threading.Lock()
+        self.files_lock = threading.RLock()
+        self.buffer: List[Tuple[str, str, float, float]] = []
+        self.rollups: Dict[str, Dict[Tuple[int, int], Rollup]] = {
+            MINUTE: {},
+            HOUR: {},
+        }
+
+        # Initialize flush variables
+        self.last_flush_time = 0.0
+
+        # Initialize counters
+        self.append_count = 0
+        self.write_count = 0
+        self.drop_count = 0
+
+    @property
+    def next_flush_time(self) -> float:
+        """Gets timestamp of next scheduled flush."""
+        return self.last_flush_time + self.flush_interval
+
+    @property
+    def disk_usage(self) -> int:
+        """Gets size of all segment files in bytes."""
+        segments = self.segments().values()
+        return sum(size for tier in segments for _, size in tier)
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Gets store metrics."""
+        return {
+            "append_count": self.append_count,
+            "write_count": self.write_count,
+            "drop_count": self.drop_count,
+            "buffered": len(self.buffer),
+            "disk_usage": self.disk_usage,
+            "disk_budget": self.disk_budget,
+        }
+
+    def load(self) -> None:
+        """Creates tier directories and loads variable and peripheral ids."""
+        for tier in TIER_NAMES:
+            os.makedirs(os.path.join(self.path, tier), exist_ok=True)
+        try:
+            with open(self.names_path) as f:
+                names = json.load(f)
+        except FileNotFoundError:
+            names = {}
+        except ValueError:
+            self.logger.exception("Unable to load time series names, resetting")
+            names = {}
+        self.variables = {
+            name: id_ for id_, name in enumerate(names.get("variables", []))
+        }
+        self.peripherals = {
+            name: id_ for id_, name in enumerate(names.get("peripherals", []))
+        }
+        self.last_flush_time = time.time()
+
+    def append(
+        self,
+        variable: str,
+        peripheral: str,
+        value: float,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Buffers sample, safe to call from sensor threads."""
+        if timestamp == None:
+            timestamp = time.time()
+        with self.lock:
+            self.buffer.append((variable, peripheral, timestamp, value))  # type: ignore
+            self.append_count += 1
+
+    def update(self, force: bool = False) -> bool:
+        """Flushes buffered samples if the flush interval elapsed. Returns true if
+        store was flushed."""
+        now = time.time()
+        if not force and now < self.next_flush_time:
+            return False
+        self.flush(now)
+        return True
+
+    def close(self) -> None:
+        """Flushes buffered samples and writes open rollups, called on shutdown
+        so partial buckets are not lost."""
+        self.flush(close=True)
+
+    def flush(self, now: Optional[float] = None, close: bool = False) -> int:
+        """Writes buffered samples, rolls up completed buckets and enforces disk
+        budget. If close is set, also writes open buckets. Returns number of raw
+        records written."""
+        if now == None:
+            now = time.time()
+        self.last_flush_time = now  # type: ignore
+
+        # Swap buffer so sensor threads are not blocked by disk writes
+        with self.lock:
+            samples = self.buffer
+            self.buffer = []
+
+        # Map names to ids
+        is_new_name = False
+        records = []
+        for variable, peripheral, timestamp, value in samples:
+            if variable not in self.variables:
+                self.variables[variable] = len(self.variables)
+                is_new_name = True
+            if peripheral not in self.peripherals:
+                self.peripherals[peripheral] = len(self.peripherals)
+                is_new_name = True
+            variable_id = self.variables[variable]
+            peripheral_id = self.peripherals[peripheral]
+            records.append((variable_id, peripheral_id, timestamp, value))
+        if is_new_name:
+            self.store_names()
+
+        # Write raw records and roll them up
+        raw = numpy.array(records, dtype=RAW_DTYPE)
+        self.write(RAW, raw)
+        minutes = self.roll_up(MINUTE, raw, now, close)  # type: ignore
+        self.write(MINUTE, minutes)
+        self.write(HOUR, self.roll_up(HOUR, minutes, now, close))  # type: ignore
+
+        # Enforce disk budget
+        self.enforce_budget()
+        return len(raw)
+
+    def roll_up(
+        self, tier: str, records: numpy.ndarray, now: float, close: bool = False
+    ) -> numpy.ndarray:
+        """Adds raw or rollup records to open buckets of tier. Returns rollup
+        records of buckets that completed before now, or of all buckets if close
+        is set."""
+        bucket = dict((name, seconds) for name, seconds, _ in TIERS)[tier]
+        rollups = self.rollups[tier]
+        is_raw = records.dtype == RAW_DTYPE
+        completed = []
+
+        # Add records to buckets, a record from a later bucket completes the open one
+        for record in records:
+            key = (int(record["variable"]), int(record["peripheral"]))
+            timestamp = int(record["timestamp"] // bucket * bucket)
+            rollup = rollups.get(key)
+            if rollup != None and rollup.timestamp != timestamp:  # type: ignore
+                completed.append(rollup.record(*key))  # type: ignore
+                rollup = None
+            if rollup == None:
+                rollup = Rollup(timestamp)
+                rollups[key] = rollup
+            if is_raw:
+                value = float(record["value"])
+                rollup.add(value, value, value, 1)
+            else:
+                rollup.add(
+                    float(record["mean"]),
+                    float(record["min"]),
+                    float(record["max"]),
+                    int(record["count"]),
+                )
+
+        # Complete buckets that ended, so quiet sensors are still rolled up
+        for key, rollup in list(rollups.items()):
+            if close or rollup.timestamp + bucket <= now:
+                completed.append(rollup.record(*key))
+                del rollups[key]
+
+        return numpy.array(completed, dtype=ROLLUP_DTYPE)
+
+    def write(self, tier: str, records: numpy.ndarray) -> None:
+        """Appends records to segment files of tier."""
+        if len(records) == 0:
+            return
+        segment_seconds = dict((name, seconds) for name, _, seconds in TIERS)[tier]
+        starts = (records["timestamp"] // segment_seconds).astype("int64")
+        with self.files_lock:
+            for start in numpy.unique(starts):
+                segment = records[starts == start]
+                file_name = "{}.bin".format(int(start) * segment_seconds)
+                with open(os.path.join(self.path, tier, file_name), "ab") as f:
+                    f.write(segment.tobytes())
+        self.write_count += len(records)
+
+    def segments(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Gets segment files and sizes of each tier, oldest first. Segments
+        removed while listing are skipped."""
+        segments: Dict[str, List[Tuple[str, int]]] = {}
+        for tier in TIER_NAMES:
+            paths = glob.glob(os.path.join(self.path, tier, "*.bin"))
+            paths.sort(key=lambda p: int(os.path.basename(p)[:-4]))
+            segments[tier] = []
+            for path in paths:
+                try:
+                    segments[tier].append((path, os.path.getsize(path)))
+                except FileNotFoundError:
+                    continue
+        return segments
+
+    def enforce_budget(self) -> None:
+        """Drops oldest segments from highest resolution tier first until store is
+        within disk budget. The newest segment of each tier is always kept."""
+        with self.files_lock:
+            segments = self.segments()
+            usage = sum(size for tier in segments.values() for _, size in tier)
+            for tier in TIER_NAMES:
+                while usage > self.disk_budget and len(segments[tier]) > 1:
+                    path, size = segments[tier].pop(0)
+                    os.remove(path)
+                    usage -= size
+                    self.drop_count += 1
+                    self.logger.info("Dropped time series segment: {}".format(path))
+        if usage > self.disk_budget:
+            self.logger.warning("Time series store exceeds disk budget")
+
+    def store_names(self) -> None:
+        """Stores variable and peripheral names ordered by id."""
+        names = {
+            "variables": sorted(self.variables, key=lambda name: self.variables[name]),
+            "peripherals": sorted(
+                self.peripherals, key=lambda name: self.peripherals[name]
+            ),
+        }
+        temp_path = self.names_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(names, f)
+        os.replace(temp_path, self.names_path)
+
+    def read(
+        self,
+        tier: str = RAW,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        variables: Optional[List[str]] = None,
+        peripherals: Optional[List[str]] = None,
+    ) -> numpy.ndarray:
+        """Reads records of tier in [start, end) from memory mapped segments,
+        optionally filtered by variable and peripheral names. Unknown names
+        match no records."""
+        dtype = RAW_DTYPE if tier == RAW else ROLLUP_DTYPE
+        segment_seconds = dict((name, seconds) for name, _, seconds in TIERS)[tier]
+        variable_ids = self.get_ids(self.variables, variables)
+        peripheral_ids = self.get_ids(self.peripherals, peripherals)
+
+        # Read overlapping segments, segments dropped by another process while
+        # reading are skipped
+        arrays = []
+        with self.files_lock:
+            for path, size in self.segments()[tier]:
+                segment_start = int(os.path.basename(path)[:-4])
+                if end != None and segment_start >= end:  # type: ignore
+                    continue
+                segment_end = segment_start + segment_seconds
+                if start != None and segment_end <= start:  # type: ignore
+                    continue
+
+                # Ignore partially written trailing record
+                count = size // dtype.itemsize
+                if count == 0:
+                    continue
+                try:
+                    records = numpy.memmap(path, dtype=dtype, mode="r", shape=(count,))
+                except FileNotFoundError:
+                    continue
+
+                # Filter records
+                mask = numpy.ones(count, dtype=bool)
+                if start != None:
+                    mask &= records["timestamp"] >= start
+                if end != None:
+                    mask &= records["timestamp"] < end
+                if variable_ids != None:
+                    mask &= numpy.isin(records["variable"], variable_ids)
+                if peripheral_ids != None:
+                    mask &= numpy.isin(records["peripheral"], peripheral_ids)
+                arrays.append(numpy.array(records[mask]))
+
+        if arrays == []:
+            return numpy.zeros(0, dtype=dtype)
+        return numpy.concatenate(arrays)
+
+    def read_rollups(
+        self,
+        tier: str,
+        start: float,
+        end: float,
+        variables: Optional[List[str]] = None,
+        peripherals: Optional[List[str]] = None,
+    ) -> numpy.ndarray:
+        """Reads rollup records of tier in [start, end), the range after the last
+        completed bucket of tier is read from the next higher resolution tier. Raw
+        records are converted to single sample rollups."""
+        if tier == RAW:
+            return to_rollups(self.read(RAW, start, end, variables, peripherals))
+
+        # Read completed buckets of tier
+        records = self.read(tier, start, end, variables, peripherals)
+        bucket = dict((name, seconds) for name, seconds, _ in TIERS)[tier]
+        horizon = start
+        if len(records) > 0:
+            horizon = max(start, float(records["timestamp"].max()) + bucket)
+        if horizon >= end:
+            return records
+
+        # Read remaining range from higher resolution tier
+        finer_tier = TIER_NAMES[TIER_NAMES.index(tier) - 1]
+        finer = self.read_rollups(finer_tier, horizon, end, variables, peripherals)
+        return numpy.concatenate((records, finer))
+
+    def aggregate(
+        self,
+        variables: List[str],
+        start: float,
+        end: float,
+        bucket: float,
+        peripherals: Optional[List[str]] = None,
+    ) -> numpy.ndarray:
+        """Aggregates min, max, mean, and count of variables over all or selected
+        peripherals into buckets of width bucket seconds. Start and end are aligned
+        to bucket width and read from the lowest resolution tier whose buckets 
+        evenly divide bucket width."""
+        start = start // bucket * bucket
+        end = -(-end // bucket) * bucket
+
+        # Get lowest resolution tier that evenly divides bucket width
+        tier = RAW
+        for name, seconds, _ in TIERS:
+            if seconds > 0 and bucket % seconds == 0:
+                tier = name
+
+        # Aggregate rollups
+        records = self.read_rollups(tier, start, end, variables, peripherals)
+        return aggregate(records, start, bucket)
+
+    def get_ids(
+        self, ids: Dict[str, int], names: Optional[List[str]]
+    ) -> Optional[List[int]]:
+        """Gets ids of names, None matches all."""
+        if names == None:
+            return None
+        return [ids[name] for name in names if name in ids]  # type: ignore
+
+    def get_variable_name(self, variable_id: int) -> Optional[str]:
+        """Gets variable name of id."""
+        for name, id_ in list(self.variables.items()):
+            if id_ == variable_id:
+                return name
+        return None
+
+    def get_peripheral_name(self, peripheral_id: int) -> Optional[str]:
+        """Gets peripheral name of id."""
+        for name, id_ in list(self.peripherals.items()):
+            if id_ == peripheral_id:
+                return name
+        return None
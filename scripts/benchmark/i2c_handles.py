@@ -0,0 +1,62 @@
+"""Measures i2c transactions per second when opening the bus for every
+transaction compared to a pooled bus handle. Run from project root on a device:
+`python scripts/benchmark/i2c_handles.py --path /dev/i2c-2 --address 0x40`.
+Without a bus, e.g. `--path /dev/zero`, measures descriptor overhead only."""
+
+# Import standard python modules
+import os, sys, io, fcntl, time, argparse
+
+# Set system path
+sys.path.append(os.getcwd())
+
+# Import device utilities
+from device.utilities.communication.i2c.handles import HandlePool, I2C_SLAVE
+
+
+def open_per_transaction(path: str, address: int, is_bus: bool) -> None:
+    """Reads one byte the way device io did before pooling."""
+    stream = io.open(path, "r+b", buffering=0)
+    if is_bus:
+        fcntl.ioctl(stream, I2C_SLAVE, address)
+    stream.read(1)
+    stream.close()
+
+
+def pooled(pool: HandlePool, path: str, address: int, is_bus: bool) -> None:
+    """Reads one byte on pooled handle."""
+    handle = pool.get(
+        path, lambda: io.open(path, "r+b", buffering=0), lambda io_: io_.close()
+    )
+    with handle.lock:
+        if is_bus:
+            handle.set_address(address)
+        handle.io.read(1)
+
+
+def main() -> None:
+    """Runs benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", default="/dev/zero")
+    parser.add_argument("--address", default="0x40")
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+    path = args.path
+    address = int(args.address, 16)
+    is_bus = path.startswith("/dev/i2c-")
+    pool = HandlePool()
+    functions = [
+        ("open per transaction", lambda: open_per_transaction(path, address, is_bus)),
+        ("pooled handle", lambda: pooled(pool, path, address, is_bus)),
+    ]
+    print("Reading 1 byte from {} ({} transactions):".format(path, args.number))
+    for name, function in functions:
+        start = time.perf_counter()
+        for _ in range(args.number):
+            function()
+        seconds = time.perf_counter() - start
+        print("  {:<22} {:>10.0f} transactions/s".format(name, args.number / seconds))
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
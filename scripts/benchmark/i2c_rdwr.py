@@ -0,0 +1,136 @@
+"""Counts syscalls per ADT7470 controller update when registers are read one at a
+time compared to combined I2C_RDWR transfers. Run from project root on a device:
+`python scripts/benchmark/i2c_rdwr.py --bus 2 --address 0x2F`. Without `--bus`
+the bus is replaced by a stub that answers every transfer with zeros, which
+counts syscalls but not bus time."""
+
+# Import standard python modules
+import os, sys, io, fcntl, time, argparse, threading
+
+# Set system path
+sys.path.append(os.getcwd())
+
+# Enable linux i2c before importing device io
+os.environ["IS_I2C_ENABLED"] = "true"
+
+# Import device utilities
+from device.utilities.communication.i2c import device_io
+from device.peripherals.common.adt7470 import driver as adt7470
+
+
+class CountingStream(object):
+    """Stream proxy that counts reads and writes."""
+
+    def __init__(self, stream: io.RawIOBase, counts: dict) -> None:
+        self.stream = stream
+        self.counts = counts
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    def read(self, num_bytes: int) -> bytes:
+        self.counts["syscalls"] += 1
+        return self.stream.read(num_bytes)
+
+    def write(self, bytes_: bytes) -> int:
+        self.counts["syscalls"] += 1
+        return self.stream.write(bytes_)
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class StubBus(io.BytesIO):
+    """Bus stub that reads zeros."""
+
+    def fileno(self) -> int:
+        return 0
+
+    def read(self, num_bytes: int = -1) -> bytes:  # type: ignore
+        return bytes(max(num_bytes, 0))
+
+
+def install_counters(is_stub: bool) -> dict:
+    """Counts ioctls and stream reads and writes of device io."""
+    counts = {"syscalls": 0}
+    open_, ioctl = io.open, fcntl.ioctl
+
+    def counting_open(*args, **kwargs):  # type: ignore
+        stream = StubBus() if is_stub else open_(*args, **kwargs)
+        return CountingStream(stream, counts)
+
+    def counting_ioctl(*args):  # type: ignore
+        counts["syscalls"] += 1
+        if not is_stub:
+            return ioctl(*args)
+
+    device_io.io.open = counting_open  # type: ignore
+    fcntl.ioctl = counting_ioctl  # type: ignore
+    return counts
+
+
+def update_per_register(
+    driver: adt7470.ADT7470Driver, sensors: list, fans: list
+) -> None:
+    """Reads sensors and fans one register at a time."""
+    for sensor_id in sensors:
+        driver.i2c.read_register(adt7470.TEMPERATURE_BASE_REGISTER + sensor_id)
+    for fan_id in fans:
+        duty_cycle_address = adt7470.PWM_CURRENT_DUTY_CYCLE_BASE_REGISTER + fan_id
+        driver.i2c.read_register(duty_cycle_address)
+        low_address = adt7470.TACHOMETER_BASE_REGISTER + 2 * fan_id
+        driver.i2c.read_register(low_address)
+        driver.i2c.read_register(low_address + 1)
+
+
+def update_combined(driver: adt7470.ADT7470Driver, sensors: list, fans: list) -> None:
+    """Reads sensors and fans in combined transfers."""
+    driver.read_temperatures(sensors)
+    driver.read_fans(fans)
+
+
+def main() -> None:
+    """Runs benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bus", type=int, default=None)
+    parser.add_argument("--address", default="0x2F")
+    parser.add_argument("--sensors", default="0,1,2,3")
+    parser.add_argument("--fans", default="0,1,2,3")
+    parser.add_argument("--number", type=int, default=100)
+    args = parser.parse_args()
+    sensors = [int(id_) for id_ in args.sensors.split(",") if id_ != ""]
+    fans = [int(id_) for id_ in args.fans.split(",") if id_ != ""]
+    is_stub = args.bus == None
+    counts = install_counters(is_stub)
+    driver = adt7470.ADT7470Driver(
+        name="Benchmark",
+        i2c_lock=threading.RLock(),
+        bus=args.bus if not is_stub else 0,
+        address=int(args.address, 16),
+    )
+    functions = [
+        ("register per transfer", update_per_register),
+        ("combined transfers", update_combined),
+    ]
+    bus = "stub bus" if is_stub else "/dev/i2c-{}".format(args.bus)
+    print(
+        "Updating {} sensors and {} fans on {} ({} updates):".format(
+            len(sensors), len(fans), bus, args.number
+        )
+    )
+    for name, function in functions:
+        counts["syscalls"] = 0
+        start = time.perf_counter()
+        for _ in range(args.number):
+            function(driver, sensors, fans)
+        milliseconds = (time.perf_counter() - start) * 1000 / args.number
+        syscalls = counts["syscalls"] / args.number
+        print(
+            "  {:<22} {:>6.1f} syscalls/update {:>8.3f} ms/update".format(
+                name, syscalls, milliseconds
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Measures per-call cost of device logger calls at a disabled level. Compares 
+eager message formatting with lazy arguments. Run from project root:
+`python scripts/benchmark/logger.py`"""
+
+# Import standard python modules
+import os, sys, logging, timeit
+
+# Set system path and django settings
+sys.path.append(os.getcwd())
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings")
+
+# Import device utilities
+from device.utilities.logger import Logger
+
+# Initialize benchmark parameters
+NUMBER = 200000
+VALUES = {"air_temperature_celsius": 21.5, "air_humidity_percent": 40.2}
+
+
+def eager(logger: Logger) -> None:
+    """Logs message formatted at call site."""
+    logger.debug("Read values: {}, interval: {:.3f}".format(VALUES, 5.0))
+
+
+def lazy(logger: Logger) -> None:
+    """Logs message with lazy arguments."""
+    logger.debug("Read values: {}, interval: {:.3f}", VALUES, 5.0)
+
+
+def constant(logger: Logger) -> None:
+    """Logs constant message."""
+    logger.debug("Updating peripheral")
+
+
+def main() -> None:
+    """Runs benchmark with debug messages disabled."""
+    logging.getLogger("peripherals").setLevel(logging.WARNING)
+    logger = Logger("Benchmark", "peripherals")
+    print("Per-call cost with DEBUG disabled ({} calls):".format(NUMBER))
+    for function in [eager, lazy, constant]:
+        seconds = timeit.timeit(lambda: function(logger), number=NUMBER)
+        print("  {:<8} {:>8.0f} ns".format(function.__name__, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    main()